@@ -7,6 +7,8 @@ TRANSLATIONS = {
     "debug.ai_state": "Rapid AI: {count} units | States: {states}",
     "debug.ai_state.empty": "Rapid AI: no active unit",
     "debug.camera_position": "Camera: ({x:.1f}, {y:.1f})",
+    "debug.dirty_rects": "Dirty area: {fraction:.1f}% of the screen | {partial} partial / {full} full frames",
+    "debug.entity_commands": "Entity changes/tick: +{created} -{deleted} | components +{components_added} -{components_removed}",
     "debug.feedback.bandits_failed": "Failed to spawn bandits",
     "debug.feedback.bandits_spawned": "Bandits spawned successfully",
     "debug.feedback.bandits_unavailable": "Bandits system not available",
@@ -31,7 +33,11 @@ TRANSLATIONS = {
     "debug.modal.spawn_storm": "Spawn Storm",
     "debug.modal.title": "Debug Menu",
     "debug.modal.unlimited_vision": "Unlimited Vision",
+    "debug.path_scheduler": "Path queue: {pending} pending | latency p50 {p50:.1f} ms, p99 {p99:.1f} ms",
+    "debug.pathfinding": "Pathfinding: {time:.2f} ms | {requests} requests | {hit_rate:.1f}% cached",
     "debug.resolution": "Resolution: {width}x{height}",
+    "debug.sprite_cache": "Sprite variants: {hit_rate:.1f}% hits | {count} images ({size:.1f} MB)",
+    "debug.text_cache": "Text surfaces: {hit_rate:.1f}% hits | {count} surfaces ({size:.1f} MB)",
     "debug.tile_size": "Tile size: {size}px",
     "debug.zoom_level": "Zoom: {zoom:.2f}x",
 }
@@ -7,6 +7,8 @@ TRANSLATIONS = {
     "debug.ai_state": "IA rapide: {count} unités | États: {states}",
     "debug.ai_state.empty": "IA rapide: aucune unité active",
     "debug.camera_position": "Caméra: ({x:.1f}, {y:.1f})",
+    "debug.dirty_rects": "Zone redessinée : {fraction:.1f}% de l'écran | {partial} frames partielles / {full} complètes",
+    "debug.entity_commands": "Changements d'entités/tick : +{created} -{deleted} | composants +{components_added} -{components_removed}",
     "debug.feedback.bandits_failed": "Échec de création des bandits",
     "debug.feedback.bandits_spawned": "Vague de bandits créée avec succès",
     "debug.feedback.bandits_unavailable": "Système de bandits non disponible",
@@ -31,7 +33,11 @@ TRANSLATIONS = {
     "debug.modal.spawn_storm": "Créer une tempête",
     "debug.modal.title": "Menu de Debug",
     "debug.modal.unlimited_vision": "Vision illimitée",
+    "debug.path_scheduler": "File de chemins : {pending} en attente | latence p50 {p50:.1f} ms, p99 {p99:.1f} ms",
+    "debug.pathfinding": "Recherche de chemin : {time:.2f} ms | {requests} requêtes | {hit_rate:.1f}% en cache",
     "debug.resolution": "Résolution: {width}x{height}",
+    "debug.sprite_cache": "Variantes de sprites : {hit_rate:.1f}% de succès | {count} images ({size:.1f} Mo)",
+    "debug.text_cache": "Surfaces de texte : {hit_rate:.1f}% de succès | {count} surfaces ({size:.1f} Mo)",
     "debug.tile_size": "Taille tuile: {size}px",
     "debug.zoom_level": "Zoom: {zoom:.2f}x",
 }
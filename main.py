@@ -1,5 +1,6 @@
 # Main menu in Pygame
 
+import argparse
 import pygame
 import sys
 import os
@@ -14,7 +15,7 @@ from src.ui.show_gamemode_selection_modal import show_gamemode_selection_modal
 from src.ui.generic_modal import GenericModal
 from src.constants.assets import MUSIC_MAIN_THEME, MUSIC_IN_GAME
 import src.settings.settings as settings
-from src.game import game
+from src.game import game, run_headless
 from src.functions.afficherModale import afficher_modale
 from src.functions.optionsWindow import show_options_window
 from src.settings.localization import t
@@ -504,8 +505,30 @@ def main_menu(win=None):
     menu.run()
 
 
+def parse_args(argv=None):
+    """Parse command line options (unknown options are ignored)."""
+    parser = argparse.ArgumentParser(description="Galad Islands")
+    parser.add_argument("--headless", action="store_true",
+                        help="run an AI vs AI match without window, rendering or audio, then exit")
+    parser.add_argument("--ticks", type=int, default=18000,
+                        help="maximum number of simulation ticks in headless mode (default: 18000, 5 min at 60 Hz)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed for map generation and gameplay randomness in headless mode")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
 # Program entry point
 if __name__ == "__main__":
+    args = parse_args()
+    if args.headless:
+        result = run_headless(args.ticks, seed=args.seed)
+        print(
+            f"Headless: {result['ticks']} ticks, {result['sim_time']:.1f}s simulées en {result['wall_time']:.2f}s "
+            f"(x{result['speedup']:.1f}), vainqueur: {result['winning_team']}"
+        )
+        sys.exit(0)
+
     # Launch menu
     try:
         main_menu()
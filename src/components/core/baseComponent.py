@@ -8,6 +8,7 @@ import pygame
 
 from src.components.core.attackComponent import AttackComponent
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.healthComponent import HealthComponent
 from src.components.core.positionComponent import PositionComponent
 from src.components.core.spriteComponent import SpriteComponent
@@ -70,7 +71,7 @@ class BaseComponent:
             esper.add_component(entity, TeamComponent(team_id=team_id))
             esper.add_component(entity, HealthComponent(currentHealth=2500, maxHealth=2500))
             esper.add_component(entity, AttackComponent(hitPoints=50))
-            esper.add_component(entity, CanCollideComponent())
+            esper.add_component(entity, CanCollideComponent(layer=CollisionLayer.BASE))
             esper.add_component(entity, ClasseComponent(
                 unit_type=unit_type,
                 shop_id=shop_id,
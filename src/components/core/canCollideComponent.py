@@ -1,5 +1,9 @@
 from dataclasses import dataclass as component
 
+from src.constants.collision_layers import CollisionLayer
+
+
 @component
 class CanCollideComponent:
-    pass
\ No newline at end of file
+    # Couche de collision, assignée à la création (voir collision_layers)
+    layer: int = CollisionLayer.UNIT
@@ -1,7 +1,18 @@
 from dataclasses import dataclass as component
+import numpy as np
+from src.managers.component_store import component_store, StoredComponent
 
 @component
-class HealthComponent:
+class HealthComponent(StoredComponent):
+    # Valeurs stockées en colonnes (src/managers/component_store.py) ; les PV entiers restent des int
+    _table = component_store.register(
+        "health",
+        (("currentHealth", np.float64), ("maxHealth", np.float64)),
+        keep_int=("currentHealth", "maxHealth"),
+    )
+    currentHealth, maxHealth = _table.fields()
+
     def __init__(self, currentHealth=0, maxHealth=0):
+        self._attach()
         self.currentHealth: int = currentHealth
         self.maxHealth: int = maxHealth
@@ -1,8 +1,15 @@
 from dataclasses import dataclass as component
+import numpy as np
+from src.managers.component_store import component_store, StoredComponent
 
 @component
-class PositionComponent:
+class PositionComponent(StoredComponent):
+    # Valeurs stockées en colonnes (src/managers/component_store.py)
+    _table = component_store.register("position", (("x", np.float64), ("y", np.float64), ("direction", np.float64)))
+    x, y, direction = _table.fields()
+
     def __init__(self, x=0.0, y=0.0, direction=0.0):
+        self._attach()
         self.x: float = x
         self.y: float = y
-        self.direction: float = direction
\ No newline at end of file
+        self.direction: float = direction
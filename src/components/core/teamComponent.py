@@ -1,6 +1,13 @@
 from dataclasses import dataclass as component
+import numpy as np
+from src.managers.component_store import component_store, StoredComponent
 
 @component
-class TeamComponent:
+class TeamComponent(StoredComponent):
+    # Valeurs stockées en colonnes (src/managers/component_store.py)
+    _table = component_store.register("team", (("team_id", np.int16),))
+    team_id, = _table.fields()
+
     def __init__(self, team_id=0):
-        self.team_id: int = team_id
\ No newline at end of file
+        self._attach()
+        self.team_id: int = team_id
@@ -1,9 +1,21 @@
 from dataclasses import dataclass as component
+import numpy as np
+from src.managers.component_store import component_store, StoredComponent
 
 @component
-class VelocityComponent:
+class VelocityComponent(StoredComponent):
+    # Valeurs stockées en colonnes (src/managers/component_store.py)
+    _table = component_store.register("velocity", (
+        ("currentSpeed", np.float64),
+        ("maxUpSpeed", np.float64),
+        ("maxReverseSpeed", np.float64),
+        ("terrain_modifier", np.float64),
+    ))
+    currentSpeed, maxUpSpeed, maxReverseSpeed, terrain_modifier = _table.fields()
+
     def __init__ (self, currentSpeed: float = 0.0, maxUpSpeed: float = 0.0, maxReverseSpeed: float = 0.0, terrain_modifier: float = 0.0):
+        self._attach()
         self.currentSpeed: float = currentSpeed
         self.maxUpSpeed: float = maxUpSpeed
         self.maxReverseSpeed: float = maxReverseSpeed
-        self.terrain_modifier: float = terrain_modifier
\ No newline at end of file
+        self.terrain_modifier: float = terrain_modifier
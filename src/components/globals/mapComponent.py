@@ -24,6 +24,7 @@ from src.components.globals.cameraComponent import Camera
 from src.functions.resource_path import get_resource_path
 from src.components.core.baseComponent import BaseComponent
 from src.managers.surface_cache import get_scaled as _get_scaled
+from src.managers.terrain_cache import terrain_cache, tile_edge, camera_origin, visible_range, draw_tile
 from src.managers.font_cache import get_font as _get_font
 
 
@@ -291,15 +292,46 @@ def rects_intersect(r1, r2):
     x2, y2, w2, h2 = r2
     return not (x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1)
 
+def afficher_tuiles(window, grid, images, camera):
+    """
+    Rendu de référence du terrain, tuile par tuile (sans cache).
+
+    Les bords des tuiles sont placés sur des pixels entiers calculés depuis la
+    position monde du bord (voir src/managers/terrain_cache.py) : les blocs
+    pré-rendus de terrain_cache donnent exactement les mêmes pixels.
+
+    Args:
+        window (pygame.Surface): window d'affichage
+        grid (list[list[int]]): Grille de la carte
+        images (dict[str, pygame.Surface]): Dictionnaire des images par type
+        camera (Camera): Instance de la caméra pour le viewport
+    """
+    zoom = camera.zoom
+    if int(TILE_SIZE * zoom) <= 0 or not grid:
+        return
+    origin_x, origin_y = camera_origin(camera)
+    window_width, window_height = window.get_size()
+    start_col, end_col = visible_range(origin_x, window_width, zoom, len(grid[0]))
+    start_row, end_row = visible_range(origin_y, window_height, zoom, len(grid))
+
+    for i in range(start_row, end_row):
+        screen_y = tile_edge(i, zoom) - origin_y
+        height = tile_edge(i + 1, zoom) - origin_y - screen_y
+        for j in range(start_col, end_col):
+            screen_x = tile_edge(j, zoom) - origin_x
+            width = tile_edge(j + 1, zoom) - origin_x - screen_x
+            if rects_intersect((screen_x, screen_y, width, height), (0, 0, window_width, window_height)):
+                draw_tile(window, images, grid[i][j], screen_x, screen_y, width, height)
+
 def afficher_grille(window, grid, images, camera, ally_base_pos, enemy_base_pos):
     """
     Affiche la grille de jeu in the window pygame, avec all éléments graphiques.
     Utilise le système de caméra pour n'afficher que les éléments visibles.
 
     Optimisations implémentées:
-    - Rendering tuile par tuile au lieu de pré-Rendering (résout les problèmes d'alignement)
+    - Terrain (mer, îles, mines, nuages) dessiné par blocs de tuiles pré-rendus
+      par niveau de zoom (terrain_cache), alignés au pixel près sur afficher_tuiles
     - Gestion spéciale des bases multi-tuiles (4x4) pour avoid les disparitions partielles
-    - Debug logging pour diagnostiquer les problèmes de Rendering
 
     Args:
         window (pygame.Surface): window d'affichage
@@ -309,39 +341,8 @@ def afficher_grille(window, grid, images, camera, ally_base_pos, enemy_base_pos)
         ally_base_pos (tuple[int, int]): Position de la base alliée.
         enemy_base_pos (tuple[int, int]): Position de la base ennemie.
     """
-    # --- OPTIMISATION DÉSACTIVÉE TEMPORAIREMENT ---
-    # L'optimisation de pré-Rendering causait des problèmes d'alignement
-    # On revient au Rendering classique qui fonctionne correctement
-
-    # Obtenir les limites visibles
-    start_col, start_row, end_col, end_row = camera.get_visible_tiles()
-
-    # Rendre les éléments statiques (mer, îles, mines) tuile par tuile
-    for i in range(start_row, end_row):
-        for j in range(start_col, end_col):
-            # Toujours rendre la mer en fond
-            world_x, world_y = j * TILE_SIZE, i * TILE_SIZE
-            screen_x, screen_y = camera.world_to_screen(world_x, world_y)
-            
-            # Check quela tuile est visible à l'écran
-            display_size = int(TILE_SIZE * camera.zoom)
-            if display_size > 0 and rects_intersect((screen_x, screen_y, display_size, display_size), (0, 0, window.get_width(), window.get_height())):
-                
-                # Rendre la mer en fond
-                scaled_sea = _get_scaled(images['sea'], (int(display_size), int(display_size)))
-                window.blit(scaled_sea, (screen_x, screen_y))
-                
-                # Rendre les éléments par-dessus la mer
-                val = grid[i][j]
-                if val == TileType.GENERIC_ISLAND:
-                    scaled_img = _get_scaled(images['generic_island'], (int(display_size), int(display_size)))
-                    window.blit(scaled_img, (screen_x, screen_y))
-                elif val == TileType.MINE:
-                    scaled_img = _get_scaled(images['mine'], (int(display_size), int(display_size)))
-                    window.blit(scaled_img, (screen_x, screen_y))
-                elif val == TileType.CLOUD:
-                    scaled_img = _get_scaled(images['cloud'], (int(display_size), int(display_size)))
-                    window.blit(scaled_img, (screen_x, screen_y))
+    # Rendre les éléments statiques (mer, îles, mines) par blocs pré-rendus
+    terrain_cache.render(window, grid, images, camera)
 
     # --- DEBUT CORRECTION DU Rendering DES BASES ---
     # CORRECTION MAJEURE: Rendering des bases en dehors de la boucle principale
@@ -361,16 +362,18 @@ def afficher_grille(window, grid, images, camera, ally_base_pos, enemy_base_pos)
     # - Logique plus simple et robuste
     
     # Base alliée (position fixe en haut à gauche)
-    ally_base_world_x, ally_base_world_y = ally_base_pos[0] * TILE_SIZE, ally_base_pos[1] * TILE_SIZE
-    ally_screen_x, ally_screen_y = camera.world_to_screen(ally_base_world_x, ally_base_world_y)
+    # (coin aligné sur les bords de tuiles du terrain)
+    origin_x, origin_y = camera_origin(camera)
+    ally_screen_x = tile_edge(ally_base_pos[0], camera.zoom) - origin_x
+    ally_screen_y = tile_edge(ally_base_pos[1], camera.zoom) - origin_y
     ally_display_size = int(4 * TILE_SIZE * camera.zoom)
     if ally_display_size > 0 and rects_intersect((ally_screen_x, ally_screen_y, ally_display_size, ally_display_size), (0, 0, window.get_width(), window.get_height())):
         scaled_ally_base = _get_scaled(images['ally'], (int(ally_display_size), int(ally_display_size)))
         window.blit(scaled_ally_base, (ally_screen_x, ally_screen_y))
 
     # Base ennemie (position fixe en bas à droite)
-    enemy_base_world_x, enemy_base_world_y = enemy_base_pos[0] * TILE_SIZE, enemy_base_pos[1] * TILE_SIZE
-    enemy_screen_x, enemy_screen_y = camera.world_to_screen(enemy_base_world_x, enemy_base_world_y)
+    enemy_screen_x = tile_edge(enemy_base_pos[0], camera.zoom) - origin_x
+    enemy_screen_y = tile_edge(enemy_base_pos[1], camera.zoom) - origin_y
     enemy_display_size = int(4 * TILE_SIZE * camera.zoom)
     if enemy_display_size > 0 and rects_intersect((enemy_screen_x, enemy_screen_y, enemy_display_size, enemy_display_size), (0, 0, window.get_width(), window.get_height())):
         scaled_enemy_base = _get_scaled(images['enemy'], (int(enemy_display_size), int(enemy_display_size)))
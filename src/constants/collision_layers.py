@@ -0,0 +1,88 @@
+"""Couches de collision (collision layers) et matrice des paires testées.
+
+Chaque entité qui peut entrer en collision reçoit une couche à sa création
+(CanCollideComponent.layer). La matrice couche x couche décide quelles
+paires sont testées : les paires qui n'interagissent jamais ne sont pas
+générées par la broad phase du CollisionProcessor.
+"""
+
+from enum import IntEnum, unique
+
+import numpy as np
+
+
+@unique
+class CollisionLayer(IntEnum):
+    """Couche de collision d'une entité."""
+
+    UNIT = 0
+    PROJECTILE = 1
+    TOWER = 2
+    BASE = 3
+    CHEST = 4
+    RESOURCE = 5
+    BANDIT = 6
+    MINE = 7
+    KRAKEN = 8
+
+    @property
+    def bit(self) -> int:
+        """Bit de la couche dans un masque de couches."""
+        return 1 << int(self)
+
+
+# Paires de couches qui ne peuvent jamais interagir
+IGNORED_LAYER_PAIRS = frozenset({
+    # Les tours (et les bases, qui sont aussi des tours) ne ramassent pas les coffres
+    frozenset((CollisionLayer.TOWER, CollisionLayer.CHEST)),
+    frozenset((CollisionLayer.BASE, CollisionLayer.CHEST)),
+    # Bandits : invulnérables aux projectiles et aux mines, ne s'attaquent pas entre eux
+    # et n'endommagent pas les bases
+    frozenset((CollisionLayer.BANDIT,)),
+    frozenset((CollisionLayer.BANDIT, CollisionLayer.PROJECTILE)),
+    frozenset((CollisionLayer.BANDIT, CollisionLayer.MINE)),
+    frozenset((CollisionLayer.BANDIT, CollisionLayer.BASE)),
+    # Les projectiles traversent les coffres et les ressources sans effet
+    frozenset((CollisionLayer.PROJECTILE, CollisionLayer.CHEST)),
+    frozenset((CollisionLayer.PROJECTILE, CollisionLayer.RESOURCE)),
+    # Les mines sont fixes, une par tuile
+    frozenset((CollisionLayer.MINE,)),
+})
+
+# Équipes 0 (neutre), 1 (alliés) et 2 (ennemis)
+COLLISION_TEAM_COUNT = 3
+
+
+def layers_collide(layer_a: int, layer_b: int) -> bool:
+    """Indique si deux couches de collision interagissent."""
+    return frozenset((CollisionLayer(layer_a), CollisionLayer(layer_b))) not in IGNORED_LAYER_PAIRS
+
+
+def _build_layer_matrix() -> np.ndarray:
+    size = len(CollisionLayer)
+    matrix = np.ones((size, size), dtype=bool)
+    for pair in IGNORED_LAYER_PAIRS:
+        layer_a, layer_b = (tuple(pair) * 2)[:2]
+        matrix[layer_a, layer_b] = matrix[layer_b, layer_a] = False
+    return matrix
+
+
+def _build_group_matrix(layer_matrix: np.ndarray) -> np.ndarray:
+    """Matrice par groupe (couche, équipe) : la matrice des couches, sans les paires
+    d'une même équipe (sauf l'équipe neutre 0, par exemple les mines)."""
+    teams = np.arange(COLLISION_TEAM_COUNT)
+    same_team = (teams[:, None] == teams[None, :]) & (teams[:, None] != 0)
+    matrix = layer_matrix[:, None, :, None] & ~same_team[None, :, None, :]
+    size = layer_matrix.shape[0] * COLLISION_TEAM_COUNT
+    return matrix.reshape(size, size)
+
+
+def collision_groups(layers: np.ndarray, teams: np.ndarray) -> np.ndarray:
+    """Index de groupe (couche, équipe) de chaque entité dans COLLISION_GROUP_MATRIX."""
+    return layers.astype(np.int64) * COLLISION_TEAM_COUNT + teams
+
+
+COLLISION_LAYER_MATRIX = _build_layer_matrix()
+COLLISION_GROUP_MATRIX = _build_group_matrix(COLLISION_LAYER_MATRIX)
+COLLISION_LAYER_MATRIX.flags.writeable = False
+COLLISION_GROUP_MATRIX.flags.writeable = False
@@ -217,6 +217,8 @@ PROJECTILE_DAMAGE = 10
 PROJECTILE_HEALTH = 1
 PROJECTILE_WIDTH = 20
 PROJECTILE_HEIGHT = 10
+PROJECTILE_LIFETIME = 1.2  # secondes
+PROJECTILE_POOL_CAPACITY = 512  # emplacements préalloués du projectile_store (agrandi si besoin)
 EXPLOSION_SIZE_WIDTH = 20
 EXPLOSION_SIZE_HEIGHT = 10
 
@@ -355,4 +357,85 @@ UNIT_VISION_SCOUT = 6.0
 UNIT_VISION_MARAUDEUR = 5.0
 UNIT_VISION_LEVIATHAN = 5.0  # Augmenté de 4.0 à 5.0 pour meilleure visibilité
 UNIT_VISION_DRUID = 5.0
-UNIT_VISION_ARCHITECT = 4.0
\ No newline at end of file
+UNIT_VISION_ARCHITECT = 4.0
+# =============================================================================
+# HORLOGE DE SIMULATION
+# =============================================================================
+
+# Les vitesses (VelocityComponent.currentSpeed) sont exprimées en pixels par tick à cette fréquence
+SIMULATION_REFERENCE_RATE = 60
+# Fréquence par défaut de la simulation à pas fixe (ticks par seconde), indépendante du FPS d'affichage
+DEFAULT_SIM_TICK_RATE = 60
+# Temps de frame maximal absorbé par l'accumulateur (évite la spirale de rattrapage après un gel)
+MAX_SIM_FRAME_TIME = 0.25
+# Au-delà de ce déplacement entre deux ticks (pixels), la position n'est pas interpolée (téléportation, respawn)
+INTERPOLATION_MAX_JUMP = 256.0
+# Nombre d'entités mobiles à partir duquel le MovementProcessor calcule le déplacement par lot (NumPy)
+MOVEMENT_BATCH_MIN_ENTITIES = 64
+# Taille des cellules de l'index spatial partagé (src/managers/spatial_index.py), en tuiles
+SPATIAL_INDEX_CELL_TILES = 4
+
+# =============================================================================
+# CACHE DE RENDU DU TERRAIN
+# =============================================================================
+
+# Côté des blocs de terrain pré-rendus (src/managers/terrain_cache.py), en tuiles
+TERRAIN_CHUNK_TILES = 8
+# Mémoire maximale des blocs pré-rendus, tous niveaux de zoom confondus (octets)
+TERRAIN_CHUNK_CACHE_BYTES = 48 * 1024 * 1024
+# Niveaux de zoom par unité des blocs de terrain : le zoom de la caméra est arrondi à 1/1000
+# (les erreurs d'arrondi des flottants ne créent plus de nouveaux blocs)
+TERRAIN_ZOOM_PRECISION = 1000
+
+# =============================================================================
+# CACHE DES VARIANTES DE SPRITES
+# =============================================================================
+
+# Niveaux de zoom discrets des sprites (le zoom de la caméra est arrondi au plus proche)
+SPRITE_ZOOM_LEVELS = (0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5)
+# Pas des rotations des sprites (degrés) : 24 orientations
+SPRITE_ROTATION_STEP = 15
+# Mémoire maximale des variantes (échelle/retournement/rotation) gardées en cache (octets)
+SPRITE_VARIANT_CACHE_BYTES = 32 * 1024 * 1024
+# Générer toutes les variantes d'un sprite (zooms x rotations) à sa première utilisation
+SPRITE_VARIANT_PREWARM = False
+# Marge (pixels monde) ajoutée au rectangle de la caméra pour choisir les sprites à dessiner :
+# déplacement maximal entre deux ticks, l'entité étant dessinée à sa position interpolée
+SPRITE_CULL_MARGIN = 32.0
+
+# =============================================================================
+# PRÉSENTATION PAR RECTANGLES SALES
+# =============================================================================
+
+# Au-delà de ce nombre de rectangles (après fusion), la frame est présentée en entier
+DIRTY_RECT_MAX_RECTS = 48
+# Au-delà de cette fraction de l'écran à redessiner, un flip complet coûte moins cher
+DIRTY_RECT_FULL_FRACTION = 0.6
+
+# =============================================================================
+# CACHE DES TEXTES RENDUS
+# =============================================================================
+
+# Mémoire maximale des surfaces de texte (chaînes et glyphes) gardées en cache (octets)
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+
+# =============================================================================
+# SERVICE DE NAVIGATION
+# =============================================================================
+
+# Nombre maximal de chemins gardés dans le cache partagé (src/managers/navigation.py)
+NAVIGATION_CACHE_ENTRIES = 512
+# Durée de validité par défaut d'un chemin en cache (secondes)
+NAVIGATION_CACHE_TTL = 1.5
+# Rayon (en cases du profil) de la recherche d'une case libre quand le départ ou l'arrivée est bloqué
+NAVIGATION_SNAP_RADIUS = 8
+# Nombre maximal de champs de flux (un par destination et profil) gardés en mémoire
+NAVIGATION_FLOW_FIELDS = 32
+# Nombre minimal de cases d'une grille pour planifier en deux niveaux (HPA*, src/managers/navigation_hierarchy.py)
+NAVIGATION_HIERARCHY_MIN_CELLS = 128 * 128
+# Côté (en cases du profil) des secteurs du graphe abstrait
+NAVIGATION_SECTOR_SIZE = 16
+# Temps maximal (millisecondes) consacré aux requêtes de chemin des IA par frame (src/managers/path_scheduler.py)
+PATH_SCHEDULER_BUDGET_MS = 2.0
+# Nombre de délais requête -> chemin gardés pour les percentiles de latence
+PATH_SCHEDULER_LATENCY_SAMPLES = 512
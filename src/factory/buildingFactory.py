@@ -10,6 +10,7 @@ from src.components.core.defenseTowerComponent import DefenseTowerComponent
 from src.components.core.healTowerComponent import HealTowerComponent
 from src.components.core.towerComponent import TowerComponent, TowerType
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.radiusComponent import RadiusComponent
 from src.components.core.classeComponent import ClasseComponent
 from src.settings.settings import TILE_SIZE
@@ -26,7 +27,7 @@ def create_defense_tower(x: float, y: float, team_id: int = 1):
     esper.add_component(entity, ClasseComponent(unit_type="ATTACK_TOWER", shop_id="defense_tower", display_name=t("shop.defense_tower"), is_enemy=False))
     # Add the unified TowerComponent for the TowerProcessor
     esper.add_component(entity, TowerComponent(tower_type=TowerType.DEFENSE, range=350.0, damage=25, attack_speed=1.0))
-    esper.add_component(entity, CanCollideComponent())  # Allows towers to be attacked
+    esper.add_component(entity, CanCollideComponent(layer=CollisionLayer.TOWER))  # Allows towers to be attacked
     esper.add_component(entity, RadiusComponent(hit_cooldown_duration=1.0))  # Cooldown between hits (like bases)
 
     # Use the correct sprite according to the team
@@ -51,7 +52,7 @@ def create_heal_tower(x: float, y: float, team_id: int = 1):
     esper.add_component(entity, ClasseComponent(unit_type="HEAL_TOWER", shop_id="heal_tower", display_name=t("shop.heal_tower"), is_enemy=False))
     # Add the unified TowerComponent for the TowerProcessor
     esper.add_component(entity, TowerComponent(tower_type=TowerType.HEAL, range=200.0, heal_amount=10, attack_speed=1.0))
-    esper.add_component(entity, CanCollideComponent())  # Allows towers to be attacked
+    esper.add_component(entity, CanCollideComponent(layer=CollisionLayer.TOWER))  # Allows towers to be attacked
     esper.add_component(entity, RadiusComponent(hit_cooldown_duration=1.0))  # Cooldown between hits (like bases)
 
     # Use the correct sprite according to the team
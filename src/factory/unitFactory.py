@@ -39,6 +39,7 @@ from src.components.core.radiusComponent import RadiusComponent
 from src.components.core.attackComponent import AttackComponent
 from src.components.core.healthComponent import HealthComponent
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.special.speDruidComponent import SpeDruid
 from src.components.special.speArchitectComponent import SpeArchitect
 from src.components.core.classeComponent import ClasseComponent
@@ -80,7 +81,7 @@ def UnitFactory(unit: UnitKey, enemy: bool, pos: PositionComponent, enable_ai: b
             es.add_component(entity, TeamComponent(1 if not enemy else 2))
             es.add_component(entity, AttackComponent(UNIT_ATTACK_SCOUT))
             es.add_component(entity, HealthComponent(UNIT_HEALTH_SCOUT, UNIT_HEALTH_SCOUT))
-            es.add_component(entity, CanCollideComponent())
+            es.add_component(entity, CanCollideComponent(layer=CollisionLayer.UNIT))
             es.add_component(entity, SpeScout())
             es.add_component(entity, VisionComponent(UNIT_VISION_SCOUT))
             sprite_id = SpriteID.ALLY_SCOUT if not enemy else SpriteID.ENEMY_SCOUT
@@ -112,7 +113,7 @@ def UnitFactory(unit: UnitKey, enemy: bool, pos: PositionComponent, enable_ai: b
             es.add_component(entity, TeamComponent(1 if not enemy else 2))
             es.add_component(entity, AttackComponent(UNIT_ATTACK_MARAUDEUR))
             es.add_component(entity, HealthComponent(UNIT_HEALTH_MARAUDEUR, UNIT_HEALTH_MARAUDEUR))
-            es.add_component(entity, CanCollideComponent())
+            es.add_component(entity, CanCollideComponent(layer=CollisionLayer.UNIT))
             es.add_component(entity, SpeMaraudeur())
             es.add_component(entity, VisionComponent(UNIT_VISION_MARAUDEUR))
             sprite_id = SpriteID.ALLY_MARAUDEUR if not enemy else SpriteID.ENEMY_MARAUDEUR
@@ -139,7 +140,7 @@ def UnitFactory(unit: UnitKey, enemy: bool, pos: PositionComponent, enable_ai: b
             es.add_component(entity, TeamComponent(1 if not enemy else 2))
             es.add_component(entity, AttackComponent(UNIT_ATTACK_LEVIATHAN))
             es.add_component(entity, HealthComponent(UNIT_HEALTH_LEVIATHAN, UNIT_HEALTH_LEVIATHAN))
-            es.add_component(entity, CanCollideComponent())
+            es.add_component(entity, CanCollideComponent(layer=CollisionLayer.UNIT))
             es.add_component(entity, SpeLeviathan())
             es.add_component(entity, VisionComponent(UNIT_VISION_LEVIATHAN))
 
@@ -174,7 +175,7 @@ def UnitFactory(unit: UnitKey, enemy: bool, pos: PositionComponent, enable_ai: b
             es.add_component(entity, TeamComponent(1 if not enemy else 2))
             es.add_component(entity, AttackComponent(UNIT_ATTACK_DRUID))
             es.add_component(entity, HealthComponent(UNIT_HEALTH_DRUID, UNIT_HEALTH_DRUID))
-            es.add_component(entity, CanCollideComponent())
+            es.add_component(entity, CanCollideComponent(layer=CollisionLayer.UNIT))
             sprite_id = SpriteID.ALLY_DRUID if not enemy else SpriteID.ENEMY_DRUID
             size = sprite_manager.get_default_size(sprite_id)
             if size:
@@ -210,7 +211,7 @@ def UnitFactory(unit: UnitKey, enemy: bool, pos: PositionComponent, enable_ai: b
             es.add_component(entity, AttackComponent(UNIT_ATTACK_ARCHITECT))
             es.add_component(entity, HealthComponent(UNIT_HEALTH_ARCHITECT, UNIT_HEALTH_ARCHITECT))
             es.add_component(entity, ArchitectAIComponent(0.02))
-            es.add_component(entity, CanCollideComponent())
+            es.add_component(entity, CanCollideComponent(layer=CollisionLayer.UNIT))
             sprite_id = SpriteID.ALLY_ARCHITECT if not enemy else SpriteID.ENEMY_ARCHITECT
             size = sprite_manager.get_default_size(sprite_id)
             if size:
@@ -246,7 +247,7 @@ def UnitFactory(unit: UnitKey, enemy: bool, pos: PositionComponent, enable_ai: b
             es.add_component(entity, TeamComponent(1 if not enemy else 2))
             es.add_component(entity, AttackComponent(UNIT_ATTACK_KAMIKAZE))
             es.add_component(entity, HealthComponent(UNIT_HEALTH_KAMIKAZE, UNIT_HEALTH_KAMIKAZE))
-            es.add_component(entity, CanCollideComponent())
+            es.add_component(entity, CanCollideComponent(layer=CollisionLayer.UNIT))
             es.add_component(entity, SpeKamikazeComponent()) # Manages the special ability and explosion marker
             es.add_component(entity, VisionComponent(UNIT_VISION_KAMIKAZE))
             # add AI component for the Kamikaze (all teams)
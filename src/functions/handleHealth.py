@@ -10,16 +10,27 @@ from src.components.core.classeComponent import ClasseComponent
 from src.processeurs.combatRewardProcessor import CombatRewardProcessor
 from src.components.events.banditsComponent import Bandits
 from src.components.core.projectileComponent import ProjectileComponent
+from src.managers.entity_commands import entity_commands
+from src.managers.component_index import component_index
 
 
 # Global instance of the combat reward processor
 _combat_reward_processor = CombatRewardProcessor()
 
+# Bits des components testés à chaque dégât (component_index)
+_MINE_COMPONENTS = component_index.mask_of(Health, Team, Attack)
+_HEALTH = component_index.bit(Health)
+_MARAUDEUR = component_index.bit(SpeMaraudeur)
+_SCOUT = component_index.bit(SpeScout)
+_BANDIT = component_index.bit(Bandits)
+_PROJECTILE = component_index.bit(ProjectileComponent)
+
 
 def processHealth(entity, damage, attacker_entity=None):
     # Protection explicite : les mines (HP=1, team=0, attack=40) ne doivent jamais recevoir de dégâts
+    components = component_index.entity_mask(entity)
     try:
-        if esper.has_component(entity, Health) and esper.has_component(entity, Team) and esper.has_component(entity, Attack):
+        if components & _MINE_COMPONENTS == _MINE_COMPONENTS:
             h = esper.component_for_entity(entity, Health)
             t = esper.component_for_entity(entity, Team)
             a = esper.component_for_entity(entity, Attack)
@@ -29,12 +40,12 @@ def processHealth(entity, damage, attacker_entity=None):
     except Exception:
         pass
 
-    if not esper.has_component(entity, Health):
+    if not components & _HEALTH:
         return  # Pas de component Health, rien à faire
     health = esper.component_for_entity(entity, Health)
     
     # Check sil'entity possède le bouclier de Barhamus
-    if esper.has_component(entity, SpeMaraudeur):
+    if components & _MARAUDEUR:
         shield = esper.component_for_entity(entity, SpeMaraudeur)
         try:
             damage = shield.apply_damage_reduction(damage)
@@ -42,29 +53,23 @@ def processHealth(entity, damage, attacker_entity=None):
             # in case of error interne au bouclier, ne pas bloquer l'application des dégâts
             pass
     # Check sil'entity possède l'invincibilité du Zasper
-    if esper.has_component(entity, SpeScout):
+    if components & _SCOUT:
         invincibility = esper.component_for_entity(entity, SpeScout)
         if invincibility.is_invincible():
             # Scout invincible — silenced debug log
             damage = 0
 
     # Check sila cible est un bandit
-    if esper.has_component(entity, Bandits):
-        if attacker_entity is not None and esper.has_component(attacker_entity, ProjectileComponent):
+    if components & _BANDIT:
+        attacker_components = component_index.entity_mask(attacker_entity) if attacker_entity is not None else 0
+        if attacker_components & _PROJECTILE:
             damage = 0
         # Check sil'attaquant est une mine (health max = 1, team_id = 0, attack = 40)
-        elif (attacker_entity is not None and 
-              esper.has_component(attacker_entity, Health) and 
-              esper.has_component(attacker_entity, Team) and 
-              esper.has_component(attacker_entity, Attack)):
-            if esper.has_component(attacker_entity, Health):
-                attacker_health = esper.component_for_entity(attacker_entity, Health)
-            else:
-                attacker_health = None
+        elif attacker_components & _MINE_COMPONENTS == _MINE_COMPONENTS:
+            attacker_health = esper.component_for_entity(attacker_entity, Health)
             attacker_team = esper.component_for_entity(attacker_entity, Team)
             attacker_attack = esper.component_for_entity(attacker_entity, Attack)
-            if (attacker_health is not None and
-                attacker_health.maxHealth == 1 and 
+            if (attacker_health.maxHealth == 1 and 
                 attacker_team.team_id == 0 and 
                 attacker_attack.hitPoints == 40):
                 damage = 0  # Bandits immunisés aux mines
@@ -95,7 +100,7 @@ def processHealth(entity, damage, attacker_entity=None):
             elif esper.has_component(entity, ClasseComponent) and attacker_entity is not None:
                 _combat_reward_processor.create_unit_reward(entity, attacker_entity)
             
-            esper.delete_entity(entity)
+            entity_commands.delete(entity)
     except Exception:
         pass
 
@@ -5,6 +5,7 @@ from src.components.core.radiusComponent import RadiusComponent
 from src.components.core.attackComponent import AttackComponent
 from src.components.core.healthComponent import HealthComponent
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.teamComponent import TeamComponent 
 from src.components.core.spriteComponent import SpriteComponent 
 from src.components.core.projectileComponent import ProjectileComponent
@@ -14,11 +15,12 @@ from src.components.special.speArchitectComponent import SpeArchitect
 from src.components.special.speDruidComponent import SpeDruid
 from src.components.special.speLeviathanComponent import SpeLeviathan
 from src.constants.gameplay import (
-    PROJECTILE_SPEED, PROJECTILE_DAMAGE, PROJECTILE_HEALTH,
+    PROJECTILE_SPEED, PROJECTILE_DAMAGE, PROJECTILE_HEALTH, PROJECTILE_LIFETIME,
     PROJECTILE_WIDTH, PROJECTILE_HEIGHT, DRUID_IMMOBILIZATION_DURATION,
     DRUID_PROJECTILE_SPEED
 )
 from src.managers.sprite_manager import SpriteID, sprite_manager
+from src.managers.projectile_store import projectile_store
 from src.managers.audio import get_audio_manager
 import logging
 
@@ -85,6 +87,24 @@ def create_projectile(entity, type: str = "bullet"):
 
         for angle in angles:
             logger.debug("create_projectile -> entity=%s angle=%s", entity, angle)
+
+            # Traiter 'leviathan' comme un 'bullet' (vitesse, dégâts, sprite) : les balles
+            # vivent dans le projectile_store, pas en tant qu'entités esper
+            if type in ("bullet", "leviathan"):
+                # Choisir le sprite selon la team (ennemi -> fireball)
+                if team_id == Team.ENEMY:
+                    sprite_id = SpriteID.PROJECTILE_FIREBALL
+                else:
+                    sprite_id = SpriteID.PROJECTILE_BULLET
+                width, height = sprite_manager.get_default_size(sprite_id) or (PROJECTILE_WIDTH, PROJECTILE_HEIGHT)
+                projectile_store.spawn(
+                    x=pos.x, y=pos.y, direction=angle,
+                    speed=PROJECTILE_SPEED + speed.currentSpeed if speed else 0,
+                    team_id=team_id, damage=PROJECTILE_DAMAGE, owner=entity,
+                    lifetime=PROJECTILE_LIFETIME, sprite_id=sprite_id, width=width, height=height,
+                )
+                continue
+
             bullet_entity = esper.create_entity()
             esper.add_component(bullet_entity, TeamComponent(
                 team_id=team_id
@@ -100,32 +120,10 @@ def create_projectile(entity, type: str = "bullet"):
                 currentHealth=PROJECTILE_HEALTH
             ))
 
-            esper.add_component(bullet_entity, CanCollideComponent())
-
-            # Traiter 'leviathan' comme un 'bullet' pour les components (vitesse, dégâts, sprite)
-            if type in ("bullet", "leviathan"):
-                esper.add_component(bullet_entity, VelocityComponent(
-                    currentSpeed=PROJECTILE_SPEED + speed.currentSpeed if speed else 0,
-                    maxUpSpeed=PROJECTILE_SPEED + speed.currentSpeed if speed else 0,
-                ))
-
-                esper.add_component(bullet_entity, LifetimeComponent(1.2))
-
-                esper.add_component(bullet_entity, AttackComponent(
-                    hitPoints=PROJECTILE_DAMAGE
-                ))
-
-                # Identifier cette entity comme un projectile
-                esper.add_component(bullet_entity, ProjectileComponent("bullet", entity))
-
-                # Choisir le sprite selon la team (ennemi -> fireball)
-                if team_id == Team.ENEMY:
-                    sprite_id = SpriteID.PROJECTILE_FIREBALL
-                else:
-                    sprite_id = SpriteID.PROJECTILE_BULLET
-                size = sprite_manager.get_default_size(sprite_id)
+            esper.add_component(bullet_entity, CanCollideComponent(layer=CollisionLayer.PROJECTILE))
 
-            elif type == "vine":
+            size = None
+            if type == "vine":
                 esper.add_component(bullet_entity, VelocityComponent(
                     currentSpeed=DRUID_PROJECTILE_SPEED,
                     maxUpSpeed=DRUID_PROJECTILE_SPEED,
@@ -1,18 +1,22 @@
 import os
 import platform
+import random
+import time
 import traceback
+import itertools
 import logging
 import pygame
 from collections import Counter
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 # Internal module imports
 import esper as es
 import src.settings.settings as settings
 import src.components.globals.mapComponent as game_map
 from src.settings.settings import MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, config_manager
-from src.constants.gameplay import INITIAL_EVENT_DELAY
+from src.constants.gameplay import INITIAL_EVENT_DELAY, DEFAULT_SIM_TICK_RATE, MAX_SIM_FRAME_TIME, INTERPOLATION_MAX_JUMP
+from src.constants.gameplay import SPRITE_CULL_MARGIN
 from src.settings.localization import t
 from src.settings.docs_manager import get_help_path
 from src.settings import controls
@@ -79,6 +83,8 @@ from src.components.core.aiEnabledComponent import AIEnabledComponent
 
 # import event
 from src.components.events.banditsComponent import Bandits
+from src.components.events.stormComponent import Storm
+from src.components.core.lifetimeComponent import LifetimeComponent
 from src.processeurs.flyingChestProcessor import FlyingChestProcessor
 from src.managers.island_resource_manager import IslandResourceManager
 from src.processeurs.stormProcessor import StormProcessor
@@ -91,6 +97,17 @@ from src.factory.buildingFactory import create_defense_tower, create_heal_tower
 from src.functions.projectileCreator import create_projectile
 from src.functions.handleHealth import entitiesHit
 from src.functions.afficherModale import afficher_modale
+from src.managers.sprite_manager import sprite_manager
+from src.managers.spatial_index import spatial_index
+from src.managers.projectile_store import projectile_store
+from src.managers.entity_commands import entity_commands
+from src.managers.sprite_variant_cache import discrete_zoom, rotation_bucket, sprite_variant_cache
+from src.managers.component_index import component_index
+from src.managers.dirty_rects import DirtyRectTracker, blit_rect
+from src.managers.terrain_cache import camera_origin, terrain_cache, tile_edge
+from src.managers.navigation import navigation
+from src.managers.path_scheduler import path_scheduler
+from src.managers.frame_snapshot import FrameSnapshot, SimulationWorker, SnapshotBuffer, SpriteState, frozen
 from src.components.core.baseComponent import BaseComponent
 from src.components.core.towerComponent import TowerComponent
 from src.components.core.projectileComponent import ProjectileComponent
@@ -107,11 +124,46 @@ from src.ui.notification_system import get_notification_system
 from src.ia.ia_scout import ensure_ai_processors
 
 from src.constants.gameplay import PLAYER_DEFAULT_GOLD
-from src.managers.font_cache import get_font as _get_font
+from src.managers.font_cache import get_font as _get_font, text_cache
 from src.managers.surface_cache import get_filled_surface as _get_filled
 # Color used to highlight the selected unit
 SELECTION_COLOR = (255, 215, 0)
 
+# Component bits tested for every rendered sprite (component_index)
+_SCOUT_BIT = component_index.bit(SpeScout)
+_MARAUDEUR_BIT = component_index.bit(SpeMaraudeur)
+_SELECTED_BIT = component_index.bit(PlayerSelectedComponent)
+_HEALTH_BIT = component_index.bit(HealthComponent)
+_VELOCITY_BIT = component_index.bit(VelocityComponent)
+_PROJECTILE_BIT = component_index.bit(ProjectileComponent)
+_EFFECT_BITS = component_index.mask_of(LifetimeComponent, Storm)
+
+# Sprite render layers, drawn in this order (GameRenderer._render_sprites)
+_LAYER_PROPS, _LAYER_UNITS, _LAYER_PROJECTILES, _LAYER_EFFECTS = range(4)
+_SPRITE_LAYER_COUNT = 4
+
+# projectile_store columns read to draw the bullets
+_PROJECTILE_COLUMNS = ("x", "y", "prev_x", "prev_y", "has_previous", "direction", "team", "sprite", "width", "height")
+
+
+def _sprite_layer(components):
+    """Render layer of an entity from its component mask: effects (explosions,
+    storms), projectiles (vines), units (anything that moves), terrain props."""
+    if components & _PROJECTILE_BIT:
+        return _LAYER_PROJECTILES
+    if components & _EFFECT_BITS:
+        return _LAYER_EFFECTS
+    if components & _VELOCITY_BIT:
+        return _LAYER_UNITS
+    return _LAYER_PROPS
+
+
+class _SpriteOverlays(NamedTuple):
+    """Overlay render lists of a frame, drawn over the sprites."""
+    halos: list
+    rings: list
+    health_bars: list
+
 
 class EventHandler:
     """Class responsible for handling all game events."""
@@ -439,9 +491,19 @@ class GameRenderer:
             game_engine: Reference to the game engine instance
         """
         self.game_engine = game_engine
+        # Changed screen areas, for the dirty-rectangle presentation mode
+        self.dirty_rects = DirtyRectTracker()
         
-    def render_frame(self, dt, adaptive_quality=1.0):
-        """Performs complete rendering of a frame."""
+    def render_frame(self, dt, adaptive_quality=1.0, alpha=1.0):
+        """Performs complete rendering of a frame.
+
+        Args:
+            dt: Duration of the render frame, in seconds
+            adaptive_quality: Quality factor (1.0 = maximum quality)
+            alpha: Progress between the last two simulation ticks, used to
+                interpolate the displayed positions (1.0 = latest tick)
+        """
+        self._interpolation_alpha = alpha
         window = self.game_engine.window
         grid = self.game_engine.grid
         images = self.game_engine.images
@@ -451,22 +513,118 @@ class GameRenderer:
         
         if window is None:
             return
-            
-        self._clear_screen(window)
 
         # Apply quality optimizations from config
         disable_particles = config_manager.get("disable_particles", False) or adaptive_quality < 0.5
         disable_shadows = config_manager.get("disable_shadows", False) or adaptive_quality < 0.7
-        
-        self._render_game_world(window, grid, images, camera)
-        self._render_fog_of_war(window, camera)
+
+        # Update visibility for the current team before anything is drawn
+        self._update_fog_of_war()
+
+        # Render lists are built first: the dirty-rectangle mode compares them with the previous frame
+        layers, overlays = self._collect_sprites(window, camera) if camera is not None else ((), ())
+        circles = self._vision_circle_blits(window, camera) if camera is not None and not disable_shadows else []
+        debug_text = self._debug_text(window, camera, dt) if show_debug else []
+
+        areas = None
+        if config_manager.get("dirty_rect_rendering", False) and camera is not None:
+            areas = self._dirty_areas(window, camera, layers, overlays, circles, debug_text, disable_shadows)
+        else:
+            self.dirty_rects.reset()
+
+        if areas is None:
+            self._clear_screen(window)
+            self._render_game_world(window, grid, images, camera)
+            self._render_fog_of_war(window, camera)
+            window.blits(circles, doreturn=False)
+            self._submit_sprites(window, layers, overlays)
+        else:
+            # Only the changed areas are redrawn, each world pass clipped to them
+            for area in areas:
+                window.set_clip(area)
+                self._clear_screen(window)
+                self._render_game_world(window, grid, images, camera)
+            window.set_clip(None)
+            self._render_fog_of_war(window, camera, areas)
+            for area in areas:
+                window.set_clip(area)
+                window.blits(circles, doreturn=False)
+                self._submit_sprites(window, *self._clip_render_lists(area, layers, overlays))
+            window.set_clip(None)
+
+        self._render_overlays(window, camera, debug_text)
+        self.dirty_rects.present(areas)
+
+    def build_snapshot(self, tick):
+        """Immutable copy of what render_world_snapshot draws, read from the ECS.
+
+        Called by the simulation thread at the end of a batch of ticks
+        (pipelined mode, see src/managers/frame_snapshot.py).
+        """
+        engine = self.game_engine
+        current_team = engine.action_bar.current_camp
+        self._update_fog_of_war()
+
+        entities = sorted(es.get_components(PositionComponent, SpriteComponent), key=lambda item: item[0])
+        sprites = tuple(self._sprite_state(ent, pos, sprite) for ent, (pos, sprite) in entities)
+        slots = projectile_store.live_slots()
+        visible = explored = None
+        if not getattr(engine, 'self_play_mode', False):
+            visible = frozen(vision_system.visible_grid(current_team))
+            explored = frozen(vision_system.explored_grid(current_team))
+        return FrameSnapshot(
+            tick=tick,
+            team=current_team,
+            sprites=sprites,
+            xs=frozen(np.fromiter((state.x for state in sprites), dtype=np.float64, count=len(sprites))),
+            ys=frozen(np.fromiter((state.y for state in sprites), dtype=np.float64, count=len(sprites))),
+            extent=max((max(state.width, state.height) for state in sprites), default=0),
+            projectiles={name: frozen(projectile_store.column(name)[slots]) for name in _PROJECTILE_COLUMNS},
+            visible=visible,
+            explored=explored,
+            vision_circle=self._vision_circle_state(),
+        )
+
+    def render_world_snapshot(self, snapshot, adaptive_quality=1.0, alpha=1.0):
+        """Draws the world of a FrameSnapshot (terrain, fog, vision circle, sprites).
+
+        Nothing is read from the ECS, so the simulation thread can run the next
+        ticks meanwhile; the interface is drawn afterwards by render_overlays.
+        Always a full frame (no dirty rectangles).
+        """
+        self._interpolation_alpha = alpha
+        window = self.game_engine.window
+        camera = self.game_engine.camera
+        if window is None or snapshot is None:
+            return
+        self.dirty_rects.reset()
+        disable_shadows = config_manager.get("disable_shadows", False) or adaptive_quality < 0.7
+
+        self._clear_screen(window)
+        self._render_game_world(window, self.game_engine.grid, self.game_engine.images, camera)
+        if camera is None:
+            return
+        if snapshot.visible is not None:
+            vision_system.draw_fog(window, camera, snapshot.team, grids=(snapshot.visible, snapshot.explored))
         if not disable_shadows:
-            self._render_vision_circles(window, camera)
-        self._render_sprites(window, camera)
-        self._render_ui(window, action_bar)
+            window.blits(self._circle_blits(window, camera, snapshot.vision_circle), doreturn=False)
+        self._submit_sprites(window, *self._collect_snapshot_sprites(window, camera, snapshot))
+
+    def render_overlays(self, dt):
+        """Draws the interface over the world drawn by render_world_snapshot."""
+        window = self.game_engine.window
+        camera = self.game_engine.camera
+        if window is None:
+            return
+        debug_text = self._debug_text(window, camera, dt) if self.game_engine.show_debug else []
+        self._render_overlays(window, camera, debug_text)
+
+    def _render_overlays(self, window, camera, debug_text):
+        """Draws everything over the world: interface, debug info, tutorial and modals."""
+        self._render_ui(window, self.game_engine.action_bar)
         
-        if show_debug:
-            self._render_debug_info(window, camera, dt, self.game_engine)
+        if self.game_engine.show_debug:
+            self._render_debug_info(window, camera, debug_text, self.game_engine)
 
         # Draw the tutorial
         if self.game_engine.tutorial_manager.is_active():
@@ -476,14 +634,65 @@ class GameRenderer:
             self.game_engine.exit_modal.render(window)
 
         # Render victory/defeat modal if active
-        if getattr(self.game_engine, 'victory_modal', None) is not None and self.game_engine.victory_modal.is_active():
+        if self._victory_modal_active():
             self.game_engine.victory_modal.render(window)
 
         # Display the old game over message only if no modal is active
-        if self.game_engine.game_over and self.game_engine.game_over_timer > 0 and (not getattr(self.game_engine, 'victory_modal', None) or not self.game_engine.victory_modal.is_active()):
+        if self._game_over_message_active():
             self._render_game_over_message(window)
 
-        pygame.display.flip()
+    def _victory_modal_active(self):
+        return getattr(self.game_engine, 'victory_modal', None) is not None and self.game_engine.victory_modal.is_active()
+
+    def _game_over_message_active(self):
+        return self.game_engine.game_over and self.game_engine.game_over_timer > 0 and not self._victory_modal_active()
+
+    def _dirty_areas(self, window, camera, layers, overlays, circles, debug_text, disable_shadows):
+        """Screen areas changed since the previous frame, or None to redraw and flip the whole frame.
+
+        Any change of view (camera position or zoom, team, terrain, settings)
+        and any full-screen overlay (tutorial, modals, shop, game over) gives a
+        full frame.
+        """
+        engine = self.game_engine
+        current_team = engine.action_bar.current_camp
+        self_play = getattr(engine, 'self_play_mode', False)
+        view = (camera.x, camera.y, camera.zoom, current_team, self_play, disable_shadows,
+                config_manager.get("fog_render_mode", "tiles"), id(engine.grid), id(engine.images),
+                terrain_cache.version)
+        self.dirty_rects.begin_frame(view, window.get_size())
+
+        if (engine.tutorial_manager.is_active() or engine.exit_modal.is_active() or self._victory_modal_active()
+                or self._game_over_message_active()):
+            self.dirty_rects.mark_full()
+        if debug_text and getattr(engine, 'rapid_ai_processor', None):
+            self.dirty_rects.mark_full()  # AI debug drawings over the whole map
+
+        self.dirty_rects.diff("sprites", itertools.chain(*layers, *overlays))
+        self.dirty_rects.diff("vision_circle", circles)
+        if not self_play:
+            origin_x, origin_y = camera_origin(camera)
+            zoom = camera.zoom
+            self.dirty_rects.add(pygame.Rect(tile_edge(x, zoom) - origin_x, tile_edge(y, zoom) - origin_y,
+                                        tile_edge(x + 1, zoom) - tile_edge(x, zoom),
+                                        tile_edge(y + 1, zoom) - tile_edge(y, zoom))
+                            for x, y in vision_system.changed_fog_tiles(current_team).tolist())
+
+        # UI widgets: their previous footprint is repainted too (closed tooltip, expired notification)
+        action_bar = engine.action_bar
+        self.dirty_rects.track("action_bar", action_bar.screen_rects() if action_bar is not None else [])
+        notifications = engine.notification_system
+        self.dirty_rects.track("notifications",
+                               notifications.screen_rects(window.get_width()) if notifications is not None else [])
+        self.dirty_rects.track("debug", [blit_rect(item) for item in debug_text])
+        return self.dirty_rects.end_frame()
+
+    @staticmethod
+    def _clip_render_lists(area, layers, overlays):
+        """Render lists restricted to the blits that overlap an area (order kept)."""
+        clipped_layers = [[item for item in layer if area.colliderect(blit_rect(item))] for layer in layers]
+        clipped_overlays = [[item for item in overlay if area.colliderect(blit_rect(item))] for overlay in overlays]
+        return clipped_layers, clipped_overlays
         
     def _clear_screen(self, window):
         """Clears the screen with a background color."""
@@ -494,47 +703,44 @@ class GameRenderer:
         if grid is not None and images is not None and camera is not None:
             game_map.afficher_grille(window, grid, images, camera, self.game_engine.ally_base_pos, self.game_engine.enemy_base_pos)
             
-    def _render_fog_of_war(self, window, camera):
-        """Renders the fog of war with clouds and light fog."""
+    def _update_fog_of_war(self):
+        """Updates the visibility grids of the current team."""
         # Disable fog of war in AI vs AI mode (display only)
         if getattr(self.game_engine, 'self_play_mode', False):
             return
+        vision_system.update_visibility(self.game_engine.action_bar.current_camp)
 
-        current_team = self.game_engine.action_bar.current_camp
-
-        # Update visibility for the current team
-        vision_system.update_visibility(current_team)
+    def _render_fog_of_war(self, window, camera, areas=None):
+        """Renders the fog of war with clouds and light fog (only in areas if given)."""
+        if getattr(self.game_engine, 'self_play_mode', False) or camera is None:
+            return
 
-        # Create the fog of war surface for the current view
-        # This method is already optimized to only draw what is visible on screen.
-        fog_surface = vision_system.create_fog_surface(camera, current_team)
+        # Draw the fog of the tiles on screen: one tile-sized texture built from
+        # the visibility grids, scaled and blitted once
+        vision_system.draw_fog(window, camera, self.game_engine.action_bar.current_camp, areas)
 
-        # Display the fog surface in a single blit operation
-        if fog_surface:
-            window.blit(fog_surface, (0, 0))
 
 
+    def _vision_circle_blits(self, window, camera):
+        """Blit list of the white circle showing the vision range of the selected unit."""
+        return self._circle_blits(window, camera, self._vision_circle_state())
 
-    def _render_vision_circles(self, window, camera):
-        """Renders white circles representing the vision range of units."""
+    def _vision_circle_state(self):
+        """(x, y, vision range) of the selected unit if it belongs to the current team, else None."""
         if es is None:
-            return
-
-        # Vision circle color
-        vision_color = (255, 255, 255)  # White
-        circle_width = 2  # Circle thickness
+            return None
 
         # Only display the circle for the selected unit
         selected_unit_id = self.game_engine.selected_unit_id
         if selected_unit_id is None:
-            return
+            return None
 
         # Check that the selected unit exists and has the right components
         if (selected_unit_id not in es._entities or
             not es.has_component(selected_unit_id, PositionComponent) or
             not es.has_component(selected_unit_id, TeamComponent) or
             not es.has_component(selected_unit_id, VisionComponent)):
-            return
+            return None
 
         # Get components of the selected unit
         pos = es.component_for_entity(selected_unit_id, PositionComponent)
@@ -543,288 +749,378 @@ class GameRenderer:
 
         # Check if the unit belongs to the current team
         current_team = self.game_engine.action_bar.current_camp
-        if team.team_id == current_team:
-            # Calculate screen position
-            screen_x, screen_y = camera.world_to_screen(pos.x, pos.y)
-
-            # Calculate screen radius (vision range in pixels)
-            vision_radius_pixels = vision.range * TILE_SIZE * camera.zoom
-
-            # Only draw if the circle is visible on screen
-            if (screen_x + vision_radius_pixels >= 0 and screen_x - vision_radius_pixels <= window.get_width() and
-                screen_y + vision_radius_pixels >= 0 and screen_y - vision_radius_pixels <= window.get_height()):
-
-                # Optimization: use a pre-rendered surface for the circle if possible
-                circle_key = (int(vision_radius_pixels), vision_color, circle_width)
-                if not hasattr(self, '_vision_circle_cache'):
-                    self._vision_circle_cache = {}
-
-                if circle_key not in self._vision_circle_cache:
-                    # Create a surface for the circle
-                    size = int(vision_radius_pixels * 2) + circle_width * 2
-                    if size > 0:
-                        circle_surface = pygame.Surface((size, size), pygame.SRCALPHA)
-                        pygame.draw.circle(circle_surface, vision_color, (size//2, size//2),
-                                         int(vision_radius_pixels), circle_width)
-                        self._vision_circle_cache[circle_key] = circle_surface
-
-                # Draw the pre-rendered circle
-                if circle_key in self._vision_circle_cache:
-                    circle_surf = self._vision_circle_cache[circle_key]
-                    dest_x = int(screen_x - circle_surf.get_width()//2)
-                    dest_y = int(screen_y - circle_surf.get_height()//2)
-                    window.blit(circle_surf, (dest_x, dest_y))
+        if team.team_id != current_team:
+            return None
+        return pos.x, pos.y, vision.range
+
+    def _circle_blits(self, window, camera, circle):
+        """Blit list of the vision circle (x, y, range) from _vision_circle_state."""
+        if circle is None:
+            return []
+
+        # Vision circle color
+        vision_color = (255, 255, 255)  # White
+        circle_width = 2  # Circle thickness
+
+        x, y, vision_range = circle
+        # Calculate screen position
+        screen_x, screen_y = camera.world_to_screen(x, y)
+
+        # Calculate screen radius (vision range in pixels)
+        vision_radius_pixels = vision_range * TILE_SIZE * camera.zoom
+
+        # Only draw if the circle is visible on screen
+        if (screen_x + vision_radius_pixels >= 0 and screen_x - vision_radius_pixels <= window.get_width() and
+            screen_y + vision_radius_pixels >= 0 and screen_y - vision_radius_pixels <= window.get_height()):
+
+            # Optimization: use a pre-rendered surface for the circle if possible
+            circle_key = (int(vision_radius_pixels), vision_color, circle_width)
+            if not hasattr(self, '_vision_circle_cache'):
+                self._vision_circle_cache = {}
+
+            if circle_key not in self._vision_circle_cache:
+                # Create a surface for the circle
+                size = int(vision_radius_pixels * 2) + circle_width * 2
+                if size > 0:
+                    circle_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+                    pygame.draw.circle(circle_surface, vision_color, (size//2, size//2),
+                                     int(vision_radius_pixels), circle_width)
+                    self._vision_circle_cache[circle_key] = circle_surface
+
+            # Draw the pre-rendered circle
+            if circle_key in self._vision_circle_cache:
+                circle_surf = self._vision_circle_cache[circle_key]
+                dest_x = int(screen_x - circle_surf.get_width()//2)
+                dest_y = int(screen_y - circle_surf.get_height()//2)
+                return [(circle_surf, (dest_x, dest_y))]
+        return []
 
     def _render_sprites(self, window, camera):
-        """Manual sprite rendering to control display order."""
-        # --- START OPTIMIZATION: SPRITE BATCHING ---
-        if not hasattr(self, '_sprite_render_group'):
-            self._sprite_render_group = pygame.sprite.Group()
-        self._sprite_render_group.empty()
-        # --- END OPTIMIZATION ---
+        """Draws the sprites from render lists, one batched call per list.
+
+        Every visible sprite is queued as a (surface, dest) pair in the list of
+        its layer (terrain props, units, projectiles, effects); the layers are
+        submitted in that order with a single blits() call. The overlays
+        (shield halos, selection rings, health bars) are collected in their own
+        lists and drawn over all the sprites.
+
+        Candidates come from a spatial query of the camera's world rectangle,
+        padded by the largest sprite extent, so off-screen entities are never
+        looked at; the exact screen culling still happens per sprite.
+        """
         if camera is None:
             return
+        self._submit_sprites(window, *self._collect_sprites(window, camera))
 
+    def _collect_sprites(self, window, camera):
+        """Render lists of the frame: (layers, overlays), see _render_sprites."""
         current_team = self.game_engine.action_bar.current_camp
-
-        for ent, (pos, sprite) in es.get_components(PositionComponent, SpriteComponent):
+        self_play = getattr(self.game_engine, 'self_play_mode', False)
+        layers = tuple([] for _ in range(_SPRITE_LAYER_COUNT))
+        overlays = _SpriteOverlays([], [], [])
+        screen_rect = window.get_rect()
+        zoom = discrete_zoom(camera.zoom)
+        left, top, right, bottom = self._sprite_query_rect(camera, screen_rect, zoom)
+
+        candidates = spatial_index.query_rect(left, top, right, bottom, components=(SpriteComponent,),
+                                              alive_only=False)
+        # Entity order keeps the draw order of overlapping sprites stable from frame to frame
+        candidates.sort(key=lambda item: item[0])
+        for ent, pos in candidates:
             # In AI vs AI mode, display everything
-            if getattr(self.game_engine, 'self_play_mode', False):
-                renderable_sprite = self._render_single_sprite(window, camera, ent, pos, sprite)
-                if renderable_sprite:
-                    self._sprite_render_group.add(renderable_sprite)
+            if not self_play and not self._is_sprite_visible(ent, pos, current_team):
                 continue
+            self._queue_sprite(layers, overlays, screen_rect, camera, zoom, ent, pos,
+                               es.component_for_entity(ent, SpriteComponent))
+
+        self._queue_projectiles(layers[_LAYER_PROJECTILES], screen_rect, camera, zoom, current_team,
+                                (left, top, right, bottom))
+        return layers, overlays
+
+    def _collect_snapshot_sprites(self, window, camera, snapshot):
+        """Render lists of a FrameSnapshot, like _collect_sprites (culling on the position columns)."""
+        layers = tuple([] for _ in range(_SPRITE_LAYER_COUNT))
+        overlays = _SpriteOverlays([], [], [])
+        screen_rect = window.get_rect()
+        zoom = discrete_zoom(camera.zoom)
+        left, top, right, bottom = self._sprite_query_rect(camera, screen_rect, zoom, snapshot.extent)
+
+        in_view = (snapshot.xs >= left) & (snapshot.xs <= right) & (snapshot.ys >= top) & (snapshot.ys <= bottom)
+        for index in np.flatnonzero(in_view).tolist():
+            state = snapshot.sprites[index]
+            if (snapshot.visible is None or state.team == snapshot.team or state.always_visible
+                    or self._snapshot_tile_visible(snapshot, state.x, state.y)):
+                self._queue_sprite_state(layers, overlays, screen_rect, camera, zoom, state)
+
+        columns = snapshot.projectiles
+        in_view = ((columns["x"] >= left) & (columns["x"] <= right)
+                   & (columns["y"] >= top) & (columns["y"] <= bottom))
+        if in_view.any():
+            is_visible = None
+            if snapshot.visible is not None:
+                is_visible = lambda x, y: self._snapshot_tile_visible(snapshot, x, y)
+            self._queue_projectile_rows(layers[_LAYER_PROJECTILES], screen_rect, camera, zoom, snapshot.team,
+                                        [columns[name][in_view].tolist() for name in _PROJECTILE_COLUMNS],
+                                        is_visible)
+        return layers, overlays
+
+    @staticmethod
+    def _snapshot_tile_visible(snapshot, x, y):
+        """Whether the tile under a world position is visible in the fog of a snapshot."""
+        grid_x, grid_y = int(x / TILE_SIZE), int(y / TILE_SIZE)
+        return 0 <= grid_x < MAP_WIDTH and 0 <= grid_y < MAP_HEIGHT and bool(snapshot.visible[grid_y, grid_x])
+
+    @staticmethod
+    def _submit_sprites(window, layers, overlays):
+        """Draws the render lists: every layer in one blits() call, then each overlay list."""
+        window.blits([item for layer in layers for item in layer], doreturn=False)
+        for overlay in overlays:
+            if overlay:
+                window.blits(overlay, doreturn=False)
+
+    def _sprite_query_rect(self, camera, screen_rect, zoom, extent=None):
+        """World rectangle seen by the camera, padded so that any sprite overlapping the screen is inside
+        (extent: largest sprite side, read from the ECS if None)."""
+        if extent is None:
+            sprites = es.get_component(SpriteComponent)
+            if sprites is not self.__dict__.get('_sprite_extent_source'):
+                # Recomputed only when sprites are added or removed (esper rebuilds its component lists)
+                self._sprite_extent_source = sprites
+                self._sprite_extent = max((max(sprite.width, sprite.height) for _, sprite in sprites), default=0)
+            extent = self._sprite_extent
+        # Half diagonal of the largest (rotated) sprite at the discrete zoom, in world pixels
+        pad = extent * zoom * 0.7072 / camera.zoom + SPRITE_CULL_MARGIN
+        return (camera.x - pad, camera.y - pad,
+                camera.x + screen_rect.width / camera.zoom + pad,
+                camera.y + screen_rect.height / camera.zoom + pad)
+
+    def _is_sprite_visible(self, ent, pos, current_team):
+        """Own team and bandits are always drawn, the rest only on the tiles the team sees."""
+        team_comp = es.try_component(ent, TeamComponent)
+        if team_comp is not None:
+            if team_comp.team_id == current_team:
+                return True
+            if es.has_component(ent, Bandits):
+                # Special exception for bandits who can be outside the map
+                return True
+        # Enemy units and entities without team (like events): visible tile only
+        return vision_system.is_tile_visible(int(pos.x / TILE_SIZE), int(pos.y / TILE_SIZE), current_team)
 
-            # ...normal logic...
-            should_render = False
-            if es.has_component(ent, TeamComponent):
-                team_comp = es.component_for_entity(ent, TeamComponent)
-                if team_comp.team_id == current_team:
-                    should_render = True
-                elif es.has_component(ent, Bandits):
-                    # Special exception for bandits who can be outside the map
-                    should_render = True  # Bandits are always visible
-                else:
-                    # Check if the enemy unit is in a visible tile
-                    grid_x = int(pos.x / TILE_SIZE)
-                    grid_y = int(pos.y / TILE_SIZE)
-                    if vision_system.is_tile_visible(grid_x, grid_y, current_team):
-                        should_render = True
-            else:
-                # Entities without team (like events) - Check visibility
-                grid_x = int(pos.x / TILE_SIZE)
-                grid_y = int(pos.y / TILE_SIZE)
-                if vision_system.is_tile_visible(grid_x, grid_y, current_team):
-                    should_render = True
-            if should_render:
-                renderable_sprite = self._render_single_sprite(window, camera, ent, pos, sprite)
-                if renderable_sprite:
-                    self._sprite_render_group.add(renderable_sprite)
-
-        # --- START OPTIMIZATION: SPRITE BATCHING ---
-        # Draw all sprites of the group at once.
-        # Pygame handles rendering order if necessary, but here the order doesn't matter.
-        self._sprite_render_group.draw(window)
-        # --- END OPTIMIZATION ---
-  
-    def _render_single_sprite(self, window, camera, entity, pos, sprite):
-        """Renders a single sprite with special visual effect if invincible."""
-
-        # Optimization: discrete zoom levels to reduce recalculations
-        zoom_levels = [0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5]
-        discrete_zoom = min(zoom_levels, key=lambda x: abs(x - camera.zoom))
+    def _queue_projectiles(self, blits, screen_rect, camera, zoom, current_team, world_rect):
+        """Queues the bullets of the projectile_store in the projectile layer."""
+        slots = projectile_store.live_slots()
+        if slots.size == 0:
+            return
+        # Bullets outside the padded camera rectangle are dropped before any per-bullet work
+        left, top, right, bottom = world_rect
+        xs = projectile_store.column("x")[slots]
+        ys = projectile_store.column("y")[slots]
+        slots = slots[(xs >= left) & (xs <= right) & (ys >= top) & (ys <= bottom)]
+        if slots.size == 0:
+            return
 
-        # Determine if the sprite should be flipped
-        # Flip if reversable and direction is between 90 and 270 degrees (facing left)
-        should_flip = sprite.reversable and (90 < pos.direction < 270)
+        is_visible = None
+        if not getattr(self.game_engine, 'self_play_mode', False):
+            is_visible = lambda x, y: vision_system.is_tile_visible(int(x / TILE_SIZE), int(y / TILE_SIZE),
+                                                                   current_team)
+        self._queue_projectile_rows(blits, screen_rect, camera, zoom, current_team,
+                                    [projectile_store.column(name)[slots].tolist() for name in _PROJECTILE_COLUMNS],
+                                    is_visible)
+
+    def _queue_projectile_rows(self, blits, screen_rect, camera, zoom, current_team, columns, is_visible):
+        """Queues bullets given as _PROJECTILE_COLUMNS lists; is_visible(x, y) tells whether an
+        enemy bullet can be seen (None: everything is drawn, AI vs AI)."""
+        alpha = getattr(self, '_interpolation_alpha', 1.0)
+        max_jump_sq = INTERPOLATION_MAX_JUMP * INTERPOLATION_MAX_JUMP
+        for x, y, prev_x, prev_y, has_previous, direction, team, code, width, height in zip(*columns):
+            # Same visibility rule as the sprites: own team, or visible tile
+            if is_visible is not None and team != current_team and not is_visible(x, y):
+                continue
 
-        # Optimized cache key: use discrete zoom + rounded rotation
-        rotation_key = round(pos.direction / 15) * 15  # Round rotation to nearest 15 degrees
-        # Include flip state in the cache key
-        cache_key = (sprite.image_path, discrete_zoom, sprite.width, sprite.height, rotation_key, should_flip)
-        
-        if not hasattr(self, '_sprite_cache'):
-            self._sprite_cache = {}
-            self._cache_access_order = []
-        
-        if cache_key not in self._sprite_cache:
-            image = self._get_sprite_image(sprite)
+            sprite_id = projectile_store.sprite_id(code)
+            image = sprite_variant_cache.get(
+                sprite_id, width, height, zoom, rotation_bucket(direction), False,
+                lambda: sprite_manager.get_scaled_sprite(sprite_id, (width, height)))
             if image is None:
-                return None
-            
-            # Resize the image (use scale instead of smoothscale for performance)
-            display_width = int(sprite.width * discrete_zoom)
-            display_height = int(sprite.height * discrete_zoom)
-            if display_width > 0 and display_height > 0:
-                if abs(discrete_zoom - 1.0) < 0.01:
-                    scaled_image = image
-                else:
-                    scaled_image = pygame.transform.scale(image, (display_width, display_height))
+                continue
 
-                # Flip the scaled image if necessary before rotation
-                if should_flip:
-                    scaled_image = pygame.transform.flip(scaled_image, False, True)
+            # Interpolation between the last two ticks (see _interpolated_position)
+            if has_previous and alpha < 1.0:
+                dx = x - prev_x
+                dy = y - prev_y
+                if dx * dx + dy * dy <= max_jump_sq:
+                    x = prev_x + dx * alpha
+                    y = prev_y + dy * alpha
+            screen_x, screen_y = camera.world_to_screen(x, y)
+            rect = image.get_rect(center=(int(screen_x), int(screen_y)))
+            if screen_rect.colliderect(rect):
+                blits.append((image, rect))
+
+    def _queue_sprite(self, layers, overlays, screen_rect, camera, zoom, entity, pos, sprite):
+        """Queues a sprite in its layer and its overlays (blinking if invincible)."""
+        self._queue_sprite_state(layers, overlays, screen_rect, camera, zoom, self._sprite_state(entity, pos, sprite))
+
+    def _sprite_state(self, entity, pos, sprite):
+        """Everything the renderer reads from the ECS to draw an entity (see SpriteState)."""
+        components = component_index.entity_mask(entity)
+        team = es.try_component(entity, TeamComponent)
+        # Visual effects based on components: Zasper invincibility, Barhamus shield
+        invincible = bool(components & _SCOUT_BIT) and bool(
+            getattr(es.component_for_entity(entity, SpeScout), 'is_active', False))
+        shielded = bool(components & _MARAUDEUR_BIT) and bool(
+            getattr(es.component_for_entity(entity, SpeMaraudeur), 'is_active', False))
+        health_ratio = -1.0
+        if components & _HEALTH_BIT:
+            health = es.component_for_entity(entity, HealthComponent)
+            # No bar at full health, nor when maxHealth is zero (division by zero)
+            if 0 < health.maxHealth and health.currentHealth < health.maxHealth:
+                health_ratio = max(0.0, min(1.0, health.currentHealth / health.maxHealth))
+        return SpriteState(
+            entity=entity,
+            x=pos.x,
+            y=pos.y,
+            previous=self.game_engine.previous_positions.get(entity),
+            direction=pos.direction,
+            image_key=sprite.image_path,
+            width=sprite.width,
+            height=sprite.height,
+            reversable=sprite.reversable,
+            image=sprite.surface if sprite.surface is not None else sprite.image,
+            layer=_sprite_layer(components),
+            team=team.team_id if team is not None else None,
+            # Special exception for bandits who can be outside the map
+            always_visible=team is not None and es.has_component(entity, Bandits),
+            invincible=invincible,
+            shielded=shielded,
+            selected=bool(components & _SELECTED_BIT),
+            health=health_ratio,
+        )
 
-                # Apply rounded rotation and cache
-                if rotation_key != 0:
-                    final_image = pygame.transform.rotate(scaled_image, -rotation_key)
-                else:
-                    final_image = scaled_image
-                
-                self._sprite_cache[cache_key] = final_image
-                self._cache_access_order.append(cache_key)
-            else:
-                return None
-        else:
-            # Mark as recently used for LRU
-            if cache_key in self._cache_access_order:
-                self._cache_access_order.remove(cache_key)
-            self._cache_access_order.append(cache_key)
-            
-        final_image = self._sprite_cache[cache_key]
+    def _queue_sprite_state(self, layers, overlays, screen_rect, camera, zoom, state):
+        """Queues a SpriteState in its layer and its overlays (blinking if invincible)."""
+
+        # Determine if the sprite should be flipped
+        # Flip if reversable and direction is between 90 and 270 degrees (facing left)
+        should_flip = state.reversable and (90 < state.direction < 270)
+
+        # Scaled/flipped/rotated image from the LRU variant cache (discrete zoom, 24 rotation buckets)
+        final_image = sprite_variant_cache.get(
+            state.image_key, state.width, state.height, zoom,
+            rotation_bucket(state.direction), should_flip,
+            lambda: state.image if state.image is not None else self._load_sprite_image(state.image_key),
+            reversable=state.reversable)
+        if final_image is None:
+            return
         display_width = final_image.get_width()
         display_height = final_image.get_height()
 
-        screen_x, screen_y = camera.world_to_screen(pos.x, pos.y)
-        
-        # --- START OPTIMIZATION: SPRITE BATCHING ---
-        # Create a pygame.sprite.Sprite object for grouped rendering
-        render_sprite = pygame.sprite.Sprite()
-        render_sprite.image = final_image
-        render_sprite.rect = final_image.get_rect(center=(int(screen_x), int(screen_y)))
-        # --- END OPTIMIZATION ---
+        world_x, world_y = self._interpolate(state.x, state.y, state.previous)
+        screen_x, screen_y = camera.world_to_screen(world_x, world_y)
+        rect = final_image.get_rect(center=(int(screen_x), int(screen_y)))
 
         # Check if the sprite is visible on screen (culling optimization)
-        if not window.get_rect().colliderect(render_sprite.rect):
-            return None
-
-        # Position the sprite (centered on the position)
-        # This part is now handled by render_sprite.rect
-        # --- START OPTIMIZATION: INDIVIDUAL BLIT REMOVAL ---
-        """
-        dest_x = int(screen_x - display_width // 2)
-        dest_y = int(screen_y - display_height // 2)
-
-        # Render the sprite
-        window.blit(final_image, (dest_x, dest_y))
+        if not screen_rect.colliderect(rect):
+            return
 
-        # Cache management: limit size to avoid memory overload
-        """
-        if len(self._sprite_cache) > 150:  # Increase limit
-            # Remove least recently used entries
-            to_remove = self._cache_access_order[:30]
-            for key in to_remove:
-                if key in self._sprite_cache:
-                    del self._sprite_cache[key]
-                if key in self._cache_access_order:
-                    self._cache_access_order.remove(key)
-
-        # --- END OPTIMIZATION ---
-
-        # Calculate the rect before any visual effect
-        # We now use render_sprite.rect
-        rect = render_sprite.rect
-
-        # Visual effects based on components
-        if es.has_component(entity, SpeScout):
-            spe = es.component_for_entity(entity, SpeScout)
-            if getattr(spe, 'is_active', False):
-                # Visual invincibility effect for Zasper: blinking
-                if (pygame.time.get_ticks() // 100) % 3 != 0:
-                    temp_img = final_image.copy()
-                    temp_img.set_alpha(128)  # semi-transparent
-                    render_sprite.image = temp_img  # Replace the sprite image
-                # Otherwise, don't draw anything for the blinking effect
-                else:
-                    return None  # Don't add this sprite to the rendering group
-        else:
-            window.blit(final_image, rect.topleft)
+        if state.invincible:
+            # Visual invincibility effect for Zasper: blinking
+            if (pygame.time.get_ticks() // 100) % 3 == 0:
+                return  # Don't draw anything for the blinking effect
+            final_image = final_image.copy()
+            final_image.set_alpha(128)  # semi-transparent
+        layers[state.layer].append((final_image, rect))
 
         # Visual effect: blue halo for Barhamus shield
-        if es.has_component(entity, SpeMaraudeur):
-            shield = es.component_for_entity(entity, SpeMaraudeur)
-            if getattr(shield, 'is_active', False):
-                # Semi-transparent blue halo
-                halo_radius = max(display_width, display_height) // 2 + 10
-                halo_surface = pygame.Surface(
-                    (halo_radius*2, halo_radius*2), pygame.SRCALPHA)
-                pygame.draw.circle(
-                    halo_surface, (80, 180, 255, 90), (halo_radius, halo_radius), halo_radius)
-                window.blit(halo_surface, (screen_x - halo_radius, screen_y -
-                                           halo_radius), special_flags=pygame.BLEND_RGBA_ADD)
-
-        # Draw selection indicator if necessary
-        if es.has_component(entity, PlayerSelectedComponent):
-            self._draw_selection_highlight(window, screen_x, screen_y, display_width, display_height)
-
-        # Draw health bar if necessary
-        if es.has_component(entity, HealthComponent):
-            health = es.component_for_entity(entity, HealthComponent)
-            if health.currentHealth < health.maxHealth:
-                self._draw_health_bar(window, screen_x, screen_y, health, display_width, display_height, entity)
-        
-        return render_sprite
+        if state.shielded:
+            # Semi-transparent blue halo
+            halo_radius = max(display_width, display_height) // 2 + 10
+            overlays.halos.append((self._halo_surface(halo_radius),
+                                   (int(screen_x - halo_radius), int(screen_y - halo_radius)),
+                                   None, pygame.BLEND_RGBA_ADD))
+
+        # Selection indicator if necessary
+        if state.selected:
+            self._queue_selection_highlight(overlays.rings, screen_x, screen_y, display_width, display_height)
+
+        # Health bar if necessary
+        if state.health >= 0:
+            self._queue_health_bar(overlays.health_bars, screen_x, screen_y, state.health,
+                                   display_width, display_height)
+
+    def _halo_surface(self, radius):
+        """Pre-rendered shield halo of a given radius."""
+        cache = self.__dict__.setdefault('_halo_cache', {})
+        surface = cache.get(radius)
+        if surface is None:
+            surface = cache[radius] = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surface, (80, 180, 255, 90), (radius, radius), radius)
+        return surface
                 
-    def _get_sprite_image(self, sprite):
-        """Gets the image of a sprite based on available data."""
-        if sprite.surface is not None:
-            return sprite.surface
-        elif sprite.image is not None:
-            return sprite.image
-        elif sprite.image_path:
+    def _interpolated_position(self, entity, pos):
+        """World position of an entity interpolated between the last two simulation ticks."""
+        return self._interpolate(pos.x, pos.y, self.game_engine.previous_positions.get(entity))
+
+    def _interpolate(self, x, y, previous):
+        """Position between previous (last tick but one, or None) and (x, y), at _interpolation_alpha."""
+        alpha = getattr(self, '_interpolation_alpha', 1.0)
+        if previous is None or alpha >= 1.0:
+            return x, y
+
+        prev_x, prev_y = previous
+        dx = x - prev_x
+        dy = y - prev_y
+        # Teleport / respawn: draw the entity where it is, without sliding across the map
+        if dx * dx + dy * dy > INTERPOLATION_MAX_JUMP * INTERPOLATION_MAX_JUMP:
+            return x, y
+        return prev_x + dx * alpha, prev_y + dy * alpha
+
+    @staticmethod
+    def _load_sprite_image(image_path):
+        """Loads a sprite image from its path (sprites without surface nor image)."""
+        if image_path:
             try:
-                img = pygame.image.load(sprite.image_path).convert_alpha()
+                img = pygame.image.load(image_path).convert_alpha()
                 return img
             except Exception as e:
-                print(f"[DEBUG] Failed to load image from {sprite.image_path}: {e}")
+                print(f"[DEBUG] Failed to load image from {image_path}: {e}")
                 return None
         else:
             print(f"[DEBUG] No image data available for sprite")
             return None
 
-    def _draw_selection_highlight(self, window, screen_x, screen_y, display_width, display_height):
-        """Draws a yellow halo around the unit controlled by the player."""
+    def _queue_selection_highlight(self, rings, screen_x, screen_y, display_width, display_height):
+        """Queues a yellow halo around the unit controlled by the player."""
         radius = max(display_width, display_height) // 2 + 6
-        center = (int(screen_x), int(screen_y))
 
         if radius <= 0:
             return
 
-        pygame.draw.circle(window, SELECTION_COLOR, center, radius, width=3)
+        cache = self.__dict__.setdefault('_selection_ring_cache', {})
+        ring = cache.get(radius)
+        if ring is None:
+            ring = cache[radius] = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(ring, SELECTION_COLOR, (radius, radius), radius, width=3)
+        rings.append((ring, (int(screen_x) - radius, int(screen_y) - radius)))
             
-    def _draw_health_bar(self, screen, x, y, health, sprite_width, sprite_height, entity_id):
-        """Draws a health bar for an entity."""
+    def _queue_health_bar(self, bars, x, y, health_ratio, sprite_width, sprite_height):
+        """Queues the health bar of an entity (background, fill and border surfaces)."""
         # Health bar configuration
         bar_width = sprite_width
         bar_height = 8  # Slightly thicker for visibility
-
-        # Calculate offset taking into account the sprite rotation
-        direction_rad = -pygame.math.Vector2(0, -1).angle_to(pygame.math.Vector2(1, 0).rotate(es.component_for_entity(entity_id, PositionComponent).direction)) * (3.14159 / 180)
         offset_y_base = sprite_height // 2 + 12
 
-        # offset_x = offset_y_base * -np.sin(direction_rad)
-        # offset_y = offset_y_base * -np.cos(direction_rad)
-
         # Bar position (centered above the entity)
-        # bar_x, bar_y = x - bar_width // 2 + offset_x, y - offset_y
-        bar_x, bar_y = x - bar_width // 2, y - offset_y_base
+        bar_x, bar_y = int(x - bar_width // 2), int(y - offset_y_base)
 
-        # Check that maxHealth is not zero to avoid division by zero
-        if health.maxHealth <= 0:
+        if bar_width <= 0:
             return
 
-        # Calculate health percentage
-        health_ratio = max(0, min(1, health.currentHealth / health.maxHealth))
-
-        # Draw the bar background (dark red)
-        background_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(screen, (100, 0, 0), background_rect)
-
-        # Draw the health bar (color according to percentage)
-        if health_ratio > 0:
-            health_bar_width = int(bar_width * health_ratio)
-            health_rect = pygame.Rect(bar_x, bar_y, health_bar_width, bar_height)
+        # Bar background (dark red)
+        bars.append((_get_filled(bar_width, bar_height, (100, 0, 0)), (bar_x, bar_y)))
 
+        # Health bar (color according to percentage)
+        health_bar_width = int(bar_width * health_ratio)
+        if health_bar_width > 0:
             # Color changes according to remaining health
             if health_ratio > 0.6:
                 color = (0, 200, 0)  # Green
@@ -832,11 +1128,15 @@ class GameRenderer:
                 color = (255, 165, 0)  # Orange
             else:
                 color = (255, 0, 0)  # Red
-
-            pygame.draw.rect(screen, color, health_rect)
+            bars.append((_get_filled(health_bar_width, bar_height, color), (bar_x, bar_y)))
 
         # Black border around the bar
-        pygame.draw.rect(screen, (0, 0, 0), background_rect, 1)
+        cache = self.__dict__.setdefault('_health_bar_border_cache', {})
+        border = cache.get(bar_width)
+        if border is None:
+            border = cache[bar_width] = pygame.Surface((bar_width, bar_height), pygame.SRCALPHA)
+            pygame.draw.rect(border, (0, 0, 0), border.get_rect(), 1)
+        bars.append((border, (bar_x, bar_y)))
         
     def _render_ui(self, window, action_bar):
         """Renders the user interface."""
@@ -847,27 +1147,43 @@ class GameRenderer:
         if self.game_engine.notification_system is not None:
             self.game_engine.notification_system.render(window)
 
-    def _render_debug_info(self, window, camera, dt, game_engine):
-        """Renders debug information."""
+    def _debug_text(self, window, camera, dt):
+        """Rendered debug lines as a blit list (drawn by _render_debug_info)."""
         if camera is None:
-            return
-            
+            return []
+
         font = _get_font(None, 36)
+        latency = path_scheduler.latency_percentiles((50, 99))
         debug_info = [
             t("debug.camera_position", x=camera.x, y=camera.y),
             t("debug.zoom_level", zoom=camera.zoom),
             t("debug.tile_size", size=TILE_SIZE),
             t("debug.resolution", width=window.get_width(), height=window.get_height()),
-            t("debug.fps", fps=1/dt if dt > 0 else 0)
+            t("debug.fps", fps=1/dt if dt > 0 else 0),
+            t("debug.entity_commands", **entity_commands.last_counts),
+            t("debug.sprite_cache", hit_rate=sprite_variant_cache.hit_rate * 100, count=len(sprite_variant_cache),
+              size=sprite_variant_cache.bytes_used / (1024 * 1024)),
+            t("debug.dirty_rects", fraction=self.dirty_rects.dirty_fraction * 100,
+              partial=self.dirty_rects.partial_frames, full=self.dirty_rects.full_frames),
+            t("debug.text_cache", hit_rate=text_cache.hit_rate * 100, count=len(text_cache),
+              size=text_cache.bytes_used / (1024 * 1024)),
+            t("debug.pathfinding", time=navigation.last_frame_time * 1000, requests=navigation.last_frame_requests,
+              hit_rate=navigation.hit_rate * 100),
+            t("debug.path_scheduler", pending=path_scheduler.pending, p50=latency[50], p99=latency[99]),
         ]
 
         ai_debug_line = self._build_ai_state_line()
         if ai_debug_line:
             debug_info.append(ai_debug_line)
         
-        for i, info in enumerate(debug_info):
-            text_surface = font.render(info, True, (255, 255, 255))
-            window.blit(text_surface, (10, 10 + i * 30))
+        return [(text_cache.render(font, info, (255, 255, 255)), (10, 10 + i * 30)) for i, info in enumerate(debug_info)]
+
+    def _render_debug_info(self, window, camera, debug_text, game_engine):
+        """Renders debug information (debug_text: rendered lines, see _debug_text)."""
+        if camera is None:
+            return
+
+        window.blits(debug_text, doreturn=False)
         
         # Display unwalkable zones for AI in red
         if hasattr(game_engine, 'rapid_ai_processor') and game_engine.rapid_ai_processor:
@@ -954,9 +1270,9 @@ class GameRenderer:
 
         for i, line in enumerate(lines):
             if i == 0:  # First line (title) larger
-                text_surface = font_large.render(line, True, (255, 255, 255))
+                text_surface = text_cache.render(font_large, line, (255, 255, 255))
             else:  # Other lines smaller
-                text_surface = font_medium.render(line, True, (255, 255, 255))
+                text_surface = text_cache.render(font_medium, line, (255, 255, 255))
 
             # Center horizontally
             text_rect = text_surface.get_rect()
@@ -968,7 +1284,7 @@ class GameRenderer:
         # Add instruction to return to menu
         instruction_font = _get_font(None, 36)
         instruction_text = "Retour au menu principal dans {:.0f}s...".format(self.game_engine.game_over_timer)
-        instruction_surface = instruction_font.render(instruction_text, True, (200, 200, 200))
+        instruction_surface = text_cache.render(instruction_font, instruction_text, (200, 200, 200))
         instruction_rect = instruction_surface.get_rect()
         instruction_rect.centerx = screen_center_x
         instruction_rect.y = start_y + len(lines) * 80 + 40
@@ -977,7 +1293,7 @@ class GameRenderer:
 class GameEngine:
     """Main class managing all game logic."""
 
-    def __init__(self, window=None, bg_original=None, select_sound=None, audio_manager=None, self_play_mode=False):
+    def __init__(self, window=None, bg_original=None, select_sound=None, audio_manager=None, self_play_mode=False, headless=False):
         """Initializes the game engine.
 
         Args:
@@ -986,11 +1302,14 @@ class GameEngine:
             select_sound: Selection sound for modals (optional)
             audio_manager: AudioManager instance for sound effects (optional)
             self_play_mode: Activates AI vs AI mode (optional)
+            headless: Runs the simulation only, without window, rendering,
+                audio, tutorials or notifications (see simulate())
         """
-        self.window = window
+        self.headless = headless
+        self.window = None if headless else window
         self.bg_original = bg_original
         self.select_sound = select_sound
-        self.audio_manager = audio_manager
+        self.audio_manager = None if headless else audio_manager
         self.running = True
         self.created_local_window = False
         self.show_debug = False
@@ -1012,8 +1331,8 @@ class GameEngine:
         # AI manager for all Maraudeurs
         self.maraudeur_ais = {}  # entity_id -> MaraudeurAI
         self.player = None
-        self.notification_system = get_notification_system()
-        self.tutorial_manager = TutorialManager(config_manager=config_manager)
+        self.notification_system = None if headless else get_notification_system()
+        self.tutorial_manager = None if headless else TutorialManager(config_manager=config_manager)
         self.previous_base_known = {Team.ALLY: False, Team.ENEMY: False}
         self.camera_tutorial_triggered = False
         self.initial_camera_state = None
@@ -1053,21 +1372,24 @@ class GameEngine:
 
         # Event handler and rendering manager
         self.event_handler = EventHandler(self)
-        self.renderer = GameRenderer(self)
-        self.exit_modal = InGameMenuModal()
-        self.victory_modal = VictoryModal()
+        self.renderer = None if headless else GameRenderer(self)
+        self.exit_modal = None if headless else InGameMenuModal()
+        self.victory_modal = None if headless else VictoryModal()
 
         # Timer for chest spawning
         self.chest_spawn_timer = 0.0
 
+        # Positions before the last simulation tick (render interpolation)
+        self.previous_positions = {}
+
         # Game over state
         self.game_over = False
         self.winning_team = None
         self.game_over_message = ""
         self.game_over_timer = 0.0
 
-        # AI vs AI mode
-        self.self_play_mode = self_play_mode
+        # AI vs AI mode (a headless match has no player, so it is always AI vs AI)
+        self.self_play_mode = self_play_mode or headless
 
     def enable_self_play(self):
         """Activates AI vs AI mode and disables player control."""
@@ -1106,6 +1428,10 @@ class GameEngine:
 
     def initialize(self):
         """Initializes all game components."""
+        if self.headless:
+            self._initialize_headless()
+            return
+
         print(t("system.game_launched"))
 
         # SDL optimizations to improve performance
@@ -1205,17 +1531,47 @@ class GameEngine:
         except Exception:
             pass
         
+    def _initialize_headless(self):
+        """Initializes the simulation only (no window, audio, UI or tutorials).
+
+        A dummy SDL video driver is still initialized because some systems
+        post pygame events (island resources, exploration, ...).
+        """
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        if not pygame.display.get_init():
+            pygame.display.init()
+
+        # Nothing is ever drawn: skip image loading, collisions use the declared sprite sizes
+        self._image_loading_before_headless = sprite_manager.image_loading_enabled
+        sprite_manager.image_loading_enabled = False
+
+        self._initialize_game_map()
+        self._initialize_ecs()
+
+        # Exploration events only feed tutorials, keep them off for the whole run
+        vision_system._suppress_explore_events = True
+        self._create_initial_entities()
+        vision_system.reset()
+
     def _initialize_game_map(self):
         """Initialise la carte du jeu."""
-        if self.window is None:
-            raise RuntimeError("La fenêtre doit être initialisée avant la carte")
-        
-        game_state = game_map.init_game_map(self.window.get_width(), self.window.get_height())
-        self.grid = game_state["grid"]
-        self.images = game_state["images"]
-        self.camera = game_state["camera"]
-        self.ally_base_pos = game_state["ally_base_pos"]
-        self.enemy_base_pos = game_state["enemy_base_pos"]
+        if self.headless:
+            # Pas d'affichage : ni images de tuiles ni caméra, seulement la grille
+            self.grid = game_map.creer_grille()
+            self.images = None
+            self.camera = None
+            self.ally_base_pos, self.enemy_base_pos = game_map.placer_elements(self.grid)
+        else:
+            if self.window is None:
+                raise RuntimeError("La fenêtre doit être initialisée avant la carte")
+
+            game_state = game_map.init_game_map(self.window.get_width(), self.window.get_height())
+            self.grid = game_state["grid"]
+            self.images = game_state["images"]
+            self.camera = game_state["camera"]
+            self.ally_base_pos = game_state["ally_base_pos"]
+            self.enemy_base_pos = game_state["enemy_base_pos"]
         
         # Initialize flying chest processor
         if self.flying_chest_processor is not None and self.grid is not None:
@@ -1247,6 +1603,10 @@ class GameEngine:
 
         # Reset global managers dependent on the world
         BaseComponent.reset()
+        projectile_store.clear()
+        entity_commands.clear()
+        path_scheduler.clear()
+        navigation.clear()
 
         # Create the ECS world
         es._world = es
@@ -2185,6 +2545,15 @@ class GameEngine:
         # Variables for adaptive optimization
         self._frame_times = []
         self._adaptive_quality = 1.0  # 1.0 = maximum quality, 0.5 = reduced quality
+
+        # Fixed-step simulation: the game runs at sim_tick_rate whatever the render frame rate
+        sim_dt = self._get_sim_step()
+        if config_manager.get("pipelined_simulation", False):
+            self._run_pipelined(sim_dt)
+            self._cleanup()
+            return
+
+        accumulator = 0.0
         
         while self.running:
             frame_start = pygame.time.get_ticks()
@@ -2192,48 +2561,173 @@ class GameEngine:
             dt = self.clock.tick(max_fps) / 1000.0
             
             self.event_handler.handle_events()
-            self._update_game(dt)
-            self._render_game(dt)
-            
-            # Adaptive FPS calculation
-            frame_time = pygame.time.get_ticks() - frame_start
-            self._frame_times.append(frame_time)
-            if len(self._frame_times) > 10:  # Keep the last 10 frames
-                self._frame_times.pop(0)
-
-            avg_frame_time = sum(self._frame_times) / len(self._frame_times)
-            target_frame_time = 1000 / 60  # 16.67ms for 60 FPS
-
-            # Adjust adaptive quality
-            performance_mode = config_manager.get("performance_mode", "auto")
-            if performance_mode == "auto":
-                if avg_frame_time > target_frame_time * 1.2:  # If we exceed 20% of target time
-                    self._adaptive_quality = max(0.3, self._adaptive_quality * 0.95)  # Reduce progressively
-                elif avg_frame_time < target_frame_time * 0.8:  # If we're well below
-                    self._adaptive_quality = min(1.0, self._adaptive_quality * 1.05)  # Increase progressively
-            elif performance_mode == "high":
-                self._adaptive_quality = 1.0
-            elif performance_mode == "medium":
-                self._adaptive_quality = 0.7
-            elif performance_mode == "low":
-                self._adaptive_quality = 0.4
+            self._update_frame(dt)
+
+            # Clamp long frames (window drag, breakpoint...) to avoid a catch-up spiral
+            accumulator += min(dt, MAX_SIM_FRAME_TIME)
+            while accumulator >= sim_dt and self.running:
+                self._snapshot_positions()
+                self._update_game(sim_dt)
+                accumulator -= sim_dt
+
+            self._render_game(dt, accumulator / sim_dt)
+            self._update_adaptive_quality(frame_start)
         
         self._cleanup()
-        
 
-        
-    def _update_game(self, dt):
-        """Update the game logic."""
-        if self.exit_modal.is_active():
-            return
+    def _run_pipelined(self, sim_dt):
+        """Main loop of the pipelined_simulation mode (see src/managers/frame_snapshot.py).
 
-        # Handle the game over timer
+        Each frame draws the world of the last snapshot while the worker thread
+        runs the current batch of ticks, waits for the batch, then handles
+        the interface and the inputs (the only work reading the live ECS)
+        before starting the next batch and flipping the display.
+        """
+        frame_buffer = SnapshotBuffer()
+        worker = SimulationWorker()
+        self._sim_tick = 0
+        frame_buffer.publish(self.renderer.build_snapshot(self._sim_tick))
+        shown = frame_buffer.front
+        accumulator = 0.0
+        alpha = 1.0
+        try:
+            while self.running:
+                frame_start = pygame.time.get_ticks()
+                max_fps = int(config_manager.get("max_fps", 60))
+                dt = self.clock.tick(max_fps) / 1000.0
+
+                # World of the previous batch, drawn while the current batch computes
+                self.renderer.render_world_snapshot(shown, self._adaptive_quality, alpha)
+                worker.wait()
+
+                # The ECS is quiescent until the next batch starts
+                self.renderer.render_overlays(dt)
+                self.event_handler.handle_events()
+                self._update_frame(dt)
+
+                # Clamp long frames (window drag, breakpoint...) to avoid a catch-up spiral
+                accumulator += min(dt, MAX_SIM_FRAME_TIME)
+                ticks = int(accumulator // sim_dt)
+                accumulator -= ticks * sim_dt
+                alpha = accumulator / sim_dt
+                shown = frame_buffer.front
+                if self.running:
+                    worker.start(lambda: self._simulate_batch(ticks, sim_dt, frame_buffer))
+
+                self.renderer.dirty_rects.present(None)
+                self._update_adaptive_quality(frame_start)
+        finally:
+            worker.stop()
+
+    def _simulate_batch(self, ticks, sim_dt, frame_buffer):
+        """Job of the simulation thread: a batch of fixed ticks, then the snapshot of the result."""
+        for _ in range(ticks):
+            if not self.running:
+                return
+            self._snapshot_positions()
+            self._update_game(sim_dt)
+            self._sim_tick += 1
+        frame_buffer.publish(self.renderer.build_snapshot(self._sim_tick))
+
+    def _update_adaptive_quality(self, frame_start):
+        """Adapts the render quality to the duration of the last frames (performance_mode option)."""
+        # Adaptive FPS calculation
+        frame_time = pygame.time.get_ticks() - frame_start
+        self._frame_times.append(frame_time)
+        if len(self._frame_times) > 10:  # Keep the last 10 frames
+            self._frame_times.pop(0)
+
+        avg_frame_time = sum(self._frame_times) / len(self._frame_times)
+        target_frame_time = 1000 / 60  # 16.67ms for 60 FPS
+
+        # Adjust adaptive quality
+        performance_mode = config_manager.get("performance_mode", "auto")
+        if performance_mode == "auto":
+            if avg_frame_time > target_frame_time * 1.2:  # If we exceed 20% of target time
+                self._adaptive_quality = max(0.3, self._adaptive_quality * 0.95)  # Reduce progressively
+            elif avg_frame_time < target_frame_time * 0.8:  # If we're well below
+                self._adaptive_quality = min(1.0, self._adaptive_quality * 1.05)  # Increase progressively
+        elif performance_mode == "high":
+            self._adaptive_quality = 1.0
+        elif performance_mode == "medium":
+            self._adaptive_quality = 0.7
+        elif performance_mode == "low":
+            self._adaptive_quality = 0.4
+
+    def simulate(self, ticks: int, seed: Optional[int] = None, dt: float = 1.0 / 60.0) -> Dict[str, object]:
+        """Run the match without display, as fast as the CPU allows.
+
+        Each tick calls _update_game() with a constant dt; there is no clock
+        throttling, no event handling and no rendering. Intended for headless
+        engines (AI vs AI balancing and training runs).
+
+        Args:
+            ticks: Maximum number of simulation ticks to run.
+            seed: Seed for map generation and gameplay randomness (optional).
+            dt: Simulated duration of one tick, in seconds.
+
+        Returns:
+            dict: Summary of the run (ticks, simulated/wall time, speedup, winner).
+        """
+        if not self.headless:
+            raise RuntimeError("simulate() requires a GameEngine created with headless=True")
+
+        if seed is not None:
+            random.seed(seed)
+            np.random.seed(seed)
+            self.flying_chest_processor.configure_seed(seed)
+            self.island_resource_manager.configure_seed(seed)
+
+        # The map is generated here so that it follows the seed
+        if self.grid is None:
+            self.initialize()
+
+        start = time.perf_counter()
+        ticks_done = 0
+        try:
+            while ticks_done < ticks and self.running and not self.game_over:
+                path_scheduler.begin_frame()  # One tick per frame: each gets the full path budget
+                self._update_game(dt)
+                # Nobody consumes the queue: drop events posted by gameplay systems
+                pygame.event.clear()
+                ticks_done += 1
+        finally:
+            self._cleanup()
+        wall_time = time.perf_counter() - start
+
+        sim_time = ticks_done * dt
+        return {
+            "ticks": ticks_done,
+            "sim_time": sim_time,
+            "wall_time": wall_time,
+            "speedup": sim_time / wall_time if wall_time > 0 else float("inf"),
+            "game_over": self.game_over,
+            "winning_team": self.winning_team,
+            "stats": getattr(self, 'game_over_stats', []),
+        }
+
+    def _get_sim_step(self) -> float:
+        """Duration of one simulation tick, in seconds (from the sim_tick_rate option)."""
+        try:
+            tick_rate = int(config_manager.get("sim_tick_rate", DEFAULT_SIM_TICK_RATE))
+        except (TypeError, ValueError):
+            tick_rate = DEFAULT_SIM_TICK_RATE
+        if tick_rate <= 0:
+            tick_rate = DEFAULT_SIM_TICK_RATE
+        return 1.0 / tick_rate
+
+    def _snapshot_positions(self):
+        """Keep the positions of the current tick before the next one (render interpolation)."""
+        self.previous_positions = {ent: (pos.x, pos.y) for ent, pos in es.get_component(PositionComponent)}
+        projectile_store.snapshot_positions()
+
+    def _update_frame(self, dt):
+        """Update what follows the render frame rate (camera, inputs, UI), once per frame."""
+        navigation.begin_frame()  # Path requests of the ticks that follow count for this frame
+        path_scheduler.begin_frame((self.selected_unit_id,), self._camera_view_rect())
+        if self.exit_modal is not None and self.exit_modal.is_active():
+            return
         if self.game_over:
-            if self.game_over_timer > 0:
-                self.game_over_timer -= dt
-                if self.game_over_timer <= 0:
-                    # Return to main menu
-                    self._quit_game()
             return
 
         # Update the camera
@@ -2265,6 +2759,33 @@ class GameEngine:
         if self.notification_system is not None:
             self.notification_system.update(dt)
 
+    def _camera_view_rect(self):
+        """World rectangle (left, top, right, bottom) shown by the camera, None without camera."""
+        if self.camera is None:
+            return None
+        return (self.camera.x, self.camera.y, self.camera.x + self.camera.screen_width / self.camera.zoom,
+                self.camera.y + self.camera.screen_height / self.camera.zoom)
+
+    def _update_game(self, dt):
+        """Update the game logic (one fixed simulation tick of dt seconds)."""
+        if self.exit_modal is not None and self.exit_modal.is_active():
+            return
+
+        # Handle the game over timer
+        if self.game_over:
+            if self.game_over_timer > 0:
+                self.game_over_timer -= dt
+                if self.game_over_timer <= 0:
+                    # Return to main menu
+                    self._quit_game()
+            return
+
+        # Shared spatial index: positions as of the start of this tick
+        spatial_index.refresh()
+
+        # Path requests left over by the previous ticks, by priority, before the AIs queue new ones
+        path_scheduler.run(minimum=1)
+
         # Process special abilities first (with dt)
         if self.capacities_processor is not None:
             self.capacities_processor.process(dt)
@@ -2275,7 +2796,7 @@ class GameEngine:
 
         # Process events first (with dt)
         if self.architect_ai_processor is not None:
-            self.architect_ai_processor.process(self.grid)
+            self.architect_ai_processor.process(self.grid, dt=dt)
 
         if self.lifetime_processor is not None:
             self.lifetime_processor.process(dt)
@@ -2321,14 +2842,17 @@ class GameEngine:
 
         # Storms are managed by storm_processor (ECS processor)
 
+        # Sync point: apply the entity creations/deletions recorded during this tick
+        entity_commands.flush()
+
         # Synchronize displayed information with current state
         self._refresh_selected_unit_info()
 
         # Flying chests are managed by flying_chest_processor.process(dt) above
         
-    def _render_game(self, dt):
-        """Perform game rendering."""
-        self.renderer.render_frame(dt, self._adaptive_quality)
+    def _render_game(self, dt, alpha=1.0):
+        """Perform game rendering (alpha: interpolation between the last two ticks)."""
+        self.renderer.render_frame(dt, self._adaptive_quality, alpha)
 
     def _quit_game(self):
         """Quit the game cleanly."""
@@ -2336,6 +2860,10 @@ class GameEngine:
 
     def _cleanup(self):
         """Clean up resources before quitting."""
+        if self.headless:
+            sprite_manager.image_loading_enabled = getattr(self, '_image_loading_before_headless', True)
+            vision_system._suppress_explore_events = False
+            return
         if self.created_local_window:
             try:
                 dm = get_display_manager()
@@ -2446,6 +2974,12 @@ class GameEngine:
         except Exception:
             stats_lines = []
 
+        if self.headless:
+            # No modal to display: the match result is read by simulate()
+            self.game_over_stats = stats_lines
+            self.running = False
+            return
+
         # Configure and open the end-of-game modal
         if getattr(self, 'victory_modal', None) is None:
             self.victory_modal = VictoryModal()
@@ -2630,6 +3164,18 @@ class GameEngine:
         elif not hasattr(self, '_ai_stats_timer'):
             self._ai_stats_timer = 10.0
 
+def run_headless(ticks: int, seed: Optional[int] = None, dt: float = 1.0 / 60.0) -> Dict[str, object]:
+    """Entry point for a display-free AI vs AI match (see GameEngine.simulate).
+
+    Args:
+        ticks: Maximum number of simulation ticks to run
+        seed: Seed for map generation and gameplay randomness (optional)
+        dt: Simulated duration of one tick, in seconds
+    """
+    engine = GameEngine(self_play_mode=True, headless=True)
+    return engine.simulate(ticks, seed=seed, dt=dt)
+
+
 def game(window=None, bg_original=None, select_sound=None, audio_manager=None, mode="player_vs_ai"):
     """Main entry point for the game (compatibility with existing API).
 
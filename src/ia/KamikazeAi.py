@@ -10,7 +10,6 @@ Remarque : ce file assume l'existence des components/imports utilisés
 in ton projet (PositionComponent, VelocityComponent, etc.).
 """
 
-import heapq
 from typing import List, Tuple, Optional
 import esper
 from src.factory.unitType import UnitType
@@ -28,6 +27,10 @@ from src.components.events.flyChestComponent import FlyingChestComponent
 from src.components.core.towerComponent import TowerComponent
 from src.components.core.baseComponent import BaseComponent
 from src.processeurs.KnownBaseProcessor import enemy_base_registry
+from src.managers.navigation import KAMIKAZE, navigation
+from src.managers.path_scheduler import path_scheduler
+from src.managers.spatial_index import spatial_index
+from src.managers.projectile_store import projectile_store
 from src.components.core.aiEnabledComponent import AIEnabledComponent
 from src.constants.team import Team
 import math
@@ -49,14 +52,14 @@ class KamikazeAiProcessor(esper.Processor):
         super().__init__()
         # world_map doit être une grille [row][col] (y,x)
         self.world_map = world_map
-        self.inflated_world_map = self._create_inflated_map(world_map) if world_map else None
         self._kamikaze_paths = {}
         self._kamikaze_exploration_targets = {}
         # Timer de recalcul de chemin par entity
         self._last_path_request_time = {}
+        # Requête de chemin en attente dans path_scheduler, par entity
+        self._path_requests = {}
 
     # Compatibilité: certaines parties du jeu s'attendent à un attribut `map_grid`.
-    # Propose un alias vers world_map et régénère la carte "gonflée" automatiquement.
     @property
     def map_grid(self) -> Optional[List[List[int]]]:
         return self.world_map
@@ -64,91 +67,19 @@ class KamikazeAiProcessor(esper.Processor):
     @map_grid.setter
     def map_grid(self, grid: Optional[List[List[int]]]) -> None:
         self.world_map = grid
-        self.inflated_world_map = self._create_inflated_map(grid) if grid else None
-
-    def _create_inflated_map(self, original_map: List[List[int]]) -> List[List[int]]:
-        """creates une carte où les obstacles sont "gonflés" pour le pathfinding."""
-        if not original_map:
-            return []
-        
-        max_y = len(original_map)
-        max_x = len(original_map[0])
-        inflated_map = [row[:] for row in original_map] # Copie la carte
-
-        # Rayon de "gonflement" en tuiles. 1 signifie que les tuiles adjacentes sont aussi bloquées.
-        # Cela permet d'avoid que les units ne se collent aux obstacles.
-        buffer_radius = 2 # Augmenté à 2 pour une plus grande marge de sécurité
-
-        for y in range(max_y):
-            for x in range(max_x):
-                if original_map[y][x] in (2, 3): # Si c'est un obstacle (île ou mine/nuage)
-                    for dy in range(-buffer_radius, buffer_radius + 1):
-                        for dx in range(-buffer_radius, buffer_radius + 1):
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < max_x and 0 <= ny < max_y and inflated_map[ny][nx] not in (2, 3):
-                                inflated_map[ny][nx] = 4 # Marque comme obstacle gonflé
-        return inflated_map
 
     # --------------------------- A* pathfinding ---------------------------
     def astar(self, grid: List[List[int]], start: Tuple[int, int], goal: Tuple[int, int]) -> List[Tuple[int, int]]:
         """A* sur une grille (grid[y][x]) — renvoie la liste de cases (x,y).
 
         Assure-toi que la grille est indexée row-major: grid[row][col] -> grid[y][x]
-        Les cellules bloquantes = 2 (île) ou 3 (nuage/mine).
+        La recherche passe par le service de navigation partagé (profil KAMIKAZE) : îles et
+        mines sont "gonflées" de 2 tuiles pour que les units ne se collent pas aux obstacles,
+        déplacements sur 4 voisins.
         """
-        # Utilise la carte gonflée si elle existe, sinon la carte originale
-        if self.inflated_world_map:
-            grid = self.inflated_world_map
-
         if not grid:
             return []
-
-        max_y = len(grid)
-        max_x = len(grid[0]) if max_y > 0 else 0
-
-        # Check sile départ ou l'arrivée sont des obstacles
-        if not (0 <= start[0] < max_x and 0 <= start[1] < max_y and grid[start[1]][start[0]] not in (2, 3)):
-            return [] # Start is an obstacle
-        if not (0 <= goal[0] < max_x and 0 <= goal[1] < max_y and grid[goal[1]][goal[0]] not in (2, 3)):
-            return [] # Goal is an obstacle
-
-        def heuristic(a, b):
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
-
-        open_set = []
-        heapq.heappush(open_set, (0, start))
-        open_set_hash = {start}  # Pour des recherches O(1)
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: heuristic(start, goal)}
-
-        while open_set:
-            _, current = heapq.heappop(open_set)
-            open_set_hash.remove(current)
-
-            if current == goal:
-                path = [current]
-                while current in came_from:
-                    current = came_from[current]
-                    path.append(current)
-                return path[::-1]
-
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-                nx, ny = neighbor
-                if not (0 <= nx < max_x and 0 <= ny < max_y):
-                    continue
-                if grid[ny][nx] in (2, 3, 4): # Check for inflated obstacles as well
-                    continue
-                tentative_g = g_score[current] + 1
-                if tentative_g < g_score.get(neighbor, float('inf')):
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + heuristic(neighbor, goal)
-                    if neighbor not in open_set_hash:
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                        open_set_hash.add(neighbor)
-        return []
+        return navigation.find_cells(grid, KAMIKAZE, start, goal)
 
     # --------------------------- processeur principal ---------------------------
     def process(self, dt: float = 0.016, **kwargs):
@@ -263,25 +194,19 @@ class KamikazeAiProcessor(esper.Processor):
                 recalculate_path = True
 
 
-        if recalculate_path and target_pos is not None:
+        if recalculate_path and target_pos is not None and not path_scheduler.is_pending(self._path_requests.get(ent)):
             start_grid = (int(pos.x // TILE_SIZE), int(pos.y // TILE_SIZE))
             goal_grid = (int(target_pos.x // TILE_SIZE), int(target_pos.y // TILE_SIZE))
-            # Utilise la world_map (ou liste vide si None) ; la méthode astar basculera sur la carte gonflée si disponible
-            path = self.astar(self.world_map or [], start_grid, goal_grid)
+            # Ruée sur la base : champ de flux partagé par tous les kamikazes au lieu d'un A* chacun
+            base_rush = target_id is None and self._is_enemy_base(target_pos, team.team_id) and bool(self.world_map)
+            # La recherche passe par la file globale (budget par frame) ; le chemin arrive par _apply_path
+            self._path_requests[ent] = path_scheduler.submit(
+                lambda: self._compute_path(start_grid, goal_grid, base_rush),
+                entity=ent,
+                key=("kamikaze", id(self.world_map), start_grid, goal_grid, base_rush),
+                on_done=lambda found: self._apply_path(ent, found, target_coords, target_id),
+            )
             self._last_path_request_time[ent] = now
-            if path:
-                # Convertir le chemin de grille en coordonnées mondiales
-                world_path = [(gx * TILE_SIZE + TILE_SIZE / 2, gy * TILE_SIZE + TILE_SIZE / 2) for gx, gy in path]
-                if ent not in self._kamikaze_paths:
-                    self._kamikaze_paths[ent] = {}
-                self._kamikaze_paths[ent].update({'path': world_path, 'target': (target_pos.x, target_pos.y), 'waypoint_index': 0, 'target_entity_id': target_id})
-                # Initialize le timer si c'est la première fois
-                if 'last_target_recalc_time' not in self._kamikaze_paths[ent]:
-                    self._kamikaze_paths[ent]['last_target_recalc_time'] = pygame.time.get_ticks()
-            else:
-                if ent not in self._kamikaze_paths:
-                    self._kamikaze_paths[ent] = {}
-                self._kamikaze_paths[ent].update({'path': [], 'target': (target_pos.x, target_pos.y), 'waypoint_index': 0, 'target_entity_id': target_id})
         elif recalculate_path:
             # Si pas de target_pos, on ne fait rien
             pass
@@ -572,6 +497,32 @@ class KamikazeAiProcessor(esper.Processor):
             center_y = (BASE_SIZE / 2) * TILE_SIZE
         return PositionComponent(x=center_x * TILE_SIZE, y=center_y * TILE_SIZE)
 
+    def _compute_path(self, start_grid: Tuple[int, int], goal_grid: Tuple[int, int], base_rush: bool) -> List[Tuple[int, int]]:
+        """Cases du chemin vers la cible (exécuté par path_scheduler)."""
+        if base_rush:
+            return navigation.route_cells(self.world_map, KAMIKAZE, start_grid, goal_grid)
+        # Utilise la world_map (ou liste vide si None)
+        return self.astar(self.world_map or [], start_grid, goal_grid)
+
+    def _apply_path(self, ent: int, path: List[Tuple[int, int]], target: Tuple[float, float], target_id: Optional[int]) -> None:
+        """Installe le chemin calculé pour une entité (rappel de path_scheduler)."""
+        self._path_requests.pop(ent, None)
+        if not esper.entity_exists(ent):
+            return
+        if ent not in self._kamikaze_paths:
+            self._kamikaze_paths[ent] = {}
+        # Convertir le chemin de grille en coordonnées mondiales
+        world_path = [(gx * TILE_SIZE + TILE_SIZE / 2, gy * TILE_SIZE + TILE_SIZE / 2) for gx, gy in path]
+        self._kamikaze_paths[ent].update({'path': world_path, 'target': target, 'waypoint_index': 0, 'target_entity_id': target_id})
+        if path and 'last_target_recalc_time' not in self._kamikaze_paths[ent]:
+            # Initialize le timer si c'est la première fois
+            self._kamikaze_paths[ent]['last_target_recalc_time'] = pygame.time.get_ticks()
+
+    def _is_enemy_base(self, target_pos: PositionComponent, my_team_id: int) -> bool:
+        """Vérifie si la cible est la base ennemie (ruée finale)."""
+        enemy_base_pos = self.find_enemy_base_position(my_team_id)
+        return abs(target_pos.x - enemy_base_pos.x) < 1 and abs(target_pos.y - enemy_base_pos.y) < 1
+
     def find_best_kamikaze_target(self, my_pos: PositionComponent, my_team_id: int, current_target_id: Optional[int]) -> Tuple[Optional[PositionComponent], Optional[int]]:
         enemy_team_id = 2 if my_team_id == 1 else 1
         DETECTION_RADIUS = 10 * TILE_SIZE
@@ -650,39 +601,35 @@ class KamikazeAiProcessor(esper.Processor):
                             obstacles.append(PositionComponent(
                                 x=gx * TILE_SIZE + TILE_SIZE / 2, y=gy * TILE_SIZE + TILE_SIZE / 2))
         # Add mines/entities team_id==0
-        for ent, (pos, team) in esper.get_components(PositionComponent, TeamComponent):
-            # Les entities neutres (team 0) sont des obstacles, SAUF les coffres volants.
-            if getattr(team, 'team_id', None) == 0 and not esper.has_component(ent, FlyingChestComponent):
-                if math.hypot(pos.x - my_pos.x, pos.y - my_pos.y) < radius:
-                    obstacles.append(pos)
-        # Add les tours comme obstacles, sauf les bases
-        for ent, (pos, tower) in esper.get_components(PositionComponent, TowerComponent):
-            # On ignore les entities qui sont des bases
-            if esper.has_component(ent, BaseComponent):
-                continue
-            if math.hypot(pos.x - my_pos.x, pos.y - my_pos.y) < radius * 1.2:  # distance légèrement augmentée
-                obstacles.append(pos)
+        # Les entities neutres (team 0) sont des obstacles, SAUF les coffres volants.
+        for _, pos, _ in spatial_index.query_radius(my_pos.x, my_pos.y, radius, team_id=0, without=(FlyingChestComponent,)):
+            obstacles.append(pos)
+        # Add les tours comme obstacles, sauf les bases (distance légèrement augmentée)
+        for _, pos, _ in spatial_index.query_radius(my_pos.x, my_pos.y, radius * 1.2, components=(TowerComponent,), without=(BaseComponent,)):
+            obstacles.append(pos)
         return obstacles
 
     def get_nearby_allies(self, my_pos: PositionComponent, my_ent: int, radius: float, my_team_id: int) -> List[Tuple[int, PositionComponent, VelocityComponent]]:
         """Trouve les autres kamikazes alliés à proximité."""
         allies = []
         # On ne cherche que les entities qui ont aussi une IA de kamikaze
-        for ent, (ai_comp, pos, vel, team) in esper.get_components(KamikazeAiComponent, PositionComponent, VelocityComponent, TeamComponent):
-            if ent == my_ent or team.team_id != my_team_id:
-                continue
-            
+        for ent, pos, _ in spatial_index.query_radius(
+            my_pos.x, my_pos.y, radius, team_id=my_team_id, exclude=my_ent,
+            components=(KamikazeAiComponent, VelocityComponent)
+        ):
+            ai_comp = esper.component_for_entity(ent, KamikazeAiComponent)
             if getattr(ai_comp, 'unit_type', None) == UnitType.KAMIKAZE:
-                if math.hypot(pos.x - my_pos.x, pos.y - my_pos.y) < radius:
-                    allies.append((ent, pos, vel))
+                allies.append((ent, pos, esper.component_for_entity(ent, VelocityComponent)))
         return allies
 
     def get_nearby_threats(self, my_pos: PositionComponent, radius: float, my_team_id: int) -> List[PositionComponent]:
-        threats = []
-        for ent, (proj, pos, team) in esper.get_components(ProjectileComponent, PositionComponent, TeamComponent):
-            if getattr(team, 'team_id', None) != my_team_id:
-                if math.hypot(pos.x - my_pos.x, pos.y - my_pos.y) < radius:
-                    threats.append(pos)
+        # Lianes (entités) et balles du projectile_store (ProjectilePoint : mêmes .x / .y)
+        threats = [pos for _, pos, _ in spatial_index.query_radius(
+            my_pos.x, my_pos.y, radius, exclude_teams=(my_team_id,), components=(ProjectileComponent,)
+        )]
+        threats.extend(pos for _, pos, _ in projectile_store.query_radius(
+            my_pos.x, my_pos.y, radius, exclude_teams=(my_team_id,)
+        ))
         return threats
 
     def get_angle_to_target(self, my_pos: PositionComponent, target_pos: PositionComponent) -> float:
@@ -265,7 +265,9 @@ class ArchitectMinimax:
         Simulates the result of an action to produce a future game state.
         This is a simplified projection, not a full physics simulation.
         """
-        next_state = copy.deepcopy(current_state)
+        # Shallow copy is enough: fields are only rebound below, never mutated in place
+        # (island_groups / allied_tower_positions are shared read-only between states).
+        next_state = copy.copy(current_state)
         move_dist = self.SIM_SPEED * self.SIM_TIME_STEP
 
         # --- Simulate Build Action Effects ---
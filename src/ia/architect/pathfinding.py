@@ -1,17 +1,22 @@
 
-import heapq
+import dataclasses
 import numpy as np
 import logging
 from typing import Tuple, List, Optional, Set, Iterable
 from src.constants.map_tiles import TileType
+from src.managers.navigation import ARCHITECT, navigation, simplify_cells
 
 class SimplePathfinder:
     """
     A* pathfinding that uses the map grid directly.
+
+    The search runs in the shared navigation service (ARCHITECT profile); this class
+    adds the enemy avoidance layer and keeps the world/grid conventions of the architect.
     """
     # --- Tile Movement Costs ---
     COST_ISLAND = 350.0  # Increased cost to make crossing islands less desirable.
     COST_OBSTACLE = 5000.0 # Very high cost for mines/clouds, making them highly undesirable.
+    ENEMY_RADIUS = 5  # Tiles around an enemy that get an avoidance cost
 
     def __init__(self, map_grid, tile_size: int):
         """
@@ -32,7 +37,8 @@ class SimplePathfinder:
         start: Tuple[float, float],
         goal: Tuple[float, float],
         max_iterations: int = 2000,
-        enemy_positions: Optional[Iterable[Tuple[float, float]]] = None
+        enemy_positions: Optional[Iterable[Tuple[float, float]]] = None,
+        shared: bool = False
     ) -> Optional[List[Tuple[float, float]]]:
         """
         Find path from start to goal avoiding islands.
@@ -42,6 +48,8 @@ class SimplePathfinder:
             goal: Goal position (world coordinates)
             max_iterations: Maximum iterations
             enemy_positions: An iterable of world coordinates for known enemies.
+            shared: Goal targeted again and again (build site): read the path from the goal's
+                flow field, which later requests towards the same goal reuse.
 
         Returns:
             List of waypoints in world coordinates, or None if no path
@@ -64,18 +72,19 @@ class SimplePathfinder:
         enemy_grid_positions = None
         if enemy_positions:
             enemy_grid_positions = {self._worldToGrid(pos) for pos in enemy_positions}
-        path_grid = self._astar(start_grid, goal_grid, max_iterations, enemy_grid_positions)
+        if shared:
+            layer = self._enemyCostLayer(enemy_grid_positions) if enemy_grid_positions else None
+            layer_key = tuple(sorted(enemy_grid_positions)) if layer is not None else None
+            path_grid = navigation.route_cells(self.map_grid, ARCHITECT, start_grid, goal_grid,
+                                               layer=layer, layer_key=layer_key)
+        else:
+            path_grid = self._astar(start_grid, goal_grid, max_iterations, enemy_grid_positions)
 
         if path_grid is None or len(path_grid) == 0:
             return None
 
-        # Convert grid path to world coordinates
-        path_world = [self._gridToWorld(p) for p in path_grid]
-
-        # Simplify path (remove unnecessary intermediate points)
-        path_world = self._simplifyPath(path_world)
-
-        return path_world
+        # Convert grid path to world coordinates, keeping only the points where direction changes
+        return [self._gridToWorld(p) for p in simplify_cells(path_grid)]
 
     def _astar(
         self,
@@ -84,73 +93,37 @@ class SimplePathfinder:
         max_iterations: int,
         enemy_grid_positions: Optional[Set[Tuple[int, int]]] = None
     ) -> Optional[List[Tuple[int, int]]]:
-        """A* algorithm on grid coordinates."""
-
-        open_set = []
-        heapq.heappush(open_set, (0, start))
-
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: self._heuristic(start, goal)}
-
-        closed_set = set()
-        iterations = 0
-
-        while open_set and iterations < max_iterations:
-            iterations += 1
-
-            _, current = heapq.heappop(open_set)
-
-            if current in closed_set:
+        """A* algorithm on grid coordinates (shared navigation service)."""
+        profile = ARCHITECT
+        if max_iterations != profile.max_expansions:
+            profile = dataclasses.replace(ARCHITECT, max_expansions=max_iterations)
+        layer = self._enemyCostLayer(enemy_grid_positions) if enemy_grid_positions else None
+        layer_key = tuple(sorted(enemy_grid_positions)) if layer is not None else None
+        path = navigation.find_cells(self.map_grid, profile, start, goal, layer=layer, layer_key=layer_key)
+        return path or None
+
+    def _enemyCostLayer(self, enemy_grid_positions: Set[Tuple[int, int]]) -> np.ndarray:
+        """
+        Additional cost of the tiles near enemies, inversely proportional to the square
+        of the distance. Islands, mines and clouds keep their own cost.
+        """
+        tiles = navigation.grid(self.map_grid).tiles
+        layer = np.zeros(tiles.shape, dtype=np.float32)
+        radius = self.ENEMY_RADIUS
+        offsets = np.arange(-radius, radius + 1)
+        dist_sq = offsets[None, :] ** 2 + offsets[:, None] ** 2
+        kernel = np.where(dist_sq < radius * radius, 100.0 / (dist_sq + 1), 0.0).astype(np.float32)
+        height, width = tiles.shape
+        for enemy_x, enemy_y in enemy_grid_positions:
+            x0, x1 = max(0, enemy_x - radius), min(width, enemy_x + radius + 1)
+            y0, y1 = max(0, enemy_y - radius), min(height, enemy_y + radius + 1)
+            if x0 >= x1 or y0 >= y1:
                 continue
-
-            # Check if we reached the goal
-            if current == goal:
-                return self._reconstructPath(came_from, current)
-
-            closed_set.add(current)
-
-            # Check neighbors (8 directions)
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if neighbor in closed_set:
-                    continue
-
-                if not self._isValidGrid(neighbor):
-                    continue
-
-                # Get additional cost from tile type (e.g., island, mine)
-                # Check if the current node is on an island to adjust costs
-                is_currently_on_buildable_island = self._is_island_buildable(current)
-                tile_cost = self._getTileCost(neighbor, enemy_grid_positions, is_currently_on_buildable_island)
-
-                # Calculate cost (diagonal moves cost more)
-                move_cost = 1.414 if dx != 0 and dy != 0 else 1.0
-                tentative_g = g_score[current] + move_cost + tile_cost
-
-
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f = tentative_g + self._heuristic(neighbor, goal)
-                    f_score[neighbor] = f
-                    heapq.heappush(open_set, (f, neighbor))
-
-        return None
-
-    def _reconstructPath(self, came_from: dict, current: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Reconstruct path from came_from dict."""
-        path = [current]
-        while current in came_from:
-            current = came_from[current]
-            path.append(current)
-        path.reverse()
-        return path
-
-    def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
-        """Euclidean distance heuristic."""
-        return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
+            layer[y0:y1, x0:x1] += kernel[y0 - enemy_y + radius:y1 - enemy_y + radius,
+                                          x0 - enemy_x + radius:x1 - enemy_x + radius]
+        weighted = np.isin(tiles, (TileType.GENERIC_ISLAND.value, TileType.MINE.value, TileType.CLOUD.value))
+        layer[weighted] = 0.0
+        return layer
 
     def _worldToGrid(self, pos: Tuple[float, float]) -> Tuple[int, int]:
         """Convert world coordinates to grid coordinates."""
@@ -168,40 +141,6 @@ class SimplePathfinder:
         """Check if grid position is within bounds."""
         return 0 <= pos[0] < self.map_width and 0 <= pos[1] < self.map_height
 
-    def _getTileCost(self, pos: Tuple[int, int], enemy_grid_positions: Optional[Set[Tuple[int, int]]], on_buildable_island: bool = False) -> float:
-        """
-        Gets the additional movement cost for a given tile.
-        Mines and clouds are heavily penalized, islands are moderately penalized.
-        Tiles near enemies also get a penalty.
-
-        Args:
-            pos: The grid position to evaluate.
-            enemy_grid_positions: Positions of enemies to avoid.
-            on_buildable_island: If the path is currently on a buildable island tile.
-        """
-        try:
-            tile_type = self.map_grid[pos[1]][pos[0]]
-
-            if self._isObstacle(pos, tile_type):
-                return self.COST_OBSTACLE
-            elif self._is_island_buildable(pos, tile_type):
-                return self.COST_ISLAND
-
-            cost = 0.0
-            # Add cost for being near an enemy
-            if enemy_grid_positions:
-                for enemy_pos in enemy_grid_positions:
-                    dist_sq = (pos[0] - enemy_pos[0])**2 + (pos[1] - enemy_pos[1])**2
-                    if dist_sq < 25: # 5 tile radius
-                        # Add cost inversely proportional to the square of the distance
-                        cost += 100.0 / (dist_sq + 1)
-
-            return cost
-
-        except (IndexError, ValueError) as e:
-            self.logger.warning(f"Could not determine tile cost for {pos}: {e}")
-            return self.COST_OBSTACLE  # Treat errors or out-of-bounds as high-cost obstacles
-
     def _is_island_buildable(self, pos: Tuple[int, int], tile_type: Optional[int] = None) -> bool:
         """Check if a grid position is a buildable island tile."""
         try:
@@ -233,21 +172,3 @@ class SimplePathfinder:
                     if self._isValidGrid(neighbor) and not self._isObstacle(neighbor):
                         return neighbor
         return None
-
-    def _simplifyPath(self, path: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
-        """
-        Simplify path by removing unnecessary waypoints.
-        Keep only points where direction changes significantly.
-        """
-        if len(path) <= 2:
-            return path
-
-        simplified = [path[0]]
-
-        for i in range(1, len(path) - 1):
-            # Always keep every Nth point to avoid overly long straight segments
-            if i % 5 == 0:
-                simplified.append(path[i])
-
-        simplified.append(path[-1])
-        return simplified
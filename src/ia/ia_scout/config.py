@@ -54,7 +54,6 @@ class PathfindingSettings:
     tile_soft_block: tuple[int, ...] = (int(TileType.MINE),)
     recompute_distance_min: float = 64.0
     waypoint_reached_radius_factor: float = 1.2  # Augmenter de 0.5 à 1.2 pour éviter micro-mouvements
-    max_batch_per_tick: int = 3
     pending_request_timeout: float = 0.5
 
 
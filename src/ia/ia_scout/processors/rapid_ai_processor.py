@@ -88,10 +88,11 @@ class RapidTroopAIProcessor(esper.Processor):
 
     # Esper API ------------------------------------------------------------
     def process(self, *_, **kwargs) -> None:
-        # Esper peut fournir un dt optionnel mais l'IA conserve sa boucle fixe interne.
-        _ = kwargs.get("dt")
+        # Esper peut fournir un dt optionnel (temps de simulation) ; l'IA conserve
+        # sa boucle fixe interne et ne retombe sur l'horloge murale qu'en son absence.
+        dt = kwargs.get("dt")
         now = time.perf_counter()
-        elapsed = now - self._last_time
+        elapsed = now - self._last_time if dt is None else dt
         self._last_time = now
         step = 1.0 / max(self.settings.tick_frequency, 1e-3)
         self._accumulator += elapsed
@@ -1097,12 +1098,15 @@ class RapidUnitController:
         dy = origin[1] - nodes[-1][1]
         distance = math.hypot(dx, dy)
         priority = 1.0 / max(distance, 1.0)
+        objective = ctx.current_objective
         request_id = self.pathfinding.enqueue_request(
             entity_id=self.entity_id,
             origin=origin,
             nodes=nodes,
             priority=priority,
             replace_request_id=ctx.path_request_id,
+            # Tous les éclaireurs qui attaquent la base partagent son champ de flux
+            shared=objective is not None and objective.type == "attack_base",
         )
         ctx.path_pending = True
         ctx.path_request_id = request_id
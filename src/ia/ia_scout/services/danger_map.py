@@ -16,6 +16,7 @@ from src.components.core.projectileComponent import ProjectileComponent
 from src.components.events.banditsComponent import Bandits
 from src.components.events.stormComponent import Storm
 from src.constants.map_tiles import TileType
+from src.managers.projectile_store import projectile_store
 from src.constants.team import Team
 from src.settings.settings import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE
 
@@ -137,6 +138,10 @@ class DangerMapService:
             if team and team.team_id == Team.ENEMY:
                 continue  # Ignore friendly projectiles
             self._add_disk((pos.x, pos.y), radius, intensity)
+        slots = projectile_store.live_slots()
+        slots = slots[projectile_store.column("team")[slots] != Team.ENEMY]  # Ignore friendly projectiles
+        for x, y in zip(projectile_store.column("x")[slots].tolist(), projectile_store.column("y")[slots].tolist()):
+            self._add_disk((x, y), radius, intensity)
 
     def _inject_bandits(self) -> None:
         radius = self.settings.danger.bandit_radius
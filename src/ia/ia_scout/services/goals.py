@@ -22,6 +22,7 @@ from src.components.core.baseComponent import BaseComponent
 from src.settings.settings import TILE_SIZE
 from src.constants.gameplay import UNIT_VISION_SCOUT
 from src.processeurs.KnownBaseProcessor import enemy_base_registry
+from src.managers.component_index import component_index
 
 from ..config import AISettings, get_settings
 from .exploration import exploration_planner
@@ -56,11 +57,12 @@ _EVENT_COMPONENTS = (
     KrakenTentacleComponent,
     IslandResourceComponent,
 )
+_EVENT_MASK = component_index.mask_of(*_EVENT_COMPONENTS)
 
 def is_event_entity(entity_id: int) -> bool:
     """Indique si l'entité représente un événement (bandits, tempête, kraken, etc.)."""
 
-    return any(esper.has_component(entity_id, comp) for comp in _EVENT_COMPONENTS)
+    return component_index.has_any(entity_id, _EVENT_MASK)
 
 
 class GoalEvaluator:
@@ -2,17 +2,16 @@
 
 from __future__ import annotations
 
-import heapq
 import time
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
 import numpy as np
-from numba import njit
-from numpy.lib.stride_tricks import sliding_window_view
-from collections import OrderedDict, deque
+from collections import deque
 
 from src.constants.map_tiles import TileType
+from src.managers.navigation import NavigationProfile, navigation
+from src.managers.path_scheduler import path_scheduler
 from src.settings.settings import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE
 
 from ..config import AISettings, get_settings
@@ -29,13 +28,6 @@ WorldPos = Tuple[float, float]
 LOGGER = get_logger()
 
 
-@njit(cache=True)
-def _heuristic_numba(goal_x: int, goal_y: int, node_x: int, node_y: int) -> float:
-    dx = goal_x - node_x
-    dy = goal_y - node_y
-    return (dx * dx + dy * dy) ** 0.5
-
-
 @dataclass
 class _PathRequest:
     """File d'attente décrivant une requête de chemin différée."""
@@ -46,6 +38,7 @@ class _PathRequest:
     nodes: Tuple[WorldPos, ...]
     priority: float
     created_at: float
+    shared: bool = False  # Dernier nœud partagé par de nombreuses unités (base) : champ de flux
 
 
 class PathfindingService:
@@ -69,7 +62,8 @@ class PathfindingService:
         self._tile_soft_block = frozenset(int(tile) for tile in self.settings.pathfinding.tile_soft_block)
         self._danger_weight = float(self.settings.pathfinding.danger_weight)
 
-        coarse_grid = np.asarray(list(grid), dtype=np.int16)
+        self._map_grid = grid if isinstance(grid, (list, np.ndarray)) else list(grid)
+        coarse_grid = np.asarray(self._map_grid, dtype=np.int16)
         if coarse_grid.shape != (MAP_HEIGHT, MAP_WIDTH):
             self._coarse_height, self._coarse_width = coarse_grid.shape
         else:
@@ -78,7 +72,7 @@ class PathfindingService:
 
         self._grid = self._expand_to_sub_tiles(coarse_grid)
         self._height, self._width = self._grid.shape
-        self._base_cost = self._build_base_cost()
+        self.profile = self._build_profile()
 
         self._neighbors = self._build_neighbors()
 
@@ -91,88 +85,47 @@ class PathfindingService:
         
         # Stockage du dernier chemin calculé pour l'affichage debug
         self._last_path: List[WorldPos] = []
-        self._pending_requests: List[Tuple[float, int, _PathRequest]] = []
+        # Requêtes confiées à path_scheduler (identifiant local -> identifiant de l'ordonnanceur)
+        self._scheduled: Dict[int, int] = {}
+        self._completions: List[Tuple[int, int, List[WorldPos]]] = []
         self._request_counter = 0
-        self._heap_sequence = 0
         self._request_to_entity: Dict[int, int] = {}
         self._entity_to_request: Dict[int, int] = {}
-        self._cancelled_requests: Set[int] = set()
-        self._path_cache: "OrderedDict[Tuple[int, int, int, int], Tuple[List[WorldPos], float]]" = OrderedDict()
-        self._path_cache_ttl = float(getattr(self.settings.pathfinding, "cache_ttl_seconds", 1.5))
-        self._path_cache_max_entries = int(getattr(self.settings.pathfinding, "cache_max_entries", 256))
 
-    def _build_base_cost(self) -> np.ndarray:
-        factor = self.sub_tile_factor
-        cost = np.ones((self._coarse_height * factor, self._coarse_width * factor), dtype=np.float32)
-
-        cloud_mask = self._coarse_grid == int(TileType.CLOUD)
-        if cloud_mask.any():
-            cloud_expanded = np.repeat(np.repeat(cloud_mask, factor, axis=0), factor, axis=1)
-            cost[cloud_expanded] = self.settings.pathfinding.cloud_weight
-
-        island_tile = int(TileType.GENERIC_ISLAND)
-        island_mask = self._coarse_grid == island_tile
-        if island_mask.any():
-            island_expanded = np.repeat(np.repeat(island_mask, factor, axis=0), factor, axis=1)
-            radius_cells = max(0, int(self.settings.pathfinding.island_perimeter_radius))
-            if radius_cells > 0:
-                # Rayon exprimé en sous-tuiles afin d'avoir un contrôle fin sur la zone bloquée
-                padded = np.pad(island_expanded.astype(np.uint8), radius_cells, mode="constant")
-                window_size = 2 * radius_cells + 1
-                neighborhood = sliding_window_view(padded, (window_size, window_size))
-                expanded_mask = neighborhood.max(axis=(2, 3)).astype(bool)
-            else:
-                expanded_mask = island_expanded
-            # Bloquer complètement les îles et leur périmètre - np.inf = infranchissable
-            cost[expanded_mask] = np.inf
-
-        mine_tile = int(TileType.MINE)
-        mine_mask = self._coarse_grid == mine_tile
-        if mine_mask.any():
-            mine_expanded = np.repeat(np.repeat(mine_mask, factor, axis=0), factor, axis=1)
-            radius_cells = max(0, int(self.settings.pathfinding.mine_perimeter_radius))
-            if radius_cells > 0:
-                # Rayon exprimé en sous-tuiles pour rester cohérent avec la résolution IA
-                mine_padded = np.pad(mine_expanded.astype(np.uint8), radius_cells, mode="constant")
-                window_size = 2 * radius_cells + 1
-                mine_neighborhood = sliding_window_view(mine_padded, (window_size, window_size))
-                mine_mask_with_perimeter = mine_neighborhood.max(axis=(2, 3)).astype(bool)
-            else:
-                mine_mask_with_perimeter = mine_expanded
-            cost[mine_mask_with_perimeter] = np.inf
-
-        # Bloquer strictement les bases alliées et ennemies
-        if self._tile_blacklist:
-            base_mask = np.isin(self._coarse_grid, list(self._tile_blacklist))
-            if base_mask.any():
-                base_expanded = np.repeat(np.repeat(base_mask, factor, axis=0), factor, axis=1)
-                cost[base_expanded] = np.inf
-
-        blocked_mask = np.isinf(cost)
-        margin_radius = max(0, int(self.settings.pathfinding.blocked_margin_radius))
-        if margin_radius > 0 and blocked_mask.any():
-            padded_blocked = np.pad(blocked_mask.astype(np.uint8), margin_radius, mode="constant")
-            window_size = 2 * margin_radius + 1
-            margin_neighborhood = sliding_window_view(padded_blocked, (window_size, window_size))
-            margin_mask = margin_neighborhood.max(axis=(2, 3)).astype(bool)
-            margin_mask = np.logical_and(margin_mask, np.logical_not(blocked_mask))
-            if margin_mask.any():
-                weight = float(self.settings.pathfinding.blocked_margin_weight)
-                current = cost[margin_mask]
-                cost[margin_mask] = np.maximum(current, weight)
-
-        border_radius_tiles = max(0, int(self.settings.pathfinding.map_border_radius))
-        if border_radius_tiles > 0:
-            border_cells = border_radius_tiles
-            border_cells = min(border_cells, cost.shape[0] // 2, cost.shape[1] // 2)
-            if border_cells > 0:
-                # Bloquer les bords de la carte pour éviter que l'IA ne s'y colle
-                cost[:border_cells, :] = np.inf
-                cost[-border_cells:, :] = np.inf
-                cost[:, :border_cells] = np.inf
-                cost[:, -border_cells:] = np.inf
-
-        return cost
+    def _build_profile(self) -> NavigationProfile:
+        """Profil de navigation de l'éclaireur (coûts de src/managers/navigation.py)."""
+        pf = self.settings.pathfinding
+        weights = [(int(TileType.CLOUD), float(pf.cloud_weight))]
+        weights.extend((tile, 2.5) for tile in sorted(self._tile_soft_block))
+        return NavigationProfile(
+            name="scout",
+            sub_tile_factor=self.sub_tile_factor,
+            diagonal_cost=float(pf.diagonal_cost),
+            blocked_tiles=tuple(sorted(self._tile_blacklist)),
+            # Rayons exprimés en sous-tuiles afin d'avoir un contrôle fin sur la zone bloquée
+            inflated_tiles=(
+                (int(TileType.GENERIC_ISLAND), max(0, int(pf.island_perimeter_radius))),
+                (int(TileType.MINE), max(0, int(pf.mine_perimeter_radius))),
+            ),
+            tile_weights=tuple(weights),
+            margin_radius=max(0, int(pf.blocked_margin_radius)),
+            margin_weight=float(pf.blocked_margin_weight),
+            # Bloquer les bords de la carte pour éviter que l'IA ne s'y colle
+            border_radius=max(0, int(pf.map_border_radius)),
+            cache_ttl=float(getattr(pf, "cache_ttl_seconds", 1.5)),
+        )
+
+    @property
+    def _base_cost(self) -> np.ndarray:
+        return navigation.grid(self._map_grid).cost(self.profile)
+
+    def _danger_layer(self) -> np.ndarray:
+        """Danger pondéré à la résolution des tuiles, ajouté au coût de base lors de la recherche."""
+        danger_field = self.danger_service.field
+        max_coarse_y, max_coarse_x = danger_field.shape
+        rows = np.minimum(np.arange(self._coarse_height), max_coarse_y - 1)
+        cols = np.minimum(np.arange(self._coarse_width), max_coarse_x - 1)
+        return danger_field[np.ix_(rows, cols)] * np.float32(self._danger_weight)
 
     def _build_neighbors(self) -> Tuple[Tuple[int, int, float], ...]:
         axial_cost = 1.0 / self.sub_tile_factor
@@ -225,8 +178,12 @@ class PathfindingService:
         *,
         priority: float = 0.0,
         replace_request_id: Optional[int] = None,
+        shared: bool = False,
     ) -> int:
-        """File une requête de chemin pour traitement différé et renvoie son identifiant."""
+        """Confie une requête de chemin à l'ordonnanceur global et renvoie son identifiant.
+
+        Les requêtes des éclaireurs partant de la même case vers les mêmes cases ne font qu'une recherche.
+        """
 
         node_tuple = tuple(nodes)
         if not node_tuple:
@@ -248,14 +205,20 @@ class PathfindingService:
             nodes=node_tuple,
             priority=max(priority, 0.0),
             created_at=time.perf_counter(),
-        )
-        self._heap_sequence += 1
-        heapq.heappush(
-            self._pending_requests,
-            (-request.priority, self._heap_sequence, request),
+            shared=shared,
         )
         self._entity_to_request[entity_id] = request_id
         self._request_to_entity[request_id] = entity_id
+        key = ("scout", id(self), self.world_to_grid(origin), tuple(self.world_to_grid(node) for node in node_tuple), shared)
+        scheduled_id = path_scheduler.submit(
+            lambda: self._build_sequence_path(request.origin, request.nodes, shared=request.shared),
+            entity=entity_id,
+            key=key,
+            urgency=request.priority,
+            on_done=lambda path: self._complete(request, path),
+        )
+        if path_scheduler.is_pending(scheduled_id):  # Sinon déjà servie pendant submit
+            self._scheduled[request_id] = scheduled_id
         return request_id
 
     def cancel_request(self, request_id: Optional[int]) -> None:
@@ -263,49 +226,47 @@ class PathfindingService:
 
         if request_id is None:
             return
-        entity_id = self._request_to_entity.pop(request_id, None)
-        if entity_id is not None:
-            current = self._entity_to_request.get(entity_id)
-            if current == request_id:
-                self._entity_to_request.pop(entity_id, None)
-        self._cancelled_requests.add(request_id)
+        path_scheduler.cancel(self._scheduled.get(request_id))
+        self._cleanup_request(request_id)
 
     def process_pending_requests(self, budget: Optional[int] = None) -> List[Tuple[int, int, List[WorldPos]]]:
-        """Traite un lot borné de requêtes et retourne les chemins terminés."""
-
-        if budget is None:
-            budget = max(1, int(self.settings.pathfinding.max_batch_per_tick))
-        budget = max(0, budget)
-        completions: List[Tuple[int, int, List[WorldPos]]] = []
-        processed = 0
-        while self._pending_requests and processed < budget:
-            _, _, request = heapq.heappop(self._pending_requests)
-            if request.request_id in self._cancelled_requests:
-                self._cleanup_request(request.request_id)
-                continue
-            path = self._build_sequence_path(request.origin, request.nodes)
-            completions.append((request.entity_id, request.request_id, path))
-            self._cleanup_request(request.request_id)
-            processed += 1
+        """Sert la file globale dans la limite du budget de la frame et retourne les chemins terminés.
+
+        Args:
+            budget: Nombre maximal de recherches lancées par cet appel (None : seul le budget de temps compte)
+        """
+
+        path_scheduler.run(max_jobs=budget)
+        completions, self._completions = self._completions, []
         return completions
 
+    def _complete(self, request: _PathRequest, path: List[WorldPos]) -> None:
+        """Range le chemin d'une requête servie par path_scheduler jusqu'au prochain process_pending_requests."""
+
+        if self._request_to_entity.get(request.request_id) != request.entity_id:
+            return
+        self._completions.append((request.entity_id, request.request_id, path))
+        self._cleanup_request(request.request_id)
+
     def _cleanup_request(self, request_id: int) -> None:
         """Supprime les références associées à une requête traitée ou annulée."""
 
+        self._scheduled.pop(request_id, None)
         entity_id = self._request_to_entity.pop(request_id, None)
         if entity_id is not None:
             current = self._entity_to_request.get(entity_id)
             if current == request_id:
                 self._entity_to_request.pop(entity_id, None)
-        self._cancelled_requests.discard(request_id)
 
-    def _build_sequence_path(self, origin: WorldPos, nodes: Tuple[WorldPos, ...]) -> List[WorldPos]:
+    def _build_sequence_path(
+        self, origin: WorldPos, nodes: Tuple[WorldPos, ...], *, shared: bool = False
+    ) -> List[WorldPos]:
         """Assemble un chemin complet en enchaînant les segments successifs."""
 
         assembled: List[WorldPos] = []
         current = origin
-        for node in nodes:
-            segment = self.find_path(current, node)
+        for index, node in enumerate(nodes):
+            segment = self.find_path(current, node, shared=shared and index == len(nodes) - 1)
             if not segment:
                 continue
             if assembled:
@@ -315,34 +276,6 @@ class PathfindingService:
             current = segment[-1]
         return assembled
 
-    def _cache_key(self, start: GridPos, goal: GridPos) -> Tuple[int, int, int, int]:
-        return (start[0], start[1], goal[0], goal[1])
-
-    def _lookup_cached_path(self, key: Tuple[int, int, int, int]) -> Optional[List[WorldPos]]:
-        if self._path_cache_ttl <= 0.0:
-            return None
-        cached = self._path_cache.get(key)
-        if cached is None:
-            return None
-        path, stored_at = cached
-        if time.perf_counter() - stored_at > self._path_cache_ttl:
-            self._path_cache.pop(key, None)
-            return None
-        self._path_cache.move_to_end(key)
-        return list(path)
-
-    def _store_cached_path(
-        self,
-        key: Tuple[int, int, int, int],
-        path: List[WorldPos],
-    ) -> None:
-        if self._path_cache_ttl <= 0.0 or not path:
-            return
-        self._path_cache[key] = (list(path), time.perf_counter())
-        self._path_cache.move_to_end(key)
-        while len(self._path_cache) > self._path_cache_max_entries:
-            self._path_cache.popitem(last=False)
-
     def has_line_of_fire(self, origin: WorldPos, target: WorldPos) -> bool:
         """Teste si un segment est libre d'obstacles en suivant une marche de Bresenham."""
 
@@ -393,15 +326,11 @@ class PathfindingService:
             return False
         return not np.isinf(self._tile_cost(grid_pos))
 
-    def find_path(self, start_world: WorldPos, goal_world: WorldPos) -> List[WorldPos]:
+    def find_path(self, start_world: WorldPos, goal_world: WorldPos, *, shared: bool = False) -> List[WorldPos]:
+        """Chemin pondéré par le danger ; shared=True pour une destination commune à de nombreuses
+        unités (base ennemie), lue dans son champ de flux tant que le danger ne touche pas le chemin."""
         start = self.world_to_grid(start_world)
         goal = self.world_to_grid(goal_world)
-        cache_key = self._cache_key(start, goal)
-
-        cached_path = self._lookup_cached_path(cache_key)
-        if cached_path is not None:
-            self._last_path = cached_path
-            return cached_path
 
         if not self._in_bounds(start) or not self._in_bounds(goal):
             LOGGER.warning(
@@ -424,67 +353,19 @@ class PathfindingService:
                 "[PF] find_path objectif ajusté: %s -> %s", goal_initial, fallback
             )
             goal = fallback
-            cache_key = self._cache_key(start, goal)
-
-        frontier: List[Tuple[float, GridPos]] = []
-        heapq.heappush(frontier, (0.0, start))
-
-        came_from: Dict[GridPos, Optional[GridPos]] = {start: None}
-        cost_so_far: Dict[GridPos, float] = {start: 0.0}
-        danger_field = self.danger_service.field
-        max_coarse_y, max_coarse_x = danger_field.shape
-        danger_weight = self._danger_weight
-        base_cost_map = self._base_cost
-        sub_factor = self.sub_tile_factor
-        width = self._width
-        # Cache local pour éviter de recalculer le coût d'une même tuile des milliers de fois
-        tile_cost_cache: Dict[int, float] = {}
-
-        def _cached_tile_cost(node: GridPos) -> float:
-            key = node[1] * width + node[0]
-            cached = tile_cost_cache.get(key)
-            if cached is not None:
-                return cached
-            base_value = base_cost_map[node[1], node[0]]
-            coarse_x = node[0] // sub_factor
-            coarse_y = node[1] // sub_factor
-            if coarse_x >= max_coarse_x:
-                coarse_x = max_coarse_x - 1
-            if coarse_y >= max_coarse_y:
-                coarse_y = max_coarse_y - 1
-            danger_value = danger_field[coarse_y, coarse_x]
-            total_cost = base_value + danger_value * danger_weight
-            tile_cost_cache[key] = total_cost
-            return total_cost
-
-        while frontier:
-            _, current = heapq.heappop(frontier)
-
-            if current == goal:
-                break
 
-            for dx, dy, move_cost in self._neighbors:
-                next_node = (current[0] + dx, current[1] + dy)
-                if not self._in_bounds(next_node):
-                    continue
-
-                tile_value = self._grid[next_node[1], next_node[0]]
-                if tile_value in self._tile_blacklist:
-                    continue
-
-                base_cost = _cached_tile_cost(next_node)
-                if tile_value in self._tile_soft_block:
-                    base_cost *= 2.5
-
-                new_cost = cost_so_far[current] + move_cost * base_cost
-
-                if next_node not in cost_so_far or new_cost < cost_so_far[next_node]:
-                    cost_so_far[next_node] = new_cost
-                    priority = new_cost + self._heuristic(goal, next_node)
-                    heapq.heappush(frontier, (priority, next_node))
-                    came_from[next_node] = current
-
-        if goal not in came_from:
+        # Le danger évolue à chaque tick : le cache partagé le traite comme le reste du coût
+        # pendant la durée de vie d'un chemin (cache_ttl_seconds), comme l'ancien cache local
+        search = navigation.route_cells if shared else navigation.find_cells
+        grid_path = search(
+            self._map_grid,
+            self.profile,
+            start,
+            goal,
+            layer=self._danger_layer(),
+            layer_key=("danger", id(self.danger_service)),
+        )
+        if not grid_path:
             LOGGER.info(
                 "[PF] find_path échec: aucun chemin trouvé start=%s goal=%s (frontier vide)",
                 start,
@@ -492,24 +373,10 @@ class PathfindingService:
             )
             return []
 
-        grid_path: List[GridPos] = []
-        node = goal
-        while True:
-            grid_path.append(node)
-            parent = came_from.get(node)
-            if parent is None:
-                break
-            node = parent
-
-        grid_path.reverse()
         axis_aligned_path = self._inject_axis_checkpoints(grid_path)
         compressed_path = self._compress_axis_segments(axis_aligned_path)
         world_path: List[WorldPos] = [self.grid_to_world(g) for g in compressed_path]
         self._last_path = world_path  # Stocker le dernier chemin calculé
-        if world_path:
-            self._store_cached_path(cache_key, world_path)
-            reversed_key = self._cache_key(goal, start)
-            self._store_cached_path(reversed_key, list(reversed(world_path)))
         LOGGER.info(
             "[PF] find_path succès: %s noeuds (compressé=%s)", len(grid_path), len(world_path)
         )
@@ -627,9 +494,6 @@ class PathfindingService:
         """Retourne le dernier chemin calculé pour l'affichage debug."""
         return list(self._last_path)
 
-    def _heuristic(self, goal: GridPos, node: GridPos) -> float:
-        return _heuristic_numba(goal[0], goal[1], node[0], node[1]) / self.sub_tile_factor
-
     def get_unwalkable_areas(self) -> List[WorldPos]:
         """Retourne la liste des positions centrales des tuiles infranchissables ou à éviter."""
         unwalkable_positions = []
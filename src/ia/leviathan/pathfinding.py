@@ -1,46 +1,41 @@
 """
 A* Pathfinding System
 
-High-performance pathfinding implementation optimized for real-time strategy games.
-Features pre-computed obstacle caching for sub-millisecond path calculations.
+Leviathan adapter over the shared navigation service (src/managers/navigation.py):
+static obstacles (islands, bases, mines and a one-tile clearance around them)
+come from the LEVIATHAN profile cost map, dynamic obstacles (storms, bandits)
+from a per-request cost layer.
 """
 
-import heapq
+import dataclasses
 import numpy as np
 from typing import Tuple, List, Optional
 
+from src.managers.navigation import LEVIATHAN, navigation, simplify_cells
+
 
 class Pathfinder:
     """
-    Optimized A* pathfinding with pre-computed obstacle caching.
+    A* pathfinding for the Leviathan, run by the shared navigation service.
 
     Performance Features:
-        - Pre-computed static obstacle map (islands, mines)
-        - O(1) blocked cell lookups via dictionary cache
-        - Euclidean distance heuristic for optimal paths
-        - Dynamic obstacle integration (storms, bandits)
-        - Path simplification to reduce waypoint count
+        - Static obstacle map (islands, bases, mines plus one tile of clearance) built once per map version
+        - Compiled A* kernel and shared path cache
+        - Dynamic obstacle integration (storms, bandits) as an impassable cost layer
+        - Path simplification to the points where direction changes
 
     Obstacle Types:
         Static (cached):
-            - Islands (from map grid)
+            - Islands and bases (from map grid)
             - Mines (from map grid)
         Dynamic (updated per-path):
             - Storms (environmental hazards)
             - Bandits (enemy units)
-
-    Typical Performance:
-        - Cache build: ~10-50ms (one-time initialization)
-        - Path calculation: ~1-5ms (vs ~100-200ms without cache)
-        - Memory overhead: ~O(blocked_cells) dictionary storage
     """
 
     def __init__(self, map_grid, tile_size: int):
         """
-        Initialize pathfinder and pre-compute obstacle cache.
-
-        Performs one-time expensive computation of all blocked cells
-        to enable fast O(1) lookups during pathfinding.
+        Initialize pathfinder.
 
         Args:
             map_grid: 2D array of tile types (TileType enum values)
@@ -54,13 +49,6 @@ class Pathfinder:
         # Dynamic Obstacles: Updated externally by AI processor before each pathfind
         self.dynamic_obstacles = []  # List of (x, y, radius) tuples in world coordinates
 
-        # Safety Margin: Buffer zone around static obstacles
-        self.static_obstacle_margin = tile_size * 0.5  # Half-tile clearance
-
-        # Performance Cache: Pre-computed blocked cells map
-        self._blocked_cache = {}  # Dict[(grid_x, grid_y)] = True for blocked cells
-        self._buildBlockedCache()  # Build cache at initialization
-
     def findPath(
         self,
         start: Tuple[float, float],
@@ -70,6 +58,8 @@ class Pathfinder:
         """
         Find path from start to goal avoiding islands and dynamic obstacles.
 
+        If the goal is blocked, the nearest free cell is used instead.
+
         Args:
             start: Starting position (world coordinates)
             goal: Goal position (world coordinates)
@@ -89,101 +79,80 @@ class Pathfinder:
         if not self._isValidGrid(start_grid) or not self._isValidGrid(goal_grid):
             return None
 
-        # If goal is on an island, find nearest valid position
-        if goal_grid in self._blocked_cache:
-            goal_grid = self._findNearestValidPosition(goal_grid)
-            if goal_grid is None:
-                return None
-
-        # Run A*
-        path_grid = self._astar(start_grid, goal_grid, max_iterations)
-
-        if path_grid is None or len(path_grid) == 0:
+        profile = LEVIATHAN
+        if max_iterations != profile.max_expansions:
+            profile = dataclasses.replace(LEVIATHAN, max_expansions=max_iterations)
+        layer, layer_key = self._dynamicObstacleRequest()
+        path_grid = navigation.find_cells(self.map_grid, profile, start_grid, goal_grid,
+                                          layer=layer, layer_key=layer_key)
+        if not path_grid:
             return None
 
-        # Convert grid path to world coordinates
-        path_world = [self._gridToWorld(p) for p in path_grid]
-
-        # Simplify path (remove unnecessary intermediate points)
-        path_world = self._simplifyPath(path_world)
-
-        return path_world
+        # Convert grid path to world coordinates, keeping only the points where direction changes
+        return [self._gridToWorld(p) for p in simplify_cells(path_grid)]
 
-    def _astar(
+    def findRoute(
         self,
-        start: Tuple[int, int],
-        goal: Tuple[int, int],
-        max_iterations: int
-    ) -> Optional[List[Tuple[int, int]]]:
-        """A* algorithm on grid coordinates."""
+        start: Tuple[float, float],
+        goal: Tuple[float, float]
+    ) -> Optional[List[Tuple[float, float]]]:
+        """
+        Path to a destination shared by many units (enemy base), read from its flow field.
 
-        open_set = []
-        heapq.heappush(open_set, (0, start))
+        Falls back to findPath when a dynamic obstacle lies on the field path.
 
-        came_from = {}
-        g_score = {start: 0}
-        f_score = {start: self._heuristic(start, goal)}
+        Returns:
+            List of waypoints in world coordinates, or None if no path
+        """
+        if self.map_grid is None:
+            return None
 
-        closed_set = set()
-        iterations = 0
+        start_grid = self._worldToGrid(start)
+        goal_grid = self._worldToGrid(goal)
+        if not self._isValidGrid(start_grid) or not self._isValidGrid(goal_grid):
+            return None
 
-        while open_set and iterations < max_iterations:
-            iterations += 1
+        layer, layer_key = self._dynamicObstacleRequest()
+        path_grid = navigation.route_cells(self.map_grid, LEVIATHAN, start_grid, goal_grid,
+                                           layer=layer, layer_key=layer_key)
+        if not path_grid:
+            return None
+        return [self._gridToWorld(p) for p in simplify_cells(path_grid)]
 
-            _, current = heapq.heappop(open_set)
+    def obstacleCells(self, obstacles) -> Tuple[int, ...]:
+        """Flat indexes (y * width + x) of the cells blocked by dynamic obstacles (storms, bandits).
 
-            if current in closed_set:
+        Obstacles that moved inside the same cells give the same cells: used as path cache key and
+        as coalescing key of the path requests.
+        """
+        return self._blockedCells(self._dynamicObstacleLayer(obstacles))
+
+    def _dynamicObstacleRequest(self):
+        """(cost layer, layer key) of the current dynamic obstacles, (None, None) without any."""
+        if not self.dynamic_obstacles:
+            return None, None
+        layer = self._dynamicObstacleLayer(self.dynamic_obstacles)
+        return layer, self._blockedCells(layer)
+
+    @staticmethod
+    def _blockedCells(layer: np.ndarray) -> Tuple[int, ...]:
+        return tuple(np.flatnonzero(np.isinf(layer)).tolist())
+
+    def _dynamicObstacleLayer(self, obstacles) -> np.ndarray:
+        """Impassable cells whose center is within a dynamic obstacle (storms, bandits)."""
+        layer = np.zeros((self.map_height, self.map_width), dtype=np.float32)
+        centers_x = (np.arange(self.map_width) + 0.5) * self.tile_size
+        centers_y = (np.arange(self.map_height) + 0.5) * self.tile_size
+        for obstacle_x, obstacle_y, obstacle_radius in obstacles:
+            near_x = np.abs(centers_x - obstacle_x) < obstacle_radius
+            near_y = np.abs(centers_y - obstacle_y) < obstacle_radius
+            if not near_x.any() or not near_y.any():
                 continue
-
-            # Check if we reached the goal
-            if current == goal:
-                return self._reconstructPath(came_from, current)
-
-            closed_set.add(current)
-
-            # Check neighbors (8 directions)
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if neighbor in closed_set:
-                    continue
-
-                if not self._isValidGrid(neighbor):
-                    continue
-
-                # OPTIMIZED: Use pre-computed cache instead of recalculating
-                if neighbor in self._blocked_cache:
-                    continue
-
-                # Check for dynamic obstacles (storms, bandits, mines)
-                if self._isDynamicObstacle(neighbor):
-                    continue
-
-                # Calculate cost (diagonal moves cost more)
-                move_cost = 1.414 if dx != 0 and dy != 0 else 1.0
-                tentative_g = g_score[current] + move_cost
-
-                if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                    came_from[neighbor] = current
-                    g_score[neighbor] = tentative_g
-                    f = tentative_g + self._heuristic(neighbor, goal)
-                    f_score[neighbor] = f
-                    heapq.heappush(open_set, (f, neighbor))
-
-        return None
-
-    def _reconstructPath(self, came_from: dict, current: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Reconstruct path from came_from dict."""
-        path = [current]
-        while current in came_from:
-            current = came_from[current]
-            path.append(current)
-        path.reverse()
-        return path
-
-    def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> float:
-        """Euclidean distance heuristic."""
-        return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
+            cols, rows = np.nonzero(near_x)[0], np.nonzero(near_y)[0]
+            dist_sq = (centers_x[cols][None, :] - obstacle_x) ** 2 + (centers_y[rows][:, None] - obstacle_y) ** 2
+            window = layer[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+            window[dist_sq < obstacle_radius * obstacle_radius] = np.inf
+        return layer
 
     def _worldToGrid(self, pos: Tuple[float, float]) -> Tuple[int, int]:
         """Convert world coordinates to grid coordinates."""
@@ -200,190 +169,3 @@ class Pathfinder:
     def _isValidGrid(self, pos: Tuple[int, int]) -> bool:
         """Check if grid position is within bounds."""
         return 0 <= pos[0] < self.map_width and 0 <= pos[1] < self.map_height
-
-    def _isIsland(self, pos: Tuple[int, int]) -> bool:
-        """Check if grid position is an island or too close to one."""
-        from src.constants.map_tiles import TileType
-
-        # Check the position itself
-        try:
-            tile_type = self.map_grid[pos[1]][pos[0]]
-            if TileType(tile_type).is_island():
-                return True
-        except:
-            return True  # Treat errors as obstacles
-
-        # Check neighboring cells for safety margin
-        # Convert to world coords to measure distance
-        world_pos = self._gridToWorld(pos)
-
-        # Check surrounding tiles (3x3 grid)
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                neighbor = (pos[0] + dx, pos[1] + dy)
-                if not self._isValidGrid(neighbor):
-                    continue
-
-                try:
-                    tile_type = self.map_grid[neighbor[1]][neighbor[0]]
-                    if TileType(tile_type).is_island():
-                        # Calculate distance to this island tile
-                        neighbor_world = self._gridToWorld(neighbor)
-                        distance = ((world_pos[0] - neighbor_world[0]) ** 2 +
-                                  (world_pos[1] - neighbor_world[1]) ** 2) ** 0.5
-
-                        # If within safety margin, consider it blocked
-                        if distance < self.static_obstacle_margin:
-                            return True
-                except:
-                    continue
-
-        return False
-
-    def _isMine(self, pos: Tuple[int, int]) -> bool:
-        """Check if grid position is a mine or too close to one."""
-        from src.constants.map_tiles import TileType
-
-        # Check the position itself
-        try:
-            tile_type = self.map_grid[pos[1]][pos[0]]
-            if TileType(tile_type) == TileType.MINE:
-                return True
-        except:
-            return False  # Treat errors as safe
-
-        # Check neighboring cells for safety margin
-        # Convert to world coords to measure distance
-        world_pos = self._gridToWorld(pos)
-
-        # Check surrounding tiles (3x3 grid)
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                neighbor = (pos[0] + dx, pos[1] + dy)
-                if not self._isValidGrid(neighbor):
-                    continue
-
-                try:
-                    tile_type = self.map_grid[neighbor[1]][neighbor[0]]
-                    if TileType(tile_type) == TileType.MINE:
-                        # Calculate distance to this mine tile
-                        neighbor_world = self._gridToWorld(neighbor)
-                        distance = ((world_pos[0] - neighbor_world[0]) ** 2 +
-                                  (world_pos[1] - neighbor_world[1]) ** 2) ** 0.5
-
-                        # If within safety margin, consider it blocked
-                        if distance < self.static_obstacle_margin:
-                            return True
-                except:
-                    continue
-
-        return False
-
-    def _isDynamicObstacle(self, pos: Tuple[int, int]) -> bool:
-        """
-        Check if grid position is blocked by a dynamic obstacle.
-
-        Checks: storms, bandits, mines (dynamic list)
-        """
-        # Convert grid position to world coordinates
-        world_pos = self._gridToWorld(pos)
-
-        # Check against all dynamic obstacles (storms, bandits, mines)
-        for obstacle_x, obstacle_y, obstacle_radius in self.dynamic_obstacles:
-            dx = world_pos[0] - obstacle_x
-            dy = world_pos[1] - obstacle_y
-            distance = (dx * dx + dy * dy) ** 0.5
-
-            # If the cell center is within the obstacle radius, consider it blocked
-            if distance < obstacle_radius:
-                return True
-
-        return False
-
-    def _buildBlockedCache(self):
-        """
-        Pre-compute static obstacle map for O(1) pathfinding lookups.
-
-        Performance Optimization:
-            - One-time O(map_width × map_height) scan at initialization
-            - Enables O(1) blocked cell queries during A* (vs O(9) per cell without cache)
-            - Typical speedup: 50-100x faster pathfinding
-
-        Algorithm:
-            1. First pass: Mark all islands and mines
-            2. Second pass: Mark cells within safety margin of obstacles
-
-        Memory Cost:
-            - Approximately 4-8 bytes per blocked cell
-            - Typical: 1000-5000 blocked cells = 4-40KB
-        """
-        from src.constants.map_tiles import TileType
-
-        if self.map_grid is None:
-            return
-
-        # Reset cache
-        self._blocked_cache = {}
-
-        # First pass: mark all islands and mines
-        for y in range(self.map_height):
-            for x in range(self.map_width):
-                try:
-                    tile_type = self.map_grid[y][x]
-                    if TileType(tile_type).is_island() or TileType(tile_type) == TileType.MINE:
-                        self._blocked_cache[(x, y)] = True
-                except:
-                    self._blocked_cache[(x, y)] = True
-
-        # Second pass: mark cells within safety margin of islands/mines
-        blocked_positions = list(self._blocked_cache.keys())
-        for blocked_pos in blocked_positions:
-            # Check 3x3 neighborhood
-            for dy in range(-1, 2):
-                for dx in range(-1, 2):
-                    if dx == 0 and dy == 0:
-                        continue
-
-                    neighbor = (blocked_pos[0] + dx, blocked_pos[1] + dy)
-                    if not self._isValidGrid(neighbor):
-                        continue
-
-                    # Calculate distance
-                    blocked_world = self._gridToWorld(blocked_pos)
-                    neighbor_world = self._gridToWorld(neighbor)
-                    distance = ((blocked_world[0] - neighbor_world[0]) ** 2 +
-                              (blocked_world[1] - neighbor_world[1]) ** 2) ** 0.5
-
-                    if distance < self.static_obstacle_margin:
-                        self._blocked_cache[neighbor] = True
-
-    def _findNearestValidPosition(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
-        """Find nearest non-blocked position - OPTIMIZED with cache."""
-        for radius in range(1, 20):
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    if abs(dx) != radius and abs(dy) != radius:
-                        continue
-
-                    neighbor = (pos[0] + dx, pos[1] + dy)
-                    if self._isValidGrid(neighbor) and neighbor not in self._blocked_cache:
-                        return neighbor
-        return None
-
-    def _simplifyPath(self, path: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
-        """
-        Simplify path by removing unnecessary waypoints.
-        Keep only points where direction changes significantly.
-        """
-        if len(path) <= 2:
-            return path
-
-        simplified = [path[0]]
-
-        for i in range(1, len(path) - 1):
-            # Always keep every Nth point to avoid overly long straight segments
-            if i % 5 == 0:
-                simplified.append(path[i])
-
-        simplified.append(path[-1])
-        return simplified
@@ -0,0 +1,122 @@
+"""Per-entity bitset of component types.
+
+Each component type that is tested in a hot path gets one bit (assigned on
+first use); every entity has an int64 mask of the registered types it owns.
+Testing several components is then one array read and a bitwise AND, and
+"entities having X but not Y" is a vectorized expression on the masks:
+
+    mine = component_index.mask_of(Health, Team, Attack)
+    if component_index.has_all(ent, mine): ...
+    flying = component_index.select(ents, any_of=(Bandits, ProjectileComponent))
+
+The masks follow esper without any hook, like the spatial index: esper
+drops its query cache on every entity/component addition or removal, and
+the index rebuilds its masks (a few NumPy operations per registered type)
+the first time it is read after such a change. Entities scheduled for
+deletion keep their components until esper finalizes them, as with
+esper.has_component.
+"""
+from typing import Dict, Iterable
+
+import esper
+import numpy as np
+
+# int64 masks: one bit per registered component type
+MAX_INDEXED_COMPONENTS = 63
+
+
+class _SyncMarker:
+    """Never instantiated: esper's cached (empty) query result for it tells whether the cache was cleared."""
+
+
+class ComponentIndex:
+    """Bitsets of the registered component types, indexed by entity id."""
+
+    def __init__(self):
+        self._bits: Dict[type, int] = {}
+        self._masks = np.zeros(256, dtype=np.int64)
+        self._marker = None
+
+    # Bits ----------------------------------------------------------------------
+    def bit(self, component_type: type) -> int:
+        """Bit of a component type (registered on first use)."""
+        bit = self._bits.get(component_type)
+        if bit is None:
+            if len(self._bits) >= MAX_INDEXED_COMPONENTS:
+                raise ValueError(f"Too many indexed component types (max {MAX_INDEXED_COMPONENTS})")
+            bit = self._bits[component_type] = 1 << len(self._bits)
+            self._marker = None  # fill the new bit at the next read
+        return bit
+
+    def mask_of(self, *component_types: type) -> int:
+        """Mask of several component types."""
+        mask = 0
+        for component_type in component_types:
+            mask |= self.bit(component_type)
+        return mask
+
+    # Masks ---------------------------------------------------------------------
+    def masks(self) -> np.ndarray:
+        """Up-to-date mask array (index = entity id, 0 beyond the last entity)."""
+        if self._marker is None or esper.get_component(_SyncMarker) is not self._marker:
+            self._rebuild()
+        return self._masks
+
+    def _rebuild(self) -> None:
+        entities = esper._entities
+        highest = max(entities, default=0)
+        if highest >= self._masks.size:
+            self._masks = np.zeros(max(highest + 1, self._masks.size * 2), dtype=np.int64)
+        else:
+            self._masks.fill(0)
+        masks = self._masks
+        components = esper._components
+        for component_type, bit in self._bits.items():
+            owners = components.get(component_type)
+            if owners:
+                masks[np.fromiter(owners, dtype=np.int64, count=len(owners))] |= bit
+        self._marker = esper.get_component(_SyncMarker)
+
+    def entity_mask(self, entity: int) -> int:
+        """Mask of one entity (0 for an unknown entity)."""
+        masks = self.masks()
+        return int(masks[entity]) if 0 <= entity < masks.size else 0
+
+    def has(self, entity: int, component_type: type) -> bool:
+        bit = self.bit(component_type)
+        return bool(self.entity_mask(entity) & bit)
+
+    def has_all(self, entity: int, mask: int) -> bool:
+        return self.entity_mask(entity) & mask == mask
+
+    def has_any(self, entity: int, mask: int) -> bool:
+        return bool(self.entity_mask(entity) & mask)
+
+    # Vectorized ------------------------------------------------------------------
+    def masks_for(self, entities: np.ndarray) -> np.ndarray:
+        """Masks aligned on an int64 array of entity ids."""
+        masks = self.masks()
+        entities = np.asarray(entities, dtype=np.int64)
+        result = np.zeros(entities.size, dtype=np.int64)
+        known = (entities >= 0) & (entities < masks.size)
+        result[known] = masks[entities[known]]
+        return result
+
+    def select(self, entities: np.ndarray, all_of: Iterable[type] = (), any_of: Iterable[type] = (),
+               none_of: Iterable[type] = ()) -> np.ndarray:
+        """Boolean mask (aligned on ``entities``) of the entities having all of ``all_of``,
+        at least one of ``any_of`` (if given) and none of ``none_of``."""
+        required = self.mask_of(*all_of)
+        any_mask = self.mask_of(*any_of)
+        excluded = self.mask_of(*none_of)
+        masks = self.masks_for(entities)
+        selected = (masks & required) == required
+        if any_mask:
+            selected &= (masks & any_mask) != 0
+        if excluded:
+            selected &= (masks & excluded) == 0
+        return selected
+
+
+# Shared instance
+component_index = ComponentIndex()
@@ -0,0 +1,217 @@
+"""Columnar (struct-of-arrays) storage for the hot ECS components.
+
+PositionComponent, VelocityComponent, HealthComponent and TeamComponent do not
+keep their values in the instance dict: each instance owns a row in a
+ComponentTable and its attributes are views on contiguous NumPy columns.
+Existing code keeps reading and writing ``pos.x`` as before, while vectorized
+code can work on whole columns (see ComponentStore.query).
+
+Rows are allocated when a component is created and released when it is
+garbage collected (i.e. once esper drops the entity), so the tables follow
+entity creation and deletion without any hook in esper. Which rows belong to
+which live entity is always read from esper itself at query time.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import esper
+
+from src.managers.component_index import component_index
+
+
+class StoredField:
+    """Data descriptor exposing one float column of a ComponentTable as an attribute."""
+
+    __slots__ = ("table", "index", "name")
+
+    def __init__(self, table: "ComponentTable", index: int, name: str):
+        self.table = table
+        self.index = index
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return self.table.views[self.index][obj._row]
+
+    def __set__(self, obj, value):
+        self.table.views[self.index][obj._row] = float(value)
+
+
+class IntegralField(StoredField):
+    """Integer column, or float column whose integral values read back as int.
+
+    Health points are ints almost everywhere but some heals/damages are floats:
+    keeping them in a float column and returning ints when integral preserves
+    what the rest of the code sees (display, comparisons, int() calls).
+    """
+
+    __slots__ = ("is_float",)
+
+    def __init__(self, table: "ComponentTable", index: int, name: str, is_float: bool):
+        super().__init__(table, index, name)
+        self.is_float = is_float
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = self.table.views[self.index][obj._row]
+        if self.is_float and value.is_integer():
+            return int(value)
+        return value
+
+    def __set__(self, obj, value):
+        self.table.views[self.index][obj._row] = float(value) if self.is_float else int(value)
+
+
+class ComponentTable:
+    """Fixed set of columns with a row free-list, grown by doubling."""
+
+    def __init__(self, name: str, fields: Sequence[Tuple[str, type]], capacity: int = 256, keep_int: Sequence[str] = ()):
+        self.name = name
+        self.field_names: Tuple[str, ...] = tuple(field for field, _ in fields)
+        self.dtypes: Tuple[np.dtype, ...] = tuple(np.dtype(dtype) for _, dtype in fields)
+        self._keep_int = set(keep_int)
+        self.capacity = 0
+        self.columns: List[np.ndarray] = []
+        self.views: List[memoryview] = []
+        self._free: List[int] = []
+        self._next_row = 0
+        self.live_rows = 0
+        self._grow(capacity)
+
+    # Rows ------------------------------------------------------------------
+    def allocate(self) -> int:
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self._next_row >= self.capacity:
+                self._grow(self.capacity * 2)
+            row = self._next_row
+            self._next_row += 1
+        self.live_rows += 1
+        return row
+
+    def release(self, row: int) -> None:
+        self._free.append(row)
+        self.live_rows -= 1
+
+    def _grow(self, capacity: int) -> None:
+        columns = []
+        for index, dtype in enumerate(self.dtypes):
+            column = np.zeros(capacity, dtype=dtype)
+            if self.columns:
+                column[: self.capacity] = self.columns[index]
+            columns.append(column)
+        self.columns = columns
+        # memoryview indexing returns plain Python scalars and is much faster than ndarray indexing
+        self.views = [memoryview(column) for column in columns]
+        self.capacity = capacity
+
+    # Access ----------------------------------------------------------------
+    def fields(self) -> Tuple[StoredField, ...]:
+        """Descriptors to declare on the component class, in column order."""
+        fields = []
+        for index, (name, dtype) in enumerate(zip(self.field_names, self.dtypes)):
+            if dtype.kind in "iu" or name in self._keep_int:
+                fields.append(IntegralField(self, index, name, is_float=dtype.kind == "f"))
+            else:
+                fields.append(StoredField(self, index, name))
+        return tuple(fields)
+
+    def column(self, name: str) -> np.ndarray:
+        """Whole column (capacity-sized); index it with the rows of a query."""
+        return self.columns[self.field_names.index(name)]
+
+
+class StoredComponent:
+    """Base class of the components whose values live in a ComponentTable.
+
+    Subclasses define ``_table`` and declare its fields as class attributes,
+    then call ``self._attach()`` first thing in ``__init__``.
+    """
+
+    _table: ComponentTable
+
+    def _attach(self) -> None:
+        self._row = self._table.allocate()
+
+    def __del__(self):
+        row = self.__dict__.get("_row")
+        if row is not None:
+            try:
+                self._table.release(row)
+            except Exception:
+                # Interpreter shutdown: the table may already be gone
+                pass
+
+    def _values(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self._table.field_names)
+
+    def __copy__(self):
+        clone = self.__class__(*self._values())
+        for key, value in self.__dict__.items():
+            if key != "_row":
+                clone.__dict__[key] = value
+        return clone
+
+    def __deepcopy__(self, memo):
+        import copy
+        clone = self.__class__(*self._values())
+        memo[id(self)] = clone
+        for key, value in self.__dict__.items():
+            if key != "_row":
+                clone.__dict__[key] = copy.deepcopy(value, memo)
+        return clone
+
+    def __getstate__(self):
+        state = {key: value for key, value in self.__dict__.items() if key != "_row"}
+        state["_stored_values"] = self._values()
+        return state
+
+    def __setstate__(self, state):
+        values = state.pop("_stored_values")
+        self._attach()
+        for name, value in zip(self._table.field_names, values):
+            setattr(self, name, value)
+        self.__dict__.update(state)
+
+
+class ComponentStore:
+    """Registry of the component tables and vectorized queries over esper."""
+
+    def __init__(self):
+        self.tables: Dict[str, ComponentTable] = {}
+
+    def register(self, name: str, fields: Sequence[Tuple[str, type]], keep_int: Sequence[str] = ()) -> ComponentTable:
+        table = ComponentTable(name, fields, keep_int=keep_int)
+        self.tables[name] = table
+        return table
+
+    def query(self, *component_types) -> Tuple[np.ndarray, List[Optional[np.ndarray]]]:
+        """Entities having all the given components, with their rows.
+
+        Returns:
+            (entities, rows): entities as an int64 array, and for each component
+            type the int64 array of its rows (None for non stored types, which
+            only filter the query). Order matches esper.get_components.
+        """
+        entities: List[int] = []
+        stored = [isinstance(getattr(ctype, "_table", None), ComponentTable) for ctype in component_types]
+        row_lists: List[List[int]] = [[] for _ in component_types]
+        for ent, comps in esper.get_components(*component_types):
+            entities.append(ent)
+            for index, comp in enumerate(comps):
+                if stored[index]:
+                    row_lists[index].append(comp._row)
+        rows = [np.fromiter(row_list, dtype=np.int64, count=len(row_list)) if stored[index] else None
+                for index, row_list in enumerate(row_lists)]
+        return np.fromiter(entities, dtype=np.int64, count=len(entities)), rows
+
+    @staticmethod
+    def has_component_mask(entities: np.ndarray, component_type) -> np.ndarray:
+        """Boolean mask (aligned on ``entities``) of the entities having component_type."""
+        return component_index.select(entities, all_of=(component_type,))
+
+
+# Shared instance
+component_store = ComponentStore()
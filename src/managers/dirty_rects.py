@@ -0,0 +1,137 @@
+"""Dirty rectangles of a frame, for the optional partial presentation mode.
+
+Each frame the renderer reports what changed on screen since the previous
+frame: the sprites that appeared, moved or disappeared (diff() compares the
+blit lists of both frames), the fog tiles whose state changed, and the
+footprint of the UI widgets (track() keeps the previous footprint so that a
+closed tooltip is repainted too). end_frame() merges the rectangles and
+decides how the frame is presented:
+
+- None: full frame (first frame, camera moved or zoomed, terrain changed,
+  full-screen overlay, too many rectangles or too large an area), the
+  renderer redraws everything and flips;
+- a list of rectangles: only those areas are redrawn (clipped) and given to
+  pygame.display.update().
+
+dirty_fraction is the share of the screen presented by the last frame (1.0
+for a full frame), shown in the debug overlay for tuning.
+"""
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import pygame
+
+from src.constants.gameplay import DIRTY_RECT_FULL_FRACTION, DIRTY_RECT_MAX_RECTS
+
+
+def blit_rect(item: Sequence) -> pygame.Rect:
+    """Screen rectangle covered by a blits() item (surface, dest[, area, flags])."""
+    surface, dest = item[0], item[1]
+    if len(item) > 2 and item[2] is not None:
+        return pygame.Rect(dest[0], dest[1], item[2][2], item[2][3])
+    return pygame.Rect(dest[0], dest[1], surface.get_width(), surface.get_height())
+
+
+def merge_rects(rects: Iterable[pygame.Rect]) -> List[pygame.Rect]:
+    """Union of overlapping or touching rectangles, until none of them touch."""
+    merged: List[pygame.Rect] = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        # A rectangle grown by a merge may now touch earlier ones: merge again
+        index = rect.inflate(2, 2).collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.inflate(2, 2).collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRectTracker:
+    """Collects the changed areas of a frame and chooses between a partial update and a full flip."""
+
+    def __init__(self, max_rects: int = DIRTY_RECT_MAX_RECTS, full_fraction: float = DIRTY_RECT_FULL_FRACTION):
+        self.max_rects = max_rects
+        self.full_fraction = full_fraction
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget the previous frame: the next one is presented in full."""
+        self._view: Optional[Hashable] = None
+        self._size: Tuple[int, int] = (0, 0)
+        self._full = True
+        self._rects: List[pygame.Rect] = []
+        self._tracked: Dict[Hashable, List[pygame.Rect]] = {}
+        self._drawn: Dict[Hashable, Dict[Tuple, pygame.Rect]] = {}
+        self.dirty_fraction = 1.0
+        self.full_frames = 0
+        self.partial_frames = 0
+
+    # Frame -----------------------------------------------------------------
+    def begin_frame(self, view: Hashable, size: Tuple[int, int]) -> None:
+        """Start a frame; any change of view (camera, zoom, team, settings) makes it full."""
+        self._full = view != self._view or size != self._size
+        self._view = view
+        self._size = size
+        self._rects = []
+
+    def mark_full(self) -> None:
+        """The whole screen changes this frame (full-screen overlay, unbounded drawing)."""
+        self._full = True
+
+    def add(self, rects: Iterable[pygame.Rect]) -> None:
+        """Areas that changed this frame only."""
+        self._rects.extend(rects)
+
+    def track(self, source: Hashable, rects: Optional[Iterable[pygame.Rect]]) -> None:
+        """Footprint of a widget this frame; its previous footprint is repainted as well.
+
+        None means that the source covers the whole screen this frame.
+        """
+        previous = self._tracked.get(source, ())
+        if rects is None:
+            self._tracked[source] = []
+            self.mark_full()
+            return
+        current = [pygame.Rect(rect) for rect in rects]
+        self._tracked[source] = current
+        self._rects.extend(previous)
+        self._rects.extend(current)
+
+    def diff(self, source: Hashable, items: Iterable[Sequence]) -> None:
+        """Blit list of a source this frame: only the blits that differ from the previous frame are dirty.
+
+        A blit is identified by its surface, destination and flags, so a
+        sprite that neither moved nor changed image costs no area.
+        """
+        current: Dict[Tuple, pygame.Rect] = {}
+        for item in items:
+            rect = blit_rect(item)
+            current[(id(item[0]), rect.x, rect.y, rect.w, rect.h) + tuple(item[3:])] = rect
+        previous = self._drawn.get(source, {})
+        self._drawn[source] = current
+        self._rects.extend(rect for key, rect in current.items() if key not in previous)
+        self._rects.extend(rect for key, rect in previous.items() if key not in current)
+
+    def end_frame(self) -> Optional[List[pygame.Rect]]:
+        """Areas to redraw and present, or None for a full frame."""
+        width, height = self._size
+        if not self._full and width > 0 and height > 0:
+            screen = pygame.Rect(0, 0, width, height)
+            rects = [rect.clip(screen) for rect in self._rects]
+            rects = merge_rects(rect for rect in rects if rect.w > 0 and rect.h > 0)
+            area = sum(rect.w * rect.h for rect in rects)
+            fraction = area / (width * height)
+            if len(rects) <= self.max_rects and fraction <= self.full_fraction:
+                self.dirty_fraction = fraction
+                self.partial_frames += 1
+                return rects
+        self.dirty_fraction = 1.0
+        self.full_frames += 1
+        return None
+
+    @staticmethod
+    def present(rects: Optional[List[pygame.Rect]]) -> None:
+        """Show the frame: pygame.display.update(rects), or flip() for a full frame."""
+        if rects is None:
+            pygame.display.flip()
+        elif rects:
+            pygame.display.update(rects)
@@ -0,0 +1,124 @@
+"""Per-tick command buffer for the structural changes of the ECS world.
+
+Systems record entity creations, component additions/removals and
+deletions here instead of changing esper's tables in the middle of their
+iterations. GameEngine._update_game flushes the buffer once per simulation
+tick (the sync point): every recorded change is applied in one batch, with a
+single esper cache invalidation.
+
+- delete() marks the entity dead right away (esper.entity_exists() is False
+  from then on, as with esper.delete_entity) and is idempotent: recording the
+  deletion of an entity already dead, deleted or never created is harmless,
+  so callers don't need entity_exists guards. esper.process() also finalizes
+  the deletions recorded before it, at its start.
+- create() reserves the entity id immediately; the entity and its components
+  appear in the queries at the next flush. add_component() and delete() on
+  that id before the flush are merged into the creation.
+- last_counts holds the number of changes applied by the last flush
+  (shown in the debug overlay), totals the counts since the last clear().
+"""
+from typing import Dict, List, Set, Tuple, Type
+
+import esper
+
+COUNTER_NAMES = ("created", "deleted", "components_added", "components_removed")
+
+
+class EntityCommandBuffer:
+    """Entity creations, component changes and deletions waiting for the next flush."""
+
+    def __init__(self):
+        self.last_counts: Dict[str, int] = dict.fromkeys(COUNTER_NAMES, 0)
+        self.totals: Dict[str, int] = dict.fromkeys(COUNTER_NAMES, 0)
+        self._reset_pending()
+
+    def _reset_pending(self) -> None:
+        self._created: Dict[int, List[object]] = {}
+        self._added: List[Tuple[int, object, Type]] = []
+        self._removed: List[Tuple[int, Type]] = []
+        self._deleted: Set[int] = set()
+
+    # Recording -----------------------------------------------------------------
+    def create(self, *components) -> int:
+        """Record the creation of an entity and return its (reserved) id."""
+        entity = next(esper._entity_count)
+        self._created[entity] = list(components)
+        return entity
+
+    def add_component(self, entity: int, component, type_alias: Type = None) -> None:
+        """Record the addition (or replacement) of a component."""
+        pending = self._created.get(entity)
+        if pending is not None and type_alias is None:
+            pending.append(component)
+        else:
+            self._added.append((entity, component, type_alias or type(component)))
+
+    def remove_component(self, entity: int, component_type: Type) -> None:
+        """Record the removal of a component (ignored if it is gone by the flush)."""
+        self._removed.append((entity, component_type))
+
+    def delete(self, entity: int) -> None:
+        """Record the deletion of an entity."""
+        if self._created.pop(entity, None) is not None:
+            return
+        if entity in esper._entities:
+            self._deleted.add(entity)
+            esper._dead_entities.add(entity)
+
+    def is_pending(self) -> bool:
+        return bool(self._created or self._added or self._removed or self._deleted)
+
+    # Sync point ------------------------------------------------------------------
+    def flush(self) -> Dict[str, int]:
+        """Apply every recorded change and return the counts of this flush."""
+        entities = esper._entities
+        components = esper._components
+        counts = dict.fromkeys(COUNTER_NAMES, 0)
+
+        for entity, new_components in self._created.items():
+            entity_components = entities.setdefault(entity, {})
+            for component in new_components:
+                component_type = type(component)
+                components.setdefault(component_type, set()).add(entity)
+                entity_components[component_type] = component
+            counts["created"] += 1
+
+        for entity, component, component_type in self._added:
+            entity_components = entities.get(entity)
+            if entity_components is None or entity in self._deleted:
+                continue
+            components.setdefault(component_type, set()).add(entity)
+            entity_components[component_type] = component
+            counts["components_added"] += 1
+
+        for entity, component_type in self._removed:
+            entity_components = entities.get(entity)
+            if entity_components is None or entity_components.pop(component_type, None) is None:
+                continue
+            owners = components[component_type]
+            owners.discard(entity)
+            if not owners:
+                del components[component_type]
+            counts["components_removed"] += 1
+
+        # Deletions: let esper finalize every dead entity still in its tables
+        # (those recorded before esper.process() were finalized by it already)
+        counts["deleted"] = len(self._deleted)
+        esper._dead_entities.intersection_update(entities)
+        esper.clear_dead_entities()
+
+        self._reset_pending()
+        self.last_counts = counts
+        for name, value in counts.items():
+            self.totals[name] += value
+        return counts
+
+    def clear(self) -> None:
+        """Drop the recorded changes and the counters (new game, tests)."""
+        self._reset_pending()
+        self.last_counts = dict.fromkeys(COUNTER_NAMES, 0)
+        self.totals = dict.fromkeys(COUNTER_NAMES, 0)
+
+
+# Shared instance
+entity_commands = EntityCommandBuffer()
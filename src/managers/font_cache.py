@@ -1,11 +1,26 @@
-"""Simple font cache to avoid creating Font objects every frame.
+"""Font and rendered-text caches, to avoid creating Font objects and text surfaces every frame.
 
-Usage: from src.managers.font_cache import get_font
+Usage: from src.managers.font_cache import get_font, text_cache
        font = get_font(name, size, bold=False, italic=False)
+       surface = text_cache.render(font, "Mode: Normal", (255, 255, 255))
+       text_cache.blit_glyphs(surface, font, f"{cooldown:.1f}s", color, (x, y))
+
+text_cache keeps the surfaces returned by font.render, keyed by (font,
+string, colour, antialias), in an LRU bounded by their memory
+(TEXT_CACHE_BYTES). Numeric fields that change often (gold, cooldowns,
+health) would fill it with one surface per value: glyph_blits() /
+blit_glyphs() compose them from the cached surface of each character
+instead, so that "1234" costs four cache hits once the digits are known.
+hits / misses / hit_rate are shown in the debug overlay.
 """
+from collections import OrderedDict
 from functools import lru_cache
+from typing import List, Sequence, Tuple
+
 import pygame
 
+from src.constants.gameplay import TEXT_CACHE_BYTES
+
 
 @lru_cache(maxsize=256)
 def get_font(name: str | None, size: int, bold: bool = False, italic: bool = False) -> pygame.font.Font:
@@ -22,3 +37,96 @@ def get_font(name: str | None, size: int, bold: bool = False, italic: bool = Fal
         # As a fallback try simpler construction
         f = pygame.font.Font(None, int(size))
     return f
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+class TextCache:
+    """Surfaces of font.render keyed by (font, text, color, antialias), in LRU order."""
+
+    def __init__(self, budget_bytes: int = TEXT_CACHE_BYTES):
+        self.budget_bytes = budget_bytes
+        self._surfaces: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pygame.font.Font, text: str, color: Sequence[int],
+               antialias: bool = True) -> pygame.Surface:
+        """font.render(text, antialias, color), from the cache when already rendered.
+
+        The returned surface is shared: blit it, do not draw on it.
+        """
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        self.bytes_used += _surface_bytes(surface)
+        # Least recently used first; the surface just added is kept even if over budget
+        while self.bytes_used > self.budget_bytes and len(self._surfaces) > 1:
+            _, evicted = self._surfaces.popitem(last=False)
+            self.bytes_used -= _surface_bytes(evicted)
+        return surface
+
+    # Numeric fields ----------------------------------------------------------
+    def _glyphs(self, font: pygame.font.Font, text: str, color: Sequence[int],
+                antialias: bool) -> List[pygame.Surface]:
+        glyphs = []
+        for char in text:
+            try:
+                glyphs.append(self.render(font, char, color, antialias))
+            except pygame.error:
+                # Zero-width character (variation selector...): nothing to draw
+                continue
+        return glyphs
+
+    def glyph_blits(self, font: pygame.font.Font, text: str, color: Sequence[int], dest: Tuple[int, int],
+                    antialias: bool = True) -> List[Tuple[pygame.Surface, Tuple[int, int]]]:
+        """Blit list drawing text character by character from the cached glyphs.
+
+        Meant for short, frequently changing fields (numbers, timers): the
+        digits are laid out with their rendered width, without kerning.
+        """
+        x, y = dest
+        blits = []
+        for glyph in self._glyphs(font, text, color, antialias):
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return blits
+
+    def glyphs_size(self, font: pygame.font.Font, text: str, color: Sequence[int],
+                    antialias: bool = True) -> Tuple[int, int]:
+        """Size of text as drawn by glyph_blits()."""
+        return sum(glyph.get_width() for glyph in self._glyphs(font, text, color, antialias)), font.get_height()
+
+    def blit_glyphs(self, target: pygame.Surface, font: pygame.font.Font, text: str, color: Sequence[int],
+                    dest: Tuple[int, int], antialias: bool = True) -> pygame.Rect:
+        """Draw text on target from the cached glyphs; returns the area covered."""
+        target.blits(self.glyph_blits(font, text, color, dest, antialias), doreturn=False)
+        return pygame.Rect(dest, self.glyphs_size(font, text, color, antialias))
+
+
+# Shared instance
+text_cache = TextCache()
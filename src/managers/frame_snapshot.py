@@ -0,0 +1,152 @@
+"""Frame snapshots and simulation thread of the optional pipelined mode.
+
+With the pipelined_simulation option, the fixed simulation ticks run on a
+worker thread while the main thread draws the world of the previous batch:
+
+- at the end of each batch of ticks, the simulation thread reads from the
+  ECS everything the world rendering needs (sprite states, bullets, fog of
+  the displayed team, vision circle) into an immutable FrameSnapshot and
+  publishes it to a SnapshotBuffer;
+- the main thread draws the last published snapshot, without touching the
+  ECS, while the next batch computes. It then waits for the batch
+  (SimulationWorker.wait) before handling events and drawing the UI, the
+  only work that reads the live ECS.
+
+The world is therefore shown one batch behind the UI. pygame blits, the
+display flip and the NumPy-heavy systems (vision, danger maps) release the
+GIL, which is where the two threads overlap today; a free-threaded Python
+lets the pure-Python parts overlap as well.
+"""
+import threading
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+import pygame
+
+
+class SpriteState(NamedTuple):
+    """What the renderer needs to draw one sprite, read from the ECS."""
+    entity: int
+    x: float
+    y: float
+    previous: Optional[Tuple[float, float]]  # Position at the previous tick (interpolation)
+    direction: float
+    image_key: str
+    width: int
+    height: int
+    reversable: bool
+    image: Optional[pygame.Surface]  # Image of the sprite component (None: loaded from image_key)
+    layer: int
+    team: Optional[int]
+    always_visible: bool  # Drawn whatever the fog (bandits)
+    invincible: bool  # Zasper ability: blinking, semi-transparent
+    shielded: bool  # Barhamus shield: blue halo
+    selected: bool
+    health: float  # Health ratio for the health bar, -1.0 when no bar is shown
+
+
+class FrameSnapshot(NamedTuple):
+    """Immutable state of the world at the end of a batch of ticks.
+
+    The NumPy arrays are read-only copies; the sprite states are tuples.
+    """
+    tick: int
+    team: int  # Team whose point of view the fog and visibility follow
+    sprites: Tuple[SpriteState, ...]  # Ordered by entity id
+    xs: np.ndarray  # Sprite positions (culling)
+    ys: np.ndarray
+    extent: int  # Largest sprite side, in world pixels
+    projectiles: Dict[str, np.ndarray]  # Live bullets, one column per projectile_store field
+    visible: Optional[np.ndarray]  # Fog grids of the team, [y, x] (None: no fog, AI vs AI)
+    explored: Optional[np.ndarray]
+    vision_circle: Optional[Tuple[float, float, float]]  # Selected unit: (x, y, vision range in tiles)
+
+
+def frozen(array: np.ndarray) -> np.ndarray:
+    """Read-only copy of an array."""
+    array = np.array(array, copy=True)
+    array.flags.writeable = False
+    return array
+
+
+class SnapshotBuffer:
+    """Double buffer of frame snapshots: the simulation publishes, the renderer reads the front one."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._front: Optional[FrameSnapshot] = None
+        self._back: Optional[FrameSnapshot] = None
+        self.published = 0
+
+    @property
+    def front(self) -> Optional[FrameSnapshot]:
+        """Last published snapshot (None before the first one)."""
+        with self._lock:
+            return self._front
+
+    def publish(self, snapshot: FrameSnapshot) -> None:
+        """Make a snapshot the front one; the previous front becomes the back buffer."""
+        with self._lock:
+            self._back, self._front = self._front, snapshot
+            self.published += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._front = self._back = None
+
+
+class SimulationWorker:
+    """Thread running one job at a time (a batch of simulation ticks) for the main thread."""
+
+    def __init__(self, name: str = "simulation"):
+        self._job: Optional[Callable[[], None]] = None
+        self._error: Optional[BaseException] = None
+        self._stopping = False
+        self._ready = threading.Condition()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = threading.Thread(target=self._loop, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        return not self._idle.is_set()
+
+    def start(self, job: Callable[[], None]) -> None:
+        """Run job on the worker thread; the previous job must be finished (see wait)."""
+        if self.busy:
+            raise RuntimeError("The previous simulation job is still running")
+        with self._ready:
+            self._idle.clear()
+            self._job = job
+            self._ready.notify()
+
+    def wait(self) -> None:
+        """Block until the current job is done; re-raise its exception in the calling thread."""
+        self._idle.wait()
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def stop(self) -> None:
+        """Finish the current job and end the thread."""
+        self._idle.wait()
+        with self._ready:
+            self._stopping = True
+            self._ready.notify()
+        self._thread.join()
+
+    def _loop(self) -> None:
+        while True:
+            with self._ready:
+                while self._job is None and not self._stopping:
+                    self._ready.wait()
+                if self._job is None:
+                    return
+                job, self._job = self._job, None
+            try:
+                job()
+            except BaseException as error:  # Re-raised by wait() in the main thread
+                self._error = error
+            finally:
+                self._idle.set()
@@ -9,6 +9,7 @@ import pygame
 import numpy as np
 
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.positionComponent import PositionComponent
 from src.components.core.spriteComponent import SpriteComponent
 from src.components.core.teamComponent import TeamComponent
@@ -167,7 +168,7 @@ class IslandResourceManager:
         esper.add_component(entity, sprite_component)
 
         # Zone collision standard - la taille plus grande du sprite améliore déjà la collecte
-        esper.add_component(entity, CanCollideComponent())
+        esper.add_component(entity, CanCollideComponent(layer=CollisionLayer.RESOURCE))
         esper.add_component(entity, TeamComponent(team_id=0))
         esper.add_component(
             entity,
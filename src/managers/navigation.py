@@ -0,0 +1,657 @@
+"""Shared grid navigation service (A* for every AI).
+
+The five AIs used to carry their own A* (scout, druid, architect, leviathan,
+kamikaze), each with its own world/grid conversion, obstacle rules and path
+simplification. They now all go through this service:
+
+- the map grid is kept as an int8 tile array (NavigationGrid), one per grid
+  object, updated in place when a tile changes (mine destroyed); cached
+  paths and flow fields are keyed by its serial number and dropped with it;
+- a NavigationProfile describes how a unit class moves over it (blocked and
+  inflated tiles, tile weights, margins, resolution, diagonal moves); its
+  float32 cost array (np.inf = impassable) is built with NumPy once per
+  profile and grid version;
+- the search itself is a numba-compiled A* over that cost array, plus an
+  optional additive cost layer given per request (danger map, enemies,
+  storms);
+- one LRU path cache with a per-profile time to live is shared by all the AIs;
+- destinations many units share (bases) get a flow field instead: one
+  reverse Dijkstra per (target, profile, grid version) after which every
+  unit reads its next cell in O(1) (route_cells);
+- on large grids (NAVIGATION_HIERARCHY_MIN_CELLS and more) searches go
+  through a sector graph instead of a flat A* (navigation_hierarchy.py).
+
+The time spent in path requests is accumulated per frame (begin_frame) for
+the debug overlay and the benchmark profiler.
+"""
+import itertools
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numba import njit
+from numpy.lib.stride_tricks import sliding_window_view
+
+from src.constants.gameplay import (NAVIGATION_CACHE_ENTRIES, NAVIGATION_CACHE_TTL, NAVIGATION_FLOW_FIELDS,
+                                    NAVIGATION_HIERARCHY_MIN_CELLS, NAVIGATION_SNAP_RADIUS)
+from src.constants.map_tiles import TileType
+from src.settings.settings import TILE_SIZE
+
+Cell = Tuple[int, int]
+WorldPos = Tuple[float, float]
+
+# Number of map grids kept (a new grid object per game; tests build many small ones)
+_MAX_GRIDS = 8
+_grid_serials = itertools.count(1)  # Never reused, unlike id() of a collected grid
+
+
+@dataclass(frozen=True)
+class NavigationProfile:
+    """Traversal rules of a unit class on the tile grid."""
+    name: str
+    sub_tile_factor: int = 1  # Cells per tile side (finer grid for small units)
+    diagonal: bool = True  # 8-neighbour moves (4-neighbour otherwise)
+    diagonal_cost: float = 1.414
+    blocked_tiles: Tuple[int, ...] = ()  # Impassable tile types
+    inflated_tiles: Tuple[Tuple[int, int], ...] = ()  # (tile type, radius in cells): impassable with a margin
+    tile_weights: Tuple[Tuple[int, float], ...] = ()  # (tile type, cost multiplier) of passable tiles
+    margin_radius: int = 0  # Cells around impassable ones weighted by margin_weight
+    margin_weight: float = 1.0
+    border_radius: int = 0  # Impassable cells along the map edges
+    cache_ttl: float = NAVIGATION_CACHE_TTL  # Lifetime of cached paths (0: no cache)
+    max_expansions: int = 0  # Search budget in expanded cells (0: unbounded)
+
+
+_SOLID_TILES = (int(TileType.GENERIC_ISLAND), int(TileType.ALLY_BASE), int(TileType.ENEMY_BASE))
+
+# Druid: islands and bases block, clouds and mines are crossed
+DRUID = NavigationProfile("druid", blocked_tiles=_SOLID_TILES)
+
+# Architect: everything is passable, islands cost more and mines/clouds much more
+ARCHITECT = NavigationProfile(
+    "architect",
+    tile_weights=((int(TileType.GENERIC_ISLAND), 351.0), (int(TileType.MINE), 5001.0), (int(TileType.CLOUD), 5001.0)),
+    max_expansions=2000,
+)
+
+# Leviathan: islands, bases and mines block with a one-tile clearance (storms and bandits come as a request layer)
+LEVIATHAN = NavigationProfile(
+    "leviathan",
+    inflated_tiles=tuple((tile, 1) for tile in _SOLID_TILES + (int(TileType.MINE),)),
+    max_expansions=2000,
+)
+
+# Kamikaze: 4-neighbour moves, islands and mines inflated by two tiles so that paths keep clear of them
+KAMIKAZE = NavigationProfile(
+    "kamikaze",
+    diagonal=False,
+    blocked_tiles=(int(TileType.ALLY_BASE), int(TileType.ENEMY_BASE)),
+    inflated_tiles=((int(TileType.GENERIC_ISLAND), 2), (int(TileType.MINE), 2)),
+)
+
+
+# A* kernel ---------------------------------------------------------------------------------
+
+@njit(cache=True)
+def _heap_push(heap_f, heap_n, count, priority, node):
+    if count == heap_f.shape[0]:
+        grown_f = np.empty(count * 2, dtype=np.float64)
+        grown_n = np.empty(count * 2, dtype=np.int64)
+        grown_f[:count] = heap_f
+        grown_n[:count] = heap_n
+        heap_f, heap_n = grown_f, grown_n
+    i = count
+    while i > 0:
+        up = (i - 1) >> 1
+        if heap_f[up] <= priority:
+            break
+        heap_f[i] = heap_f[up]
+        heap_n[i] = heap_n[up]
+        i = up
+    heap_f[i] = priority
+    heap_n[i] = node
+    return heap_f, heap_n, count + 1
+
+
+@njit(cache=True)
+def _heap_pop(heap_f, heap_n, count):
+    node = heap_n[0]
+    count -= 1
+    priority, last = heap_f[count], heap_n[count]
+    i = 0
+    while True:
+        child = 2 * i + 1
+        if child >= count:
+            break
+        if child + 1 < count and heap_f[child + 1] < heap_f[child]:
+            child += 1
+        if heap_f[child] >= priority:
+            break
+        heap_f[i] = heap_f[child]
+        heap_n[i] = heap_n[child]
+        i = child
+    heap_f[i] = priority
+    heap_n[i] = last
+    return node, count
+
+
+@njit(cache=True)
+def _heuristic(x, y, goal_x, goal_y, diagonal, diagonal_cost, scale):
+    ax = abs(x - goal_x)
+    ay = abs(y - goal_y)
+    if diagonal and diagonal_cost < 2.0:
+        low = min(ax, ay)
+        return ((ax + ay - 2 * low) + diagonal_cost * low) * scale
+    return (ax + ay) * scale
+
+
+@njit(cache=True)
+def _astar(cost, start_x, start_y, goal_x, goal_y, diagonal, diagonal_cost, scale, max_expansions):
+    """A* over a float32 cost array (inf: impassable); a step costs its length times the cost of the
+    entered cell. Returns the (x, y) cells from start to goal (empty if none) and the expanded count."""
+    height, width = cost.shape
+    size = height * width
+    g = np.full(size, np.inf)
+    parent = np.full(size, -1, dtype=np.int64)
+    closed = np.zeros(size, dtype=np.bool_)
+    heap_f = np.empty(64, dtype=np.float64)
+    heap_n = np.empty(64, dtype=np.int64)
+
+    if diagonal:
+        moves = 8
+    else:
+        moves = 4
+    step_x = np.array([-1, 1, 0, 0, -1, -1, 1, 1])
+    step_y = np.array([0, 0, -1, 1, -1, 1, -1, 1])
+
+    start = start_y * width + start_x
+    goal = goal_y * width + goal_x
+    g[start] = 0.0
+    heap_f, heap_n, count = _heap_push(heap_f, heap_n, 0, 0.0, start)
+    expanded = 0
+    found = False
+    while count > 0:
+        node, count = _heap_pop(heap_f, heap_n, count)
+        if closed[node]:
+            continue
+        if node == goal:
+            found = True
+            break
+        closed[node] = True
+        expanded += 1
+        if max_expansions > 0 and expanded > max_expansions:
+            break
+        x = node % width
+        y = node // width
+        for k in range(moves):
+            nx = x + step_x[k]
+            ny = y + step_y[k]
+            if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                continue
+            neighbor = ny * width + nx
+            if closed[neighbor]:
+                continue
+            cell_cost = cost[ny, nx]
+            if not np.isfinite(cell_cost):
+                continue
+            length = diagonal_cost if k >= 4 else 1.0
+            tentative = g[node] + length * cell_cost
+            if tentative < g[neighbor]:
+                g[neighbor] = tentative
+                parent[neighbor] = node
+                priority = tentative + _heuristic(nx, ny, goal_x, goal_y, diagonal, diagonal_cost, scale)
+                heap_f, heap_n, count = _heap_push(heap_f, heap_n, count, priority, neighbor)
+
+    if not found:
+        return np.empty((0, 2), dtype=np.int64), expanded
+    length = 1
+    node = goal
+    while node != start:
+        node = parent[node]
+        length += 1
+    path = np.empty((length, 2), dtype=np.int64)
+    node = goal
+    for i in range(length - 1, -1, -1):
+        path[i, 0] = node % width
+        path[i, 1] = node // width
+        node = parent[node]
+    return path, expanded
+
+
+@njit(cache=True)
+def _flow(cost, target_x, target_y, diagonal, diagonal_cost):
+    """Reverse Dijkstra from a passable target cell: cost to reach the target from every cell (inf when
+    unreachable) and, for each cell, the index of the next cell towards the target (-1: none)."""
+    height, width = cost.shape
+    size = height * width
+    distance = np.full(size, np.inf)
+    next_cell = np.full(size, -1, dtype=np.int32)
+    closed = np.zeros(size, dtype=np.bool_)
+    heap_f = np.empty(256, dtype=np.float64)
+    heap_n = np.empty(256, dtype=np.int64)
+
+    if diagonal:
+        moves = 8
+    else:
+        moves = 4
+    step_x = np.array([-1, 1, 0, 0, -1, -1, 1, 1])
+    step_y = np.array([0, 0, -1, 1, -1, 1, -1, 1])
+
+    target = target_y * width + target_x
+    distance[target] = 0.0
+    heap_f, heap_n, count = _heap_push(heap_f, heap_n, 0, 0.0, target)
+    while count > 0:
+        node, count = _heap_pop(heap_f, heap_n, count)
+        if closed[node]:
+            continue
+        closed[node] = True
+        x = node % width
+        y = node // width
+        entered = cost[y, x]  # Cost of stepping from a neighbour into this cell
+        for k in range(moves):
+            nx = x + step_x[k]
+            ny = y + step_y[k]
+            if nx < 0 or ny < 0 or nx >= width or ny >= height:
+                continue
+            neighbor = ny * width + nx
+            if closed[neighbor] or not np.isfinite(cost[ny, nx]):
+                continue
+            length = diagonal_cost if k >= 4 else 1.0
+            tentative = distance[node] + length * entered
+            if tentative < distance[neighbor]:
+                distance[neighbor] = tentative
+                next_cell[neighbor] = node
+                heap_f, heap_n, count = _heap_push(heap_f, heap_n, count, tentative, neighbor)
+    return distance.reshape((height, width)).astype(np.float32), next_cell
+
+
+# Cost arrays -------------------------------------------------------------------------------
+
+def _dilate(mask: np.ndarray, radius: int) -> np.ndarray:
+    """Cells within a square of radius cells around the mask."""
+    if radius <= 0 or not mask.any():
+        return mask
+    size = 2 * radius + 1
+    padded = np.pad(mask.astype(np.uint8), radius, mode="constant")
+    return sliding_window_view(padded, (size, size)).max(axis=(2, 3)).astype(bool)
+
+
+def build_cost(tiles: np.ndarray, profile: NavigationProfile) -> np.ndarray:
+    """float32 cost array of a profile over an int8 tile grid (np.inf: impassable)."""
+    factor = max(1, int(profile.sub_tile_factor))
+    cells = np.repeat(np.repeat(tiles, factor, axis=0), factor, axis=1) if factor > 1 else tiles
+    cost = np.ones(cells.shape, dtype=np.float32)
+    for tile, weight in profile.tile_weights:
+        cost[cells == tile] = weight
+
+    blocked = np.isin(cells, profile.blocked_tiles) if profile.blocked_tiles else np.zeros(cells.shape, dtype=bool)
+    for tile, radius in profile.inflated_tiles:
+        blocked |= _dilate(cells == tile, radius)
+    cost[blocked] = np.inf
+
+    if profile.margin_radius > 0 and blocked.any():
+        margin = _dilate(blocked, profile.margin_radius) & ~blocked
+        cost[margin] = np.maximum(cost[margin], profile.margin_weight)
+
+    border = min(profile.border_radius, cost.shape[0] // 2, cost.shape[1] // 2)
+    if border > 0:
+        cost[:border, :] = np.inf
+        cost[-border:, :] = np.inf
+        cost[:, :border] = np.inf
+        cost[:, -border:] = np.inf
+    return cost
+
+
+def simplify_cells(cells: Sequence[Cell]) -> List[Cell]:
+    """Keeps the first and last cells and the corners where the direction changes."""
+    if len(cells) <= 2:
+        return list(cells)
+    simplified = [cells[0]]
+    for previous, corner, following in zip(cells, cells[1:], cells[2:]):
+        if (corner[0] - previous[0], corner[1] - previous[1]) != (following[0] - corner[0], following[1] - corner[1]):
+            simplified.append(corner)
+    simplified.append(cells[-1])
+    return simplified
+
+
+class NavigationGrid:
+    """int8 copy of a map grid and the cost arrays of the profiles used on it."""
+
+    def __init__(self, grid):
+        tiles = np.asarray(grid, dtype=np.int8)
+        self.tiles = tiles if tiles.ndim == 2 else np.zeros((0, 0), dtype=np.int8)
+        self.serial = next(_grid_serials)
+        self.version = 0
+        self._costs: Dict[NavigationProfile, np.ndarray] = {}
+        self._hierarchies: Dict[NavigationProfile, "SectorGraph"] = {}
+        self._changes: List[Tuple[int, int, int]] = []  # (version, x, y) of the changed tiles
+
+    def set_tile(self, x: int, y: int, value: int) -> None:
+        if self.tiles[y, x] != value:
+            self.tiles[y, x] = value
+            self._costs.clear()
+            self.version += 1
+            self._changes.append((self.version, x, y))
+
+    def cost(self, profile: NavigationProfile) -> np.ndarray:
+        cost = self._costs.get(profile)
+        if cost is None:
+            cost = self._costs[profile] = build_cost(self.tiles, profile)
+        return cost
+
+    def hierarchy(self, profile: NavigationProfile) -> "SectorGraph":
+        """Sector graph of a profile, brought up to date with the tiles changed since it was built."""
+        from src.managers.navigation_hierarchy import SectorGraph
+
+        cost = self.cost(profile)
+        graph = self._hierarchies.get(profile)
+        if graph is None:
+            graph = self._hierarchies[profile] = SectorGraph(cost, profile.diagonal, profile.diagonal_cost)
+        elif graph.version != self.version:
+            # A tile changes the cost of its cells plus the inflated and margin cells around them
+            factor = max(1, int(profile.sub_tile_factor))
+            reach = max([radius for _, radius in profile.inflated_tiles] + [0]) + profile.margin_radius
+            changed = [(x, y) for version, x, y in self._changes if version > graph.version]
+            xs = [x for x, _ in changed]
+            ys = [y for _, y in changed]
+            graph.update(cost, (min(xs) * factor - reach, min(ys) * factor - reach,
+                                (max(xs) + 1) * factor + reach, (max(ys) + 1) * factor + reach))
+        graph.version = self.version
+        return graph
+
+    def shape(self, profile: NavigationProfile) -> Tuple[int, int]:
+        """(width, height) of the grid in cells of the profile."""
+        factor = max(1, int(profile.sub_tile_factor))
+        return self.tiles.shape[1] * factor, self.tiles.shape[0] * factor
+
+    def in_bounds(self, profile: NavigationProfile, cell: Cell) -> bool:
+        width, height = self.shape(profile)
+        return 0 <= cell[0] < width and 0 <= cell[1] < height
+
+    def is_blocked(self, profile: NavigationProfile, cell: Cell) -> bool:
+        return not self.in_bounds(profile, cell) or not np.isfinite(self.cost(profile)[cell[1], cell[0]])
+
+    def blocked_cells(self, profile: NavigationProfile) -> List[Cell]:
+        ys, xs = np.nonzero(~np.isfinite(self.cost(profile)))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def with_layer(self, profile: NavigationProfile, layer: Optional[np.ndarray]) -> np.ndarray:
+        """Cost array of a profile plus an additive layer (at tile or cell resolution)."""
+        cost = self.cost(profile)
+        if layer is None:
+            return cost
+        factor = max(1, int(profile.sub_tile_factor))
+        if factor > 1 and layer.shape == self.tiles.shape:
+            layer = np.repeat(np.repeat(layer, factor, axis=0), factor, axis=1)
+        return (cost + layer).astype(np.float32, copy=False)
+
+
+def nearest_free_cell(cost: np.ndarray, cell: Cell, radius: int) -> Optional[Cell]:
+    """Closest passable cell of a cost array within radius cells (ties: first in row order)."""
+    x, y = cell
+    height, width = cost.shape
+    left, top = max(0, x - radius), max(0, y - radius)
+    window = cost[top:min(height, y + radius + 1), left:min(width, x + radius + 1)]
+    ys, xs = np.nonzero(np.isfinite(window))
+    if xs.size == 0:
+        return None
+    best = int(np.argmin((xs + left - x) ** 2 + (ys + top - y) ** 2))
+    return int(xs[best] + left), int(ys[best] + top)
+
+
+class FlowField:
+    """Distances to one target cell and next-cell pointers, for every cell of a grid."""
+
+    def __init__(self, target: Cell, distance: np.ndarray, next_cell: np.ndarray):
+        self.target = target
+        self.distance = distance
+        self.next_index = next_cell
+        self.width = distance.shape[1]
+
+    def reachable(self, cell: Cell) -> bool:
+        height, width = self.distance.shape
+        return 0 <= cell[0] < width and 0 <= cell[1] < height and bool(np.isfinite(self.distance[cell[1], cell[0]]))
+
+    def next_cell(self, cell: Cell) -> Optional[Cell]:
+        """Neighbour to move to from a reachable cell (None at the target or when unreachable)."""
+        index = int(self.next_index[cell[1] * self.width + cell[0]])
+        return (index % self.width, index // self.width) if index >= 0 else None
+
+    def cells_from(self, cell: Cell) -> List[Cell]:
+        """Cells from a reachable cell to the target (both included), [] if unreachable."""
+        if not self.reachable(cell):
+            return []
+        cells = [cell]
+        step = self.next_cell(cell)
+        while step is not None:
+            cells.append(step)
+            step = self.next_cell(step)
+        return cells
+
+
+class NavigationService:
+    """Path requests of every AI: one A* kernel, one path cache, per-frame timing."""
+
+    def __init__(self, cache_entries: int = NAVIGATION_CACHE_ENTRIES):
+        self.cache_entries = cache_entries
+        self._grids: "OrderedDict[int, Tuple[object, NavigationGrid]]" = OrderedDict()
+        self._cache: "OrderedDict[Hashable, Tuple[List[Cell], float]]" = OrderedDict()
+        self._fields: "OrderedDict[Hashable, Optional[FlowField]]" = OrderedDict()
+        self.field_builds = 0
+        self.searches = 0
+        self.cache_hits = 0
+        # Time spent in path requests during the current frame and the last complete one
+        self.frame_time = 0.0
+        self.frame_requests = 0
+        self.last_frame_time = 0.0
+        self.last_frame_requests = 0
+
+    # Grids -------------------------------------------------------------------------------
+    def grid(self, grid) -> NavigationGrid:
+        """Navigation data of a map grid (the same grid object always gives the same instance)."""
+        entry = self._grids.get(id(grid))
+        if entry is None or entry[0] is not grid:
+            if entry is not None:
+                self._drop_grid(entry[1])  # id() of a collected grid reused by a new one
+            entry = self._grids[id(grid)] = (grid, NavigationGrid(grid))
+            while len(self._grids) > _MAX_GRIDS:
+                self._drop_grid(self._grids.popitem(last=False)[1][1])
+        self._grids.move_to_end(id(grid))
+        return entry[1]
+
+    def _drop_grid(self, nav: NavigationGrid) -> None:
+        """Forget the cached paths and flow fields of a grid that is no longer tracked."""
+        for entries in (self._cache, self._fields):
+            for key in [key for key in entries if key[0] == nav.serial]:
+                del entries[key]
+
+    def set_tile(self, grid, x: int, y: int, value: int) -> None:
+        """A tile of a map grid changed: its costs and cached paths are dropped."""
+        entry = self._grids.get(id(grid))
+        if entry is not None and entry[0] is grid:
+            entry[1].set_tile(x, y, int(value))
+
+    # Requests ----------------------------------------------------------------------------
+    def find_cells(self, grid, profile: NavigationProfile, start: Cell, goal: Cell,
+                   layer: Optional[np.ndarray] = None, layer_key: Optional[Hashable] = None,
+                   snap: bool = True) -> List[Cell]:
+        """Cells from start to goal (both included), or [] if there is no path.
+
+        Args:
+            grid: Map grid (grid[y][x] tile types)
+            profile: Traversal rules of the unit class
+            start, goal: Cells at the resolution of the profile
+            layer: Additive cost (np.inf blocks) for this request only: dangers, enemies, storms
+            layer_key: Identifies the layer in the path cache; a layer without key is not cached
+            snap: Move a blocked start or goal to the nearest passable cell (a snapped start stays
+                the first cell of the path)
+        """
+        began = time.perf_counter()
+        try:
+            return self._find_cells(grid, profile, tuple(start), tuple(goal), layer, layer_key, snap)
+        finally:
+            self.frame_time += time.perf_counter() - began
+            self.frame_requests += 1
+
+    def find_path(self, grid, profile: NavigationProfile, start: WorldPos, goal: WorldPos,
+                  layer: Optional[np.ndarray] = None, layer_key: Optional[Hashable] = None,
+                  snap: bool = True) -> List[WorldPos]:
+        """World waypoints (cell centres, corners only) from start to goal, or [] (see find_cells)."""
+        start_cell = world_to_cell(profile, start)
+        goal_cell = world_to_cell(profile, goal)
+        nav = self.grid(grid)
+        if not nav.in_bounds(profile, start_cell) or not nav.in_bounds(profile, goal_cell):
+            return []
+        cells = self.find_cells(grid, profile, start_cell, goal_cell, layer, layer_key, snap)
+        return [cell_to_world(profile, cell) for cell in simplify_cells(cells)]
+
+    def _find_cells(self, grid, profile, start, goal, layer, layer_key, snap):
+        nav = self.grid(grid)
+        if not nav.in_bounds(profile, start) or not nav.in_bounds(profile, goal):
+            return []
+        cacheable = profile.cache_ttl > 0 and (layer is None or layer_key is not None)
+        key = (nav.serial, nav.version, profile, start, goal, layer_key, snap)
+        if cacheable:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if time.perf_counter() - cached[1] <= profile.cache_ttl:
+                    self._cache.move_to_end(key)
+                    self.cache_hits += 1
+                    return list(cached[0])
+                del self._cache[key]
+
+        cost = nav.with_layer(profile, layer)
+        origin = start
+        if snap:
+            radius = NAVIGATION_SNAP_RADIUS * max(1, int(profile.sub_tile_factor))
+            if not np.isfinite(cost[start[1], start[0]]):
+                start = nearest_free_cell(cost, start, radius)
+            if not np.isfinite(cost[goal[1], goal[0]]):
+                goal = nearest_free_cell(cost, goal, radius)
+            if start is None or goal is None:
+                return []
+        elif not np.isfinite(cost[goal[1], goal[0]]):
+            return []
+
+        if cost.size >= NAVIGATION_HIERARCHY_MIN_CELLS:
+            # Large map: abstract path over the sectors, refined sector by sector (max_expansions does not apply)
+            cells = nav.hierarchy(profile).find(nav.cost(profile), start, goal, cost)
+        else:
+            finite = cost[np.isfinite(cost)]
+            scale = float(finite.min()) if finite.size else 1.0
+            path, _ = _astar(np.ascontiguousarray(cost, dtype=np.float32), start[0], start[1], goal[0], goal[1],
+                             profile.diagonal, float(profile.diagonal_cost), max(scale, 0.0),
+                             int(profile.max_expansions))
+            cells = [(int(x), int(y)) for x, y in path.tolist()]
+        self.searches += 1
+        if cells and start != origin:
+            cells.insert(0, origin)  # The unit first leaves the blocked cell it stands on
+        if cacheable and cells:
+            self._cache[key] = (cells, time.perf_counter())
+            while len(self._cache) > self.cache_entries:
+                self._cache.popitem(last=False)
+        return list(cells)
+
+    def flow_field(self, grid, profile: NavigationProfile, target: Cell) -> Optional[FlowField]:
+        """Flow field towards a cell (snapped to the nearest passable one), None if there is none.
+
+        Fields are kept per grid version: they are only rebuilt when a tile changes.
+        """
+        nav = self.grid(grid)
+        target = tuple(target)
+        if not nav.in_bounds(profile, target):
+            return None
+        key = (nav.serial, nav.version, profile, target)
+        if key in self._fields:
+            self._fields.move_to_end(key)
+            return self._fields[key]
+
+        cost = nav.cost(profile)
+        seed = target
+        if not np.isfinite(cost[seed[1], seed[0]]):
+            seed = nearest_free_cell(cost, seed, NAVIGATION_SNAP_RADIUS * max(1, int(profile.sub_tile_factor)))
+        field = None
+        if seed is not None:
+            distance, next_cell = _flow(cost, seed[0], seed[1], profile.diagonal, float(profile.diagonal_cost))
+            field = FlowField(seed, distance, next_cell)
+            self.field_builds += 1
+        self._fields[key] = field
+        while len(self._fields) > NAVIGATION_FLOW_FIELDS:
+            self._fields.popitem(last=False)
+        return field
+
+    def route_cells(self, grid, profile: NavigationProfile, start: Cell, target: Cell,
+                    layer: Optional[np.ndarray] = None, layer_key: Optional[Hashable] = None) -> List[Cell]:
+        """Cells from start to a destination shared by many units (bases), read from its flow field.
+
+        Same contract as find_cells with snap=True. When the request has a cost layer and the field path
+        crosses a cell where the layer adds cost (storm, danger, enemies), the path is searched with A*
+        instead, since the field does not know about it.
+        """
+        began = time.perf_counter()
+        try:
+            start, target = tuple(start), tuple(target)
+            nav = self.grid(grid)
+            if not nav.in_bounds(profile, start):
+                return []
+            field = self.flow_field(grid, profile, target)
+            if field is None:
+                return []
+            cells = field.cells_from(start)
+            if not cells and not np.isfinite(nav.cost(profile)[start[1], start[0]]):
+                # The unit stands on a blocked cell: leave it towards the nearest cell of the field
+                radius = NAVIGATION_SNAP_RADIUS * max(1, int(profile.sub_tile_factor))
+                snapped = nearest_free_cell(np.where(np.isfinite(field.distance), 0.0, np.inf), start, radius)
+                if snapped is not None:
+                    cells = [start] + field.cells_from(snapped)
+            if cells and layer is not None and self._layer_on_path(layer, nav, profile, cells):
+                return self._find_cells(grid, profile, start, target, layer, layer_key, True)
+            return cells
+        finally:
+            self.frame_time += time.perf_counter() - began
+            self.frame_requests += 1
+
+    @staticmethod
+    def _layer_on_path(layer: np.ndarray, nav: NavigationGrid, profile: NavigationProfile, cells: List[Cell]) -> bool:
+        xs, ys = np.array(cells, dtype=np.int64).T
+        if layer.shape == nav.tiles.shape:
+            factor = max(1, int(profile.sub_tile_factor))
+            xs, ys = xs // factor, ys // factor
+        return bool(np.any(layer[ys, xs] > 0))
+
+    # Statistics --------------------------------------------------------------------------
+    def begin_frame(self) -> None:
+        """Start timing a new frame (the previous one becomes last_frame_*)."""
+        self.last_frame_time, self.last_frame_requests = self.frame_time, self.frame_requests
+        self.frame_time = 0.0
+        self.frame_requests = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.searches + self.cache_hits
+        return self.cache_hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self._grids.clear()
+        self._cache.clear()
+        self._fields.clear()
+        self.searches = self.cache_hits = self.field_builds = 0
+        self.frame_time = self.last_frame_time = 0.0
+        self.frame_requests = self.last_frame_requests = 0
+
+
+def world_to_cell(profile: NavigationProfile, pos: WorldPos) -> Cell:
+    factor = max(1, int(profile.sub_tile_factor))
+    return int(pos[0] * factor // TILE_SIZE), int(pos[1] * factor // TILE_SIZE)
+
+
+def cell_to_world(profile: NavigationProfile, cell: Cell) -> WorldPos:
+    """Centre of a cell, in world pixels."""
+    factor = max(1, int(profile.sub_tile_factor))
+    return (cell[0] + 0.5) / factor * TILE_SIZE, (cell[1] + 0.5) / factor * TILE_SIZE
+
+
+# Shared instance
+navigation = NavigationService()
@@ -0,0 +1,309 @@
+"""Hierarchical path planning (HPA*) for large maps.
+
+Flat A* over a 256x256 or 512x512 grid expands too many cells to stay under
+a millisecond. For grids of at least NAVIGATION_HIERARCHY_MIN_CELLS cells,
+the navigation service plans in two levels instead:
+
+- the cost array of a profile is cut into square sectors of
+  NAVIGATION_SECTOR_SIZE cells; each run of free cell pairs across a sector
+  border is an entrance (two for long runs), and the entrance cells are the
+  nodes of an abstract graph;
+- the intra-sector edges are the costs of the shortest paths between the
+  entrances of a sector inside that sector. They are computed once per
+  profile and updated sector by sector when a tile changes;
+- a query links the start and the goal to the entrances of their sectors,
+  runs A* on the abstract graph and turns every leg into cells with an A*
+  bounded to the sector it crosses. A leg that cannot be refined (closed by
+  the request layer) makes the whole query fail rather than return part of
+  a path.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numba import njit
+
+from src.constants.gameplay import NAVIGATION_SECTOR_SIZE
+from src.managers.navigation import _astar, _flow, _heap_pop, _heap_push, _heuristic
+
+Cell = Tuple[int, int]
+Sector = Tuple[int, int]
+
+# Border runs at least this long get two entrances (one at each end) instead of one in the middle
+_LONG_ENTRANCE = 6
+
+
+@njit(cache=True)
+def _sector_costs(cost, x0, y0, x1, y1, node_x, node_y, diagonal, diagonal_cost):
+    """Cost of the shortest path from node i to node j inside the window, for every pair (inf: none)."""
+    window = np.ascontiguousarray(cost[y0:y1, x0:x1])
+    count = node_x.shape[0]
+    costs = np.full((count, count), np.inf)
+    for j in range(count):
+        distance, _ = _flow(window, node_x[j] - x0, node_y[j] - y0, diagonal, diagonal_cost)
+        for i in range(count):
+            costs[i, j] = distance[node_y[i] - y0, node_x[i] - x0]
+    return costs
+
+
+@njit(cache=True)
+def _graph_astar(indptr, indices, weights, node_x, node_y, start_nodes, start_costs, goal_costs,
+                 goal_x, goal_y, diagonal, diagonal_cost, scale):
+    """A* on the abstract graph from a virtual start (linked to start_nodes) to a virtual goal (reached
+    from the nodes with a finite goal_costs). Returns the node ids in order (empty if none)."""
+    count_nodes = node_x.shape[0]
+    goal = count_nodes
+    g = np.full(count_nodes + 1, np.inf)
+    parent = np.full(count_nodes + 1, -1, dtype=np.int64)
+    closed = np.zeros(count_nodes + 1, dtype=np.bool_)
+    heap_f = np.empty(64, dtype=np.float64)
+    heap_n = np.empty(64, dtype=np.int64)
+    count = 0
+    for i in range(start_nodes.shape[0]):
+        node = start_nodes[i]
+        if start_costs[i] < g[node]:
+            g[node] = start_costs[i]
+            priority = g[node] + _heuristic(node_x[node], node_y[node], goal_x, goal_y, diagonal, diagonal_cost, scale)
+            heap_f, heap_n, count = _heap_push(heap_f, heap_n, count, priority, node)
+
+    found = False
+    while count > 0:
+        node, count = _heap_pop(heap_f, heap_n, count)
+        if closed[node]:
+            continue
+        if node == goal:
+            found = True
+            break
+        closed[node] = True
+        link = goal_costs[node]
+        if np.isfinite(link) and g[node] + link < g[goal]:
+            g[goal] = g[node] + link
+            parent[goal] = node
+            heap_f, heap_n, count = _heap_push(heap_f, heap_n, count, g[goal], goal)
+        for edge in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[edge]
+            if closed[neighbor]:
+                continue
+            tentative = g[node] + weights[edge]
+            if tentative < g[neighbor]:
+                g[neighbor] = tentative
+                parent[neighbor] = node
+                priority = tentative + _heuristic(node_x[neighbor], node_y[neighbor], goal_x, goal_y,
+                                                  diagonal, diagonal_cost, scale)
+                heap_f, heap_n, count = _heap_push(heap_f, heap_n, count, priority, neighbor)
+
+    if not found:
+        return np.empty(0, dtype=np.int64)
+    length = 0
+    node = parent[goal]
+    while node != -1:
+        length += 1
+        node = parent[node]
+    path = np.empty(length, dtype=np.int64)
+    node = parent[goal]
+    for i in range(length - 1, -1, -1):
+        path[i] = node
+        node = parent[node]
+    return path
+
+
+def _window_astar(cost: np.ndarray, box: Tuple[int, int, int, int], start: Cell, goal: Cell,
+                  diagonal: bool, diagonal_cost: float, scale: float) -> List[Cell]:
+    """A* restricted to the cells of a box (x0, y0, x1, y1)."""
+    x0, y0, x1, y1 = box
+    path, _ = _astar(np.ascontiguousarray(cost[y0:y1, x0:x1], dtype=np.float32), start[0] - x0, start[1] - y0,
+                     goal[0] - x0, goal[1] - y0, diagonal, diagonal_cost, scale, 0)
+    return [(int(x) + x0, int(y) + y0) for x, y in path.tolist()]
+
+
+class SectorGraph:
+    """Abstract graph of the sector entrances of one profile cost array."""
+
+    def __init__(self, cost: np.ndarray, diagonal: bool, diagonal_cost: float,
+                 sector_size: int = NAVIGATION_SECTOR_SIZE):
+        self.diagonal = diagonal
+        self.diagonal_cost = float(diagonal_cost)
+        self.sector_size = max(4, int(sector_size))
+        self.height, self.width = cost.shape
+        self.cols = -(-self.width // self.sector_size)
+        self.rows = -(-self.height // self.sector_size)
+        self.version = 0
+        # (sx, sy, 0): border with the sector on the right, (sx, sy, 1): with the sector below.
+        # Each entrance is a pair of cell indexes (y * width + x) on both sides of the border.
+        self._entrances: Dict[Tuple[int, int, int], np.ndarray] = {}
+        self._edges: Dict[Sector, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+        self._rebuild(cost, [(sx, sy) for sy in range(self.rows) for sx in range(self.cols)])
+
+    # Construction ------------------------------------------------------------------------
+    def update(self, cost: np.ndarray, box: Tuple[int, int, int, int]) -> None:
+        """Cells of a box (x0, y0, x1, y1) changed cost: rebuild the sectors around them."""
+        size = self.sector_size
+        x0, y0, x1, y1 = box
+        sectors = [(sx, sy)
+                   for sy in range(max(0, y0 // size), min(self.rows, (y1 - 1) // size + 1))
+                   for sx in range(max(0, x0 // size), min(self.cols, (x1 - 1) // size + 1))]
+        self._rebuild(cost, sectors)
+
+    def _rebuild(self, cost: np.ndarray, sectors: Sequence[Sector]) -> None:
+        self.scale = float(np.min(cost, initial=np.inf))
+        self.scale = self.scale if np.isfinite(self.scale) else 1.0
+        touched = set(sectors)
+        for sx, sy in sectors:
+            for border in ((sx, sy, 0), (sx, sy, 1), (sx - 1, sy, 0), (sx, sy - 1, 1)):
+                if border[0] >= 0 and border[1] >= 0:
+                    self._entrances[border] = self._find_entrances(cost, *border)
+            # The entrances of the neighbours on these borders changed too
+            touched.update(((sx - 1, sy), (sx + 1, sy), (sx, sy - 1), (sx, sy + 1)))
+        for sector in touched:
+            if 0 <= sector[0] < self.cols and 0 <= sector[1] < self.rows:
+                self._edges[sector] = self._sector_edges(cost, sector)
+        self._compile(cost)
+
+    def _find_entrances(self, cost: np.ndarray, sx: int, sy: int, axis: int) -> np.ndarray:
+        size, width = self.sector_size, self.width
+        if axis == 0:
+            line = (sx + 1) * size
+            if line >= width:
+                return np.empty((0, 2), dtype=np.int64)
+            along = np.arange(sy * size, min(self.height, (sy + 1) * size))
+            free = np.isfinite(cost[along, line - 1]) & np.isfinite(cost[along, line])
+            inside, outside = along * width + line - 1, along * width + line
+        else:
+            line = (sy + 1) * size
+            if line >= self.height:
+                return np.empty((0, 2), dtype=np.int64)
+            along = np.arange(sx * size, min(width, (sx + 1) * size))
+            free = np.isfinite(cost[line - 1, along]) & np.isfinite(cost[line, along])
+            inside, outside = (line - 1) * width + along, line * width + along
+        picked = []
+        for run in np.split(np.flatnonzero(free), np.flatnonzero(np.diff(np.flatnonzero(free)) != 1) + 1):
+            if run.size == 0:
+                continue
+            picked.extend((run[0], run[-1]) if run.size >= _LONG_ENTRANCE else (run[run.size // 2],))
+        return np.stack((inside[picked], outside[picked]), axis=1) if picked else np.empty((0, 2), dtype=np.int64)
+
+    def _sector_nodes(self, sector: Sector) -> np.ndarray:
+        """Cell indexes of the entrances on the sector side of its four borders."""
+        sx, sy = sector
+        sides = [self._entrances.get((sx, sy, 0), np.empty((0, 2), dtype=np.int64))[:, 0],
+                 self._entrances.get((sx, sy, 1), np.empty((0, 2), dtype=np.int64))[:, 0],
+                 self._entrances.get((sx - 1, sy, 0), np.empty((0, 2), dtype=np.int64))[:, 1],
+                 self._entrances.get((sx, sy - 1, 1), np.empty((0, 2), dtype=np.int64))[:, 1]]
+        return np.unique(np.concatenate(sides))
+
+    def _box(self, sector: Sector) -> Tuple[int, int, int, int]:
+        size = self.sector_size
+        return (sector[0] * size, sector[1] * size,
+                min(self.width, (sector[0] + 1) * size), min(self.height, (sector[1] + 1) * size))
+
+    def _sector_edges(self, cost: np.ndarray, sector: Sector):
+        nodes = self._sector_nodes(sector)
+        if nodes.size < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+        x0, y0, x1, y1 = self._box(sector)
+        costs = _sector_costs(cost, x0, y0, x1, y1, nodes % self.width, nodes // self.width,
+                              self.diagonal, self.diagonal_cost)
+        np.fill_diagonal(costs, np.inf)
+        source, target = np.nonzero(np.isfinite(costs))
+        return nodes[source], nodes[target], costs[source, target]
+
+    def _compile(self, cost: np.ndarray) -> None:
+        """CSR arrays of the abstract graph (intra-sector edges + border crossings)."""
+        sources, targets, weights = [], [], []
+        flat = cost.ravel()
+        for pairs in self._entrances.values():
+            if pairs.size:
+                sources += [pairs[:, 0], pairs[:, 1]]
+                targets += [pairs[:, 1], pairs[:, 0]]
+                weights += [flat[pairs[:, 1]].astype(np.float64), flat[pairs[:, 0]].astype(np.float64)]
+        for source, target, weight in self._edges.values():
+            sources.append(source)
+            targets.append(target)
+            weights.append(weight)
+        source = np.concatenate(sources) if sources else np.empty(0, dtype=np.int64)
+        target = np.concatenate(targets) if targets else np.empty(0, dtype=np.int64)
+        weight = np.concatenate(weights) if weights else np.empty(0)
+
+        self.cells = np.unique(np.concatenate((source, target)))
+        source_id = np.searchsorted(self.cells, source)
+        order = np.argsort(source_id, kind="stable")
+        self.indices = np.searchsorted(self.cells, target)[order]
+        self.weights = weight[order]
+        self.indptr = np.concatenate(([0], np.cumsum(np.bincount(source_id, minlength=self.cells.size))))
+        self.node_x = self.cells % self.width
+        self.node_y = self.cells // self.width
+
+    @property
+    def node_count(self) -> int:
+        return int(self.cells.size)
+
+    # Queries -----------------------------------------------------------------------------
+    def find(self, cost: np.ndarray, start: Cell, goal: Cell, refine_cost: Optional[np.ndarray] = None) -> List[Cell]:
+        """Cells from a passable start to a passable goal, each adjacent to the next ([] if there is no path).
+
+        Args:
+            cost: Cost array the graph was built on
+            refine_cost: Cost array used to turn legs into cells (cost plus a request layer)
+        """
+        refine_cost = cost if refine_cost is None else refine_cost
+        size = self.sector_size
+        if max(abs(goal[0] - start[0]), abs(goal[1] - start[1])) <= size:
+            # Close enough for a direct search in a small box around both cells
+            box = (max(0, min(start[0], goal[0]) - size // 2), max(0, min(start[1], goal[1]) - size // 2),
+                   min(self.width, max(start[0], goal[0]) + size // 2 + 1),
+                   min(self.height, max(start[1], goal[1]) + size // 2 + 1))
+            cells = _window_astar(refine_cost, box, start, goal, self.diagonal, self.diagonal_cost, self.scale)
+            if cells:
+                return cells
+
+        start_nodes, start_costs = self._links(cost, start, outgoing=True)
+        goal_nodes, goal_links = self._links(cost, goal, outgoing=False)
+        goal_costs = np.full(self.node_count, np.inf)
+        goal_costs[goal_nodes] = goal_links
+        nodes = _graph_astar(self.indptr, self.indices, self.weights, self.node_x, self.node_y,
+                             start_nodes, start_costs, goal_costs, goal[0], goal[1],
+                             self.diagonal, self.diagonal_cost, self.scale)
+        if nodes.size == 0:
+            return []
+        waypoints = [start] + list(zip(self.node_x[nodes].tolist(), self.node_y[nodes].tolist())) + [goal]
+        return self._refine(refine_cost, waypoints)
+
+    def _links(self, cost: np.ndarray, cell: Cell, outgoing: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """Node ids of the entrances of the cell's sector and the cost from the cell to each of them
+        (outgoing) or from each of them to the cell."""
+        sector = (cell[0] // self.sector_size, cell[1] // self.sector_size)
+        nodes = self._sector_nodes(sector)
+        if nodes.size == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        x0, y0, x1, y1 = self._box(sector)
+        distance, _ = _flow(np.ascontiguousarray(cost[y0:y1, x0:x1]), cell[0] - x0, cell[1] - y0,
+                            self.diagonal, self.diagonal_cost)
+        node_x, node_y = nodes % self.width, nodes // self.width
+        links = distance[node_y - y0, node_x - x0].astype(np.float64)
+        if outgoing:
+            # Reversing a path swaps its first and last cells in the sum of entered cells
+            links = links - cost[cell[1], cell[0]] + cost[node_y, node_x]
+        reachable = np.isfinite(links)
+        return np.searchsorted(self.cells, nodes[reachable]), links[reachable]
+
+    def _refine(self, cost: np.ndarray, waypoints: List[Cell]) -> List[Cell]:
+        cells = [waypoints[0]]
+        for origin, target in zip(waypoints, waypoints[1:]):
+            if target == origin:
+                continue  # Start or goal on an entrance cell
+            if max(abs(target[0] - origin[0]), abs(target[1] - origin[1])) <= 1:
+                cells.append(target)
+                continue
+            # Legs stay inside one sector, except when the request layer closes it: widen the box
+            x0, y0, x1, y1 = self._box((origin[0] // self.sector_size, origin[1] // self.sector_size))
+            box = (min(x0, target[0]), min(y0, target[1]), max(x1, target[0] + 1), max(y1, target[1] + 1))
+            segment = _window_astar(cost, box, origin, target, self.diagonal, self.diagonal_cost, self.scale)
+            if not segment:
+                size = self.sector_size
+                wide = (max(0, box[0] - size), max(0, box[1] - size),
+                        min(self.width, box[2] + size), min(self.height, box[3] + size))
+                segment = _window_astar(cost, wide, origin, target, self.diagonal, self.diagonal_cost, self.scale)
+            if not segment:
+                return []  # A partial path would lead the unit to a dead end
+            cells.extend(segment[1:])
+        return cells
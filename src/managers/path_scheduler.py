@@ -0,0 +1,231 @@
+"""Game-wide scheduler of the AI path requests, bounded by a time budget per frame.
+
+Every AI (scout, druid, architect, leviathan, kamikaze) submits its path
+searches here instead of running them inside its process(). A request is a
+callable computing the path plus a completion callback:
+
+- requests are served by priority: units selected by the player first, then
+  units inside the camera view, then off-screen ones (urgency breaks ties
+  within a tier, then submission order);
+- the work done in a frame stops once PATH_SCHEDULER_BUDGET_MS have been
+  spent; what is left waits for the next frame. The engine serves at least
+  one request per tick so that nothing starves;
+- requests sharing a key (same profile, start and goal cells) are coalesced
+  into one search whose result goes to every requester;
+- a request can be cancelled until it is served (the search is dropped
+  when no requester is left);
+- a search that raises completes with no path ([]) and a failing
+  completion callback is logged, so no request is left pending forever;
+- the delay from submission to completion is sampled for the debug overlay
+  and the benchmark (latency_percentiles).
+
+submit() serves the queue right away while the frame budget lasts, so an
+unloaded game gets its paths in the same tick as before.
+"""
+import heapq
+import itertools
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import esper
+import numpy as np
+
+from src.components.core.positionComponent import PositionComponent
+from src.constants.gameplay import PATH_SCHEDULER_BUDGET_MS, PATH_SCHEDULER_LATENCY_SAMPLES
+
+logger = logging.getLogger(__name__)
+
+# Priority tiers (lowest served first)
+PRIORITY_SELECTED = 0
+PRIORITY_VISIBLE = 1
+PRIORITY_OFFSCREEN = 2
+
+ViewRect = Tuple[float, float, float, float]
+
+
+@dataclass
+class _Job:
+    """One search and the requests waiting for it."""
+    compute: Callable[[], Any]
+    key: Optional[Hashable]
+    urgency: float
+    # request id -> (entity, completion callback, submission time)
+    waiters: Dict[int, Tuple[Optional[int], Optional[Callable[[Any], None]], float]] = field(default_factory=dict)
+    tier: int = PRIORITY_OFFSCREEN
+
+
+class PathScheduler:
+    """Priority queue of path searches served within a per-frame time budget."""
+
+    def __init__(self, budget_ms: float = PATH_SCHEDULER_BUDGET_MS,
+                 latency_samples: int = PATH_SCHEDULER_LATENCY_SAMPLES):
+        self.budget = budget_ms / 1000.0
+        self._latencies: deque = deque(maxlen=max(1, int(latency_samples)))
+        self.clear()
+
+    def clear(self) -> None:
+        self._heap: List[Tuple[int, float, int, _Job]] = []
+        self._jobs: Dict[Hashable, _Job] = {}  # Pending jobs by coalescing key
+        self._requests: Dict[int, _Job] = {}  # Pending jobs by request id
+        self._ids = itertools.count(1)
+        self._sequence = itertools.count()
+        self._running = False
+        self._selected: frozenset = frozenset()
+        self._view: Optional[ViewRect] = None
+        self._latencies.clear()
+        self.frame_time = 0.0
+        self.frame_served = 0
+        self.served = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    # Frame -------------------------------------------------------------------------------
+    def begin_frame(self, selected: Iterable[int] = (), view: Optional[ViewRect] = None) -> None:
+        """Start a new frame budget; selected units and the camera view (world left, top, right, bottom)
+        set the priority of the pending requests."""
+        self.frame_time = 0.0
+        self.frame_served = 0
+        selected = frozenset(entity for entity in selected if entity is not None)
+        if selected != self._selected or view != self._view:
+            self._selected, self._view = selected, view
+            for job in self._requests.values():
+                job.tier = self._job_tier(job)
+            self._heap = [(job.tier, -job.urgency, sequence, job) for _, _, sequence, job in self._heap if job.waiters]
+            heapq.heapify(self._heap)
+
+    @property
+    def remaining(self) -> float:
+        """Seconds of the frame budget left."""
+        return max(0.0, self.budget - self.frame_time)
+
+    # Requests ----------------------------------------------------------------------------
+    def submit(self, compute: Callable[[], Any], *, entity: Optional[int] = None, key: Optional[Hashable] = None,
+               urgency: float = 0.0, on_done: Optional[Callable[[Any], None]] = None) -> int:
+        """Queue a path search and return its request id.
+
+        Args:
+            compute: Runs the search and returns the path
+            entity: Unit the path is for (sets the priority tier)
+            key: Identifies identical searches (profile, start and goal cells...); a pending search with
+                the same key is shared instead of queued again. None: never coalesced
+            urgency: Order within a tier (higher first)
+            on_done: Called with the result once the search ran (possibly before submit returns)
+        """
+        request_id = next(self._ids)
+        job = self._jobs.get(key) if key is not None else None
+        if job is None:
+            job = _Job(compute, key, float(urgency))
+            if key is not None:
+                self._jobs[key] = job
+            job.waiters[request_id] = (entity, on_done, time.perf_counter())
+            job.tier = self._job_tier(job)
+            heapq.heappush(self._heap, (job.tier, -job.urgency, next(self._sequence), job))
+        else:
+            self.coalesced += 1
+            job.waiters[request_id] = (entity, on_done, time.perf_counter())
+            tier = self._tier(entity)
+            if tier < job.tier or urgency > job.urgency:
+                # Served at the best priority of its requesters (the old heap entry is skipped)
+                job.tier, job.urgency = min(tier, job.tier), max(float(urgency), job.urgency)
+                heapq.heappush(self._heap, (job.tier, -job.urgency, next(self._sequence), job))
+        self._requests[request_id] = job
+        self.run()
+        return request_id
+
+    def cancel(self, request_id: Optional[int]) -> None:
+        """Drop a request that was not served yet (its search too if nobody else waits for it)."""
+        job = self._requests.pop(request_id, None) if request_id is not None else None
+        if job is None:
+            return
+        job.waiters.pop(request_id, None)
+        self.cancelled += 1
+        if not job.waiters and job.key is not None and self._jobs.get(job.key) is job:
+            del self._jobs[job.key]
+
+    def is_pending(self, request_id: Optional[int]) -> bool:
+        return request_id in self._requests
+
+    @property
+    def pending(self) -> int:
+        return len(self._requests)
+
+    def run(self, minimum: int = 0, max_jobs: Optional[int] = None) -> int:
+        """Serve queued searches by priority while the frame budget lasts; returns how many ran.
+
+        Args:
+            minimum: Searches to serve even when the budget is spent
+            max_jobs: Upper bound on the searches served by this call
+        """
+        if self._running:
+            return 0  # Called from a completion callback
+        self._running = True
+        served = 0
+        try:
+            while self._heap and (max_jobs is None or served < max_jobs):
+                if served >= minimum and self.frame_time >= self.budget:
+                    break
+                tier, urgency, _, job = heapq.heappop(self._heap)
+                if not job.waiters or (tier, -urgency) != (job.tier, job.urgency):
+                    continue  # Cancelled, or a stale entry of a job moved up
+                if job.key is not None and self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+                began = time.perf_counter()
+                try:
+                    result = job.compute()
+                except Exception:
+                    # A failed search completes as "no path": its requesters ask again later
+                    logger.exception("Path search failed (key %r)", job.key)
+                    result = []
+                done = time.perf_counter()
+                self.frame_time += done - began
+                # Every requester is served before any callback runs, so none is left pending
+                waiters = list(job.waiters.items())
+                job.waiters.clear()
+                for request_id, (_, _, submitted) in waiters:
+                    self._requests.pop(request_id, None)
+                    self._latencies.append(done - submitted)
+                for request_id, (_, on_done, _) in waiters:
+                    if on_done is None:
+                        continue
+                    try:
+                        on_done(list(result) if isinstance(result, list) else result)
+                    except Exception:
+                        logger.exception("Path completion callback failed (request %d)", request_id)
+                served += 1
+        finally:
+            self._running = False
+        self.frame_served += served
+        self.served += served
+        return served
+
+    # Priorities --------------------------------------------------------------------------
+    def _tier(self, entity: Optional[int]) -> int:
+        if entity is None:
+            return PRIORITY_OFFSCREEN
+        if entity in self._selected:
+            return PRIORITY_SELECTED
+        if self._view is not None:
+            pos = esper.try_component(entity, PositionComponent)
+            if pos is not None:
+                left, top, right, bottom = self._view
+                if left <= pos.x <= right and top <= pos.y <= bottom:
+                    return PRIORITY_VISIBLE
+        return PRIORITY_OFFSCREEN
+
+    def _job_tier(self, job: _Job) -> int:
+        return min((self._tier(entity) for entity, _, _ in job.waiters.values()), default=PRIORITY_OFFSCREEN)
+
+    # Statistics --------------------------------------------------------------------------
+    def latency_percentiles(self, percentiles: Sequence[float] = (50, 90, 99)) -> Dict[float, float]:
+        """Submission-to-completion delay of the last served requests, in milliseconds."""
+        if not self._latencies:
+            return {p: 0.0 for p in percentiles}
+        values = np.percentile(np.fromiter(self._latencies, dtype=np.float64), percentiles) * 1000.0
+        return dict(zip(percentiles, values.tolist()))
+
+
+# Shared instance
+path_scheduler = PathScheduler()
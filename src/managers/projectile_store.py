@@ -0,0 +1,197 @@
+"""Pooled, array-backed storage of the bullets in flight.
+
+Bullets (units, Leviathan sprays, towers, bandits) are not esper entities:
+each one is a slot of preallocated NumPy columns (position, heading, speed,
+team, damage, owner, remaining lifetime...) recycled through a free-list.
+The systems that used to see them as generic entities have a batched path
+over the store instead:
+
+- MovementProcessor calls integrate(),
+- CollisionProcessor resets the terrain modifiers and resolves the hits
+  against units (hit-once, mines, bandits, bases) and between bullets,
+- LifetimeProcessor calls expire(),
+- GameRenderer draws them with one blits() call.
+
+Druid vines keep their esper entity (rare, and their hit has side effects
+on the target components).
+"""
+from typing import Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from src.constants.gameplay import PROJECTILE_HEALTH, PROJECTILE_POOL_CAPACITY
+from src.managers.component_store import ComponentTable
+
+
+class ProjectilePoint(NamedTuple):
+    """Position of a bullet, as returned by the queries (same .x / .y as PositionComponent)."""
+    x: float
+    y: float
+
+
+class ProjectileStore:
+    """Bullets in flight, one slot of the columns per bullet."""
+
+    def __init__(self, capacity: int = PROJECTILE_POOL_CAPACITY):
+        self.table = ComponentTable("projectile", (
+            ("x", np.float64),
+            ("y", np.float64),
+            ("direction", np.float64),
+            ("speed", np.float64),
+            ("terrain_modifier", np.float64),
+            ("lifetime", np.float64),
+            ("health", np.float64),
+            ("damage", np.int64),
+            ("team", np.int16),
+            ("owner", np.int64),
+            ("serial", np.int64),
+            ("sprite", np.int16),
+            ("width", np.int32),
+            ("height", np.int32),
+            ("prev_x", np.float64),
+            ("prev_y", np.float64),
+            ("has_previous", bool),
+            ("alive", bool),
+            ("dying", bool),
+        ), capacity=capacity)
+        # Entities already hit by each slot (hit-once semantics of ProjectileComponent.hit_entities)
+        self._hits: Dict[int, Set[int]] = {}
+        self._sprite_ids: List[object] = []
+        self._sprite_codes: Dict[object, int] = {}
+        self._next_serial = 0
+
+    def __len__(self) -> int:
+        return self.table.live_rows
+
+    def column(self, name: str) -> np.ndarray:
+        return self.table.column(name)
+
+    # Slots -----------------------------------------------------------------
+    def spawn(self, x: float, y: float, direction: float, speed: float, team_id: int, damage: int,
+              owner: Optional[int], lifetime: float, sprite_id, width: int, height: int,
+              health: float = PROJECTILE_HEALTH, terrain_modifier: float = 0.0) -> int:
+        """Add a bullet and return its slot.
+
+        terrain_modifier is the initial one, as on the VelocityComponent of the
+        former bullet entities: 0.0 keeps the bullet in place until the next
+        terrain pass sets it to 1.0.
+        """
+        slot = self.table.allocate()
+        code = self._sprite_codes.get(sprite_id)
+        if code is None:
+            code = self._sprite_codes[sprite_id] = len(self._sprite_ids)
+            self._sprite_ids.append(sprite_id)
+        values = (
+            ("x", x), ("y", y), ("direction", direction), ("speed", speed),
+            ("terrain_modifier", terrain_modifier), ("lifetime", lifetime), ("health", health),
+            ("damage", int(damage)), ("team", team_id), ("owner", -1 if owner is None else owner),
+            ("serial", self._next_serial), ("sprite", code), ("width", int(width)), ("height", int(height)),
+            ("has_previous", False), ("alive", True), ("dying", False),
+        )
+        for name, value in values:
+            self.table.column(name)[slot] = value
+        self._next_serial += 1
+        self._hits[slot] = set()
+        return slot
+
+    def live_slots(self) -> np.ndarray:
+        return np.flatnonzero(self.table.column("alive"))
+
+    def kill(self, slot: int) -> None:
+        """Remove a bullet at the next flush_dead(), like a deferred esper.delete_entity."""
+        self.table.column("dying")[slot] = True
+
+    def flush_dead(self) -> None:
+        dying = self.table.column("dying")
+        for slot in np.flatnonzero(dying).tolist():
+            self.release(slot)
+
+    def release(self, slot: int) -> None:
+        alive = self.table.column("alive")
+        if not alive[slot]:
+            return
+        alive[slot] = False
+        self.table.column("dying")[slot] = False
+        self._hits.pop(slot, None)
+        self.table.release(slot)
+
+    def clear(self) -> None:
+        for slot in self.live_slots().tolist():
+            self.release(slot)
+
+    def hit_entities(self, slot: int) -> Set[int]:
+        return self._hits[slot]
+
+    def sprite_id(self, code: int):
+        return self._sprite_ids[code]
+
+    def owner(self, slot: int) -> Optional[int]:
+        owner = int(self.table.column("owner")[slot])
+        return None if owner < 0 else owner
+
+    @staticmethod
+    def target_key(slot_serial: int) -> int:
+        """Key of a bullet in the hit_entities of another one (entity ids are >= 0)."""
+        return -1 - int(slot_serial)
+
+    # Simulation --------------------------------------------------------------
+    def integrate(self, step_scale: float) -> None:
+        """Move every bullet along its heading (same arithmetic as MovementProcessor)."""
+        slots = self.live_slots()
+        if slots.size == 0:
+            return
+        effective_speed = self.table.column("speed")[slots] * self.table.column("terrain_modifier")[slots]
+        effective_speed *= step_scale
+        moving = effective_speed != 0
+        slots = slots[moving]
+        effective_speed = effective_speed[moving]
+        direction_rad = np.radians(self.table.column("direction")[slots])
+        x = self.table.column("x")
+        y = self.table.column("y")
+        x[slots] = x[slots] - effective_speed * np.cos(direction_rad)
+        y[slots] = y[slots] - effective_speed * np.sin(direction_rad)
+
+    def reset_terrain_modifiers(self) -> None:
+        """Bullets fly over every tile and may leave the map: full speed everywhere."""
+        modifier = self.table.column("terrain_modifier")
+        modifier[self.live_slots()] = 1.0
+
+    def expire(self, dt: float) -> None:
+        """Age the bullets and remove those whose lifetime is over (LifetimeComponent rule)."""
+        slots = self.live_slots()
+        if slots.size == 0:
+            return
+        lifetime = self.table.column("lifetime")
+        lifetime[slots] -= dt
+        for slot in slots[lifetime[slots] <= 0].tolist():
+            self.release(slot)
+
+    def snapshot_positions(self) -> None:
+        """Keep the positions of the current tick (render interpolation)."""
+        slots = self.live_slots()
+        self.table.column("prev_x")[slots] = self.table.column("x")[slots]
+        self.table.column("prev_y")[slots] = self.table.column("y")[slots]
+        self.table.column("has_previous")[slots] = True
+
+    # Queries -------------------------------------------------------------------
+    def query_radius(self, x: float, y: float, radius: float,
+                     exclude_teams: Sequence[int] = ()) -> List[Tuple[int, ProjectilePoint, float]]:
+        """(slot, position, distance) of the bullets within radius of (x, y)."""
+        slots = self.live_slots()
+        if slots.size == 0:
+            return []
+        if exclude_teams:
+            slots = slots[~np.isin(self.table.column("team")[slots], exclude_teams)]
+        xs = self.table.column("x")[slots]
+        ys = self.table.column("y")[slots]
+        distances = np.hypot(xs - x, ys - y)
+        inside = distances <= radius
+        return [
+            (slot, ProjectilePoint(px, py), distance)
+            for slot, px, py, distance in zip(slots[inside].tolist(), xs[inside].tolist(),
+                                              ys[inside].tolist(), distances[inside].tolist())
+        ]
+
+
+# Shared instance
+projectile_store = ProjectileStore()
@@ -0,0 +1,316 @@
+"""World-level spatial index (uniform grid hash) of the positioned entities.
+
+One index is shared by every system that needs "what is near this point"
+(collisions, towers, storms, bandits, AIs) instead of each of them scanning
+all entities or rebuilding its own grid every frame.
+
+The index is persistent: refresh() reads the position columns of the
+component_store and only moves the entities whose cell changed since the
+previous refresh (plus spawned/removed entities). The engine refreshes it at
+the start of each simulation tick. Queries also refresh it lazily when entities were added or removed
+since the last refresh, and widen their search by ``slack`` pixels to cover
+positions that moved a little since then; results are always filtered with
+the current positions.
+
+candidate_pairs() is the pair search, on the arrays of positions the caller
+already holds (collision broad phase).
+"""
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import esper
+import numpy as np
+
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.teamComponent import TeamComponent
+from src.constants.gameplay import SPATIAL_INDEX_CELL_TILES
+from src.settings.settings import TILE_SIZE
+
+# Cell keys pack (gx, gy) in one int: gx and gy must stay within +/- _KEY_OFFSET
+_KEY_STRIDE = 1 << 20
+_KEY_OFFSET = 1 << 19
+_NO_CELL = -1
+
+
+def _cell_key(gx: int, gy: int) -> int:
+    return (gx + _KEY_OFFSET) * _KEY_STRIDE + gy + _KEY_OFFSET
+
+
+class SpatialIndex:
+    """Uniform grid of entity ids, queried by radius, rectangle or k-nearest.
+
+    All queries accept the same filters:
+        team_id: only entities of this team
+        exclude_teams: drop entities of these teams (team filters require a TeamComponent)
+        components: component types the entity must have
+        without: component types the entity must not have
+        exclude: one entity id to skip (usually the caller)
+        alive_only: skip entities already scheduled for deletion
+    """
+
+    def __init__(self, cell_size: Optional[float] = None, slack: Optional[float] = None):
+        self.cell_size = float(cell_size if cell_size is not None else TILE_SIZE * SPATIAL_INDEX_CELL_TILES)
+        # Distance an entity may have moved since the last refresh and still be found
+        self.slack = float(slack if slack is not None else TILE_SIZE)
+        self.clear()
+
+    def clear(self) -> None:
+        self._cells: Dict[int, Set[int]] = {}
+        self._positions: Dict[int, PositionComponent] = {}
+        self._cell_by_entity = np.full(256, _NO_CELL, dtype=np.int64)
+        self._entities = np.zeros(0, dtype=np.int64)
+        self._source = None
+        self._bounds = (0, 0, -1, -1)
+
+    # Maintenance -----------------------------------------------------------
+    def refresh(self) -> None:
+        """Bring the grid up to date with the current positions."""
+        positioned = esper.get_component(PositionComponent)
+        self._source = positioned
+        self._positions = dict(positioned)
+        count = len(positioned)
+
+        entities = np.fromiter((ent for ent, _ in positioned), dtype=np.int64, count=count)
+        if count:
+            rows = np.fromiter((pos._row for _, pos in positioned), dtype=np.int64, count=count)
+            table = PositionComponent._table
+            gx = np.floor(table.column("x")[rows] / self.cell_size).astype(np.int64)
+            gy = np.floor(table.column("y")[rows] / self.cell_size).astype(np.int64)
+            keys = (gx + _KEY_OFFSET) * _KEY_STRIDE + gy + _KEY_OFFSET
+            self._bounds = (int(gx.min()), int(gy.min()), int(gx.max()), int(gy.max()))
+            highest = int(entities.max())
+            if highest >= self._cell_by_entity.size:
+                grown = np.full(max(highest + 1, self._cell_by_entity.size * 2), _NO_CELL, dtype=np.int64)
+                grown[: self._cell_by_entity.size] = self._cell_by_entity
+                self._cell_by_entity = grown
+        else:
+            keys = np.zeros(0, dtype=np.int64)
+            self._bounds = (0, 0, -1, -1)
+
+        cell_by_entity = self._cell_by_entity
+        cells = self._cells
+
+        # Entities that lost their position (deleted, or component removed)
+        present = np.zeros(cell_by_entity.size, dtype=bool)
+        present[entities] = True
+        gone = self._entities[~present[self._entities]]
+        for ent, key in zip(gone.tolist(), cell_by_entity[gone].tolist()):
+            self._remove_from_cell(ent, key)
+        cell_by_entity[gone] = _NO_CELL
+
+        # New entities and entities that changed cell
+        changed = np.flatnonzero(cell_by_entity[entities] != keys)
+        if changed.size:
+            moved = entities[changed]
+            for ent, old_key, new_key in zip(moved.tolist(), cell_by_entity[moved].tolist(), keys[changed].tolist()):
+                if old_key != _NO_CELL:
+                    self._remove_from_cell(ent, old_key)
+                bucket = cells.get(new_key)
+                if bucket is None:
+                    cells[new_key] = {ent}
+                else:
+                    bucket.add(ent)
+            cell_by_entity[moved] = keys[changed]
+        self._entities = entities
+
+    def _remove_from_cell(self, ent: int, key: int) -> None:
+        bucket = self._cells.get(key)
+        if bucket is not None:
+            bucket.discard(ent)
+            if not bucket:
+                del self._cells[key]
+
+    def _sync(self) -> None:
+        # esper rebuilds its component lists whenever entities/components are added or removed
+        if esper.get_component(PositionComponent) is not self._source:
+            self.refresh()
+
+    # Queries ---------------------------------------------------------------
+    def query_radius(self, x: float, y: float, radius: float, **filters) -> List[Tuple[int, PositionComponent, float]]:
+        """Entities within ``radius`` of (x, y) as (entity, position, distance), unordered."""
+        self._sync()
+        reach = radius + self.slack
+        accept = self._make_filter(**filters)
+        positions = self._positions
+        hypot = math.hypot
+        results = []
+        for ent in self._candidates(x - reach, y - reach, x + reach, y + reach):
+            pos = positions[ent]
+            distance = hypot(pos.x - x, pos.y - y)
+            if distance <= radius and accept(ent):
+                results.append((ent, pos, distance))
+        return results
+
+    def query_rect(self, left: float, top: float, right: float, bottom: float, **filters) -> List[Tuple[int, PositionComponent]]:
+        """Entities whose position lies in the rectangle, as (entity, position)."""
+        self._sync()
+        slack = self.slack
+        accept = self._make_filter(**filters)
+        positions = self._positions
+        results = []
+        for ent in self._candidates(left - slack, top - slack, right + slack, bottom + slack):
+            pos = positions[ent]
+            if left <= pos.x <= right and top <= pos.y <= bottom and accept(ent):
+                results.append((ent, pos))
+        return results
+
+    def query_nearest(self, x: float, y: float, k: int = 1, max_radius: float = math.inf,
+                      **filters) -> List[Tuple[int, PositionComponent, float]]:
+        """The ``k`` nearest entities within ``max_radius``, sorted by distance."""
+        self._sync()
+        if k <= 0 or not self._cells:
+            return []
+        accept = self._make_filter(**filters)
+        size = self.cell_size
+        cx, cy = math.floor(x / size), math.floor(y / size)
+        min_gx, min_gy, max_gx, max_gy = self._bounds
+        last_ring = max(cx - min_gx, max_gx - cx, cy - min_gy, max_gy - cy, 0)
+        found: List[Tuple[int, PositionComponent, float]] = []
+        ring = 0
+        while ring <= last_ring:
+            for key in self._ring_keys(cx, cy, ring):
+                for ent in self._cells.get(key, ()):
+                    pos = self._positions[ent]
+                    distance = math.hypot(pos.x - x, pos.y - y)
+                    if distance <= max_radius and accept(ent):
+                        found.append((ent, pos, distance))
+            # Everything closer than this has been seen (rings cover ring * size around the cell)
+            covered = ring * size - self.slack
+            if covered >= max_radius:
+                break
+            if len(found) >= k:
+                found.sort(key=lambda item: item[2])
+                if found[k - 1][2] <= covered:
+                    break
+            ring += 1
+        found.sort(key=lambda item: item[2])
+        return found[:k]
+
+    # Internals -------------------------------------------------------------
+    def _candidates(self, left: float, top: float, right: float, bottom: float) -> List[int]:
+        size = self.cell_size
+        gx0, gy0 = math.floor(left / size), math.floor(top / size)
+        gx1, gy1 = math.floor(right / size), math.floor(bottom / size)
+        cells = self._cells
+        candidates: List[int] = []
+        if (gx1 - gx0 + 1) * (gy1 - gy0 + 1) > len(cells):
+            # Query wider than the occupied grid: walk the occupied cells instead
+            for bucket in cells.values():
+                candidates.extend(bucket)
+            return candidates
+        get = cells.get
+        for gx in range(gx0, gx1 + 1):
+            base = (gx + _KEY_OFFSET) * _KEY_STRIDE + _KEY_OFFSET
+            for gy in range(gy0, gy1 + 1):
+                bucket = get(base + gy)
+                if bucket:
+                    candidates.extend(bucket)
+        return candidates
+
+    @staticmethod
+    def _ring_keys(cx: int, cy: int, ring: int) -> Iterable[int]:
+        if ring == 0:
+            yield _cell_key(cx, cy)
+            return
+        for gx in range(cx - ring, cx + ring + 1):
+            yield _cell_key(gx, cy - ring)
+            yield _cell_key(gx, cy + ring)
+        for gy in range(cy - ring + 1, cy + ring):
+            yield _cell_key(cx - ring, gy)
+            yield _cell_key(cx + ring, gy)
+
+    @staticmethod
+    def _make_filter(team_id: Optional[int] = None, exclude_teams: Iterable[int] = (),
+                     components: Iterable[type] = (), without: Iterable[type] = (),
+                     exclude: Optional[int] = None, alive_only: bool = True) -> Callable[[int], bool]:
+        """Build the per-entity predicate once per query (see the class docstring for the filters)."""
+        entities = esper._entities
+        dead = esper._dead_entities
+        components = tuple(components)
+        without = tuple(without)
+        check_team = team_id is not None or bool(exclude_teams)
+
+        def accept(ent: int) -> bool:
+            if ent == exclude:
+                return False
+            entity_components = entities.get(ent)
+            if entity_components is None or (alive_only and ent in dead):
+                return False
+            for component_type in components:
+                if component_type not in entity_components:
+                    return False
+            for component_type in without:
+                if component_type in entity_components:
+                    return False
+            if check_team:
+                team = entity_components.get(TeamComponent)
+                if team is None:
+                    return False
+                if team_id is not None and team.team_id != team_id:
+                    return False
+                if team.team_id in exclude_teams:
+                    return False
+            return True
+
+        return accept
+
+
+def candidate_pairs(xs: np.ndarray, ys: np.ndarray, max_dx: float, max_dy: float,
+                    groups: Optional[np.ndarray] = None,
+                    group_matrix: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Index pairs (i, j, in no particular order) of points closer than max_dx / max_dy on each axis.
+
+    Vectorized broad phase over arrays of current positions: points are
+    bucketed in cells of max_dx x max_dy, so both points of a pair are in the
+    same or in adjacent cells; only half of the neighbourhood is searched so
+    that each pair comes out once.
+
+    With groups / group_matrix, only pairs with group_matrix[groups[i], groups[j]]
+    are returned, and points whose group interacts with nothing are skipped.
+    """
+    empty = np.zeros(0, dtype=np.int64)
+    if groups is not None:
+        active = np.flatnonzero(group_matrix.any(axis=1)[groups])
+        if active.size < xs.size:
+            first, second = candidate_pairs(xs[active], ys[active], max_dx, max_dy, groups[active], group_matrix)
+            return active[first], active[second]
+    count = xs.size
+    if count < 2:
+        return empty, empty
+    gx = np.floor(xs / max(max_dx, 1.0)).astype(np.int64)
+    gy = np.floor(ys / max(max_dy, 1.0)).astype(np.int64)
+    keys = (gx + _KEY_OFFSET) * _KEY_STRIDE + gy + _KEY_OFFSET
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    rank = np.empty(count, dtype=np.int64)
+    rank[order] = np.arange(count)
+
+    firsts, seconds = [], []
+    for offset_x, offset_y in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+        target = keys + offset_x * _KEY_STRIDE + offset_y
+        start = np.searchsorted(sorted_keys, target, side="left")
+        end = np.searchsorted(sorted_keys, target, side="right")
+        if offset_x == 0 and offset_y == 0:
+            # Same cell: only the points sorted after this one
+            start = rank + 1
+        counts = np.maximum(end - start, 0)
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        # Concatenation of the ranges [start, end) of every point
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        positions = np.repeat(start, counts) + (np.arange(total) - run_starts)
+        firsts.append(np.repeat(np.arange(count), counts))
+        seconds.append(order[positions])
+    if not firsts:
+        return empty, empty
+    first = np.concatenate(firsts)
+    second = np.concatenate(seconds)
+    close = (np.abs(xs[first] - xs[second]) <= max_dx) & (np.abs(ys[first] - ys[second]) <= max_dy)
+    if groups is not None:
+        close &= group_matrix[groups[first], groups[second]]
+    return first[close], second[close]
+
+
+# Shared instance
+spatial_index = SpatialIndex()
@@ -0,0 +1,136 @@
+"""Cache of the scaled / flipped / rotated variants of the sprites.
+
+A variant is identified by the sprite (image key and size), a discrete zoom
+level (SPRITE_ZOOM_LEVELS), one of the 24 rotation buckets of 15 degrees
+and the flip state. The cache is a true LRU (OrderedDict: O(1) hit and
+eviction) bounded by the memory of the variants (SPRITE_VARIANT_CACHE_BYTES)
+rather than by their number.
+
+With prewarm enabled (SPRITE_VARIANT_PREWARM), the first request for a
+sprite generates all its variants (every zoom level x rotation bucket, x2
+if reversable) so that zooming or turning never builds an image during a
+frame. hits / misses / hit_rate are shown in the debug overlay.
+"""
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional, Set, Tuple
+
+import pygame
+
+from src.constants.gameplay import (
+    SPRITE_ROTATION_STEP,
+    SPRITE_VARIANT_CACHE_BYTES,
+    SPRITE_VARIANT_PREWARM,
+    SPRITE_ZOOM_LEVELS,
+)
+
+ROTATION_BUCKETS = 360 // SPRITE_ROTATION_STEP
+
+
+def discrete_zoom(zoom: float) -> float:
+    """Nearest zoom level of SPRITE_ZOOM_LEVELS."""
+    return min(SPRITE_ZOOM_LEVELS, key=lambda level: abs(level - zoom))
+
+
+def rotation_bucket(direction: float) -> int:
+    """Rotation (degrees, multiple of SPRITE_ROTATION_STEP in [0, 360)) used to draw a heading."""
+    return (round(direction / SPRITE_ROTATION_STEP) % ROTATION_BUCKETS) * SPRITE_ROTATION_STEP
+
+
+def build_variant(image: pygame.Surface, width: int, height: int, zoom: float, rotation: int,
+                  flip: bool) -> Optional[pygame.Surface]:
+    """Scale (nearest), flip vertically then rotate an image (None if empty at this zoom)."""
+    display_width = int(width * zoom)
+    display_height = int(height * zoom)
+    if display_width <= 0 or display_height <= 0:
+        return None
+    if abs(zoom - 1.0) < 0.01:
+        variant = image
+    else:
+        variant = pygame.transform.scale(image, (display_width, display_height))
+    if flip:
+        variant = pygame.transform.flip(variant, False, True)
+    if rotation != 0:
+        variant = pygame.transform.rotate(variant, -rotation)
+    return variant
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+class SpriteVariantCache:
+    """Variants keyed by (image_key, zoom, width, height, rotation, flip), in LRU order."""
+
+    def __init__(self, budget_bytes: int = SPRITE_VARIANT_CACHE_BYTES, prewarm: bool = SPRITE_VARIANT_PREWARM):
+        self.budget_bytes = budget_bytes
+        self.prewarm = prewarm
+        self._variants: "OrderedDict[Tuple, pygame.Surface]" = OrderedDict()
+        self._warmed: Set[Tuple] = set()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._variants)
+
+    @property
+    def hit_rate(self) -> float:
+        requests = self.hits + self.misses
+        return self.hits / requests if requests else 0.0
+
+    def clear(self) -> None:
+        self._variants.clear()
+        self._warmed.clear()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image_key: Hashable, width: int, height: int, zoom: float, rotation: int, flip: bool,
+            load_image: Callable[[], Optional[pygame.Surface]], reversable: bool = False) -> Optional[pygame.Surface]:
+        """Variant of a sprite; load_image() gives the base image on a miss."""
+        key = (image_key, zoom, width, height, rotation, flip)
+        variant = self._variants.get(key)
+        if variant is not None:
+            self._variants.move_to_end(key)
+            self.hits += 1
+            return variant
+
+        self.misses += 1
+        image = load_image()
+        if image is None:
+            return None
+        if self.prewarm:
+            self.warm(image_key, image, width, height, reversable=reversable)
+        variant = build_variant(image, width, height, zoom, rotation, flip)
+        if variant is not None:
+            self._store(key, variant)
+        return variant
+
+    def warm(self, image_key: Hashable, image: pygame.Surface, width: int, height: int,
+             reversable: bool = False) -> None:
+        """Generate every variant of a sprite (zoom levels x rotation buckets, x2 if reversable)."""
+        sprite = (image_key, width, height, reversable)
+        if sprite in self._warmed:
+            return
+        self._warmed.add(sprite)
+        for zoom in SPRITE_ZOOM_LEVELS:
+            for flip in ((False, True) if reversable else (False,)):
+                for bucket in range(ROTATION_BUCKETS):
+                    rotation = bucket * SPRITE_ROTATION_STEP
+                    key = (image_key, zoom, width, height, rotation, flip)
+                    if key not in self._variants:
+                        variant = build_variant(image, width, height, zoom, rotation, flip)
+                        if variant is not None:
+                            self._store(key, variant)
+
+    def _store(self, key: Tuple, variant: pygame.Surface) -> None:
+        self._variants[key] = variant
+        self.bytes_used += _surface_bytes(variant)
+        # Least recently used first; the variant just added is kept even if over budget
+        while self.bytes_used > self.budget_bytes and len(self._variants) > 1:
+            _, evicted = self._variants.popitem(last=False)
+            self.bytes_used -= _surface_bytes(evicted)
+
+
+# Shared instance
+sprite_variant_cache = SpriteVariantCache()
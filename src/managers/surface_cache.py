@@ -125,6 +125,13 @@ def _generate_base_cloud_texture(grid_x: int, grid_y: int, is_explored: bool) ->
     return surf
 
 
+def get_cloud_shade(grid_x: int, grid_y: int) -> int:
+    """Gray level of the procedural cloud texture of a tile, sampled at its center."""
+    seed = grid_x * 1000 + grid_y
+    noise_val = (_perlin_noise((grid_x + 0.5) * 0.5, (grid_y + 0.5) * 0.5, octaves=2, persistence=0.5, seed=seed) + 1) / 2
+    return int(200 + noise_val * 55)
+
+
 def get_cloud_texture(width: int, height: int, grid_x: int, grid_y: int, is_explored: bool = False) -> pygame.Surface:
     """Get a cached procedural cloud texture, scaled to requested size."""
     w, h = int(width), int(height)
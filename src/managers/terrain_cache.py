@@ -0,0 +1,202 @@
+"""Pre-rendered terrain chunks (sea, islands, mines, clouds of the grid).
+
+The map is cut into square chunks of TERRAIN_CHUNK_TILES x TERRAIN_CHUNK_TILES
+tiles. Each chunk is drawn once per zoom level into its own surface, and a
+frame of terrain is then a handful of chunk blits instead of one or two
+blits per visible tile.
+
+Alignment: tile edges are placed on whole screen pixels, computed from the
+world position of the edge rather than from the previous tile:
+
+    tile j spans [tile_edge(j, zoom), tile_edge(j + 1, zoom)) - camera_origin(x, zoom)
+
+The offset of a tile inside its chunk then does not depend on the camera, so
+blitting a chunk gives exactly the pixels of the tile-by-tile renderer
+(mapComponent.afficher_tuiles), with no seam between chunks nor between
+tiles.
+
+The cache keeps the chunks of several zoom levels and evicts the least
+recently used ones beyond TERRAIN_CHUNK_CACHE_BYTES. Chunks are drawn at the
+camera zoom snapped to 1/TERRAIN_ZOOM_PRECISION (chunk_zoom), so that zooms
+differing by float noise (0.1 * 3 and 0.3) share their chunks. A grid change (mine
+destroyed) invalidates the chunk of the tile, see invalidate_tile().
+"""
+import math
+import threading
+from collections import OrderedDict
+from typing import Set, Tuple
+
+import pygame
+
+from src.constants.gameplay import TERRAIN_CHUNK_CACHE_BYTES, TERRAIN_CHUNK_TILES, TERRAIN_ZOOM_PRECISION
+from src.constants.map_tiles import TileType
+from src.managers.surface_cache import get_scaled
+from src.settings.settings import TILE_SIZE
+
+# Couleur de fond de la fenêtre de jeu (GameRenderer._clear_screen)
+TERRAIN_BACKGROUND = (0, 50, 100)
+
+# Images dessinées par-dessus la mer, par type de tuile
+_OVERLAYS = {
+    int(TileType.GENERIC_ISLAND): 'generic_island',
+    int(TileType.MINE): 'mine',
+    int(TileType.CLOUD): 'cloud',
+}
+
+
+def chunk_zoom(zoom: float) -> float:
+    """Zoom level the terrain chunks are drawn and keyed at (camera zoom snapped to 1/TERRAIN_ZOOM_PRECISION)."""
+    return round(zoom * TERRAIN_ZOOM_PRECISION) / TERRAIN_ZOOM_PRECISION
+
+
+def tile_edge(index: int, zoom: float) -> int:
+    """Pixel (in zoomed world space) of the left/top edge of tile ``index``."""
+    return int(math.floor(index * TILE_SIZE * zoom + 0.5))
+
+
+def camera_origin(camera) -> Tuple[int, int]:
+    """Zoomed world pixel shown at the top-left corner of the screen."""
+    zoom = camera.zoom
+    return int(math.floor(camera.x * zoom + 0.5)), int(math.floor(camera.y * zoom + 0.5))
+
+
+def visible_range(origin: int, extent: int, zoom: float, count: int, step: int = 1) -> Tuple[int, int]:
+    """Range [start, end) of the groups of ``step`` tiles that may intersect
+    the screen pixels [origin, origin + extent)."""
+    pitch = TILE_SIZE * zoom * step
+    start = max(0, int(origin // pitch) - 1)
+    end = min(-(-count // step), int((origin + extent) // pitch) + 2)
+    return start, end
+
+
+def draw_tile(surface: pygame.Surface, images, value: int, x: int, y: int, width: int, height: int) -> None:
+    """Draw one tile: the sea, then the island/mine/cloud image over it."""
+    size = (width, height)
+    surface.blit(get_scaled(images['sea'], size), (x, y))
+    overlay = _OVERLAYS.get(value)
+    if overlay is not None:
+        surface.blit(get_scaled(images[overlay], size), (x, y))
+
+
+class TerrainChunkCache:
+    """Surfaces of the terrain chunks, keyed by (zoom, chunk_x, chunk_y), in LRU order."""
+
+    def __init__(self, chunk_tiles: int = TERRAIN_CHUNK_TILES, budget_bytes: int = TERRAIN_CHUNK_CACHE_BYTES):
+        self.chunk_tiles = chunk_tiles
+        self.budget_bytes = budget_bytes
+        self._chunks: "OrderedDict[Tuple[float, int, int], pygame.Surface]" = OrderedDict()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._grid = None
+        self._images = None
+        # Bumped whenever a tile of the grid changes (invalidate_tile)
+        self.version = 0
+        # The simulation thread invalidates tiles while the render thread draws (pipelined mode)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._chunks)
+
+    # Invalidation --------------------------------------------------------------
+    def clear(self) -> None:
+        self._chunks.clear()
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+        self._grid = None
+        self._images = None
+
+    def invalidate_tile(self, grid_x: int, grid_y: int) -> None:
+        """Drop the chunk of a tile at every zoom level (tile changed in the grid)."""
+        chunk = (grid_x // self.chunk_tiles, grid_y // self.chunk_tiles)
+        with self._lock:
+            for key in [key for key in self._chunks if key[1:] == chunk]:
+                self._drop(key)
+            self.version += 1
+
+    def _drop(self, key) -> None:
+        surface = self._chunks.pop(key)
+        self.bytes_used -= surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+    # Rendering -------------------------------------------------------------------
+    def render(self, window: pygame.Surface, grid, images, camera) -> int:
+        """Draw the visible terrain on the window and return the number of chunk blits."""
+        with self._lock:
+            return self._render(window, grid, images, camera)
+
+    def _render(self, window: pygame.Surface, grid, images, camera) -> int:
+        if grid is not self._grid or images is not self._images:
+            self.clear()
+            self._grid, self._images = grid, images
+        if not grid or not grid[0]:
+            return 0
+
+        zoom = chunk_zoom(camera.zoom)
+        if int(TILE_SIZE * zoom) <= 0:
+            return 0
+        origin_x, origin_y = camera_origin(camera)
+        window_width, window_height = window.get_size()
+        n = self.chunk_tiles
+        rows, cols = len(grid), len(grid[0])
+        start_cx, end_cx = visible_range(origin_x, window_width, zoom, cols, n)
+        start_cy, end_cy = visible_range(origin_y, window_height, zoom, rows, n)
+
+        blits = []
+        used: Set[Tuple[float, int, int]] = set()
+        for cy in range(start_cy, end_cy):
+            top = tile_edge(cy * n, zoom) - origin_y
+            bottom = tile_edge(min((cy + 1) * n, rows), zoom) - origin_y
+            if bottom <= 0 or top >= window_height:
+                continue
+            for cx in range(start_cx, end_cx):
+                left = tile_edge(cx * n, zoom) - origin_x
+                right = tile_edge(min((cx + 1) * n, cols), zoom) - origin_x
+                if right <= 0 or left >= window_width:
+                    continue
+                key = (zoom, cx, cy)
+                blits.append((self._chunk(key, window, grid, images), (left, top)))
+                used.add(key)
+
+        window.blits(blits, doreturn=False)
+        self._evict(used)
+        return len(blits)
+
+    def _chunk(self, key, window: pygame.Surface, grid, images) -> pygame.Surface:
+        surface = self._chunks.get(key)
+        if surface is not None:
+            self._chunks.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        zoom, cx, cy = key
+        n = self.chunk_tiles
+        col0, row0 = cx * n, cy * n
+        col1, row1 = min(col0 + n, len(grid[0])), min(row0 + n, len(grid))
+        left, top = tile_edge(col0, zoom), tile_edge(row0, zoom)
+        surface = pygame.Surface((tile_edge(col1, zoom) - left, tile_edge(row1, zoom) - top), 0, window)
+        surface.fill(TERRAIN_BACKGROUND)
+        for i in range(row0, row1):
+            y = tile_edge(i, zoom)
+            height = tile_edge(i + 1, zoom) - y
+            row = grid[i]
+            for j in range(col0, col1):
+                x = tile_edge(j, zoom)
+                draw_tile(surface, images, row[j], x - left, y - top, tile_edge(j + 1, zoom) - x, height)
+
+        self._chunks[key] = surface
+        self.bytes_used += surface.get_bytesize() * surface.get_width() * surface.get_height()
+        return surface
+
+    def _evict(self, keep: Set[Tuple[float, int, int]]) -> None:
+        """Drop the least recently used chunks beyond the budget (never those of this frame)."""
+        while self.bytes_used > self.budget_bytes and self._chunks:
+            oldest = next(iter(self._chunks))
+            if oldest in keep:
+                break
+            self._drop(oldest)
+
+
+# Shared instance
+terrain_cache = TerrainChunkCache()
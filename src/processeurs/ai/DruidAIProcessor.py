@@ -31,6 +31,7 @@ from src.components.special.isVinedComponent import isVinedComponent
 # Make sure these import paths match your structure
 from src.ia.ia_druid.astar.aStarPathfinding import a_star_pathfinding, Grid, PositionPixel
 from src.ia.ia_druid.minimax.minimax import run_minimax, AI_DEPTH, GameState
+from src.managers.path_scheduler import path_scheduler
 
 
 # Type alias for grid (from mapComponent.py)
@@ -56,6 +57,7 @@ class DruidAIProcessor(esper.Processor):
         self.grid = grid
         self.world = world
         self.pathfinding_service = a_star_pathfinding
+        self._path_requests = {}  # entity -> requête en attente dans path_scheduler
         self.minimax_service = run_minimax
         self.debug_timer = 0.0
         self.last_dt = 0.0
@@ -144,6 +146,20 @@ class DruidAIProcessor(esper.Processor):
                     ai.current_action = best_action
                     self._execute_action(ent, ai, pos, best_action)
 
+    def _apply_path(self, druid_entity: int, ai: DruidAiComponent, action, path: List[PositionPixel]) -> None:
+        """Applique le chemin calculé si l'action qui l'a demandé est toujours en cours (rappel de path_scheduler)."""
+        self._path_requests.pop(druid_entity, None)
+        if ai.current_action is not action:
+            return
+
+        # print(f"[AI DEBUG 7] Pathfinding demandé. Chemin trouvé de {len(path)} points.") Moins de spam
+
+        if path and len(path) > 1:
+            ai.current_path = path[1:]
+        else:
+            # print(f"[AI DEBUG 7b] Pathfinding ÉCHOUÉ ou chemin trop court.") Moins de spam
+            ai.current_action = None # Se remet en mode 'réflexion'
+
     def _build_game_state(self, druid_entity: int, ai: DruidAiComponent, druid_pos: PositionComponent, druid_team: TeamComponent, druid_health: HealthComponent) -> Optional[GameState]:
         """Construit un état de jeu simplifié pour Minimax."""
         try:
@@ -250,15 +266,17 @@ class DruidAIProcessor(esper.Processor):
                     end_pos = (druid_pos_comp.x + (dx / dist) * flee_dist,
                                druid_pos_comp.y + (dy / dist) * flee_dist)
 
-                path = self.pathfinding_service(self.grid, start_pos, end_pos)
-
-                # print(f"[AI DEBUG 7] Pathfinding demandé. Chemin trouvé de {len(path)} points.") Moins de spam
-
-                if path and len(path) > 1:
-                    ai.current_path = path[1:]
-                else:
-                    # print(f"[AI DEBUG 7b] Pathfinding ÉCHOUÉ ou chemin trop court.") Moins de spam
-                    ai.current_action = None # Se remet en mode 'réflexion'
+                # Recherche confiée à la file globale (budget par frame) ; le chemin arrive par _apply_path
+                path_scheduler.cancel(self._path_requests.pop(druid_entity, None))
+                request_id = path_scheduler.submit(
+                    lambda: self.pathfinding_service(self.grid, start_pos, end_pos),
+                    entity=druid_entity,
+                    key=("druid", id(self.grid), int(start_pos[0] // TILE_SIZE), int(start_pos[1] // TILE_SIZE),
+                         int(end_pos[0] // TILE_SIZE), int(end_pos[1] // TILE_SIZE)),
+                    on_done=lambda path: self._apply_path(druid_entity, ai, action, path),
+                )
+                if path_scheduler.is_pending(request_id):
+                    self._path_requests[druid_entity] = request_id
 
             elif action_type == "WAIT":
                 vel = esper.component_for_entity(druid_entity, VelocityComponent)
@@ -25,9 +25,18 @@ from src.ia.leviathan.pathfinding import Pathfinder
 from src.components.core.aiEnabledComponent import AIEnabledComponent
 from src.settings.settings import TILE_SIZE
 from src.constants.map_tiles import TileType
+from src.components.events.stormComponent import Storm
+from src.components.events.banditsComponent import Bandits
+from src.managers.spatial_index import spatial_index
+from src.managers.path_scheduler import path_scheduler
 
 logger = logging.getLogger(__name__)
 
+# Avoidance radii (in tiles) of the moving hazards returned by _getObstaclesAround
+STORM_AVOID_RADIUS_TILES = 1.5
+# Bandits have a larger avoidance radius to give AI space to maneuver
+BANDIT_AVOID_RADIUS_TILES = 2.0
+
 
 class AILeviathanProcessor(esper.Processor):
     """
@@ -69,11 +78,6 @@ class AILeviathanProcessor(esper.Processor):
         self.map_grid = None  # Initialized externally by game manager
         self.pathfinder = None  # Lazy initialization after map_grid is available
 
-        # Performance: Entity Cache System
-        self.entity_cache = {}
-        self.cache_update_frequency = 30  # Frames between updates (~0.5s at 60 FPS)
-        self.cache_frame_counter = 0
-
         # Timing System
         self.elapsed_time = 0.0
 
@@ -91,6 +95,7 @@ class AILeviathanProcessor(esper.Processor):
         # Pathfinding Optimization: Rate Limiting
         self._path_recalc_cooldown = {}  # entity_id -> last_recalc_timestamp
         self.min_recalc_interval = 3.0  # Seconds between path recalculations
+        self._path_requests = {}  # entity_id -> request id in path_scheduler
 
         # Stuck Detection System (currently disabled)
         self._stuck_detection = {}
@@ -110,7 +115,8 @@ class AILeviathanProcessor(esper.Processor):
             5. Performance metrics tracking
 
         Note:
-            ECS doesn't provide dt parameter, so we calculate it internally.
+            Uses the dt passed to esper.process() when available (simulation
+            time), otherwise falls back to the wall-clock time between calls.
         """
         # Lazy Initialization: Create pathfinder when map becomes available
         if self.map_grid is not None and self.pathfinder is None:
@@ -119,20 +125,15 @@ class AILeviathanProcessor(esper.Processor):
         # Frame-Independent Timing: Calculate delta time
         import time
         current_time = time.time()
-        if not hasattr(self, '_last_process_time'):
-            self._last_process_time = current_time
-            dt = 0.016  # Default: 60 FPS assumption
-        else:
-            dt = current_time - self._last_process_time
-            self._last_process_time = current_time
+        dt = kwargs.get('dt')
+        if dt is None:
+            if not hasattr(self, '_last_process_time'):
+                dt = 0.016  # Default: 60 FPS assumption
+            else:
+                dt = current_time - self._last_process_time
+        self._last_process_time = current_time
 
         self.elapsed_time += dt
-        self.cache_frame_counter += 1
-
-        # Performance Optimization: Update entity cache periodically
-        if self.cache_frame_counter >= self.cache_update_frequency:
-            self._updateEntityCache()
-            self.cache_frame_counter = 0
 
         # Main AI Loop: Process each autonomous Leviathan
         ai_entities_found = 0
@@ -751,6 +752,24 @@ class AILeviathanProcessor(esper.Processor):
 
         return False
 
+    def _computeRoute(self, start, goal, obstacles) -> list:
+        """Path search run by path_scheduler (obstacles as seen when the path was requested)."""
+        self.pathfinder.dynamic_obstacles = list(obstacles)
+        # Every Leviathan heads for the same base: shared flow field instead of one A* each
+        return self.pathfinder.findRoute(start, goal)
+
+    def _applyPath(self, entity: int, path: list, target) -> None:
+        """Install a computed path (path_scheduler callback)."""
+        self._path_requests.pop(entity, None)
+        if not esper.entity_exists(entity):
+            return
+        if path and len(path) > 1:
+            self._entity_paths[entity] = path[1:]  # Skip first point (current position)
+            self._entity_path_targets[entity] = target
+        else:
+            # No path found, clear cached path
+            self._entity_paths[entity] = []
+
     def _navigateToEnemyBase(
         self,
         entity: int,
@@ -814,23 +833,23 @@ class AILeviathanProcessor(esper.Processor):
 
             # Calculate new path if needed AND (cooldown allows it OR forced)
             # Only update obstacles when we actually need to recalculate (performance optimization)
-            if needs_new_path and (can_recalculate or force_recalc):
-                # Update pathfinder with current dynamic obstacles NOW (only when recalculating)
+            if (needs_new_path and (can_recalculate or force_recalc)
+                    and not path_scheduler.is_pending(self._path_requests.get(entity))):
+                # Current dynamic obstacles, read only when we actually need to recalculate
                 team = esper.component_for_entity(entity, TeamComponent)
-                obstacles = self._getObstaclesAround(pos, radius=1000, team=team)
-                self.pathfinder.dynamic_obstacles = obstacles
-
-                path = self.pathfinder.findPath(current_pos, enemy_base_pos)
-                if path and len(path) > 1:
-                    self._entity_paths[entity] = path[1:]  # Skip first point (current position)
-                    self._entity_path_targets[entity] = enemy_base_pos
-                    # Record recalculation time
-                    self._path_recalc_cooldown[entity] = self.elapsed_time
-                else:
-                    # No path found, clear cached path
-                    self._entity_paths[entity] = []
-                    # Record recalculation time even on failure to avoid constant retrying
-                    self._path_recalc_cooldown[entity] = self.elapsed_time
+                obstacles = tuple(self._getObstaclesAround(pos, radius=1000, team=team))
+                # Queued in the game-wide path scheduler (per-frame budget); the path comes back in _applyPath.
+                # Requests from the same cell to the same base around the same storm/bandit cells share one search
+                self._path_requests[entity] = path_scheduler.submit(
+                    lambda: self._computeRoute(current_pos, enemy_base_pos, obstacles),
+                    entity=entity,
+                    key=("leviathan", id(self.pathfinder), int(pos.x // TILE_SIZE), int(pos.y // TILE_SIZE),
+                         int(enemy_base_pos[0] // TILE_SIZE), int(enemy_base_pos[1] // TILE_SIZE),
+                         self.pathfinder.obstacleCells(obstacles)),
+                    on_done=lambda path: self._applyPath(entity, path, enemy_base_pos),
+                )
+                # Record recalculation time (also on failure, to avoid constant retrying)
+                self._path_recalc_cooldown[entity] = self.elapsed_time
 
             # Get next waypoint from path
             if entity in self._entity_paths and self._entity_paths[entity]:
@@ -883,56 +902,11 @@ class AILeviathanProcessor(esper.Processor):
         else:
             vel.currentSpeed = vel.maxUpSpeed
 
-    def _updateEntityCache(self):
-        """Update the entity cache for faster queries."""
-        self.entity_cache = {
-            'enemies': {},
-            'allies': {},
-            'storms': [],
-            'bandits': [],
-        }
-
-        for entity, (other_pos, other_team) in esper.get_components(PositionComponent, TeamComponent):
-            team_id = other_team.team_id
-
-            # IGNORE team_id=0 (mines and neutral entities)
-            # Only track actual player/AI teams (team_id >= 1)
-            if team_id == 0:
-                continue
-
-            if team_id not in self.entity_cache['enemies']:
-                self.entity_cache['enemies'][team_id] = []
-            if team_id not in self.entity_cache['allies']:
-                self.entity_cache['allies'][team_id] = []
-
-            self.entity_cache['enemies'][team_id].append((entity, other_pos.x, other_pos.y))
-            self.entity_cache['allies'][team_id].append((entity, other_pos.x, other_pos.y))
-
-        from src.components.core.attackComponent import AttackComponent
-        try:
-            from src.components.events.stormComponent import Storm
-            for _, (storm_pos, _) in esper.get_components(PositionComponent, Storm):
-                # Use storm radius from settings (1.5 tiles)
-                storm_radius = 1.5 * TILE_SIZE
-                self.entity_cache['storms'].append((storm_pos.x, storm_pos.y, storm_radius))
-        except ImportError:
-            pass
-
-        # Cache bandits
-        try:
-            from src.components.events.banditsComponent import Bandits
-            for _, (bandit_pos, _) in esper.get_components(PositionComponent, Bandits):
-                # Bandits have a larger avoidance radius to give AI space to maneuver
-                bandit_radius = 2.0 * TILE_SIZE
-                self.entity_cache['bandits'].append((bandit_pos.x, bandit_pos.y, bandit_radius))
-        except ImportError:
-            pass
-
     def _getNearestEnemies(
         self, entity: int, pos: PositionComponent, team: TeamComponent
     ) -> Tuple[float, float, float, float]:
         """
-        Find nearby enemies using cached data.
+        Find nearby enemies using the shared spatial index.
 
         Returns:
             (enemy_count, min_normalized_distance, angle_to_nearest, avg_health_ratio)
@@ -943,35 +917,24 @@ class AILeviathanProcessor(esper.Processor):
         total_health_ratio = 0.0
         detection_radius = 500.0
 
-        if not self.entity_cache:
-            self._updateEntityCache()
-
-        for team_id, entities in self.entity_cache['enemies'].items():
-            if team_id == team.team_id:
+        # IGNORE team_id=0 (mines and neutral entities)
+        for other_entity, other_pos, distance in spatial_index.query_radius(
+            pos.x, pos.y, detection_radius, exclude=entity, exclude_teams=(0, team.team_id)
+        ):
+            if distance >= detection_radius:
                 continue
+            enemies_nearby += 1
 
-            for other_entity, other_x, other_y in entities:
-                if other_entity == entity:
-                    continue
+            if esper.has_component(other_entity, HealthComponent):
+                health_comp = esper.component_for_entity(other_entity, HealthComponent)
+                health_ratio = health_comp.currentHealth / health_comp.maxHealth if health_comp.maxHealth > 0 else 0.0
+                total_health_ratio += health_ratio
 
-                if not esper.entity_exists(other_entity):
-                    continue
-
-                dx = other_x - pos.x
-                dy = other_y - pos.y
-                distance_sq = dx * dx + dy * dy
-
-                if distance_sq < detection_radius * detection_radius:
-                    enemies_nearby += 1
-
-                    if esper.has_component(other_entity, HealthComponent):
-                        health_comp = esper.component_for_entity(other_entity, HealthComponent)
-                        health_ratio = health_comp.currentHealth / health_comp.maxHealth if health_comp.maxHealth > 0 else 0.0
-                        total_health_ratio += health_ratio
-
-                    if distance_sq < min_distance * min_distance:
-                        min_distance = distance_sq ** 0.5
-                        angle_to_nearest = (np.arctan2(dy, dx) * 180 / np.pi + 180) % 360  # Convert to degrees and add 180° to face enemy
+            if distance < min_distance:
+                min_distance = distance
+                dx = other_pos.x - pos.x
+                dy = other_pos.y - pos.y
+                angle_to_nearest = (np.arctan2(dy, dx) * 180 / np.pi + 180) % 360  # Convert to degrees and add 180° to face enemy
 
         min_distance_norm = min(min_distance / detection_radius, 1.0) if min_distance != float('inf') else 1.0
 
@@ -981,45 +944,29 @@ class AILeviathanProcessor(esper.Processor):
 
     def _getNearbyStorms(self, pos: PositionComponent) -> float:
         """
-        Detect nearby storms (tornades) using cached data.
+        Detect nearby storms (tornades) using the shared spatial index.
 
         Returns:
             min_distance to nearest storm (or inf if none)
         """
-        min_distance = float('inf')
-        detection_radius = 500.0
-
-        if not self.entity_cache:
-            self._updateEntityCache()
-
-        for storm_x, storm_y, _ in self.entity_cache['storms']:
-            distance = ((storm_x - pos.x) ** 2 + (storm_y - pos.y) ** 2) ** 0.5
-
-            if distance < detection_radius:
-                min_distance = min(min_distance, distance)
-
-        return min_distance
+        return self._nearestDistance(pos, Storm, detection_radius=500.0)
 
     def _getNearbyBandits(self, pos: PositionComponent) -> float:
         """
-        Detect nearby bandits using cached data.
+        Detect nearby bandits using the shared spatial index.
 
         Returns:
             min_distance to nearest bandit (or inf if none)
         """
-        min_distance = float('inf')
-        detection_radius = 500.0
+        return self._nearestDistance(pos, Bandits, detection_radius=500.0)
 
-        if not self.entity_cache:
-            self._updateEntityCache()
-
-        for bandit_x, bandit_y, _ in self.entity_cache['bandits']:
-            distance = ((bandit_x - pos.x) ** 2 + (bandit_y - pos.y) ** 2) ** 0.5
-
-            if distance < detection_radius:
-                min_distance = min(min_distance, distance)
-
-        return min_distance
+    @staticmethod
+    def _nearestDistance(pos: PositionComponent, component_type: type, detection_radius: float) -> float:
+        """Distance to the nearest entity having component_type, strictly within detection_radius (or inf)."""
+        nearest = spatial_index.query_nearest(pos.x, pos.y, k=1, max_radius=detection_radius, components=(component_type,))
+        if nearest and nearest[0][2] < detection_radius:
+            return nearest[0][2]
+        return float('inf')
 
     def _getNearbyMines(self, pos: PositionComponent) -> float:
         """
@@ -1159,12 +1106,12 @@ class AILeviathanProcessor(esper.Processor):
 
     def _getObstaclesAround(self, pos: PositionComponent, radius: float = 1000, team: TeamComponent = None) -> list:
         """
-        OPTIMIZED: Get all obstacles (islands, storms, bandits, mines) around a position.
+        OPTIMIZED: Get the moving obstacles (storms, bandits) around a position.
 
         Note:
         - Enemy units are NOT included - decision tree handles combat
-        - Only real blocking obstacles are returned
-        - Uses pre-computed pathfinder cache for islands/mines
+        - Islands, bases and mines are not included either: the LEVIATHAN navigation
+          profile already blocks them with a one-tile clearance
 
         Args:
             pos: Position to check around
@@ -1176,42 +1123,11 @@ class AILeviathanProcessor(esper.Processor):
         """
         obstacles = []
 
-        # OPTIMIZED: Use pathfinder's pre-computed cache if available
-        if self.pathfinder is not None and hasattr(self.pathfinder, '_blocked_cache'):
-            center_grid_x = int(pos.x // TILE_SIZE)
-            center_grid_y = int(pos.y // TILE_SIZE)
-            tile_radius = int(radius // TILE_SIZE) + 2
-
-            # Only check blocked cells from cache (much faster)
-            for blocked_pos in self.pathfinder._blocked_cache.keys():
-                grid_x, grid_y = blocked_pos
-
-                # Quick distance check in grid space first
-                if abs(grid_x - center_grid_x) > tile_radius or abs(grid_y - center_grid_y) > tile_radius:
-                    continue
-
-                world_x = (grid_x + 0.5) * TILE_SIZE
-                world_y = (grid_y + 0.5) * TILE_SIZE
-
-                # Distance check in world space
-                dist_sq = (world_x - pos.x) ** 2 + (world_y - pos.y) ** 2
-                if dist_sq < radius * radius:
-                    obstacle_radius = TILE_SIZE * 1.5
-                    obstacles.append((world_x, world_y, obstacle_radius))
-
-        if not self.entity_cache:
-            self._updateEntityCache()
-
-        # Add storms and bandits from cache (much faster than scanning all entities)
-        for storm_x, storm_y, storm_radius in self.entity_cache['storms']:
-            dist_sq = (storm_x - pos.x) ** 2 + (storm_y - pos.y) ** 2
-            if dist_sq < radius * radius:
-                obstacles.append((storm_x, storm_y, storm_radius))
-
-        for bandit_x, bandit_y, bandit_radius in self.entity_cache['bandits']:
-            dist_sq = (bandit_x - pos.x) ** 2 + (bandit_y - pos.y) ** 2
-            if dist_sq < radius * radius:
-                obstacles.append((bandit_x, bandit_y, bandit_radius))
+        # Storms and bandits from the shared spatial index
+        for component_type, obstacle_radius in ((Storm, STORM_AVOID_RADIUS_TILES), (Bandits, BANDIT_AVOID_RADIUS_TILES)):
+            for _, other_pos, distance in spatial_index.query_radius(pos.x, pos.y, radius, components=(component_type,)):
+                if distance < radius:
+                    obstacles.append((other_pos.x, other_pos.y, obstacle_radius * TILE_SIZE))
 
         return obstacles
 
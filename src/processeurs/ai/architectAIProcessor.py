@@ -27,6 +27,7 @@ from src.functions.buildingCreator import createDefenseTower, createHealTower
 from src.components.ai.architectAIComponent import ArchitectAIComponent
 from src.ia.architect.min_max import ArchitectMinimax, GameState, DecisionAction
 from src.ia.architect.pathfinding import SimplePathfinder
+from src.managers.path_scheduler import path_scheduler
 from src.settings.settings import TILE_SIZE
 from src.constants.gameplay import UNIT_COST_ATTACK_TOWER, UNIT_COST_HEAL_TOWER
 from src.constants.map_tiles import TileType
@@ -56,6 +57,7 @@ class ArchitectAIProcessor(esper.Processor):
         # Caches for pathfinding and behavior to avoid redundant calculations.
         self._entity_paths = {}
         self._entity_path_targets = {}
+        self._path_requests = {}  # entity -> (request id in path_scheduler, target)
         self.gold_reserve = 50  # Réserve d'or à conserver, comme pour BaseAi
         self._entity_taboo_targets = {}  # Stores recently failed pathfinding targets to avoid retrying.
         self._entity_position_history = {}  # Tracks recent positions to detect if an entity is stuck.
@@ -83,8 +85,14 @@ class ArchitectAIProcessor(esper.Processor):
                 return player_comp.spend_gold(amount)
         return False
     
-    def process(self, grid):
-        """Process all Architect units with enabled AI."""
+    def process(self, grid, dt=None):
+        """Process all Architect units with enabled AI.
+
+        Args:
+            grid: Map grid used for pathfinding.
+            dt: Simulation time step in seconds. When omitted, the wall-clock
+                time since the previous call is used.
+        """
         self.map_grid = grid
         # Lazy initialization of the pathfinder once the map grid is available.
         if self.map_grid is not None and self.pathfinder is None:
@@ -92,7 +100,8 @@ class ArchitectAIProcessor(esper.Processor):
 
         # Calculate delta time for time-based calculations.
         current_time = time.time()
-        dt = current_time - getattr(self, '_last_process_time', current_time)
+        if dt is None:
+            dt = current_time - getattr(self, '_last_process_time', current_time)
         self._last_process_time = current_time
         self.dt = dt
 
@@ -397,6 +406,13 @@ class ArchitectAIProcessor(esper.Processor):
             if dist_to_target < TILE_SIZE * 2:  # If new target is close to the old one, reuse the path.
                 needs_new_path = False
 
+        pending = self._path_requests.get(entity)
+        if needs_new_path and pending is not None and path_scheduler.is_pending(pending[0]):
+            if np.hypot(target_pos[0] - pending[1][0], target_pos[1] - pending[1][1]) < TILE_SIZE * 2:
+                needs_new_path = False  # The same request is already queued: keep following the old path
+            else:
+                path_scheduler.cancel(pending[0])
+
         if needs_new_path:
             # Provide enemy positions to the pathfinder to calculate a safer path.
             enemy_positions = []
@@ -405,20 +421,19 @@ class ArchitectAIProcessor(esper.Processor):
                 if other_team.team_id != my_team_id:
                     enemy_positions.append((other_pos.x, other_pos.y))
 
-            path = self.pathfinder.findPath((pos.x, pos.y), target_pos, enemy_positions=enemy_positions)
-            if path and len(path) > 1:
-                self._entity_paths[entity] = path[1:]  # Skip current pos
-                self._entity_path_targets[entity] = target_pos
-                # Clear the taboo list on successful path generation.
-                if entity in self._entity_taboo_targets:
-                    self._entity_taboo_targets[entity] = []
-            else:
-                # Pathfinding failed. Add the target to a "taboo" list to prevent retrying immediately.
-                if entity not in self._entity_taboo_targets:
-                    self._entity_taboo_targets[entity] = []
-                self._entity_taboo_targets[entity].append((target_pos, time.time()))
-                self._entity_taboo_targets[entity] = self._entity_taboo_targets[entity][-5:]  # Keep last 5 failed targets.
-                self._clear_path(entity)
+            start = (pos.x, pos.y)
+            enemy_cells = tuple(sorted({(int(x // TILE_SIZE), int(y // TILE_SIZE)) for x, y in enemy_positions}))
+            # Queued in the game-wide path scheduler (per-frame budget); the path comes back in _apply_path
+            request_id = path_scheduler.submit(
+                # The architect keeps heading for the same site between re-plans: flow field of the target
+                lambda: self.pathfinder.findPath(start, target_pos, enemy_positions=enemy_positions, shared=True),
+                entity=entity,
+                key=("architect", id(self.pathfinder), int(start[0] // TILE_SIZE), int(start[1] // TILE_SIZE),
+                     int(target_pos[0] // TILE_SIZE), int(target_pos[1] // TILE_SIZE), enemy_cells),
+                on_done=lambda path: self._apply_path(entity, path, target_pos),
+            )
+            if path_scheduler.is_pending(request_id):
+                self._path_requests[entity] = (request_id, target_pos)
 
         # Follow the current path.
         if self._entity_paths.get(entity):
@@ -792,6 +807,25 @@ class ArchitectAIProcessor(esper.Processor):
         """Checks if the entity is within a certain distance of a target."""
         return np.hypot(target[0] - pos.x, target[1] - pos.y) < threshold
 
+    def _apply_path(self, entity: int, path, target_pos: Tuple[float, float]):
+        """Installs a computed path, or marks its target as taboo when none was found (path_scheduler callback)."""
+        self._path_requests.pop(entity, None)
+        if not esper.entity_exists(entity):
+            return
+        if path and len(path) > 1:
+            self._entity_paths[entity] = path[1:]  # Skip current pos
+            self._entity_path_targets[entity] = target_pos
+            # Clear the taboo list on successful path generation.
+            if entity in self._entity_taboo_targets:
+                self._entity_taboo_targets[entity] = []
+        else:
+            # Pathfinding failed. Add the target to a "taboo" list to prevent retrying immediately.
+            if entity not in self._entity_taboo_targets:
+                self._entity_taboo_targets[entity] = []
+            self._entity_taboo_targets[entity].append((target_pos, time.time()))
+            self._entity_taboo_targets[entity] = self._entity_taboo_targets[entity][-5:]  # Keep last 5 failed targets.
+            self._clear_path(entity)
+
     def _clear_path(self, entity: int):
         """Clears the cached path for an entity."""
         if entity in self._entity_paths:
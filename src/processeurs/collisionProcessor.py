@@ -14,6 +14,7 @@ from src.components.special.VineComponent import VineComponent as Vine
 from src.components.special.isVinedComponent import isVinedComponent as IsVined
 from src.constants.map_tiles import TileType
 from src.settings.settings import TILE_SIZE
+from src.constants.gameplay import SIMULATION_REFERENCE_RATE
 from src.components.core.lifetimeComponent import LifetimeComponent
 from src.components.core.projectileComponent import ProjectileComponent
 from src.components.core.radiusComponent import RadiusComponent
@@ -21,6 +22,13 @@ from src.components.special.speScoutComponent import SpeScout
 from src.components.special.speMaraudeurComponent import SpeMaraudeur
 from src.components.special.speKamikazeComponent import SpeKamikazeComponent
 from src.managers.sprite_manager import SpriteID, sprite_manager
+from src.managers.spatial_index import candidate_pairs
+from src.managers.component_index import component_index
+from src.managers.projectile_store import projectile_store
+from src.managers.entity_commands import entity_commands
+from src.managers.terrain_cache import terrain_cache
+from src.managers.navigation import navigation
+from src.constants.collision_layers import CollisionLayer, COLLISION_GROUP_MATRIX, collision_groups
 from src.components.events.flyChestComponent import FlyingChestComponent
 from src.components.events.islandResourceComponent import IslandResourceComponent
 from src.components.core.towerComponent import TowerComponent
@@ -28,6 +36,16 @@ from src.functions.handleHealth import processHealth
 from src.components.events.banditsComponent import Bandits
 from src.components.core.velocityComponent import VelocityComponent as VelocityComp
 
+# Bits des components testés à chaque collision (component_index)
+_PROJECTILE = component_index.bit(ProjectileComponent)
+_BANDIT = component_index.bit(Bandits)
+_CHEST = component_index.bit(FlyingChestComponent)
+_KAMIKAZE = component_index.bit(SpeKamikazeComponent)
+_HEALTH = component_index.bit(Health)
+_ATTACK = component_index.bit(Attack)
+_MINE_COMPONENTS = component_index.mask_of(Health, Team, Attack)
+
+
 class CollisionProcessor(esper.Processor):
     def __init__(self, graph=None):
         super().__init__()
@@ -42,6 +60,9 @@ class CollisionProcessor(esper.Processor):
                         'ally_base': {'can_pass': False, 'speed_modifier': 0.0}, # 4 - Allied base blocks
                         'enemy_base': {'can_pass': False, 'speed_modifier': 0.0} # 5 - Enemy base blocks
                 }
+        # Copie NumPy (int8) de la grille, tenue à jour avec self.graph par _set_tile
+        self.tiles = np.asarray(graph, dtype=np.int8) if graph else None
+        self._build_terrain_tables()
 
     def process(self, **kwargs):
         # Initialize mine entities only once
@@ -50,7 +71,9 @@ class CollisionProcessor(esper.Processor):
             self.mines_initialized = True
 
         # Terrain collision first (before movement)
-        self._process_terrain_collisions()
+        dt = kwargs.get('dt')
+        step_scale = 1.0 if dt is None else dt * SIMULATION_REFERENCE_RATE
+        self._process_terrain_collisions(step_scale)
 
         # Entity-to-entity collisions
         self._process_entity_collisions()
@@ -62,155 +85,141 @@ class CollisionProcessor(esper.Processor):
 
         mine_count = 0
 
-        for y in range(len(self.graph)):
-            for x in range(len(self.graph[0])):
-                if self.graph[y][x] == TileType.MINE:  # Mine
-                    # Calculate position at tile center
-                    world_x = (x + 0.5) * TILE_SIZE
-                    world_y = (y + 0.5) * TILE_SIZE
-
-                    # Create the mine entity
-                    mine_entity = esper.create_entity()
-
-                    # Position
-                    esper.add_component(mine_entity, Position(
-                        x=world_x,
-                        y=world_y,
-                        direction=0
-                    ))
-
-                    # Invisible sprite (transparent surface)
-                    invisible_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-                    invisible_surface.fill((0, 0, 0, 0))  # Completely transparent
-
-                    esper.add_component(mine_entity, Sprite(
-                        image=invisible_surface,
-                        width=TILE_SIZE,
-                        height=TILE_SIZE
-                    ))
-
-                    # Health (1 HP - destroyed in one collision)
-                    esper.add_component(mine_entity, Health(
-                        currentHealth=1,
-                        maxHealth=1
-                    ))
-
-                    # Attack (40 damage)
-                    esper.add_component(mine_entity, Attack(
-                        hitPoints=40
-                    ))
-
-                    # Can collide
-                    esper.add_component(mine_entity, CanCollide())
-
-                    # Neutral team (so it hits everyone)
-                    esper.add_component(mine_entity, Team(team_id=0))
-
-                    mine_count += 1
+        for y, x in np.argwhere(self.tiles == TileType.MINE).tolist():  # Mines
+            # Calculate position at tile center
+            world_x = (x + 0.5) * TILE_SIZE
+            world_y = (y + 0.5) * TILE_SIZE
+
+            # Create the mine entity
+            mine_entity = esper.create_entity()
+
+            # Position
+            esper.add_component(mine_entity, Position(
+                x=world_x,
+                y=world_y,
+                direction=0
+            ))
+
+            # Invisible sprite (transparent surface)
+            invisible_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+            invisible_surface.fill((0, 0, 0, 0))  # Completely transparent
+
+            esper.add_component(mine_entity, Sprite(
+                image=invisible_surface,
+                width=TILE_SIZE,
+                height=TILE_SIZE
+            ))
+
+            # Health (1 HP - destroyed in one collision)
+            esper.add_component(mine_entity, Health(
+                currentHealth=1,
+                maxHealth=1
+            ))
+
+            # Attack (40 damage)
+            esper.add_component(mine_entity, Attack(
+                hitPoints=40
+            ))
+
+            # Can collide
+            esper.add_component(mine_entity, CanCollide(layer=CollisionLayer.MINE))
+
+            # Neutral team (so it hits everyone)
+            esper.add_component(mine_entity, Team(team_id=0))
+
+            mine_count += 1
         
 
     def _process_entity_collisions(self):
-        """Process entity collisions using spatial hashing."""
+        """Process entity collisions: vectorized broad phase and AABB narrow phase.
+
+        The broad phase only generates pairs allowed by the collision layer
+        matrix (COLLISION_GROUP_MATRIX: layers and teams). Entity hits never
+        move or immediately delete entities, so every candidate pair can be
+        tested at once on the positions of this pass; only confirmed hits
+        reach _handle_entity_hit.
+
+        The bullets of the projectile_store take part in the same broad phase
+        (after the entities, in the PROJECTILE layer); their hits go to
+        _handle_projectile_hit and _handle_projectile_pair, and the bullets
+        killed during the pass are removed at its end.
+        """
+        entities = esper.get_components(Position, Sprite, CanCollide, Team)
+        count = len(entities)
+        slots = projectile_store.live_slots()
+        if count + slots.size < 2:
+            return
 
-        # 1. Define hash grid size
-        # A good size is generally 2x the average entity size.
-        CELL_SIZE = TILE_SIZE * 4
+        ents = np.fromiter((ent for ent, _ in entities), dtype=np.int64, count=count)
+        pos_rows = np.fromiter((comps[0]._row for _, comps in entities), dtype=np.int64, count=count)
+        team_rows = np.fromiter((comps[3]._row for _, comps in entities), dtype=np.int64, count=count)
+        layers = np.fromiter((comps[2].layer for _, comps in entities), dtype=np.int64, count=count)
+        widths = np.fromiter((int(comps[1].original_width) for _, comps in entities), dtype=np.int64, count=count)
+        heights = np.fromiter((int(comps[1].original_height) for _, comps in entities), dtype=np.int64, count=count)
+        teams = Team._table.column("team_id")[team_rows]
+
+        # Bullets come after the entities: index count + i is slots[i]
+        xs = np.concatenate((Position._table.column("x")[pos_rows], projectile_store.column("x")[slots]))
+        ys = np.concatenate((Position._table.column("y")[pos_rows], projectile_store.column("y")[slots]))
+        widths = np.concatenate((widths, projectile_store.column("width")[slots].astype(np.int64)))
+        heights = np.concatenate((heights, projectile_store.column("height")[slots].astype(np.int64)))
+        layers = np.concatenate((layers, np.full(slots.size, int(CollisionLayer.PROJECTILE), dtype=np.int64)))
+        teams = np.concatenate((teams.astype(np.int64), projectile_store.column("team")[slots].astype(np.int64)))
+        groups = collision_groups(layers, teams)
+
+        # Broad phase: two rects can only overlap if their centers are closer than
+        # the sum of their half-sizes (+1: rect centers are truncated to ints)
+        first, second = candidate_pairs(xs, ys, int(widths.max()) + 1, int(heights.max()) + 1,
+                                        groups, COLLISION_GROUP_MATRIX)
+        if first.size == 0:
+            return
 
-        # 2. Create and populate the hash grid
-        spatial_grid = {}
-        entities = esper.get_components(Position, Sprite, CanCollide, Team)
+        hits = self._filter_hits(first, second, xs, ys, widths, heights)
+        ent_list = ents.tolist()
+        slot_list = slots.tolist()
+        for index, other_index in zip(first[hits].tolist(), second[hits].tolist()):
+            if index < count and other_index < count:
+                self._handle_entity_hit(ent_list[index], ent_list[other_index])
+            elif index < count:
+                self._handle_projectile_hit(slot_list[other_index - count], ent_list[index])
+            elif other_index < count:
+                self._handle_projectile_hit(slot_list[index - count], ent_list[other_index])
+            else:
+                self._handle_projectile_pair(slot_list[index - count], slot_list[other_index - count])
+        projectile_store.flush_dead()
 
-        for ent, (pos, sprite, _, _) in entities:
-            # Use original dimensions for collision logic
-            width = int(sprite.original_width)
-            height = int(sprite.original_height)
-
-            # Determine which grid cells the entity overlaps
-            min_x = int((pos.x - width / 2) / CELL_SIZE)
-            max_x = int((pos.x + width / 2) / CELL_SIZE)
-            min_y = int((pos.y - height / 2) / CELL_SIZE)
-            max_y = int((pos.y + height / 2) / CELL_SIZE)
-
-            for grid_x in range(min_x, max_x + 1):
-                for grid_y in range(min_y, max_y + 1):
-                    cell_key = (grid_x, grid_y)
-                    if cell_key not in spatial_grid:
-                        spatial_grid[cell_key] = []
-                    spatial_grid[cell_key].append(ent)
-
-        # 3. Check collisions
-        already_checked = set()
-
-        for ent, (pos, sprite, collide, team) in entities:
-            width = int(sprite.original_width)
-            height = int(sprite.original_height)
-            rect1 = pygame.Rect(0, 0, width, height)
-            rect1.center = (int(pos.x), int(pos.y))
-
-            # Determine cells to check
-            min_x = int((pos.x - width / 2) / CELL_SIZE)
-            max_x = int((pos.x + width / 2) / CELL_SIZE)
-            min_y = int((pos.y - height / 2) / CELL_SIZE)
-            max_y = int((pos.y + height / 2) / CELL_SIZE)
-
-            potential_colliders = set()
-            for grid_x in range(min_x, max_x + 1):
-                for grid_y in range(min_y, max_y + 1):
-                    cell_key = (grid_x, grid_y)
-                    if cell_key in spatial_grid:
-                        for collider_ent in spatial_grid[cell_key]:
-                            potential_colliders.add(collider_ent)
-            
-            for other_ent in potential_colliders:
-                # Avoid self-collision and already checked pairs
-                if ent == other_ent:
-                    continue
-
-                pair_key = tuple(sorted((ent, other_ent)))
-                if pair_key in already_checked:
-                    continue
-                already_checked.add(pair_key)
-
-                # Get the other entity's components
-                other_pos, other_sprite, other_team = esper.component_for_entity(other_ent, Position), esper.component_for_entity(other_ent, Sprite), esper.component_for_entity(other_ent, Team)
-
-                rect2 = pygame.Rect(0, 0, int(other_sprite.original_width), int(other_sprite.original_height))
-                rect2.center = (int(other_pos.x), int(other_pos.y))
-
-                if rect1.colliderect(rect2):
-                    # Ignore collisions between towers and flying chests
-                    is_tower1 = esper.has_component(ent, TowerComponent)
-                    is_tower2 = esper.has_component(other_ent, TowerComponent)
-                    is_chest1 = esper.has_component(ent, FlyingChestComponent)
-                    is_chest2 = esper.has_component(other_ent, FlyingChestComponent)
-
-                    if (is_tower1 and is_chest2) or (is_tower2 and is_chest1):
-                        continue
-
-                    # Ignore collisions between bandits
-                    is_bandit1 = esper.has_component(ent, Bandits)
-                    is_bandit2 = esper.has_component(other_ent, Bandits)
-                    if is_bandit1 and is_bandit2:
-                        continue
-
-
-                    # If same team, ignore UNLESS one is a mine (team_id=0)
-                    if team.team_id == other_team.team_id and team.team_id != 0 and other_team.team_id != 0:
-                        continue
-
-                    # Handle collision between the two entities
-                    self._handle_entity_hit(ent, other_ent)
+    @staticmethod
+    def _filter_hits(first, second, xs, ys, widths, heights) -> np.ndarray:
+        """Indices of the candidate pairs whose rects overlap.
+
+        Same test as pygame.Rect.colliderect on rects of the sprite size
+        centered on (int(x), int(y)).
+        """
+        cx = np.trunc(xs).astype(np.int64)
+        cy = np.trunc(ys).astype(np.int64)
+        left = cx - widths // 2
+        top = cy - heights // 2
+        right = left + widths
+        bottom = top + heights
+        overlap = (
+            (widths[first] > 0) & (heights[first] > 0) & (widths[second] > 0) & (heights[second] > 0)
+            & (left[first] < right[second]) & (left[second] < right[first])
+            & (top[first] < bottom[second]) & (top[second] < bottom[first])
+        )
+        return np.flatnonzero(overlap)
 
     def _handle_entity_hit(self, entity1, entity2):
         """Handles damage between two colliding entities"""
         # Check if it's an already processed projectile-entity collision
         projectile_entity = None
         target_entity = None
+        components1 = component_index.entity_mask(entity1)
+        components2 = component_index.entity_mask(entity2)
 
-        if esper.has_component(entity1, ProjectileComponent):
+        if components1 & _PROJECTILE:
             projectile_entity = entity1
             target_entity = entity2
-        elif esper.has_component(entity2, ProjectileComponent):
+        elif components2 & _PROJECTILE:
             projectile_entity = entity2
             target_entity = entity1
 
@@ -232,8 +241,7 @@ class CollisionProcessor(esper.Processor):
             if is_mine_target:
                 # Impact explosion and projectile removal (mine remains intact)
                 self._create_explosion_at_entity(projectile_entity)
-                if esper.entity_exists(projectile_entity):
-                    esper.delete_entity(projectile_entity)
+                entity_commands.delete(projectile_entity)
                 return
 
             # Detect bandit - bandits are invulnerable to projectiles
@@ -263,8 +271,7 @@ class CollisionProcessor(esper.Processor):
                     processHealth(target_entity, dmg, projectile_entity)
                     # Impact explosion and projectile removal
                     self._create_explosion_at_entity(projectile_entity)
-                    if esper.entity_exists(projectile_entity):
-                        esper.delete_entity(projectile_entity)
+                    entity_commands.delete(projectile_entity)
                     return
         
         # If it's not a projectile, check cooldowns to avoid continuous damage
@@ -298,21 +305,21 @@ class CollisionProcessor(esper.Processor):
                 pass
 
         # Check if one entity is a projectile and the other a mine
-        is_projectile1 = esper.has_component(entity1, ProjectileComponent)
-        is_projectile2 = esper.has_component(entity2, ProjectileComponent)
+        is_projectile1 = components1 & _PROJECTILE
+        is_projectile2 = components2 & _PROJECTILE
         is_mine1 = self._is_mine_entity(entity1)
         is_mine2 = self._is_mine_entity(entity2)
-        is_chest1 = esper.has_component(entity1, FlyingChestComponent)
-        is_chest2 = esper.has_component(entity2, FlyingChestComponent)
+        is_chest1 = components1 & _CHEST
+        is_chest2 = components2 & _CHEST
         # But the projectile can be destroyed
         if (is_projectile1 and is_mine2) or (is_projectile2 and is_mine1):
             # Destroy only the projectile and create an explosion
             if is_projectile1:
                 self._create_explosion_at_entity(entity1)
-                esper.delete_entity(entity1)
+                entity_commands.delete(entity1)
             if is_projectile2:
                 self._create_explosion_at_entity(entity2)
-                esper.delete_entity(entity2)
+                entity_commands.delete(entity2)
             # Mine takes no damage and stays in place
             return
 
@@ -331,8 +338,8 @@ class CollisionProcessor(esper.Processor):
             pass
 
         # If a mine or entity hits a bandit, ignore completely (bandits invulnerable)
-        is_bandit1 = esper.has_component(entity1, Bandits)
-        is_bandit2 = esper.has_component(entity2, Bandits)
+        is_bandit1 = components1 & _BANDIT
+        is_bandit2 = components2 & _BANDIT
 
         # Bandits are invulnerable: they never take damage
         # But other entities take damage if they touch a bandit
@@ -417,47 +424,106 @@ class CollisionProcessor(esper.Processor):
 
         # --- SPECIAL KAMIKAZE HANDLING ---
         # Must be after dispatch so mine takes damage before being checked.
-        is_kamikaze1 = esper.has_component(entity1, SpeKamikazeComponent)
-        is_kamikaze2 = esper.has_component(entity2, SpeKamikazeComponent)
+        is_kamikaze1 = components1 & _KAMIKAZE
+        is_kamikaze2 = components2 & _KAMIKAZE
 
         # Kamikaze explodes on everything, except chests.
         if is_kamikaze1 and not is_chest2:
             self._create_explosion_at_entity(entity1)
-            esper.delete_entity(entity1)
+            entity_commands.delete(entity1)
 
         if is_kamikaze2 and not is_chest1:
             self._create_explosion_at_entity(entity2)
-            esper.delete_entity(entity2)
+            entity_commands.delete(entity2)
 
         # If a mine hits another entity (e.g. a ship), it explodes and disappears
         if is_mine1:
             self._create_explosion_at_entity(entity1)
             self._destroy_mine_on_grid_with_position(pos1)
-            esper.delete_entity(entity1)
+            entity_commands.delete(entity1)
 
         if is_mine2:
             self._create_explosion_at_entity(entity2)
             self._destroy_mine_on_grid_with_position(pos2)
-            esper.delete_entity(entity2)
+            entity_commands.delete(entity2)
 
 
-        # After dispatch, check if entities were deleted and act accordingly
-        # Mine handling - use saved positions because entity may be deleted
-        if is_mine1 and not esper.entity_exists(entity1):
-            self._destroy_mine_on_grid_with_position(pos1)
-        if is_mine2 and not esper.entity_exists(entity2):
-            self._destroy_mine_on_grid_with_position(pos2)
+    def _handle_projectile_hit(self, slot, target_entity):
+        """Handles a bullet of the projectile_store hitting an entity.
 
-        # Explosion handling for deleted projectiles
-        try:
-            # If a projectile was deleted during dispatch, create an impact explosion
-            if had_proj1 and entity1 not in esper._entities and pos1 is not None:
-                self._create_explosion_at_position(pos1[0], pos1[1], impact=True)
+        Same rules as _handle_entity_hit for projectile entities: hit-once,
+        mines only destroy the bullet, bandits are invulnerable and bandit
+        bullets don't damage bases.
+        """
+        hit_entities = projectile_store.hit_entities(slot)
+        if target_entity in hit_entities:
+            return
+        hit_entities.add(target_entity)
+        x = float(projectile_store.column("x")[slot])
+        y = float(projectile_store.column("y")[slot])
+
+        components = component_index.entity_mask(target_entity)
+        # Mine: impact explosion and bullet removal (mine remains intact)
+        if self._is_mine_entity(target_entity):
+            self._create_explosion_at_position(x, y, impact=True)
+            projectile_store.kill(slot)
+            return
 
-            if had_proj2 and entity2 not in esper._entities and pos2 is not None:
-                self._create_explosion_at_position(pos2[0], pos2[1], impact=True)
-        except Exception:
-            pass
+        # Bandits are invulnerable to projectiles
+        if components & _BANDIT:
+            return
+
+        # Bandit projectiles don't damage bases
+        from src.components.core.baseComponent import BaseComponent
+        owner = projectile_store.owner(slot)
+        if (esper.has_component(target_entity, BaseComponent) and owner is not None and
+                esper.entity_exists(owner) and esper.has_component(owner, Bandits)):
+            return
+
+        damage = int(projectile_store.column("damage")[slot])
+        if damage > 0 and components & _HEALTH:
+            processHealth(target_entity, damage, owner)
+            # Impact explosion and bullet removal
+            self._create_explosion_at_position(x, y, impact=True)
+            projectile_store.kill(slot)
+            return
+
+        # No damage dealt: the target's attack damages the bullet, and a Kamikaze
+        # explodes on it (as after the 'entities_hit' dispatch)
+        if components & _ATTACK:
+            self._damage_projectile(slot, int(esper.component_for_entity(target_entity, Attack).hitPoints))
+        if components & (_KAMIKAZE | _CHEST) == _KAMIKAZE:
+            self._create_explosion_at_entity(target_entity)
+            entity_commands.delete(target_entity)
+
+    def _handle_projectile_pair(self, slot, other_slot):
+        """Handles two bullets of the projectile_store hitting each other (the first one is the attacker)"""
+        hit_entities = projectile_store.hit_entities(slot)
+        key = projectile_store.target_key(projectile_store.column("serial")[other_slot])
+        if key in hit_entities:
+            return
+        hit_entities.add(key)
+
+        damage_col = projectile_store.column("damage")
+        damage = int(damage_col[slot])
+        if damage > 0:
+            self._damage_projectile(other_slot, damage)
+            self._create_explosion_at_position(float(projectile_store.column("x")[slot]),
+                                               float(projectile_store.column("y")[slot]), impact=True)
+            projectile_store.kill(slot)
+            return
+        self._damage_projectile(slot, int(damage_col[other_slot]))
+
+    @staticmethod
+    def _damage_projectile(slot, damage):
+        """Applies damage to a bullet, killed when its health drops to 0 (processHealth rule)"""
+        if damage <= 0:
+            return
+        health = projectile_store.column("health")
+        if health[slot] > 0:
+            health[slot] -= damage
+        if health[slot] <= 0:
+            projectile_store.kill(slot)
 
     def _create_explosion_at_entity(self, entity):
         """Create an explosion at the given entity's position (projectile)"""
@@ -477,8 +543,6 @@ class CollisionProcessor(esper.Processor):
 
         If impact=True, uses impact sprite (`IMPACT_EXPLOSION`), otherwise `EXPLOSION`.
         """
-        explosion_entity = esper.create_entity()
-        esper.add_component(explosion_entity, Position(x=x, y=y, direction=0))
         sprite_id = SpriteID.IMPACT_EXPLOSION if impact else SpriteID.EXPLOSION
         # Larger size for better visibility (impact even larger)
         scale = 3.0 if impact else 2.5
@@ -492,8 +556,12 @@ class CollisionProcessor(esper.Processor):
             width = int(base * scale)
             height = int(base * scale)
         # Always create component via sprite_manager to stay consistent
-        esper.add_component(explosion_entity, sprite_manager.create_sprite_component(sprite_id, width, height))
-        esper.add_component(explosion_entity, LifetimeComponent(duration))
+        # (the explosion appears at the end of the tick, see entity_commands)
+        entity_commands.create(
+            Position(x=x, y=y, direction=0),
+            sprite_manager.create_sprite_component(sprite_id, width, height),
+            LifetimeComponent(duration),
+        )
 
     def _destroy_mine_on_grid(self, entity):
         """Destroys mine on grid if entity is a mine"""
@@ -514,11 +582,18 @@ class CollisionProcessor(esper.Processor):
                     if (0 <= grid_y < len(self.graph) and
                         0 <= grid_x < len(self.graph[0]) and
                         self.graph[grid_y][grid_x] == TileType.MINE):
-                        self.graph[grid_y][grid_x] = int(TileType.SEA)  # Replace with water
+                        self._set_tile(grid_x, grid_y, TileType.SEA)  # Replace with water
 
                         # Dispatch explosion event
                         esper.dispatch_event('mine_explosion', pos.x, pos.y)
 
+    def _set_tile(self, grid_x, grid_y, value):
+        """Writes a tile in the shared grid and in its NumPy copy (redraws its terrain chunk, updates the navigation costs)"""
+        self.graph[grid_y][grid_x] = int(value)
+        self.tiles[grid_y, grid_x] = int(value)
+        terrain_cache.invalidate_tile(grid_x, grid_y)
+        navigation.set_tile(self.graph, grid_x, grid_y, value)
+
     def _destroy_mine_on_grid_with_position(self, position):
         """Destroys mine on grid using a saved position"""
         if not self.graph or position is None:
@@ -532,69 +607,105 @@ class CollisionProcessor(esper.Processor):
         if (0 <= grid_y < len(self.graph) and
             0 <= grid_x < len(self.graph[0]) and
             self.graph[grid_y][grid_x] == TileType.MINE):
-            self.graph[grid_y][grid_x] = int(TileType.SEA)  # Replace with water
+            self._set_tile(grid_x, grid_y, TileType.SEA)  # Replace with water
             # Dispatch explosion event
             esper.dispatch_event('mine_explosion', x, y)
 
-    def _process_terrain_collisions(self):
-        """Handles terrain collisions - before movement"""
-        if not self.graph:
+    def _process_terrain_collisions(self, step_scale=1.0):
+        """Handles terrain collisions - before movement
+
+        The destination tile of every moving entity is gathered from the int8
+        tile array in one go; its effects come from the per-tile lookup tables
+        built by _build_terrain_tables.
+
+        Args:
+            step_scale: Movement scale of this tick (dt * SIMULATION_REFERENCE_RATE),
+                so the look-ahead matches the distance MovementProcessor will cover.
+        """
+        if self.tiles is None:
             return
 
+        # Bullets of the projectile_store fly over every tile and may leave the map
+        projectile_store.reset_terrain_modifiers()
+
         # Get all entities that can collide with terrain
         entities = esper.get_components(Position, Velocity, CanCollide)
+        count = len(entities)
+        if count == 0:
+            return
 
-        for ent, (pos, velocity, collide) in entities:
-            # Ignore non-moving entities
-            if velocity.currentSpeed == 0:
-                # Reset modifier if not moving
-                velocity.terrain_modifier = 1.0
-                continue
-
-            # Calculate future position (where entity wants to go)
-            # IMPORTANT: Keep currentSpeed sign to handle knockback
-            direction_rad = math.radians(pos.direction)
-            future_x = pos.x - velocity.currentSpeed * math.cos(direction_rad)
-            future_y = pos.y - velocity.currentSpeed * math.sin(direction_rad)
-
-
-            # Convert positions to grid coordinates
-            future_grid_x = int(future_x // TILE_SIZE)
-            future_grid_y = int(future_y // TILE_SIZE)
-
-            # Check grid bounds for future position
-            if (future_grid_x < 0 or future_grid_x >= len(self.graph[0]) or
-                future_grid_y < 0 or future_grid_y >= len(self.graph)):
-                # Check if it's a bandit or projectile - they can leave the map
-                is_bandit = esper.has_component(ent, Bandits)
-                is_projectile = esper.has_component(ent, ProjectileComponent)
-                if is_bandit or is_projectile:
-                    # Bandits and projectiles can leave the map freely
-                    velocity.terrain_modifier = 1.0
-                    continue
-                # Out of bounds - block movement for other entities
+        ents = np.fromiter((ent for ent, _ in entities), dtype=np.int64, count=count)
+        pos_rows = np.fromiter((comps[0]._row for _, comps in entities), dtype=np.int64, count=count)
+        vel_rows = np.fromiter((comps[1]._row for _, comps in entities), dtype=np.int64, count=count)
+        speed_col = Velocity._table.column("currentSpeed")
+        modifier_col = Velocity._table.column("terrain_modifier")
+        speed = speed_col[vel_rows]
+
+        # Reset modifier of non-moving entities
+        moving = speed != 0
+        modifier_col[vel_rows[~moving]] = 1.0
+        if not moving.any():
+            return
+        indices = np.flatnonzero(moving)
+        pos_rows = pos_rows[moving]
+        vel_rows = vel_rows[moving]
+
+        # Calculate future position (where entity wants to go)
+        # IMPORTANT: Keep currentSpeed sign to handle knockback
+        direction_rad = np.radians(Position._table.column("direction")[pos_rows])
+        step = speed[moving] * step_scale
+        future_x = Position._table.column("x")[pos_rows] - step * np.cos(direction_rad)
+        future_y = Position._table.column("y")[pos_rows] - step * np.sin(direction_rad)
+        grid_x = np.floor_divide(future_x, TILE_SIZE).astype(np.int64)
+        grid_y = np.floor_divide(future_y, TILE_SIZE).astype(np.int64)
+
+        # Bandits and projectiles fly over everything and can leave the map
+        moving_ents = ents[moving]
+        flying = component_index.select(moving_ents, any_of=(Bandits, ProjectileComponent))
+
+        height, width = self.tiles.shape
+        inside = (grid_x >= 0) & (grid_x < width) & (grid_y >= 0) & (grid_y < height)
+        tiles = np.zeros(indices.size, dtype=np.uint8)
+        tiles[inside] = self.tiles.view(np.uint8)[grid_y[inside], grid_x[inside]]
+
+        modifier = np.where(flying, self._flying_speed_modifiers[tiles], self._speed_modifiers[tiles])
+        # Out of bounds: block movement of other entities
+        out_of_map = ~inside & ~flying
+        modifier[~inside] = 1.0
+        speed_col[vel_rows[out_of_map]] = 0.0
+        # Impassable destination: block movement and apply centralized knockback
+        blocked = inside & ~flying & ~self._can_pass[tiles]
+        modifier[blocked] = 0.0
+        modifier_col[vel_rows] = modifier
+
+        magnitude = TILE_SIZE * 0.5
+        for index in indices[blocked].tolist():
+            ent, (pos, velocity, _) = entities[index]
+            try:
+                self._apply_knockback(ent, pos, velocity, magnitude=magnitude)
+            except Exception:
+                # Fallback: simple stop
                 velocity.currentSpeed = 0
-                velocity.terrain_modifier = 1.0
-                continue
-
-            # Get destination terrain type
-            future_terrain = self._get_terrain_type_from_grid(future_grid_x, future_grid_y)
-
-            # Apply effects based on destination terrain
-            self._apply_terrain_effects(ent, pos, velocity, future_terrain)
 
-    def _get_terrain_type_from_grid(self, grid_x, grid_y):
-        """Gets terrain type from grid coordinates"""
-        # If grid is not provided, consider as water
-        if not self.graph:
-            return 'water'
-
-        if (grid_x < 0 or grid_x >= len(self.graph[0]) or
-            grid_y < 0 or grid_y >= len(self.graph)):
-            return 'water'
+    def _build_terrain_tables(self):
+        """Per-tile lookup tables (indexed by the tile value as uint8) of terrain_effects.
 
-        terrain_value = self.graph[grid_y][grid_x]
-        return self._get_terrain_type(terrain_value)
+        Unknown tile values are treated as water.
+        """
+        self._can_pass = np.ones(256, dtype=bool)
+        self._speed_modifiers = np.ones(256, dtype=np.float64)
+        self._flying_speed_modifiers = np.ones(256, dtype=np.float64)
+        for value in range(256):
+            terrain_type = self._get_terrain_type(int(np.uint8(value).view(np.int8)))
+            effect = self.terrain_effects.get(terrain_type)
+            if effect is None:
+                continue
+            self._can_pass[value] = effect['can_pass']
+            self._speed_modifiers[value] = effect['speed_modifier']
+            # Projectiles and bandits pass through islands and bases and are
+            # not slowed down in clouds
+            if effect['can_pass'] and terrain_type != 'cloud':
+                self._flying_speed_modifiers[value] = effect['speed_modifier']
 
     def _get_terrain_type(self, terrain_value):
         """Converts numeric terrain value to terrain type according to your system"""
@@ -622,57 +733,9 @@ class CollisionProcessor(esper.Processor):
             # Unknown value, treat as water
             return 'water'
 
-    def _apply_terrain_effects(self, entity, pos, velocity, terrain_type):
-        # ProjectileComponent imported at top of file
-        if terrain_type not in self.terrain_effects:
-            velocity.terrain_modifier = 1.0
-            return
-        effect = self.terrain_effects[terrain_type]
-        is_projectile = esper.has_component(entity, ProjectileComponent)
-        is_bandit = esper.has_component(entity, Bandits)
-        # Projectiles and bandits pass through islands and bases
-        if not effect['can_pass']:
-            if is_projectile:
-                # Destroy only if mine, NOT for bases or islands
-                if terrain_type in ['mine']:
-                    esper.delete_entity(entity)
-                    return
-                # Otherwise (e.g.: island, base), pass through without effect
-                else:
-                    # No destruction, no blocking
-                    velocity.terrain_modifier = 1.0
-                    return
-            elif is_bandit:
-                # Bandits fly over everything (islands, bases, mines)
-                # No destruction, no blocking, no slowdown
-                velocity.terrain_modifier = 1.0
-                return
-            else:
-                # Block movement and apply centralized knockback
-                # Set speed to 0 and apply simple recoil (back along direction)
-                magnitude = TILE_SIZE * 0.5
-                try:
-                    # Position component
-                    pos_comp = esper.component_for_entity(entity, Position)
-                    vel_comp = velocity
-                    # Apply knockback via centralized method
-                    self._apply_knockback(entity, pos_comp, vel_comp, magnitude=magnitude)
-                except Exception:
-                    # Fallback: simple stop
-                    velocity.currentSpeed = 0
-                velocity.terrain_modifier = 0.0
-        else:
-            if (is_projectile or is_bandit) and terrain_type == 'cloud':
-                # Projectiles and bandits are not slowed down in clouds
-                velocity.terrain_modifier = 1.0
-            else:
-                velocity.terrain_modifier = effect['speed_modifier']
-
     def _is_mine_entity(self, entity):
         """Check if an entity is a mine (max health = 1, team_id = 0, attack = 40)"""
-        if (esper.has_component(entity, Health) and
-            esper.has_component(entity, Team) and
-            esper.has_component(entity, Attack)):
+        if component_index.has_all(entity, _MINE_COMPONENTS):
             health = esper.component_for_entity(entity, Health)
             team = esper.component_for_entity(entity, Team)
             attack = esper.component_for_entity(entity, Attack)
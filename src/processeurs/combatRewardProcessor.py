@@ -18,6 +18,7 @@ from src.factory.unitType import UnitType
 from src.components.core.positionComponent import PositionComponent
 from src.components.core.spriteComponent import SpriteComponent
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.events.flyChestComponent import FlyingChestComponent
 from src.managers.sprite_manager import SpriteID, sprite_manager
 from src.settings.settings import TILE_SIZE
@@ -115,7 +116,7 @@ class CombatRewardProcessor(esper.Processor):
         if sprite_component is not None:
             esper.add_component(entity, sprite_component)
 
-        esper.add_component(entity, CanCollideComponent())
+        esper.add_component(entity, CanCollideComponent(layer=CollisionLayer.CHEST))
         esper.add_component(entity, TeamComponent(team_id=0))  # Neutral
         esper.add_component(
             entity,
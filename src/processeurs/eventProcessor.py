@@ -5,6 +5,7 @@ from src.components.core.spriteComponent import SpriteComponent as Sprite
 from src.components.core.teamComponent import TeamComponent as Team
 from src.components.core.attackComponent import AttackComponent as Attack
 from src.components.core.canCollideComponent import CanCollideComponent as CanCollide
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.positionComponent import PositionComponent as Position
 
 from src.components.properties.eventsComponent import EventsComponent as Event
@@ -49,7 +50,7 @@ class EventProcessor(esper.Processor):
             if newPosition is not None:
                 krakenEnt = esper.create_entity()
                 esper.add_component(krakenEnt, Attack(1))
-                esper.add_component(krakenEnt, CanCollide())
+                esper.add_component(krakenEnt, CanCollide(layer=CollisionLayer.KRAKEN))
                 esper.add_component(krakenEnt, Position(newPosition[0], newPosition[1]))
                 esper.add_component(krakenEnt, Team(0))
                 esper.add_component(krakenEnt, Event(0, 20, 20))
@@ -8,9 +8,11 @@ from src.components.core.teamComponent import TeamComponent as Team
 from src.components.core.attackComponent import AttackComponent as Attack
 from src.components.core.healthComponent import HealthComponent as Health
 from src.components.core.canCollideComponent import CanCollideComponent as CanCollide
+from src.constants.collision_layers import CollisionLayer
 from src.components.events.banditsComponent import Bandits
 from src.components.properties.eventsComponent import EventsComponent as Event
 from src.managers.sprite_manager import SpriteID, sprite_manager
+from src.managers.spatial_index import spatial_index
 from src.settings.settings import TILE_SIZE, MAP_WIDTH, MAP_HEIGHT
 
 
@@ -123,37 +125,15 @@ class BanditsProcessor:
         target_pos = None
         min_dist = float('inf')
 
-        for target_ent, (target_pos_comp, target_health) in esper.get_components(Position, Health):
-            # Don't attack itself
-            if target_ent == entity:
-                continue
-
-            # Don't attack other bandits
-            if esper.has_component(target_ent, Bandits):
-                continue
-
-            # Don't attack bases
-            from src.components.core.baseComponent import BaseComponent
-            if esper.has_component(target_ent, BaseComponent):
-                continue
-
-            # Check that the target has a team (so it's a playable unit)
-            if not esper.has_component(target_ent, Team):
-                continue
-
-            # Don't attack neutral entities (team 0)
-            target_team = esper.component_for_entity(target_ent, Team)
-            if target_team.team_id == 0:
-                continue
-
-            # Calculate distance and angle to target
+        # Don't attack itself, other bandits, bases or neutral entities (team 0):
+        # only playable units (with a team) within the detection radius
+        from src.components.core.baseComponent import BaseComponent
+        for target_ent, target_pos_comp, distance in spatial_index.query_radius(
+            bandit_pos.x, bandit_pos.y, detection_radius_pixels, exclude=entity,
+            components=(Health,), without=(Bandits, BaseComponent), exclude_teams=(0,)
+        ):
             dx = target_pos_comp.x - bandit_pos.x
             dy = target_pos_comp.y - bandit_pos.y
-            distance = math.sqrt(dx * dx + dy * dy)
-
-            # Check if target is within detection radius
-            if distance > detection_radius_pixels:
-                continue
 
             # Calculate angle to target
             angle_to_target_rad = math.atan2(dy, dx)
@@ -269,7 +249,7 @@ class BanditsProcessor:
             esper.add_component(bandit_ent, Attack(20))
             # Bandits have CanCollide to detect collisions with units
             # They are invulnerable (handled in collisionProcessor)
-            esper.add_component(bandit_ent, CanCollide())
+            esper.add_component(bandit_ent, CanCollide(layer=CollisionLayer.BANDIT))
             esper.add_component(bandit_ent, Team(0))  # Neutral team
             # event_chance=0, event_duration=60s, current_time=0
             esper.add_component(bandit_ent, Event(0, 60, 0))
@@ -5,6 +5,7 @@ from src.components.properties.eventsComponent import EventsComponent as Event
 from src.components.events.krakenTentacleComponent import KrakenTentacleComponent as Tentacle
 from src.components.core.attackComponent import AttackComponent as Attack
 from src.components.core.canCollideComponent import CanCollideComponent as CanCollide
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.positionComponent import PositionComponent as Position
 from src.components.core.spriteComponent import SpriteComponent as Sprite
 from src.components.core.teamComponent import TeamComponent as Team
@@ -36,7 +37,7 @@ def _createTentaclesEntities(nbLaying: int = 0, nbIdle: int = 0, grid = None):
             tentacleIdle = esper.create_entity()
             esper.add_component(tentacleIdle, Tentacle())
             esper.add_component(tentacleIdle, Attack(1))
-            esper.add_component(tentacleIdle, CanCollide())
+            esper.add_component(tentacleIdle, CanCollide(layer=CollisionLayer.KRAKEN))
             esper.add_component(tentacleIdle, Position(newPosition[0], newPosition[1], newPosition[2]))
             esper.add_component(tentacleIdle, Team(0))
             
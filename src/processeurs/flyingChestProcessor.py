@@ -10,6 +10,7 @@ import pygame
 import numpy as np
 
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.positionComponent import PositionComponent
 from src.components.core.spriteComponent import SpriteComponent
 from src.components.events.flyChestComponent import FlyingChestComponent
@@ -176,7 +177,7 @@ class FlyingChestProcessor(esper.Processor):
         if sprite_component is not None:
             esper.add_component(entity, sprite_component)
 
-        esper.add_component(entity, CanCollideComponent())
+        esper.add_component(entity, CanCollideComponent(layer=CollisionLayer.CHEST))
         esper.add_component(entity, TeamComponent(team_id=0))
         esper.add_component(
             entity,
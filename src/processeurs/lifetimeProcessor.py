@@ -1,16 +1,19 @@
 import esper
 from src.components.core.lifetimeComponent import LifetimeComponent
+from src.managers.projectile_store import projectile_store
+from src.managers.entity_commands import entity_commands
 
 class LifetimeProcessor(esper.Processor):
     def process(self, dt=0.016, **kwargs):
         """
-        Supprime les entities dont la durée de vie est écoulée.
+        Supprime les entities dont la durée de vie est écoulée,
+        ainsi que les balles expirées du projectile_store.
         dt : temps écoulé from la dernière frame (en secondes)
         """
-        entities_to_delete = []
+        projectile_store.expire(dt)
 
         for ent, lifetime in esper.get_component(LifetimeComponent):
             lifetime.duration -= dt
             if lifetime.duration <= 0:
-                esper.delete_entity(ent)
+                entity_commands.delete(ent)
         
\ No newline at end of file
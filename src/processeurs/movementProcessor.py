@@ -1,4 +1,5 @@
 import esper
+import numpy as np
 from math import cos, sin, radians
 from src.components.core.velocityComponent import VelocityComponent as Velocity
 from src.components.core.positionComponent import PositionComponent as Position
@@ -7,6 +8,15 @@ from src.components.special.speKamikazeComponent import SpeKamikazeComponent
 from src.components.core.projectileComponent import ProjectileComponent
 from src.components.events.banditsComponent import Bandits
 from src.settings.settings import MAP_WIDTH, MAP_HEIGHT, TILE_SIZE
+from src.constants.gameplay import SIMULATION_REFERENCE_RATE, MOVEMENT_BATCH_MIN_ENTITIES
+from src.managers.component_index import component_index
+from src.managers.projectile_store import projectile_store
+
+# Bits des components testés à chaque déplacement (component_index)
+_BANDIT = component_index.bit(Bandits)
+_KAMIKAZE = component_index.bit(SpeKamikazeComponent)
+_VINED = component_index.bit(isVined)
+_PROJECTILE = component_index.bit(ProjectileComponent)
 
 class MovementProcessor(esper.Processor):
     """
@@ -15,6 +25,13 @@ class MovementProcessor(esper.Processor):
     - Les troupes sont bloquées aux limites de la carte
     - Les projectiles sont supprimés quand ils atteignent les limites
     - Prend en compte les modificateurs de terrain (nuages, îles, etc.)
+    - Les vitesses sont en pixels par tick à SIMULATION_REFERENCE_RATE : le
+      déplacement est mis à l'échelle du dt reçu (vitesse de jeu indépendante
+      de la fréquence de simulation)
+    - Au-delà de MOVEMENT_BATCH_MIN_ENTITIES entités mobiles, le déplacement
+      est calculé en quelques opérations NumPy sur les colonnes du
+      component_store (résultats identiques au calcul entité par entité)
+    - Les balles du projectile_store avancent en un seul calcul sur leurs colonnes
     """
 
     def __init__(self):
@@ -26,58 +43,134 @@ class MovementProcessor(esper.Processor):
         # (basée sur une taille moyenne de sprite)
         self.boundary_margin = 32  # pixels
 
+        # En dessous de ce nombre d'entités, la boucle Python reste plus rapide que NumPy
+        self.batch_min_entities = MOVEMENT_BATCH_MIN_ENTITIES
+
     def process(self, **kwargs):
-        for ent, (vel, pos) in esper.get_components(Velocity, Position):
-            # Check sic'est un bandit (ils traversent les îles)
-            is_bandit = esper.has_component(ent, Bandits)
-            
-            # Calculer la vitesse effective d'abord
-            effective_speed = 0
-            if vel.currentSpeed != 0:
-                if is_bandit:
-                    # Les bandits ignorent les modificateurs de terrain (traversent les îles)
-                    effective_speed = vel.currentSpeed
-                else:
-                    effective_speed = vel.currentSpeed * vel.terrain_modifier
-
-                # Appliquer le boost de vitesse du Kamikaze si actif
-                if esper.has_component(ent, SpeKamikazeComponent):
-                    kamikaze_comp = esper.component_for_entity(ent, SpeKamikazeComponent)
-                    if kamikaze_comp.is_active:
-                        effective_speed *= kamikaze_comp.speed_multiplier
-            
-            # Ne bouger que si la vitesse effective != 0
-            if effective_speed != 0 and not esper.has_component(ent, isVined):
-                # Calculer la nouvelle position avec la vitesse effective
-                direction_rad = radians(pos.direction)
-                new_x = pos.x - effective_speed * cos(direction_rad)
-                new_y = pos.y - effective_speed * sin(direction_rad)
-                is_projectile = esper.has_component(ent, ProjectileComponent)
-                
-                if is_projectile:
-                    # Pour les projectiles : appliquer le mouvement sans suppression aux limites
-                    pos.x = new_x
-                    pos.y = new_y
-                else:
-                    # Pour les troupes : contraindre la position et arrêter si nécessaire
-                    # Les bandits ne sont pas contraints par les limites de terrain
-                    if is_bandit:
-                        # Les bandits peuvent aller n'importe où sur la carte
-                        pos.x = new_x
-                        pos.y = new_y
-                    else:
-                        constrained_x, constrained_y = self._constrain_position(new_x, new_y)
-                        
-                        # Si la position a été contrainte par les limites de la carte, arrêter le mouvement
-                        if constrained_x != new_x or constrained_y != new_y:
-                            vel.currentSpeed = 0.0
-                            # Réinitialiser le modificateur de terrain si arrêté par les limites
-                            vel.terrain_modifier = 1.0
-                        
-                        # Appliquer la position contrainte
-                        pos.x = constrained_x
-                        pos.y = constrained_y
-            # Si effective_speed est 0, le vaisseau ne bouge pas
+        dt = kwargs.get('dt')
+        step_scale = 1.0 if dt is None else dt * SIMULATION_REFERENCE_RATE
+        movers = esper.get_components(Velocity, Position)
+        if len(movers) >= self.batch_min_entities:
+            self._process_batch(movers, step_scale)
+        else:
+            for ent, (vel, pos) in movers:
+                self._move_entity(ent, vel, pos, step_scale)
+        projectile_store.integrate(step_scale)
+
+    def _move_entity(self, ent, vel, pos, step_scale: float) -> None:
+        """Déplacement d'une seule entité (petits effectifs, où NumPy ne paie pas)."""
+        components = component_index.entity_mask(ent)
+        # Check sic'est un bandit (ils traversent les îles)
+        is_bandit = components & _BANDIT
+
+        # Calculer la vitesse effective d'abord
+        effective_speed = 0
+        if vel.currentSpeed != 0:
+            if is_bandit:
+                # Les bandits ignorent les modificateurs de terrain (traversent les îles)
+                effective_speed = vel.currentSpeed
+            else:
+                effective_speed = vel.currentSpeed * vel.terrain_modifier
+
+            # Appliquer le boost de vitesse du Kamikaze si actif
+            if components & _KAMIKAZE:
+                kamikaze_comp = esper.component_for_entity(ent, SpeKamikazeComponent)
+                if kamikaze_comp.is_active:
+                    effective_speed *= kamikaze_comp.speed_multiplier
+
+        effective_speed *= step_scale
+
+        # Ne bouger que si la vitesse effective != 0
+        if effective_speed != 0 and not components & _VINED:
+            # Calculer la nouvelle position avec la vitesse effective
+            direction_rad = radians(pos.direction)
+            new_x = pos.x - effective_speed * cos(direction_rad)
+            new_y = pos.y - effective_speed * sin(direction_rad)
+            is_projectile = components & _PROJECTILE
+
+            if is_projectile or is_bandit:
+                # Projectiles et bandits ne sont pas contraints par les limites de la carte
+                pos.x = new_x
+                pos.y = new_y
+            else:
+                # Pour les troupes : contraindre la position et arrêter si nécessaire
+                constrained_x, constrained_y = self._constrain_position(new_x, new_y)
+
+                # Si la position a été contrainte par les limites de la carte, arrêter le mouvement
+                if constrained_x != new_x or constrained_y != new_y:
+                    vel.currentSpeed = 0.0
+                    # Réinitialiser le modificateur de terrain si arrêté par les limites
+                    vel.terrain_modifier = 1.0
+
+                # Appliquer la position contrainte
+                pos.x = constrained_x
+                pos.y = constrained_y
+        # Si effective_speed est 0, le vaisseau ne bouge pas
+
+    def _process_batch(self, movers, step_scale: float) -> None:
+        """Même calcul que _move_entity, pour toutes les entités à la fois, sur les colonnes du component_store."""
+        count = len(movers)
+        if count == 0:
+            return
+        entities = np.fromiter((ent for ent, _ in movers), dtype=np.int64, count=count)
+        vel_rows = np.fromiter((comps[0]._row for _, comps in movers), dtype=np.int64, count=count)
+        pos_rows = np.fromiter((comps[1]._row for _, comps in movers), dtype=np.int64, count=count)
+
+        speed_col = Velocity._table.column("currentSpeed")
+        terrain_col = Velocity._table.column("terrain_modifier")
+        speed = speed_col[vel_rows]
+        terrain = terrain_col[vel_rows]
+
+        # Les bandits ignorent les modificateurs de terrain (traversent les îles)
+        components = component_index.masks_for(entities)
+        is_bandit = (components & _BANDIT) != 0
+        effective_speed = np.zeros(count)
+        nonzero = speed != 0
+        effective_speed[nonzero] = np.where(is_bandit[nonzero], speed[nonzero], speed[nonzero] * terrain[nonzero])
+
+        # Boost de vitesse du Kamikaze si actif
+        effective_speed *= self._kamikaze_multipliers(entities)
+        effective_speed *= step_scale
+
+        # Ne bouger que si la vitesse effective != 0 et si l'unité n'est pas immobilisée par des lianes
+        moving = (effective_speed != 0) & ((components & _VINED) == 0)
+        if not moving.any():
+            return
+
+        pos_rows = pos_rows[moving]
+        vel_rows = vel_rows[moving]
+        effective_speed = effective_speed[moving]
+        x_col = Position._table.column("x")
+        y_col = Position._table.column("y")
+        direction_rad = np.radians(Position._table.column("direction")[pos_rows])
+        new_x = x_col[pos_rows] - effective_speed * np.cos(direction_rad)
+        new_y = y_col[pos_rows] - effective_speed * np.sin(direction_rad)
+
+        # Les projectiles et les bandits ne sont pas contraints par les limites de la carte ;
+        # les troupes sont contraintes et s'arrêtent si elles touchent un bord
+        constrained = (components[moving] & (_BANDIT | _PROJECTILE)) == 0
+        constrained_x = np.maximum(self.boundary_margin, np.minimum(self.world_width - self.boundary_margin, new_x))
+        constrained_y = np.maximum(self.boundary_margin, np.minimum(self.world_height - self.boundary_margin, new_y))
+        stopped = constrained & ((constrained_x != new_x) | (constrained_y != new_y))
+
+        x_col[pos_rows] = np.where(constrained, constrained_x, new_x)
+        y_col[pos_rows] = np.where(constrained, constrained_y, new_y)
+        if stopped.any():
+            speed_col[vel_rows[stopped]] = 0.0
+            # Réinitialiser le modificateur de terrain si arrêté par les limites
+            terrain_col[vel_rows[stopped]] = 1.0
+
+    @staticmethod
+    def _kamikaze_multipliers(entities: np.ndarray) -> np.ndarray:
+        """Multiplicateur de vitesse par entité (1.0 sauf Kamikaze avec boost actif)."""
+        boosted = [(ent, kamikaze.speed_multiplier)
+                   for ent, kamikaze in esper.get_component(SpeKamikazeComponent) if kamikaze.is_active]
+        if not boosted:
+            return np.ones(entities.size)
+        lookup = np.ones(max(max(ent for ent, _ in boosted), int(entities.max())) + 1)
+        for ent, multiplier in boosted:
+            lookup[ent] = multiplier
+        return lookup[entities]
 
     def _is_out_of_bounds(self, x: float, y: float) -> bool:
         """
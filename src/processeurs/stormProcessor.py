@@ -6,6 +6,7 @@ from typing import Optional, Tuple, Dict
 import logging
 
 from src.components.events.stormComponent import Storm
+from src.components.events.banditsComponent import Bandits
 from src.components.core.positionComponent import PositionComponent
 from src.components.core.spriteComponent import SpriteComponent
 from src.components.core.healthComponent import HealthComponent
@@ -14,6 +15,8 @@ from src.settings.settings import TILE_SIZE, MAP_WIDTH, MAP_HEIGHT
 from src.constants.gameplay import INITIAL_EVENT_DELAY
 from src.constants.map_tiles import TileType
 from src.managers.sprite_manager import SpriteID, sprite_manager
+from src.managers.spatial_index import spatial_index
+from src.managers.entity_commands import entity_commands
 
 logger = logging.getLogger(__name__)
 
@@ -180,21 +183,11 @@ class StormProcessor(es.Processor):
         stormPos = es.component_for_entity(stormEntity, PositionComponent)
         radius_world = self.stormRadius * TILE_SIZE
 
-        # Find all vulnerable units
-        for entity, (pos, health, team) in es.get_components(
-            PositionComponent, HealthComponent, TeamComponent
+        # Find all vulnerable units (bandits resist storms)
+        for entity, pos, _ in spatial_index.query_radius(
+            stormPos.x, stormPos.y, radius_world, exclude=stormEntity,
+            components=(HealthComponent, TeamComponent), without=(Bandits,)
         ):
-            # Skip bandit entities (they should resist storms)
-            try:
-                from src.components.events.banditsComponent import Bandits
-                if es.has_component(entity, Bandits):
-                    continue
-            except Exception:
-                # If the component can't be imported, ignore and continue
-                pass
-            if entity == stormEntity:
-                continue
-
             # Skip bases - check if entity is on a base tile
             grid_x = int(pos.x // TILE_SIZE)
             grid_y = int(pos.y // TILE_SIZE)
@@ -203,29 +196,24 @@ class StormProcessor(es.Processor):
                 if terrain in [TileType.ALLY_BASE, TileType.ENEMY_BASE]:
                     continue  # Don't attack units on bases
 
-            # Calculate distance
-            dx = pos.x - stormPos.x
-            dy = pos.y - stormPos.y
-            distance = (dx * dx + dy * dy) ** 0.5
+            # Check cooldown for this entity
+            last_attack = stormState['entity_attacks'].get(entity, -999.0)
+            time_since_last = stormState['elapsed_time'] - last_attack
 
-            if distance <= radius_world:
-                # Check cooldown for this entity
-                last_attack = stormState['entity_attacks'].get(entity, -999.0)
-                time_since_last = stormState['elapsed_time'] - last_attack
+            if time_since_last >= stormConfig.tempete_cooldown:
+                # Deal damage
+                health = es.component_for_entity(entity, HealthComponent)
+                health.currentHealth -= self.stormDamage
+                stormState['entity_attacks'][entity] = stormState['elapsed_time']
 
-                if time_since_last >= stormConfig.tempete_cooldown:
-                    # Deal damage
-                    health.currentHealth -= self.stormDamage
-                    stormState['entity_attacks'][entity] = stormState['elapsed_time']
-
-                    logger.debug(
-                        f"Storm {stormEntity} deals {self.stormDamage} damage to entity {entity} "
-                        f"(HP: {health.currentHealth}/{health.maxHealth})"
-                    )
+                logger.debug(
+                    f"Storm {stormEntity} deals {self.stormDamage} damage to entity {entity} "
+                    f"(HP: {health.currentHealth}/{health.maxHealth})"
+                )
 
-                    # Check if entity is destroyed
-                    if health.currentHealth <= 0:
-                        es.delete_entity(entity)
+                # Check if entity is destroyed
+                if health.currentHealth <= 0:
+                    entity_commands.delete(entity)
 
     def trySpawnStorm(self):
         """Attempt to spawn a new storm."""
@@ -325,12 +313,8 @@ class StormProcessor(es.Processor):
 
     def destroyStorm(self, stormEntity: int):
         """Destroy a storm (end of life)."""
-        try:
-            if stormEntity in es._entities:
-                es.delete_entity(stormEntity)
-                logger.debug(f"Storm {stormEntity} destroyed (lifetime expired)")
-        except Exception as e:
-            logger.error(f"Error destroying storm: {e}")
+        entity_commands.delete(stormEntity)
+        logger.debug(f"Storm {stormEntity} destroyed (lifetime expired)")
 
     def clearAllStorms(self):
         """Remove all active storms."""
@@ -4,15 +4,11 @@ from src.components.core.towerComponent import TowerComponent, TowerType
 from src.components.core.positionComponent import PositionComponent
 from src.components.core.healthComponent import HealthComponent
 from src.components.core.teamComponent import TeamComponent
-from src.components.core.velocityComponent import VelocityComponent
-from src.components.core.attackComponent import AttackComponent
-from src.components.core.canCollideComponent import CanCollideComponent
-from src.components.core.spriteComponent import SpriteComponent
-from src.components.core.projectileComponent import ProjectileComponent
-from src.components.core.lifetimeComponent import LifetimeComponent
 from src.components.core.baseComponent import BaseComponent
 from src.managers.sprite_manager import SpriteID, sprite_manager
-from src.constants.gameplay import PROJECTILE_SPEED, PROJECTILE_WIDTH, PROJECTILE_HEIGHT
+from src.managers.spatial_index import spatial_index
+from src.managers.projectile_store import projectile_store
+from src.constants.gameplay import PROJECTILE_SPEED, PROJECTILE_WIDTH, PROJECTILE_HEIGHT, PROJECTILE_LIFETIME
 
 
 class TowerProcessor(esper.Processor):
@@ -29,40 +25,22 @@ class TowerProcessor(esper.Processor):
             target_entity = None
             target_pos = None
             min_dist = float('inf')
-            
-            for e2, (p2, t2, hp2) in esper.get_components(PositionComponent, TeamComponent, HealthComponent):
-                # avoid de se cibler soi-même
-                if e2 == ent:
-                    continue
-                
-                # NE PAS cibler les entities neutres (team_id = 0, comme les mines)
-                if t2.team_id == 0:
-                    continue
-                
-                # Si la tour ne peut pas attaquer les bâtiments, on ignore les bases et les autres tours
-                if not tower.can_attack_buildings:
-                    # NE PAS cibler les bases (elles ont BaseComponent)
-                    if esper.has_component(e2, BaseComponent):
-                        continue
-                    # NE PAS cibler d'autres tours
-                    if esper.has_component(e2, TowerComponent):
-                        continue
-                    
-                # Defense towers attack enemies (team différente)
-                if tower.is_defense_tower():
-                    if t2.team_id == team.team_id:  # Même équipe = skip
-                        continue
-                # Heal towers heal allies (même team)
-                elif tower.is_heal_tower():
-                    if t2.team_id != team.team_id:  # Équipe différente = skip
-                        continue
+
+            # Defense towers attack enemies (team différente), heal towers heal allies (même team)
+            # NE PAS cibler les entities neutres (team_id = 0, comme les mines)
+            if tower.is_defense_tower():
+                candidates = self._find_candidates(ent, pos, tower, exclude_teams=(0, team.team_id))
+            elif tower.is_heal_tower():
+                candidates = self._find_candidates(ent, pos, tower, team_id=team.team_id, exclude_teams=(0,))
+            else:
+                candidates = []  # Unknown tower type
+
+            for e2, p2, dist in candidates:
+                if tower.is_heal_tower():
+                    hp2 = esper.component_for_entity(e2, HealthComponent)
                     if hp2.currentHealth >= hp2.maxHealth:  # Pleine santé = skip
                         continue
-                else:
-                    continue  # Unknown tower type
-                
-                dist = math.hypot(p2.x - pos.x, p2.y - pos.y)
-                if dist <= tower.range and dist < min_dist:
+                if dist < min_dist:
                     min_dist = dist
                     target_entity = e2
                     target_pos = p2
@@ -82,6 +60,16 @@ class TowerProcessor(esper.Processor):
                 
                 tower.trigger_action()
 
+    @staticmethod
+    def _find_candidates(ent: int, pos: PositionComponent, tower: TowerComponent, **team_filter):
+        """Entités avec de la vie à portée de la tour (index spatial partagé)."""
+        # Si la tour ne peut pas attaquer les bâtiments, on ignore les bases et les autres tours
+        excluded_types = () if tower.can_attack_buildings else (BaseComponent, TowerComponent)
+        return spatial_index.query_radius(
+            pos.x, pos.y, tower.range, exclude=ent,
+            components=(HealthComponent,), without=excluded_types, **team_filter
+        )
+
     def _create_tower_projectile(self, tower_entity: int, tower_pos: PositionComponent, target_pos: PositionComponent, team_id: int, damage: int):
         """creates un projectile de tour to une cible."""
         # Calculer l'angle to la cible
@@ -91,56 +79,17 @@ class TowerProcessor(esper.Processor):
         dy = tower_pos.y - target_pos.y
         angle = math.degrees(math.atan2(dy, dx))
         
-        # Create l'entity projectile
-        projectile = esper.create_entity()
-        
-        # Position de départ
-        esper.add_component(projectile, PositionComponent(
-            x=tower_pos.x,
-            y=tower_pos.y,
-            direction=angle
-        ))
-        
-        # Équipe
-        esper.add_component(projectile, TeamComponent(team_id=team_id))
-        
-        # Vitesse - IMPORTANT : Initialize terrain_modifier à 1.0
-        esper.add_component(projectile, VelocityComponent(
-            currentSpeed=PROJECTILE_SPEED,
-            maxUpSpeed=PROJECTILE_SPEED,
-            maxReverseSpeed=0.0,
-            terrain_modifier=1.0
-        ))
-        
-        # Dégâts
-        esper.add_component(projectile, AttackComponent(hitPoints=damage))
-        
-        # Santé (projectile destructible)
-        esper.add_component(projectile, HealthComponent(currentHealth=1))
-        
-        # Collision
-        esper.add_component(projectile, CanCollideComponent())
-        
-        # Durée de vie
-        esper.add_component(projectile, LifetimeComponent(duration=1.2))
-        
-        # Identifier comme projectile
-        esper.add_component(projectile, ProjectileComponent("tower_bullet", tower_entity))
-        
         # Sprite (boule bleue pour allié, rouge pour ennemi)
         if team_id == 1:  # Allié
             sprite_id = SpriteID.PROJECTILE_BULLET
         else:  # Ennemi
             sprite_id = SpriteID.PROJECTILE_FIREBALL
-            
-        size = sprite_manager.get_default_size(sprite_id)
-        if size:
-            width, height = size
-            esper.add_component(projectile, sprite_manager.create_sprite_component(sprite_id, width, height))
-        else:
-            # Fallback
-            esper.add_component(projectile, SpriteComponent(
-                "assets/sprites/projectile/ball.png",
-                PROJECTILE_WIDTH,
-                PROJECTILE_HEIGHT
-            ))
+        width, height = sprite_manager.get_default_size(sprite_id) or (PROJECTILE_WIDTH, PROJECTILE_HEIGHT)
+
+        # Projectile dans le projectile_store (destructible : 1 PV), lancé à pleine
+        # vitesse dès ce tick (terrain_modifier à 1.0)
+        projectile_store.spawn(
+            x=tower_pos.x, y=tower_pos.y, direction=angle, speed=PROJECTILE_SPEED,
+            team_id=team_id, damage=damage, owner=tower_entity, lifetime=PROJECTILE_LIFETIME,
+            sprite_id=sprite_id, width=width, height=height, health=1, terrain_modifier=1.0,
+        )
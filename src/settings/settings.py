@@ -33,11 +33,14 @@ DEFAULT_CONFIG = {
     "disable_shadows": False,
     "disable_ai_learning": True,
     "max_fps": 60,
+    "sim_tick_rate": 60,  # Fréquence de la simulation à pas fixe (indépendante du FPS d'affichage)
     "show_fps": False,
     "dev_mode": False,  # Mode développement pour les actions debug
     "language": "fr",
     "check_updates": True,  # Vérification automatique des mises à jour au démarrage
     "fog_render_mode": "tiles",  # "image" or "tiles"
+    "dirty_rect_rendering": False,  # Ne redessiner et présenter que les zones modifiées (caméra immobile)
+    "pipelined_simulation": False,  # Simulation sur un thread dédié, le rendu dessine l'instantané précédent
     "camera_sensitivity": 1.0,
     "camera_fast_multiplier": 2.5,
     "show_tutorial": True,  # Affichage du tutoriel activé/désactivé
@@ -3,11 +3,10 @@ Système de gestion de la visibilité et du brouillard de guerre.
 Calcule les zones visibles par l'équipe actuelle et applique le brouillard.
 """
 
-import math
 import pygame
-from typing import Set, Tuple, Optional
-import random
+from typing import Dict, List, Set, Tuple, Optional
 
+import numpy as np
 import esper as es
 
 
@@ -16,18 +15,27 @@ from src.components.core.teamComponent import TeamComponent
 from src.constants.team import Team
 from src.components.core.visionComponent import VisionComponent
 from src.settings.settings import MAP_WIDTH, MAP_HEIGHT, TILE_SIZE, config_manager, get_fog_render_mode
-from src.managers.surface_cache import get_filled_surface, get_cloud_texture
+from src.managers.surface_cache import get_cloud_shade
+from src.managers.terrain_cache import camera_origin, tile_edge, visible_range
 from src.processeurs.KnownBaseProcessor import enemy_base_registry
 from src.functions.resource_path import get_resource_path
 from src.managers.sprite_manager import sprite_manager, SpriteID
 
 
+# Transparence du brouillard : tuile explorée mais non visible
+EXPLORED_FOG_ALPHA = 120
+
+
 class VisionSystem:
-    """Système pour gérer la visibilité des units et le brouillard de guerre."""
+    """Système pour gérer la visibilité des units et le brouillard de guerre.
+
+    Les tuiles visibles et découvertes de chaque équipe sont des grilles uint8
+    (MAP_HEIGHT x MAP_WIDTH, indexées [y, x], 1 = visible / découverte).
+    """
 
     def __init__(self):
-        self.visible_tiles: dict[int, Set[Tuple[int, int]]] = {}  # Par équipe
-        self.explored_tiles: dict[int, Set[Tuple[int, int]]] = {}  # Par équipe
+        self.visible_tiles: Dict[int, np.ndarray] = {}  # Par équipe
+        self.explored_tiles: Dict[int, np.ndarray] = {}  # Par équipe
         self.current_team = 1  # Équipe actuelle (1 = alliés, 2 = ennemis)
         self.cloud_image = sprite_manager.load_sprite(SpriteID.TERRAIN_CLOUD)
         self._dirty_teams: Set[int] = set()
@@ -35,8 +43,38 @@ class VisionSystem:
         # If True, suppress the 'tile_explored' event during update_visibility.
         # This is used to avoid firing tutorial tips during initial entity spawn.
         self._suppress_explore_events: bool = False
+        # Masques circulaires de vision, par portée
+        self._stamps: Dict[float, np.ndarray] = {}
+        # Nombre d'units de l'équipe voyant chaque tuile, [y, x] (par équipe)
+        self.vision_counts: Dict[int, np.ndarray] = {}
+        # Masque appliqué pour chaque unit : entity -> (tuile x, tuile y, portée) (par équipe)
+        self._unit_stamps: Dict[int, Dict[int, Tuple[int, int, float]]] = {}
+        # Équipes dont la grille visible doit être recalculée from les compteurs
+        self._resync_teams: Set[int] = set()
+        # Couleur (RGBA) du brouillard des tuiles non découvertes, par mode de rendu : [x, y, canal]
+        self._cloud_colors: Dict[str, np.ndarray] = {}
+        # Tampons du rendu du brouillard réutilisés d'une frame à l'autre (par taille)
+        self._fog_texture: Optional[pygame.Surface] = None
+        self._fog_scaled: Optional[pygame.Surface] = None
+        self._fog_screen: Optional[pygame.Surface] = None
+        # Grilles (visible, explorée) au dernier appel de changed_fog_tiles, par équipe
+        self._fog_snapshots: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
         self._load_cloud_image()
 
+    def visible_grid(self, team: int) -> np.ndarray:
+        """Grille uint8 des tuiles visibles d'une équipe (créée au besoin)."""
+        grid = self.visible_tiles.get(team)
+        if grid is None:
+            grid = self.visible_tiles[team] = np.zeros((MAP_HEIGHT, MAP_WIDTH), dtype=np.uint8)
+        return grid
+
+    def explored_grid(self, team: int) -> np.ndarray:
+        """Grille uint8 des tuiles découvertes d'une équipe (créée au besoin)."""
+        grid = self.explored_tiles.get(team)
+        if grid is None:
+            grid = self.explored_tiles[team] = np.zeros((MAP_HEIGHT, MAP_WIDTH), dtype=np.uint8)
+        return grid
+
     def _load_cloud_image(self):
         """Charge l'image des nuages pour le brouillard."""
         if self.cloud_image is None:  # Only load once
@@ -80,10 +118,22 @@ class VisionSystem:
         subsurface = self.cloud_image.subsurface((start_x, start_y, size, size))
         return subsurface
 
+    def vision_count_grid(self, team: int) -> np.ndarray:
+        """Grille uint16 du nombre d'units d'une équipe voyant chaque tuile (créée au besoin)."""
+        grid = self.vision_counts.get(team)
+        if grid is None:
+            grid = self.vision_counts[team] = np.zeros((MAP_HEIGHT, MAP_WIDTH), dtype=np.uint16)
+        return grid
+
     def update_visibility(self, current_team: Optional[int] = None):
         """
         Met à jour les zones visibles pour l'équipe actuelle.
 
+        Mise à jour incrémentale : chaque tuile compte les units de l'équipe qui
+        la voient. Le masque de vision d'une unit n'est retiré puis réappliqué que
+        lorsqu'elle change de tuile (ou de portée), apparaît ou disparaît ; une
+        frame où aucune unit ne change de tuile ne touche pas aux grilles.
+
         Args:
             current_team (int, optional): Équipe pour laquelle calculer la visibilité.
                                         Si None, utilise l'équipe actuelle.
@@ -94,117 +144,156 @@ class VisionSystem:
         if current_team is not None:
             self.current_team = current_team
 
-        # Initialize les ensembles pour cette équipe si nécessaire
-        if self.current_team not in self.visible_tiles:
-            self.visible_tiles[self.current_team] = set()
-        if self.current_team not in self.explored_tiles:
-            self.explored_tiles[self.current_team] = set()
+        # Initialize les grilles pour cette équipe si nécessaire
+        visible = self.visible_grid(self.current_team)
+        explored = self.explored_grid(self.current_team)
         if self.current_team not in self.unlimited_vision:
             self.unlimited_vision[self.current_team] = False
 
-        self.visible_tiles[self.current_team].clear()
+        # Suivre les units de l'équipe : (tuile, portée) de leur masque appliqué
+        changed = self._update_unit_stamps(self.current_team)
 
         # Check sila vision illimitée est enabled for cette équipe
-        if self.unlimited_vision.get(self.current_team, False):
-            # Vision illimitée : révéler toute la carte
-            all_tiles = set()
-            for x in range(MAP_WIDTH):
-                for y in range(MAP_HEIGHT):
-                    all_tiles.add((x, y))
-            self.visible_tiles[self.current_team] = all_tiles.copy()
-        else:
-            # Vision normale : calculer from les units
-            # Parcourir all units de l'équipe actuelle avec vision
-            for entity, (pos, team, vision) in es.get_components(
-                PositionComponent, TeamComponent, VisionComponent
-            ):
-                if team.team_id == self.current_team:
-                    # Calculer les tuiles visibles from cette unit
-                    self._add_visible_tiles_from_unit(pos.x, pos.y, vision.range)
+        unlimited = self.unlimited_vision.get(self.current_team, False)
+        if unlimited or self.current_team in self._resync_teams:
+            # Vision illimitée : révéler toute la carte, sinon repartir des compteurs
+            self._resync_teams.discard(self.current_team)
+            if unlimited:
+                visible.fill(1)
+            else:
+                np.greater(self.vision_count_grid(self.current_team), 0, out=visible, casting='unsafe')
+            changed = True
+
+        if not changed:
+            return
 
         # Add les zones actuellement visibles aux zones découvertes
         # before d'update explored, Check sides tuiles de base ennemie deviennent visibles
-        newly_visible = set(self.visible_tiles[self.current_team]) - set(self.explored_tiles.get(self.current_team, set()))
-        
+        newly_visible = visible & (explored ^ 1)
+        newly_count = int(np.count_nonzero(newly_visible))
+
         # Déterminer la base ennemie en fonction de l'équipe actuelle
         if self.current_team == 1:
-            enemy_base_tiles = set((x, y) for x in range(MAP_WIDTH - 4, MAP_WIDTH) for y in range(MAP_HEIGHT - 4, MAP_HEIGHT))
+            enemy_base_tiles = (slice(MAP_HEIGHT - 4, MAP_HEIGHT), slice(MAP_WIDTH - 4, MAP_WIDTH))
             enemy_team_id = 2
             enemy_base_pos = ((MAP_WIDTH - 3.0) * TILE_SIZE, (MAP_HEIGHT - 2.8) * TILE_SIZE)
         else: # self.current_team == 2
-            enemy_base_tiles = set((x, y) for x in range(1, 1 + 4) for y in range(1, 1 + 4))
+            enemy_base_tiles = (slice(1, 1 + 4), slice(1, 1 + 4))
             enemy_team_id = 1
             enemy_base_pos = (3.0 * TILE_SIZE, 3.0 * TILE_SIZE)
 
         # Ne Check la découverte que si la base n'est pas déjà connue
-        if not enemy_base_registry.is_enemy_base_known(self.current_team):
-            for (tx, ty) in newly_visible:
-                if (tx, ty) in enemy_base_tiles:
-                    try:
-                        enemy_base_registry.declare_enemy_base(self.current_team, enemy_team_id, enemy_base_pos[0], enemy_base_pos[1])
-                        # Une fois la base trouvée, inutile de continuer la boucle pour cette frame
-                        break
-                    except Exception:
-                        pass
+        if newly_count and not enemy_base_registry.is_enemy_base_known(self.current_team):
+            if newly_visible[enemy_base_tiles].any():
+                try:
+                    enemy_base_registry.declare_enemy_base(self.current_team, enemy_team_id, enemy_base_pos[0], enemy_base_pos[1])
+                except Exception:
+                    pass
 
-        self.explored_tiles[self.current_team].update(self.visible_tiles[self.current_team])
+        explored |= visible
 
         # Notify that new tiles were explored (used to trigger tutorial on fog-of-war)
         try:
-            if len(newly_visible) > 0 and not getattr(self, '_suppress_explore_events', False):
-                pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"user_type": "tile_explored", "count": len(newly_visible)}))
+            if newly_count > 0 and not getattr(self, '_suppress_explore_events', False):
+                pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"user_type": "tile_explored", "count": newly_count}))
         except Exception:
             pass
 
         # Check for enemy units entering the newly-visible tiles and notify once
         try:
             # Iterate over entities that belong to a team and check their positions
-            for ent, (pos, team_comp) in es.get_components(PositionComponent, TeamComponent):
-                # Ignore neutral/other teams (team_id=0 or unknown)
-                if team_comp.team_id not in (Team.ALLY, Team.ENEMY):
-                    continue
-                if team_comp.team_id == self.current_team:
-                    continue
-                grid_x = int(pos.x / TILE_SIZE)
-                grid_y = int(pos.y / TILE_SIZE)
-                if (grid_x, grid_y) in newly_visible and not getattr(self, '_suppress_explore_events', False):
-                    # Found an enemy unit that was just revealed; post a single event
-                    pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"user_type": "enemy_spotted", "entity": ent}))
-                    break
+            if newly_count and not getattr(self, '_suppress_explore_events', False):
+                for ent, (pos, team_comp) in es.get_components(PositionComponent, TeamComponent):
+                    # Ignore neutral/other teams (team_id=0 or unknown)
+                    if team_comp.team_id not in (Team.ALLY, Team.ENEMY):
+                        continue
+                    if team_comp.team_id == self.current_team:
+                        continue
+                    grid_x = int(pos.x / TILE_SIZE)
+                    grid_y = int(pos.y / TILE_SIZE)
+                    if 0 <= grid_x < MAP_WIDTH and 0 <= grid_y < MAP_HEIGHT and newly_visible[grid_y, grid_x]:
+                        # Found an enemy unit that was just revealed; post a single event
+                        pygame.event.post(pygame.event.Event(pygame.USEREVENT, {"user_type": "enemy_spotted", "entity": ent}))
+                        break
         except Exception:
             pass
         
         # Marquer cette équipe comme "sale" (dirty) car la visibilité a changé
         self._dirty_teams.add(self.current_team)
 
-    def _add_visible_tiles_from_unit(self, unit_x: float, unit_y: float, vision_range: float):
+    def _stamp(self, vision_range: float) -> np.ndarray:
+        """Masque uint8 (2r+1 x 2r+1) des tuiles à portée d'une unit placée au centre."""
+        stamp = self._stamps.get(vision_range)
+        if stamp is None:
+            radius_tiles = int(vision_range)
+            offsets = np.arange(-radius_tiles, radius_tiles + 1, dtype=np.float64)
+            distance = np.sqrt(offsets[:, None] ** 2 + offsets[None, :] ** 2)
+            stamp = self._stamps[vision_range] = (distance <= vision_range).astype(np.uint8)
+        return stamp
+
+    def _update_unit_stamps(self, team_id: int) -> bool:
         """
-        adds les tuiles visibles from une unit à l'ensemble des tuiles visibles.
+        Applique/retire les masques des units de l'équipe qui ont changé de tuile,
+        sont apparues ou ont disparu since la dernière mise à jour.
+
+        Returns:
+            bool: True si au moins un masque a été appliqué ou retiré
+        """
+        stamped = self._unit_stamps.setdefault(team_id, {})
+        seen = set()
+        changed = False
+        for entity, (pos, team, vision) in es.get_components(
+            PositionComponent, TeamComponent, VisionComponent
+        ):
+            if team.team_id != team_id:
+                continue
+            seen.add(entity)
+            key = (int(pos.x / TILE_SIZE), int(pos.y / TILE_SIZE), vision.range)
+            previous = stamped.get(entity)
+            if previous == key:
+                continue
+            if previous is not None:
+                self._apply_stamp(team_id, *previous, -1)
+            self._apply_stamp(team_id, *key, 1)
+            stamped[entity] = key
+            changed = True
+
+        # Units mortes, passées dans l'autre équipe ou sans vision
+        for entity in [entity for entity in stamped if entity not in seen]:
+            self._apply_stamp(team_id, *stamped.pop(entity), -1)
+            changed = True
+        return changed
+
+    def _apply_stamp(self, team_id: int, grid_x: int, grid_y: int, vision_range: float, delta: int):
+        """
+        Ajoute (delta=1) ou retire (delta=-1) le masque de vision d'une unit placée
+        sur la tuile (grid_x, grid_y) aux compteurs de l'équipe.
 
         Args:
-            unit_x (float): Position X de l'unit en coordonnées monde
-            unit_y (float): Position Y de l'unit en coordonnées monde
+            team_id (int): Équipe de l'unit
+            grid_x (int): Tuile X de l'unit
+            grid_y (int): Tuile Y de l'unit
             vision_range (float): Portée de vision en units de grille
+            delta (int): 1 pour appliquer le masque, -1 pour le retirer
         """
-        # Convertir les coordonnées monde en coordonnées grille
-        grid_x = int(unit_x / TILE_SIZE)
-        grid_y = int(unit_y / TILE_SIZE)
-
-        # Rayon en tuiles
-        radius_tiles = int(vision_range)
-
-        # Calculer le cercle de visibilité (approximation avec carrés)
-        for dy in range(-radius_tiles, radius_tiles + 1):
-            for dx in range(-radius_tiles, radius_tiles + 1):
-                # Check sidans le cercle
-                distance = math.sqrt(dx * dx + dy * dy)
-                if distance <= vision_range:
-                    tile_x = grid_x + dx
-                    tile_y = grid_y + dy
-
-                    # Check les limites de la carte
-                    if 0 <= tile_x < MAP_WIDTH and 0 <= tile_y < MAP_HEIGHT:
-                        self.visible_tiles[self.current_team].add((tile_x, tile_y))
+        # Appliquer le masque circulaire, découpé aux limites de la carte
+        stamp = self._stamp(vision_range)
+        radius_tiles = stamp.shape[0] // 2
+        x0, y0 = grid_x - radius_tiles, grid_y - radius_tiles
+        x1, y1 = x0 + stamp.shape[1], y0 + stamp.shape[0]
+        cx0, cy0 = max(x0, 0), max(y0, 0)
+        cx1, cy1 = min(x1, MAP_WIDTH), min(y1, MAP_HEIGHT)
+        if cx0 >= cx1 or cy0 >= cy1:
+            return
+        counts = self.vision_count_grid(team_id)
+        region = (slice(cy0, cy1), slice(cx0, cx1))
+        stamp_region = stamp[cy0 - y0:cy1 - y0, cx0 - x0:cx1 - x0]
+        if delta > 0:
+            counts[region] += stamp_region
+        else:
+            counts[region] -= stamp_region
+        if not self.unlimited_vision.get(team_id, False):
+            np.greater(counts[region], 0, out=self.visible_grid(team_id)[region], casting='unsafe')
 
     def is_tile_visible(self, grid_x: int, grid_y: int, team_id: Optional[int] = None) -> bool:
         """
@@ -219,9 +308,10 @@ class VisionSystem:
             bool: True si la tuile est visible
         """
         team = team_id if team_id is not None else self.current_team
-        if team not in self.visible_tiles:
+        visible = self.visible_tiles.get(team)
+        if visible is None or not (0 <= grid_x < MAP_WIDTH and 0 <= grid_y < MAP_HEIGHT):
             return False
-        return (grid_x, grid_y) in self.visible_tiles[team]
+        return bool(visible[grid_y, grid_x])
 
     def is_tile_explored(self, grid_x: int, grid_y: int, team_id: Optional[int] = None) -> bool:
         """
@@ -236,9 +326,10 @@ class VisionSystem:
             bool: True si la tuile a été découverte
         """
         team = team_id if team_id is not None else self.current_team
-        if team not in self.explored_tiles:
+        explored = self.explored_tiles.get(team)
+        if explored is None or not (0 <= grid_x < MAP_WIDTH and 0 <= grid_y < MAP_HEIGHT):
             return False
-        return (grid_x, grid_y) in self.explored_tiles[team]
+        return bool(explored[grid_y, grid_x])
 
     def is_dirty(self, team_id: int) -> bool:
         """
@@ -255,70 +346,151 @@ class VisionSystem:
             return True
         return False
 
-    def create_fog_surface(self, camera, team_id: int) -> Optional[pygame.Surface]:
+    def _cloud_colors_for(self, fog_mode: str) -> Optional[np.ndarray]:
+        """Couleur RGBA du brouillard de chaque tuile non découverte ([x, y, canal]), calculée une fois par mode.
+
+        - "tiles" : gris de la texture procédurale de la tuile (get_cloud_shade)
+        - "image" : couleur moyenne de la portion de l'image de nuage de la tuile
         """
-        creates une surface unique pour le brouillard de guerre, optimisée pour le Rendering.
+        colors = self._cloud_colors.get(fog_mode)
+        if colors is not None:
+            return colors
+        colors = np.empty((MAP_WIDTH, MAP_HEIGHT, 4), dtype=np.uint8)
+        if fog_mode == "tiles":
+            for x in range(MAP_WIDTH):
+                for y in range(MAP_HEIGHT):
+                    gray = get_cloud_shade(x, y)
+                    colors[x, y] = (gray, gray, gray, 255)
+        else:
+            if self.cloud_image is None:
+                return None
+            size = min(TILE_SIZE, *self.cloud_image.get_size())
+            # La portion d'image ne dépend que de (x % 3, y % 3), voir _get_cloud_subsurface
+            for ox in range(3):
+                for oy in range(3):
+                    colors[ox::3, oy::3] = pygame.transform.average_color(self._get_cloud_subsurface(ox, oy, size))
+        self._cloud_colors[fog_mode] = colors
+        return colors
+
+    @staticmethod
+    def _reusable_surface(surface: Optional[pygame.Surface], size: Tuple[int, int]) -> pygame.Surface:
+        if surface is None or surface.get_size() != size:
+            surface = pygame.Surface(size, pygame.SRCALPHA)
+        return surface
+
+    def draw_fog(self, window: pygame.Surface, camera, team_id: int, areas: Optional[List[pygame.Rect]] = None,
+                 grids: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> bool:
+        """
+        Dessine le brouillard de guerre de l'équipe sur window.
+
+        Une texture d'un pixel par tuile visible à l'écran est remplie depuis les
+        grilles de visibilité (pygame.surfarray), puis agrandie à la taille des
+        tuiles en une seule transformation : le coût en appels Python ne dépend
+        pas du nombre de tuiles. Les tampons sont réutilisés d'une frame à l'autre.
 
         Args:
+            window: Surface de destination
             camera: Instance de la caméra pour les calculs de viewport
             team_id: L'ID de l'équipe dont on veut afficher la perspective.
-        
+            areas: Si donné, seules ces zones de l'écran sont dessinées (rectangles sales)
+            grids: Grilles (visibles, découvertes) à dessiner à la place de celles de l'équipe
+                (copies d'un FrameSnapshot, mode pipeline)
+
         Returns:
-            pygame.Surface | None: Une surface contenant le brouillard de guerre à afficher
-                                   par-dessus le monde, ou None si non applicable.
+            bool: False si le brouillard ne peut pas être rendu (image de nuage absente, zoom nul)
         """
         fog_mode = get_fog_render_mode() if callable(get_fog_render_mode) else config_manager.get("fog_render_mode", "image")
 
         # Load cloud image only if needed by image mode
-        if fog_mode == "image":
-            if not hasattr(self, '_cloud_image') or self.cloud_image is None:
-                self._load_cloud_image()
-                if self.cloud_image is None:
-                    return None # Impossible de rendre le brouillard sans l'image
+        if fog_mode == "image" and self.cloud_image is None:
+            self._load_cloud_image()
+        colors = self._cloud_colors_for(fog_mode)
+        if colors is None:
+            return False # Impossible de rendre le brouillard sans l'image
+
+        zoom = camera.zoom
+        if int(TILE_SIZE * zoom) <= 0:
+            return False
 
-        # Create une surface de la taille de the window, avec transparence
-        fog_surface = pygame.Surface(camera.get_screen_size(), pygame.SRCALPHA)
-        fog_surface.fill((0, 0, 0, 0)) # Remplir de transparent
+        # Tuiles couvrant l'écran, bords alignés sur ceux du terrain (terrain_cache)
+        origin_x, origin_y = camera_origin(camera)
+        window_width, window_height = window.get_size()
+        start_x, end_x = visible_range(origin_x, window_width, zoom, MAP_WIDTH)
+        start_y, end_y = visible_range(origin_y, window_height, zoom, MAP_HEIGHT)
+        if start_x >= end_x or start_y >= end_y:
+            return True
 
-        # Obtenir les limites visibles
-        start_x, start_y, end_x, end_y = camera.get_visible_tiles()
-        
-        # Pré-calculer la taille des tuiles pour le zoom actuel
-        tile_size = int(TILE_SIZE * camera.zoom)
-        if tile_size <= 0:
-            return None
+        # Texture d'un pixel par tuile : transparente si visible, voile sombre si
+        # découverte, nuage sinon
+        visible_grid, explored_grid = grids if grids is not None else (self.visible_grid(team_id),
+                                                                      self.explored_grid(team_id))
+        visible = visible_grid[start_y:end_y, start_x:end_x].T
+        explored = explored_grid[start_y:end_y, start_x:end_x].T
+        texture = self._fog_texture = self._reusable_surface(self._fog_texture, (end_x - start_x, end_y - start_y))
+        tile_colors = colors[start_x:end_x, start_y:end_y]
+        rgb = pygame.surfarray.pixels3d(texture)
+        rgb[...] = tile_colors[..., :3]
+        rgb[explored.astype(bool)] = 0
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(texture)
+        alpha[...] = np.where(visible, 0, np.where(explored, EXPLORED_FOG_ALPHA, tile_colors[..., 3]))
+        del alpha
+
+        left = tile_edge(start_x, zoom)
+        top = tile_edge(start_y, zoom)
+        size = (tile_edge(end_x, zoom) - left, tile_edge(end_y, zoom) - top)
+        scaled = self._fog_scaled = self._reusable_surface(self._fog_scaled, size)
+        pygame.transform.scale(texture, size, scaled)
+        dest = scaled.get_rect(topleft=(left - origin_x, top - origin_y))
+        if areas is None:
+            window.blit(scaled, dest)
+        else:
+            window.blits([(scaled, area.topleft, area.move(-dest.x, -dest.y))
+                          for area in (rect.clip(dest) for rect in areas) if area.w and area.h], doreturn=False)
+        return True
 
-        # Préparer les couleurs
-        explored_fog_color = (0, 0, 0, 120) # Brouillard léger pour les zones explorées
-        unexplored_fog_color = (0, 0, 0, 255) # Brouillard total pour les zones non explorées
-
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if not self.is_tile_visible(x, y, team_id):
-                    screen_x, screen_y = camera.world_to_screen(x * TILE_SIZE, y * TILE_SIZE)
-
-                    if fog_mode == "tiles":
-                        # Tile-based rendering: use procedural cloud textures
-                        is_explored = self.is_tile_explored(x, y, team_id)
-                        cloud_surf = get_cloud_texture(tile_size, tile_size, x, y, is_explored)
-                        fog_surface.blit(cloud_surf, (screen_x, screen_y))
-                    else:
-                        # Image mode: render clouds for unexplored tiles (original behavior)
-                        if not self.is_tile_explored(x, y, team_id):
-                            cloud_subsurface = self._get_cloud_subsurface(x, y, tile_size)
-                            if cloud_subsurface:
-                                fog_surface.blit(cloud_subsurface, (screen_x, screen_y))
-                        else:
-                            # Zone explorée mais non visible : dessiner un rectangle semi-transparent
-                            pygame.draw.rect(fog_surface, explored_fog_color, (screen_x, screen_y, tile_size, tile_size))
-
-        return fog_surface
+    def changed_fog_tiles(self, team_id: int) -> np.ndarray:
+        """
+        Tuiles (x, y) dont l'état du brouillard a changé depuis l'appel précédent pour cette équipe.
+
+        Returns:
+            np.ndarray: tableau (N, 2) des coordonnées de tuiles
+        """
+        visible = self.visible_grid(team_id)
+        explored = self.explored_grid(team_id)
+        previous = self._fog_snapshots.get(team_id)
+        if previous is None:
+            changed = np.argwhere(np.ones_like(visible))
+        else:
+            changed = np.argwhere((previous[0] != visible) | (previous[1] != explored))
+        self._fog_snapshots[team_id] = (visible.copy(), explored.copy())
+        return changed[:, ::-1]
+
+    def create_fog_surface(self, camera, team_id: int) -> Optional[pygame.Surface]:
+        """
+        Retourne une surface de la taille de l'écran contenant le brouillard de guerre (voir draw_fog).
+
+        Args:
+            camera: Instance de la caméra pour les calculs de viewport
+            team_id: L'ID de l'équipe dont on veut afficher la perspective.
+        
+        Returns:
+            pygame.Surface | None: Une surface contenant le brouillard de guerre à afficher
+                                   par-dessus le monde, ou None si non applicable.
+        """
+        fog_surface = self._fog_screen = self._reusable_surface(self._fog_screen, camera.get_screen_size())
+        fog_surface.fill((0, 0, 0, 0)) # Remplir de transparent
+        return fog_surface if self.draw_fog(fog_surface, camera, team_id) else None
 
     def reset(self):
         """Réinitialise complètement le système de vision pour une nouvelle partie."""
         self.visible_tiles.clear()
         self.explored_tiles.clear()
+        self.vision_counts.clear()
+        self._unit_stamps.clear()
+        self._resync_teams.clear()
         self._dirty_teams.clear()
+        self._fog_snapshots.clear()
         self.unlimited_vision.clear()  # Réinitialiser la vision illimitée
         self.current_team = 1
 
@@ -337,6 +509,7 @@ class VisionSystem:
             self.reveal_all_map(team)
         else:
             # Forcer un recalcul de la visibilité normale
+            self._resync_teams.add(team)
             self._dirty_teams.add(team)
         print(f"[DEV VISION] Vision illimitée {'activée' if enabled else 'désactivée'} pour l'équipe {team}")
 
@@ -347,20 +520,11 @@ class VisionSystem:
         Args:
             team (int): Équipe pour laquelle révéler la carte
         """
-        # Initialize les ensembles pour cette équipe si nécessaire
-        if team not in self.visible_tiles:
-            self.visible_tiles[team] = set()
-        if team not in self.explored_tiles:
-            self.explored_tiles[team] = set()
-
         # Marquer all tuiles comme visibles et explorées
-        all_tiles = set()
-        for x in range(MAP_WIDTH):
-            for y in range(MAP_HEIGHT):
-                all_tiles.add((x, y))
-        
-        self.visible_tiles[team] = all_tiles.copy()
-        self.explored_tiles[team] = all_tiles.copy()
+        self.visible_grid(team).fill(1)
+        self.explored_grid(team).fill(1)
+        # La mise à jour suivante repart des compteurs (sauf vision illimitée)
+        self._resync_teams.add(team)
         
         print(f"[DEV VISION] Toute la carte révélée pour l'équipe {team}")
 
@@ -11,7 +11,8 @@ except Exception:
     esper = None
 
 from src.ui.boutique import Shop, ShopFaction
-from src.settings.localization import t
+from src.settings.localization import t, get_current_language
+from src.ui.retained_layer import RetainedLayer
 from src.ui.debug_modal import DebugModal
 from src.ui.notification_system import get_notification_system, NotificationType
 from src.constants.team import Team
@@ -36,7 +37,7 @@ from src.settings.settings import config_manager
 from src.functions.buildingCreator import createDefenseTower, createHealTower
 from src.components.core.positionComponent import PositionComponent
 from src.managers.surface_cache import get_scaled as _get_scaled
-from src.managers.font_cache import get_font as _get_font
+from src.managers.font_cache import get_font as _get_font, text_cache
 
 # Couleurs de l'interface améliorées
 class UIColors:
@@ -158,6 +159,11 @@ class ActionBar:
         # Animation et effets
         self.button_glow_timer = 0
         self.tooltip_text = ""
+        # Calques retenus : barre, bannière self-play et tooltip ne sont redessinés que si leur état change
+        self._bar_layer = RetainedLayer()
+        self._banner_layer = RetainedLayer()
+        self._tooltip_surface: Optional[pygame.Surface] = None
+        self._tooltip_key = None
         # Modal de debug
         self.debug_modal = DebugModal(
             game_engine=self.game_engine,
@@ -383,6 +389,8 @@ class ActionBar:
             self.font_small = _get_font(None, int(self.font_small.get_height()))
             self.font_large = _get_font(None, int(self.font_large.get_height()))
             self.font_title = _get_font(None, int(self.font_title.get_height()))
+            self._bar_layer.invalidate()
+            self._tooltip_surface = None
         except Exception:
             # Silencieux : avoid de faire planter la boucle principale
             pass
@@ -401,6 +409,7 @@ class ActionBar:
             except Exception as e:
                 print(f"Erreur lors du chargement de l'icône {button.icon_path}: {e}")
                 self.icons[button.action_type] = self._create_placeholder_icon(button.text, button.is_global)
+        self._bar_layer.invalidate()
     
     def resize(self, new_width: int, new_height: int):
         """Adapte l'ActionBar à la nouvelle résolution."""
@@ -420,6 +429,8 @@ class ActionBar:
         self.font_small = _get_font(None, int(18 * font_scale))
         self.font_large = _get_font(None, int(32 * font_scale))
         self.font_title = _get_font(None, int(28 * font_scale))
+        self._bar_layer.invalidate()
+        self._tooltip_surface = None
     
     def _create_placeholder_icon(self, text: str, is_global: bool = False) -> pygame.Surface:
         """creates une icône de remplacement avec du texte."""
@@ -967,26 +978,54 @@ class ActionBar:
                 button.enabled = True
     
     def draw(self, surface: pygame.Surface):
-        """Dessine la barre d'action."""
+        """Dessine la barre d'action.
+
+        La barre (fond, boutons, or, unité sélectionnée), la bannière self-play
+        et la tooltip sont des surfaces retenues : elles ne sont redessinées que
+        lorsque l'état qu'elles affichent change (voir _bar_state).
+        """
         # Bannière self-play (au dessus de la barre)
+        if getattr(self, 'self_play_mode', False):
+            self._banner_layer.draw(surface, pygame.Rect(0, 0, self.screen_width, 48),
+                                    (self.screen_width, get_current_language()), self._draw_self_play_banner)
+
+        # Fond, bordures, boutons et informations
+        bar_rect = self.bar_rect if self.camp_button_rect is None else self.bar_rect.union(self.camp_button_rect)
+        self._bar_layer.draw(surface, bar_rect, self._bar_state(), self._draw_bar)
+        
+        # Tooltip
+        if self.tooltip_text:
+            self._draw_tooltip(surface)
+        
+        # Dessiner la boutique par-dessus tout
+        self.shop.draw(surface)
+        
+        # Dessiner le modal debug par-dessus tout si actif
+        if self.debug_modal.is_active():
+            self.debug_modal.render(surface)
+
+    def _draw_self_play_banner(self, surface: pygame.Surface):
+        """Dessine la bannière du mode IA vs IA."""
         try:
-            if getattr(self, 'self_play_mode', False):
-                
-                banner_font = _get_font(None, 28)
-                banner_text = "IA vs IA — Contrôles joueur désactivés"
-                banner_surf = banner_font.render(banner_text, True, (255, 200, 0))
-                banner_rect = banner_surf.get_rect()
-                banner_rect.centerx = surface.get_width() // 2
-                banner_rect.y = 8
-                bg = pygame.Surface((banner_rect.width + 16, banner_rect.height + 8), pygame.SRCALPHA)
-                bg.fill((0, 0, 0, 160))
-                bg_rect = bg.get_rect()
-                bg_rect.centerx = banner_rect.centerx
-                bg_rect.y = banner_rect.y - 4
-                surface.blit(bg, bg_rect)
-                surface.blit(banner_surf, banner_rect)
+            banner_font = _get_font(None, 28)
+            banner_text = "IA vs IA — Contrôles joueur désactivés"
+            banner_surf = text_cache.render(banner_font, banner_text, (255, 200, 0))
+            banner_rect = banner_surf.get_rect()
+            banner_rect.centerx = surface.get_width() // 2
+            banner_rect.y = 8
+            bg = pygame.Surface((banner_rect.width + 16, banner_rect.height + 8), pygame.SRCALPHA)
+            bg.fill((0, 0, 0, 160))
+            bg_rect = bg.get_rect()
+            bg_rect.centerx = banner_rect.centerx
+            bg_rect.y = banner_rect.y - 4
+            self._banner_rect = bg_rect
+            surface.blit(bg, bg_rect)
+            surface.blit(banner_surf, banner_rect)
         except Exception:
             pass
+
+    def _draw_bar(self, surface: pygame.Surface):
+        """Dessine le contenu de la barre (appelé quand _bar_state change)."""
         # Fond avec dégradé
         self._draw_background(surface)
         
@@ -1008,18 +1047,60 @@ class ActionBar:
         # Informations de l'unit sélectionnée
         if self.selected_unit:
             self._draw_selected_unit_info(surface)
-        
-        # Tooltip
-        if self.tooltip_text:
-            self._draw_tooltip(surface)
-        
-        # Dessiner la boutique par-dessus tout
-        self.shop.draw(surface)
-        
-        # Dessiner le modal debug par-dessus tout si actif
-        if self.debug_modal.is_active():
-            self.debug_modal.render(surface)
-    
+
+    def _bar_state(self) -> Tuple:
+        """Tout ce qui est affiché par _draw_bar : la barre est redessinée quand cet état change."""
+        buttons = tuple((button.action_type, button.enabled, button.visible, button.cost, button.hotkey)
+                        for button in self.action_buttons)
+        ai_states = tuple(check() for action_type, check in ((ActionType.AI_TOGGLE, self._is_selected_unit_ai_enabled),
+                                                             (ActionType.AI_TOGGLE_ALL, self._are_all_ai_enabled))
+                          if any(button.action_type == action_type and button.enabled and
+                                 (button.visible or button.is_global) for button in self.action_buttons))
+        hovered = (self.hovered_button, self.hovered_global_button, self.hovered_camp_button)
+
+        is_self_play = getattr(self, 'game_engine', None) and getattr(self.game_engine, 'self_play_mode', False)
+        if is_self_play:
+            try:
+                counts = (len(BaseComponent.get_base_units(is_enemy=False)),
+                          len(BaseComponent.get_base_units(is_enemy=True)))
+            except Exception:
+                counts = None
+            gold = (self._get_player_gold_direct(is_enemy=False), self._get_player_gold_direct(is_enemy=True), counts)
+        else:
+            gold = self._get_player_gold_direct(self.current_camp == Team.ENEMY)
+
+        unit = None
+        if self.selected_unit:
+            info = self.selected_unit
+            max_health = max(1, int(info.max_health)) if isinstance(info.max_health, (int, float)) else 1
+            health = float(info.health) if isinstance(info.health, (int, float)) else 0.0
+            health_ratio = max(0.0, min(1.0, health / max_health))
+            mana_width = int(80 * info.mana / info.max_mana) if info.max_mana > 0 else 0
+            # Valeurs telles qu'affichées (entiers, largeur des barres, dixièmes de seconde)
+            unit = (info.unit_type, getattr(info, 'description', None), int(health), max_health,
+                    int(80 * health_ratio), info.mana, info.max_mana, mana_width,
+                    info.special_cooldown > 0 and f"{info.special_cooldown:.1f}")
+
+        rects = tuple(map(tuple, self.button_rects + self.global_button_rects))
+        camp_hotkey = self._get_hotkey_for_action("selection_cycle_team") if self.camp_button_rect is not None else None
+        return ((self.screen_width, self.screen_height), get_current_language(), self.current_camp,
+                self.current_mode, buttons, rects, ai_states, hovered, gold, unit, camp_hotkey)
+
+    def screen_rects(self) -> Optional[List[pygame.Rect]]:
+        """Zones de l'écran dessinées par draw() (None si la barre couvre tout l'écran)."""
+        if self.shop.is_open or self.debug_modal.is_active():
+            return None
+        rects = [self.bar_rect]
+        if self.camp_button_rect is not None:
+            rects.append(self.camp_button_rect)
+        banner_rect = getattr(self, '_banner_rect', None)
+        if getattr(self, 'self_play_mode', False) and banner_rect is not None:
+            rects.append(banner_rect)
+        tooltip_rect = getattr(self, '_tooltip_rect', None)
+        if self.tooltip_text and tooltip_rect is not None:
+            rects.append(tooltip_rect)
+        return rects
+
     def _draw_background(self, surface: pygame.Surface):
         """Dessine le fond avec dégradé."""
         background_surface = pygame.Surface((self.bar_width, self.bar_height), pygame.SRCALPHA)
@@ -1069,14 +1150,13 @@ class ActionBar:
         
         # Texte du camp
         camp_text = t("camp.ally") if self.current_camp == Team.ALLY else t("camp.enemy")
-        text_surface = self.font_normal.render(camp_text, True, UIColors.TEXT_NORMAL)
-        text_surface = self.font_normal.render(camp_text, True, UIColors.TEXT_NORMAL)
+        text_surface = text_cache.render(self.font_normal, camp_text, UIColors.TEXT_NORMAL)
         text_rect = text_surface.get_rect(center=self.camp_button_rect.center)
         surface.blit(text_surface, text_rect)
         
         # Raccourci clavier en bas du bouton
         camp_hotkey = self._get_hotkey_for_action("selection_cycle_team")
-        shortcut_surface = self.font_small.render(camp_hotkey, True, UIColors.TEXT_DISABLED)
+        shortcut_surface = text_cache.render(self.font_small, camp_hotkey, UIColors.TEXT_DISABLED)
         shortcut_rect = shortcut_surface.get_rect()
         shortcut_rect.centerx = self.camp_button_rect.centerx
         shortcut_rect.bottom = self.camp_button_rect.bottom - 2
@@ -1130,26 +1210,24 @@ class ActionBar:
         # Coût
         if button.cost > 0:
             cost_color = UIColors.GOLD if button.enabled else UIColors.TEXT_DISABLED
-            cost_text = self.font_small.render(str(button.cost), True, cost_color)
+            cost_text = text_cache.render(self.font_small, str(button.cost), cost_color)
             cost_bg = pygame.Rect(rect.right - 22, rect.bottom - 18, 20, 16)
-            pygame.draw.rect(surface, (0, 0, 0, 180), cost_bg, border_radius=4)
+            pygame.draw.rect(surface, (0, 0, 0), cost_bg, border_radius=4)
             surface.blit(cost_text, (rect.right - 20, rect.bottom - 16))
         
         # Raccourci clavier
         hotkey_color = UIColors.TEXT_HIGHLIGHT if button.enabled else UIColors.TEXT_DISABLED
-        hotkey_text = self.font_small.render(button.hotkey, True, hotkey_color)
+        hotkey_text = text_cache.render(self.font_small, button.hotkey, hotkey_color)
         surface.blit(hotkey_text, (rect.left + 4, rect.top + 4))
         
         # Cooldown pour capacité spéciale
         if (button.action_type == ActionType.SPECIAL_ABILITY and 
             self.selected_unit and self.selected_unit.special_cooldown > 0):
-            cooldown_text = self.font_small.render(
-                f"{self.selected_unit.special_cooldown:.1f}s", 
-                True, UIColors.WARNING
-            )
-            text_rect = cooldown_text.get_rect(center=(rect.centerx, rect.bottom - 10))
-            pygame.draw.rect(surface, (0, 0, 0, 150), text_rect.inflate(4, 2), border_radius=2)
-            surface.blit(cooldown_text, text_rect)
+            cooldown_text = f"{self.selected_unit.special_cooldown:.1f}s"
+            text_rect = pygame.Rect((0, 0), text_cache.glyphs_size(self.font_small, cooldown_text, UIColors.WARNING))
+            text_rect.center = (rect.centerx, rect.bottom - 10)
+            pygame.draw.rect(surface, (0, 0, 0), text_rect.inflate(4, 2), border_radius=2)
+            text_cache.blit_glyphs(surface, self.font_small, cooldown_text, UIColors.WARNING, text_rect.topleft)
     
     def _draw_player_info(self, surface: pygame.Surface):
         """Dessine les informations du joueur au centre, sur deux lignes distinctes."""
@@ -1180,8 +1258,8 @@ class ActionBar:
 
             ally_label = f"{t('camp.ally')}: {ally_gold} ({ally_units_count})"
             enemy_label = f"{t('camp.enemy')}: {enemy_gold} ({enemy_units_count})"
-            gold_text_ally = self.font_title.render(ally_label, True, UIColors.GOLD)
-            gold_text_enemy = self.font_title.render(enemy_label, True, UIColors.GOLD)
+            gold_text_ally = text_cache.render(self.font_title, ally_label, UIColors.GOLD)
+            gold_text_enemy = text_cache.render(self.font_title, enemy_label, UIColors.GOLD)
             gold_line_width = gold_text_ally.get_width() + gold_text_enemy.get_width() + 30
         else:
             current_gold = self._get_player_gold_direct(self.current_camp == Team.ENEMY)
@@ -1195,22 +1273,22 @@ class ActionBar:
             if gold_icon:
                 
                 icon_surface = _get_scaled(gold_icon, (28, 28))
-                gold_text = self.font_title.render(gold_str, True, UIColors.GOLD)
-                gold_line_width = icon_surface.get_width() + gold_text.get_width() + 16
+                gold_size = text_cache.glyphs_size(self.font_title, gold_str, UIColors.GOLD)
+                gold_line_width = icon_surface.get_width() + gold_size[0] + 16
             else:
-                gold_text = self.font_title.render(f"💰 {gold_str}", True, UIColors.GOLD)
+                gold_text = text_cache.render(self.font_title, f"💰 {gold_str}", UIColors.GOLD)
                 gold_line_width = gold_text.get_width()
 
         # Mode (ligne 2)
         mode_color = UIColors.SUCCESS if self.current_mode == "attack" else UIColors.TEXT_NORMAL
-        mode_text_colored = self.font_small.render(f"Mode: {self.current_mode.title()}", True, mode_color)
+        mode_text_colored = text_cache.render(self.font_small, f"Mode: {self.current_mode.title()}", mode_color)
         mode_line_width = mode_text_colored.get_width()
 
         # Largeur de la zone = max des deux lignes + padding
         info_width = max(gold_line_width, mode_line_width) + 40
         info_height = 68
         info_rect = pygame.Rect(center_x - info_width//2, info_y, info_width, info_height)
-        pygame.draw.rect(surface, UIColors.BACKGROUND, info_rect, border_radius=8)
+        pygame.draw.rect(surface, UIColors.BACKGROUND[:3], info_rect, border_radius=8)
         pygame.draw.rect(surface, UIColors.BORDER, info_rect, 2, border_radius=8)
 
         # Affichage ligne 1 : or
@@ -1225,8 +1303,9 @@ class ActionBar:
             icon_x = info_rect.x + (info_width - gold_line_width) // 2
             icon_y = gold_y
             surface.blit(icon_surface, (icon_x, icon_y))
-            gold_rect = gold_text.get_rect(midleft=(icon_x + icon_surface.get_width() + 8, icon_y + icon_surface.get_height() // 2))
-            surface.blit(gold_text, gold_rect)
+            gold_rect = pygame.Rect((0, 0), gold_size)
+            gold_rect.midleft = (icon_x + icon_surface.get_width() + 8, icon_y + icon_surface.get_height() // 2)
+            text_cache.blit_glyphs(surface, self.font_title, gold_str, UIColors.GOLD, gold_rect.topleft)
         else:
             gold_rect = gold_text.get_rect(center=(center_x, gold_y + 14))
             surface.blit(gold_text, gold_rect)
@@ -1248,18 +1327,15 @@ class ActionBar:
         
         # Fond pour les informations de l'unit
         unit_rect = pygame.Rect(info_x, info_y, info_width, 70)
-        pygame.draw.rect(surface, UIColors.BACKGROUND, unit_rect, border_radius=8)
+        pygame.draw.rect(surface, UIColors.BACKGROUND[:3], unit_rect, border_radius=8)
         pygame.draw.rect(surface, UIColors.SELECTION, unit_rect, 2, border_radius=8)
         
         # Nom de l'unit
-        unit_name = self.font_normal.render(
-            f"{self.selected_unit.unit_type}", 
-            True, UIColors.TEXT_HIGHLIGHT
-        )
+        unit_name = text_cache.render(self.font_normal, f"{self.selected_unit.unit_type}", UIColors.TEXT_HIGHLIGHT)
         surface.blit(unit_name, (info_x + 5, info_y + 5))
         # Description (si disponible)
         if getattr(self.selected_unit, 'description', None):
-            desc_text = self.font_small.render(self.selected_unit.description, True, UIColors.TEXT_NORMAL)
+            desc_text = text_cache.render(self.font_small, self.selected_unit.description, UIColors.TEXT_NORMAL)
             surface.blit(desc_text, (info_x + 5, info_y + 28))
         
         # Barres de vie et mana côte à côte
@@ -1278,11 +1354,8 @@ class ActionBar:
         pygame.draw.rect(surface, UIColors.BORDER, health_bg_rect, 1, border_radius=4)
         
         # Texte de vie
-        health_text = self.font_small.render(
-            f"{int(current_health)}/{max_health}", 
-            True, UIColors.TEXT_NORMAL
-        )
-        surface.blit(health_text, (info_x + 5, info_y + 45))
+        text_cache.blit_glyphs(surface, self.font_small, f"{int(current_health)}/{max_health}",
+                               UIColors.TEXT_NORMAL, (info_x + 5, info_y + 45))
         
         # Barre de mana si l'unit en a (à côté de la vie)
         if self.selected_unit.max_mana > 0:
@@ -1295,39 +1368,26 @@ class ActionBar:
             pygame.draw.rect(surface, UIColors.BORDER, mana_bg_rect, 1, border_radius=4)
             
             # Texte de mana
-            mana_text = self.font_small.render(
-                f"💙{self.selected_unit.mana}/{self.selected_unit.max_mana}", 
-                True, UIColors.TEXT_NORMAL
-            )
-            surface.blit(mana_text, (info_x + 105, info_y + 45))
+            text_cache.blit_glyphs(surface, self.font_small, f"💙{self.selected_unit.mana}/{self.selected_unit.max_mana}",
+                                   UIColors.TEXT_NORMAL, (info_x + 105, info_y + 45))
         
         # Cooldown de capacité spéciale si applicable
         if self.selected_unit.special_cooldown > 0:
-            cooldown_text = self.font_small.render(
-                f"⏱️ {self.selected_unit.special_cooldown:.1f}s", 
-                True, UIColors.WARNING
-            )
-            surface.blit(cooldown_text, (info_x + 5, info_y + 60))
+            text_cache.blit_glyphs(surface, self.font_small, f"⏱️ {self.selected_unit.special_cooldown:.1f}s",
+                                   UIColors.WARNING, (info_x + 5, info_y + 60))
     
     def _draw_tooltip(self, surface: pygame.Surface):
-        """Dessine la tooltip."""
+        """Dessine la tooltip (surface mise en cache tant que le texte ne change pas)."""
         if not self.tooltip_text:
             return
         
-        mouse_pos = pygame.mouse.get_pos()
-        tooltip_lines = self.tooltip_text.split('\n')
-        
-        # Calculer la taille de la tooltip
-        max_width = 0
-        line_height = 20
-        for line in tooltip_lines:
-            text_surface = self.font_small.render(line, True, UIColors.TEXT_NORMAL)
-            max_width = max(max_width, text_surface.get_width())
-        
-        tooltip_width = max_width + 20
-        tooltip_height = len(tooltip_lines) * line_height + 10
+        if self._tooltip_surface is None or self._tooltip_key != self.tooltip_text:
+            self._tooltip_surface = self._render_tooltip(self.tooltip_text)
+            self._tooltip_key = self.tooltip_text
+        tooltip_width, tooltip_height = self._tooltip_surface.get_size()
         
         # Position de la tooltip (avoid les bords)
+        mouse_pos = pygame.mouse.get_pos()
         tooltip_x = mouse_pos[0] + 15
         tooltip_y = mouse_pos[1] - tooltip_height - 10
         
@@ -1336,15 +1396,29 @@ class ActionBar:
         if tooltip_y < 0:
             tooltip_y = mouse_pos[1] + 20
         
-        # Fond de la tooltip
-        tooltip_rect = pygame.Rect(tooltip_x, tooltip_y, tooltip_width, tooltip_height)
-        pygame.draw.rect(surface, UIColors.BACKGROUND, tooltip_rect, border_radius=5)
-        pygame.draw.rect(surface, UIColors.BORDER_LIGHT, tooltip_rect, 1, border_radius=5)
+        self._tooltip_rect = surface.blit(self._tooltip_surface, (tooltip_x, tooltip_y))
+
+    def _render_tooltip(self, text: str) -> pygame.Surface:
+        """Rendu de la tooltip (fond, bordure et lignes de texte)."""
+        tooltip_lines = text.split('\n')
+        line_height = 20
+        text_surfaces = [text_cache.render(self.font_small, line, UIColors.TEXT_NORMAL) for line in tooltip_lines]
+        
+        # Calculer la taille de la tooltip
+        max_width = max(text_surface.get_width() for text_surface in text_surfaces)
+        tooltip_width = max_width + 20
+        tooltip_height = len(tooltip_lines) * line_height + 10
+        
+        # Fond de la tooltip (opaque : la couleur alpha n'avait pas d'effet sur l'écran)
+        tooltip = pygame.Surface((tooltip_width, tooltip_height), pygame.SRCALPHA)
+        tooltip_rect = tooltip.get_rect()
+        pygame.draw.rect(tooltip, UIColors.BACKGROUND[:3], tooltip_rect, border_radius=5)
+        pygame.draw.rect(tooltip, UIColors.BORDER_LIGHT, tooltip_rect, 1, border_radius=5)
         
         # Texte de la tooltip
-        for i, line in enumerate(tooltip_lines):
-            text_surface = self.font_small.render(line, True, UIColors.TEXT_NORMAL)
-            surface.blit(text_surface, (tooltip_x + 10, tooltip_y + 5 + i * line_height))
+        for i, text_surface in enumerate(text_surfaces):
+            tooltip.blit(text_surface, (10, 5 + i * line_height))
+        return tooltip
 
 # Exemple d'utilisation
 def main():
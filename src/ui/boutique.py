@@ -6,7 +6,7 @@ import math
 import os
 import random
 import esper
-from src.settings.localization import t
+from src.settings.localization import t, get_current_language
 from src.components.core.playerComponent import PlayerComponent
 from src.components.core.teamComponent import TeamComponent
 from src.components.core.team_enum import Team as TeamEnum
@@ -20,6 +20,8 @@ from src.components.core.baseComponent import BaseComponent
 from src.settings.settings import MAP_WIDTH, MAP_HEIGHT, TILE_SIZE
 from src.managers.sprite_manager import sprite_manager, SpriteID
 from src.managers.surface_cache import get_scaled as _get_scaled
+from src.managers.font_cache import text_cache
+from src.ui.retained_layer import RetainedLayer
 from src.factory.unitType import UnitType
 from src.constants.gameplay import (
     COLOR_WHITE, COLOR_GOLD, COLOR_BLACK, COLOR_GREEN_SUCCESS, COLOR_RED_ERROR,
@@ -172,6 +174,10 @@ class UnifiedShop:
         self.purchase_feedback = ""
         self.feedback_timer = 0.0
         self.feedback_color = self.theme.PURCHASE_SUCCESS
+
+        # Rendu retenu : voile plein écran et panneau redessiné seulement quand son état change
+        self._overlay: Optional[pygame.Surface] = None
+        self._panel_layer = RetainedLayer()
         
         # Initialisation
         self._initialize_items()
@@ -264,6 +270,7 @@ class UnifiedShop:
         self._initialize_items()
         self._load_icons()
         self._load_tab_icons()
+        self._panel_layer.invalidate()
     
 
     def _initialize_items(self):
@@ -643,12 +650,7 @@ class UnifiedShop:
             return False
         
         # Bouton fermeture
-        close_button_rect = pygame.Rect(
-            self.shop_x + self.shop_width - SHOP_CLOSE_BUTTON_SIZE - SHOP_CLOSE_BUTTON_MARGIN, 
-            self.shop_y + SHOP_CLOSE_BUTTON_MARGIN, 
-            SHOP_CLOSE_BUTTON_SIZE, 
-            SHOP_CLOSE_BUTTON_SIZE
-        )
+        close_button_rect = self._get_close_rect()
         if close_button_rect.collidepoint(mouse_pos):
             self.close()
             return True
@@ -674,6 +676,15 @@ class UnifiedShop:
 
         return True
     
+    def _get_close_rect(self) -> pygame.Rect:
+        """Retourne le rectangle du bouton de fermeture."""
+        return pygame.Rect(
+            self.shop_x + self.shop_width - SHOP_CLOSE_BUTTON_SIZE - SHOP_CLOSE_BUTTON_MARGIN, 
+            self.shop_y + SHOP_CLOSE_BUTTON_MARGIN, 
+            SHOP_CLOSE_BUTTON_SIZE, 
+            SHOP_CLOSE_BUTTON_SIZE
+        )
+
     def _get_tab_rects(self) -> List[pygame.Rect]:
         """Retourne les rectangles des onglets."""
         tab_width = SHOP_TAB_WIDTH
@@ -787,15 +798,27 @@ class UnifiedShop:
             self.feedback_timer -= dt
     
     def draw(self, surface: pygame.Surface):
-        """Dessine la boutique."""
+        """Dessine la boutique.
+
+        Le panneau est une surface retenue, redessinée seulement quand l'état
+        affiché change (voir _panel_state) ; sinon la boutique coûte deux blits.
+        """
         if not self.is_open:
             return
         
         # Fond semi-transparent
-        overlay = pygame.Surface((self.screen_width, self.screen_height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 100))
-        surface.blit(overlay, (0, 0))
+        if self._overlay is None or self._overlay.get_size() != surface.get_size():
+            self._overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            self._overlay.fill((0, 0, 0, 100))
+        surface.blit(self._overlay, (0, 0))
         
+        # Panneau (ombre comprise)
+        shop_rect = pygame.Rect(self.shop_x, self.shop_y, self.shop_width, self.shop_height)
+        panel_rect = shop_rect.union(shop_rect.move(SHOP_SHADOW_OFFSET, SHOP_SHADOW_OFFSET))
+        self._panel_layer.draw(surface, panel_rect, self._panel_state(), self._draw_panel)
+
+    def _draw_panel(self, surface: pygame.Surface):
+        """Dessine le panneau de la boutique (appelé quand _panel_state change)."""
         # Fond de la boutique
         self._draw_shop_background(surface)
         
@@ -817,7 +840,18 @@ class UnifiedShop:
         # Feedback d'achat
         if self.feedback_timer > 0:
             self._draw_feedback(surface)
-    
+
+    def _panel_state(self) -> Tuple:
+        """Tout ce qui est affiché par _draw_panel : le panneau est redessiné quand cet état change."""
+        key = self.current_category if self.current_category in self.shop_items else ShopCategory.UNITS
+        items = tuple((item.id, item.name, item.cost, item.current_quantity, item.max_quantity,
+                       self._can_purchase_item(item)) for item in self.shop_items[key])
+        feedback = (self.purchase_feedback, self.feedback_color) if self.feedback_timer > 0 else None
+        close_hovered = self._get_close_rect().collidepoint(pygame.mouse.get_pos())
+        return ((self.shop_x, self.shop_y), get_current_language(), self.faction, self.current_category,
+                self.hovered_tab_index, self.hovered_item_index, close_hovered, self.get_player_gold(),
+                items, feedback)
+
     def _draw_shop_background(self, surface: pygame.Surface):
         """Dessine le fond de la boutique."""
         shop_rect = pygame.Rect(self.shop_x, self.shop_y, self.shop_width, self.shop_height)
@@ -861,12 +895,12 @@ class UnifiedShop:
             title_text = f"{t('enemy_shop.title').upper()}"
         
         # Ombre du texte
-        shadow_surface = self.font_title.render(title_text, True, (0, 0, 0))
+        shadow_surface = text_cache.render(self.font_title, title_text, (0, 0, 0))
         shadow_rect = shadow_surface.get_rect(center=(self.shop_x + self.shop_width // 2 + 2, self.shop_y + 32))
         surface.blit(shadow_surface, shadow_rect)
         
         # Texte principal
-        title_surface = self.font_title.render(title_text, True, self.theme.TEXT_HIGHLIGHT)
+        title_surface = text_cache.render(self.font_title, title_text, self.theme.TEXT_HIGHLIGHT)
         title_rect = title_surface.get_rect(center=(self.shop_x + self.shop_width // 2, self.shop_y + 30))
         surface.blit(title_surface, title_rect)
         
@@ -878,18 +912,13 @@ class UnifiedShop:
         lookup_key = self.current_category if self.current_category in category_names else ShopCategory.UNITS
         subtitle = category_names.get(lookup_key, "")
         if subtitle:
-            subtitle_surface = self.font_small.render(subtitle, True, self.theme.TEXT_NORMAL)
+            subtitle_surface = text_cache.render(self.font_small, subtitle, self.theme.TEXT_NORMAL)
             subtitle_rect = subtitle_surface.get_rect(center=(self.shop_x + self.shop_width // 2, self.shop_y + 55))
             surface.blit(subtitle_surface, subtitle_rect)
     
     def _draw_close_button(self, surface: pygame.Surface):
         """Dessine le bouton de fermeture."""
-        close_rect = pygame.Rect(
-            self.shop_x + self.shop_width - SHOP_CLOSE_BUTTON_SIZE - SHOP_CLOSE_BUTTON_MARGIN, 
-            self.shop_y + SHOP_CLOSE_BUTTON_MARGIN, 
-            SHOP_CLOSE_BUTTON_SIZE, 
-            SHOP_CLOSE_BUTTON_SIZE
-        )
+        close_rect = self._get_close_rect()
         
         # Effet de hover
         mouse_pos = pygame.mouse.get_pos()
@@ -960,7 +989,7 @@ class UnifiedShop:
             
             # Texte de l'onglet
             text_color = self.theme.TEXT_HIGHLIGHT if is_active else self.theme.TEXT_NORMAL
-            text_surface = self.font_small.render(name, True, text_color)
+            text_surface = text_cache.render(self.font_small, name, text_color)
             text_rect = text_surface.get_rect(center=(text_x, rect.y + 28))
             surface.blit(text_surface, text_rect)
     
@@ -999,7 +1028,7 @@ class UnifiedShop:
         if gold_icon:
             icon_surface = pygame.transform.scale(gold_icon, (28, 28))
             # Surface rendue pour l'or
-            gold_surface = self.font_subtitle.render(gold_str, True, self.theme.GOLD)
+            gold_surface = text_cache.render(self.font_subtitle, gold_str, self.theme.GOLD)
             gold_line_width = icon_surface.get_width() + gold_surface.get_width() + 16
         else:
             # Fallback: utiliser un symbole monétaire générique Rendering par la police
@@ -1019,9 +1048,9 @@ class UnifiedShop:
             surface.blit(gold_surface, gold_rect)
         else:
             # Create le Surface Rendering pour l'affichage
-            gold_surface = self.font_subtitle.render(gold_text, True, self.theme.GOLD)
+            gold_surface = text_cache.render(self.font_subtitle, gold_text, self.theme.GOLD)
             # Ombre du texte
-            shadow_surface = self.font_subtitle.render(gold_text, True, (0, 0, 0))
+            shadow_surface = text_cache.render(self.font_subtitle, gold_text, (0, 0, 0))
             shadow_rect = shadow_surface.get_rect(center=(text_center_x + 1, gold_y + 1))
             surface.blit(shadow_surface, shadow_rect)
             
@@ -1087,9 +1116,9 @@ class UnifiedShop:
         
         # Nom de l'item
         name_color = self.theme.TEXT_HIGHLIGHT if can_purchase else self.theme.TEXT_DISABLED
-        name_shadow = self.font_normal.render(item.name, True, (0, 0, 0))
+        name_shadow = text_cache.render(self.font_normal, item.name, (0, 0, 0))
         surface.blit(name_shadow, (text_x + 1, rect.y + 9))
-        name_text = self.font_normal.render(item.name, True, name_color)
+        name_text = text_cache.render(self.font_normal, item.name, name_color)
         surface.blit(name_text, (text_x, rect.y + 8))
         
         # Prix
@@ -1111,9 +1140,9 @@ class UnifiedShop:
             # Fallback: utiliser un symbole monétaire générique sans emoji
             cost_text = f"¤ {item.cost}"
         
-        cost_shadow = self.font_small.render(cost_text, True, (0, 0, 0))
+        cost_shadow = text_cache.render(self.font_small, cost_text, (0, 0, 0))
         surface.blit(cost_shadow, (cost_x + 1, rect.y + 31))
-        cost_surface = self.font_small.render(cost_text, True, cost_color)
+        cost_surface = text_cache.render(self.font_small, cost_text, cost_color)
         surface.blit(cost_surface, (cost_x, rect.y + 30))
         
         # Description
@@ -1121,13 +1150,13 @@ class UnifiedShop:
         desc_lines = item.description.split(' | ')[:2]
         
         for i, line in enumerate(desc_lines):
-            desc_surface = self.font_tiny.render(line, True, desc_color)
+            desc_surface = text_cache.render(self.font_tiny, line, desc_color)
             surface.blit(desc_surface, (text_x, rect.y + 50 + i * 14))
         
         # Quantité si limitée
         if item.max_quantity > 0:
             qty_text = f"{item.current_quantity}/{item.max_quantity}"
-            qty_surface = self.font_tiny.render(qty_text, True, self.theme.TEXT_DISABLED)
+            qty_surface = text_cache.render(self.font_tiny, qty_text, self.theme.TEXT_DISABLED)
             qty_rect = qty_surface.get_rect(topright=(rect.right - 5, rect.y + 5))
             surface.blit(qty_surface, qty_rect)
         
@@ -1135,7 +1164,7 @@ class UnifiedShop:
         if not can_purchase:
             # Utiliser des symboles de police compatibles pour indiquer l'error
             error_text = "⚠" if self.get_player_gold() < item.cost else "✖"
-            error_surface = self.font_normal.render(error_text, True, self.theme.PURCHASE_ERROR)
+            error_surface = text_cache.render(self.font_normal, error_text, self.theme.PURCHASE_ERROR)
             error_rect = error_surface.get_rect(bottomright=(rect.right - 5, rect.bottom - 5))
             surface.blit(error_surface, error_rect)
     
@@ -1145,12 +1174,12 @@ class UnifiedShop:
             return
         
         # Position centrée en haut de la boutique
-        feedback_text = self.font_normal.render(self.purchase_feedback, True, self.feedback_color)
+        feedback_text = text_cache.render(self.font_normal, self.purchase_feedback, self.feedback_color)
         feedback_rect = feedback_text.get_rect(center=(self.shop_x + self.shop_width // 2, self.shop_y + 120))
         
         # Fond pour le feedback
         bg_rect = feedback_rect.inflate(20, 10)
-        pygame.draw.rect(surface, (0, 0, 0, 200), bg_rect, border_radius=5)
+        pygame.draw.rect(surface, (0, 0, 0), bg_rect, border_radius=5)
         pygame.draw.rect(surface, self.feedback_color, bg_rect, 2, border_radius=5)
         
         # Texte du feedback
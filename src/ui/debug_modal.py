@@ -21,6 +21,7 @@ from src.components.events.krakenTentacleComponent import KrakenTentacleComponen
 from src.components.events.islandResourceComponent import IslandResourceComponent
 from src.components.core.attackComponent import AttackComponent
 from src.components.core.canCollideComponent import CanCollideComponent
+from src.constants.collision_layers import CollisionLayer
 from src.components.core.positionComponent import PositionComponent
 from src.components.core.spriteComponent import SpriteComponent
 from src.managers.sprite_manager import SpriteID, sprite_manager
@@ -245,7 +246,7 @@ class DebugModal:
                 # Create kraken entity
                 kraken_entity = esper.create_entity()
                 esper.add_component(kraken_entity, AttackComponent(1))
-                esper.add_component(kraken_entity, CanCollideComponent())
+                esper.add_component(kraken_entity, CanCollideComponent(layer=CollisionLayer.KRAKEN))
                 esper.add_component(kraken_entity, PositionComponent(position[0], position[1]))
                 esper.add_component(kraken_entity, TeamComponent(0))  # Neutral team
                 esper.add_component(kraken_entity, EventsComponent(0.0, 20.0, 20.0))  # 20 seconds duration
@@ -403,7 +404,6 @@ class DebugModal:
         
         # Reveal the entire map for the current team
         from src.systems.vision_system import vision_system
-        from src.settings.settings import MAP_WIDTH, MAP_HEIGHT
         
         # Get current team from action bar
         current_team = 1  # Default to allies
@@ -411,12 +411,7 @@ class DebugModal:
             current_team = self.game_engine.action_bar.current_camp
         
         # Add all tiles to explored tiles for this team
-        if current_team not in vision_system.explored_tiles:
-            vision_system.explored_tiles[current_team] = set()
-        
-        for x in range(MAP_WIDTH):
-            for y in range(MAP_HEIGHT):
-                vision_system.explored_tiles[current_team].add((x, y))
+        vision_system.explored_grid(current_team).fill(1)
         
         print(f"[DEV] Map revealed for team {current_team}")
         self._show_feedback('success', t('debug.feedback.map_revealed', default='Map revealed'))
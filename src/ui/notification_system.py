@@ -2,10 +2,12 @@
 Système de notification générique pour afficher des messages à l'utilisateur.
 """
 import pygame
-from typing import List, Tuple
-from dataclasses import dataclass
+from typing import List, Optional, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+from src.managers.font_cache import text_cache
+
 
 class NotificationType(Enum):
     """Types de notifications."""
@@ -23,6 +25,9 @@ class Notification:
     duration: float  # Durée d'affichage en secondes
     elapsed_time: float = 0.0
     alpha: int = 255  # Transparence pour le fade out
+    # Rendu en cache, refait seulement quand l'alpha change (pendant le fade out)
+    surface: Optional[pygame.Surface] = field(default=None, repr=False, compare=False)
+    surface_alpha: int = field(default=-1, repr=False, compare=False)
 
 
 class NotificationSystem:
@@ -92,62 +97,73 @@ class NotificationSystem:
         for notification in notifications_to_remove:
             self.notifications.remove(notification)
     
+    def _origin(self, screen_width: int) -> Tuple[int, int]:
+        """Position de la première notification (en haut à droite, en dessous de l'ActionBar)."""
+        return screen_width - self.notification_width - self.padding, 140
+
+    def screen_rects(self, screen_width: int) -> List[pygame.Rect]:
+        """Zones de l'écran couvertes par les notifications actives."""
+        start_x, start_y = self._origin(screen_width)
+        return [pygame.Rect(start_x, start_y + i * (self.notification_height + self.padding),
+                            self.notification_width, self.notification_height)
+                for i in range(len(self.notifications))]
+
     def render(self, screen: pygame.Surface):
         """Affiche all notifications actives."""
         if not self.notifications:
             return
         
-        screen_width = screen.get_width()
-        screen_height = screen.get_height()
-        
-        # Position de départ (en haut à droite, en dessous de l'ActionBar)
-        start_x = screen_width - self.notification_width - self.padding
-        start_y = 140  # En dessous de la barre d'action
+        start_x, start_y = self._origin(screen.get_width())
         
         for i, notification in enumerate(self.notifications):
             y_pos = start_y + i * (self.notification_height + self.padding)
-            
-            # Create une surface pour la notification avec alpha
-            notif_surface = pygame.Surface((self.notification_width, self.notification_height), pygame.SRCALPHA)
-            
-            # Couleur de fond avec transparence
-            bg_color = self.colors[notification.notification_type]
-            bg_with_alpha = (*bg_color, min(200, notification.alpha))
-            
-            # Dessiner le fond
-            pygame.draw.rect(
-                notif_surface,
-                bg_with_alpha,
-                (0, 0, self.notification_width, self.notification_height),
-                border_radius=5
-            )
-            
-            # Bordure
-            border_color = (*bg_color, notification.alpha)
-            pygame.draw.rect(
-                notif_surface,
-                border_color,
-                (0, 0, self.notification_width, self.notification_height),
-                width=2,
-                border_radius=5
-            )
-            
-            # Texte
-            text_color = (255, 255, 255, notification.alpha)
-            text_surface = self.font.render(notification.message, True, (255, 255, 255))
-            
-            # Appliquer l'alpha au texte
-            text_with_alpha = text_surface.copy()
-            text_with_alpha.set_alpha(notification.alpha)
-            
-            # Centrer le texte verticalement
-            text_rect = text_with_alpha.get_rect(
-                center=(self.notification_width // 2, self.notification_height // 2)
-            )
-            notif_surface.blit(text_with_alpha, text_rect)
+            if notification.surface is None or notification.surface_alpha != notification.alpha:
+                notification.surface = self._render_notification(notification)
+                notification.surface_alpha = notification.alpha
             
             # Afficher la notification sur l'écran
-            screen.blit(notif_surface, (start_x, y_pos))
+            screen.blit(notification.surface, (start_x, y_pos))
+
+    def _render_notification(self, notification: Notification) -> pygame.Surface:
+        """Rendu d'une notification (fond, bordure et texte) avec son alpha courant."""
+        # Create une surface pour la notification avec alpha
+        notif_surface = pygame.Surface((self.notification_width, self.notification_height), pygame.SRCALPHA)
+        
+        # Couleur de fond avec transparence
+        bg_color = self.colors[notification.notification_type]
+        bg_with_alpha = (*bg_color, min(200, notification.alpha))
+        
+        # Dessiner le fond
+        pygame.draw.rect(
+            notif_surface,
+            bg_with_alpha,
+            (0, 0, self.notification_width, self.notification_height),
+            border_radius=5
+        )
+        
+        # Bordure
+        border_color = (*bg_color, notification.alpha)
+        pygame.draw.rect(
+            notif_surface,
+            border_color,
+            (0, 0, self.notification_width, self.notification_height),
+            width=2,
+            border_radius=5
+        )
+        
+        # Texte
+        text_surface = text_cache.render(self.font, notification.message, (255, 255, 255))
+        
+        # Appliquer l'alpha au texte
+        text_with_alpha = text_surface.copy()
+        text_with_alpha.set_alpha(notification.alpha)
+        
+        # Centrer le texte verticalement
+        text_rect = text_with_alpha.get_rect(
+            center=(self.notification_width // 2, self.notification_height // 2)
+        )
+        notif_surface.blit(text_with_alpha, text_rect)
+        return notif_surface
     
     def clear(self):
         """Efface all notifications."""
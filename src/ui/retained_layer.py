@@ -0,0 +1,70 @@
+"""
+Calques d'interface retenus : la surface d'un widget n'est redessinée que
+lorsque son état change.
+
+Un widget fournit à chaque frame une clé d'état (or affiché, survol, unité
+sélectionnée...) et la zone de l'écran qu'il occupe. Tant que la clé ne
+change pas, RetainedLayer.draw() se contente d'un blit de la surface en
+cache. Quand elle change, la fonction de dessin d'origine du widget est
+appelée sur une toile transparente partagée (mêmes coordonnées écran,
+découpée à la zone du widget), dont la zone est ensuite copiée.
+"""
+from typing import Callable, Hashable, Optional
+
+import pygame
+
+# Toile transparente de la taille de l'écran, partagée par tous les calques
+# (toujours entièrement transparente entre deux rendus)
+_scratch: Optional[pygame.Surface] = None
+
+
+def _render_region(size, rect: pygame.Rect, render: Callable[[pygame.Surface], None]) -> pygame.Surface:
+    """Rendu de render() limité à rect, sur fond transparent, en coordonnées écran."""
+    global _scratch
+    if _scratch is None or _scratch.get_size() != size:
+        _scratch = pygame.Surface(size, pygame.SRCALPHA)
+    _scratch.set_clip(rect)
+    try:
+        render(_scratch)
+        return _scratch.subsurface(rect).copy()
+    finally:
+        _scratch.fill((0, 0, 0, 0), rect)
+        _scratch.set_clip(None)
+
+
+class RetainedLayer:
+    """Surface en cache d'un widget, redessinée quand sa clé d'état ou sa zone change."""
+
+    def __init__(self):
+        self.surface: Optional[pygame.Surface] = None
+        self.rect: Optional[pygame.Rect] = None
+        self.renders = 0
+        self._key: Optional[Hashable] = None
+
+    def invalidate(self) -> None:
+        """Force le prochain draw() à redessiner le widget (polices, icônes ou langue changées)."""
+        self.surface = None
+
+    def draw(self, target: pygame.Surface, rect: pygame.Rect, key: Hashable,
+             render: Callable[[pygame.Surface], None]) -> pygame.Rect:
+        """
+        Affiche le widget sur target.
+
+        Args:
+            target: Surface de destination (l'écran)
+            rect: Zone de l'écran occupée par le widget (rien n'est dessiné en dehors)
+            key: État dont dépend l'apparence du widget
+            render: Fonction de dessin du widget, appelée seulement quand la clé change
+
+        Returns:
+            pygame.Rect: La zone affichée
+        """
+        rect = pygame.Rect(rect).clip(target.get_rect())
+        if rect.w <= 0 or rect.h <= 0:
+            return rect
+        if self.surface is None or key != self._key or rect != self.rect:
+            self.surface = _render_region(target.get_size(), rect, render)
+            self.rect = rect
+            self._key = key
+            self.renders += 1
+        return target.blit(self.surface, rect)
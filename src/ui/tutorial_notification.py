@@ -4,8 +4,9 @@ Widget de notification pour le tutoriel.
 """
 import pygame
 import logging
-from src.settings.localization import t
-from src.managers.font_cache import get_font as _get_font
+from src.settings.localization import t, get_current_language
+from src.managers.font_cache import get_font as _get_font, text_cache
+from src.ui.retained_layer import RetainedLayer
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +47,11 @@ class TutorialNotification:
         
         # État d'interaction
         self.ok_button_hover = False
+
+        # Rendu retenu : mise en page (lignes, hauteur) et surface refaites seulement si le contenu change
+        self._layout_key = None
+        self._message_lines: list = []
+        self._layer = RetainedLayer()
         
     def set_position(self, screen_width: int, screen_height: int):
         """
@@ -133,27 +139,16 @@ class TutorialNotification:
             self.button_height
         )
 
-    def draw(self, surface: pygame.Surface):
-        """
-        Dessine la notification sur la surface.
-        
-        Args:
-            surface: Surface pygame sur laquelle dessiner
-        """
-        if not self.visible or self.dismissed:
-            return
-            
+    def _layout(self) -> list:
+        """Découpe le message en lignes et ajuste la hauteur (mis en cache tant que le texte ne change pas)."""
+        if self._layout_key == self.message:
+            return self._message_lines
+
         # Message with wrapping (respect the notification width)
         # Use slightly larger fonts to match the larger window
         font_title = _get_font(None, 28)
         font_msg = _get_font(None, 20)
         max_text_width = self.width - 2 * self.padding
-        
-        # Title will be drawn after the background is drawn (below)
-        
-        # Message with wrapping (respect the notification width)
-        font_msg = _get_font(None, 20)
-        max_text_width = self.width - 2 * self.padding
 
         message_lines = []
         for paragraph in self.message.split('\n'):
@@ -165,25 +160,51 @@ class TutorialNotification:
 
         # Recalculate height to fit the content and buttons
         title_height = font_title.get_linesize()
-        line_height = font_msg.get_linesize()
-        content_height = len(message_lines) * line_height
+        content_height = len(message_lines) * font_msg.get_linesize()
         self.height = self.padding + title_height + 8 + content_height + self.padding + self.button_height + self.padding
+        self._layout_key = self.message
+        self._message_lines = message_lines
+        return message_lines
+
+    def draw(self, surface: pygame.Surface):
+        """
+        Dessine la notification sur la surface.
+        
+        Le rendu est retenu : il n'est refait que si le titre, le message,
+        le survol du bouton ou la langue changent.
+        
+        Args:
+            surface: Surface pygame sur laquelle dessiner
+        """
+        if not self.visible or self.dismissed:
+            return
+
+        self._layout()
+        key = (self.title, self.message, self.ok_button_hover, get_current_language())
+        self._layer.draw(surface, pygame.Rect(self.x, self.y, self.width, self.height), key, self._draw_content)
+
+    def _draw_content(self, surface: pygame.Surface):
+        """Dessine le fond, le titre, le message et le bouton OK."""
+        font_title = _get_font(None, 28)
+        font_msg = _get_font(None, 20)
+        message_lines = self._layout()
+        title_height = font_title.get_linesize()
+        line_height = font_msg.get_linesize()
 
         # Draw background with updated height
-        # Background panel (recreated when size changes) — keep as-is but ensure alpha surface creation is efficient
         bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         pygame.draw.rect(bg_surface, self.bg_color, bg_surface.get_rect(), border_radius=10)
         pygame.draw.rect(bg_surface, self.border_color, bg_surface.get_rect(), 2, border_radius=10)
         surface.blit(bg_surface, (self.x, self.y))
 
         # Title (draw on top of background)
-        title_surface = font_title.render(self.title, True, self.text_color)
+        title_surface = text_cache.render(font_title, self.title, self.text_color)
         surface.blit(title_surface, (self.x + self.padding, self.y + self.padding))
 
         # Draw the message lines
         y_offset = self.y + self.padding + title_height + 8
         for line in message_lines:
-            line_surface = font_msg.render(line, True, self.text_color)
+            line_surface = text_cache.render(font_msg, line, self.text_color)
             surface.blit(line_surface, (self.x + self.padding, y_offset))
             y_offset += line_height
             
@@ -213,6 +234,6 @@ class TutorialNotification:
         
         # Texte centré
         font = _get_font(None, 20)
-        text_surface = font.render(text, True, self.text_color)
+        text_surface = text_cache.render(font, text, self.text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
@@ -21,6 +21,10 @@ from components.core.team_enum import Team
 from components.core.velocityComponent import VelocityComponent
 from components.core.spriteComponent import SpriteComponent
 from src.managers.sprite_manager import sprite_manager
+from src.managers.projectile_store import projectile_store
+from src.managers.entity_commands import entity_commands
+from src.managers.path_scheduler import path_scheduler
+from src.managers.navigation import navigation
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -41,12 +45,20 @@ def world():
 
     # Clean up les processeurs
     esper._processors.clear()
+    projectile_store.clear()
+    entity_commands.clear()
+    path_scheduler.clear()
+    navigation.clear()
 
     yield esper
     # Nettoyage after le test
     for entity in list(esper._entities.keys()):
         esper.delete_entity(entity, immediate=True)
     esper._processors.clear()
+    projectile_store.clear()
+    entity_commands.clear()
+    path_scheduler.clear()
+    navigation.clear()
 
 
 @pytest.fixture
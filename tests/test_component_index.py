@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests de l'index des components par bitset (src/managers/component_index.py)
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+import esper
+from src.managers.component_index import ComponentIndex
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.healthComponent import HealthComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.projectileComponent import ProjectileComponent
+from src.components.events.banditsComponent import Bandits
+
+TYPES = (PositionComponent, HealthComponent, TeamComponent, ProjectileComponent, Bandits)
+
+
+def _make(component_type):
+    if component_type is ProjectileComponent:
+        return ProjectileComponent("bullet")
+    return component_type()
+
+
+@pytest.mark.unit
+class TestComponentIndex:
+    """Les masques suivent les ajouts et retraits faits directement dans esper."""
+
+    def test_matches_has_component_after_changes(self, world):
+        rng = random.Random(1)
+        index = ComponentIndex()
+        entities = [esper.create_entity(*(_make(t) for t in TYPES if rng.random() < 0.5)) for _ in range(200)]
+        for _ in range(3):
+            for ent in rng.sample(entities, 40):
+                component_type = rng.choice(TYPES)
+                if esper.has_component(ent, component_type):
+                    esper.remove_component(ent, component_type)
+                else:
+                    esper.add_component(ent, _make(component_type))
+            for ent in entities:
+                for component_type in TYPES:
+                    assert index.has(ent, component_type) == esper.has_component(ent, component_type)
+
+        entities.append(esper.create_entity(Bandits()))  # au-delà de la taille initiale du tableau
+        ids = np.array(entities + [10 ** 6], dtype=np.int64)
+        selected = index.select(ids, all_of=(PositionComponent,), any_of=(HealthComponent, Bandits),
+                                none_of=(ProjectileComponent,))
+        expected = [
+            ent in esper._entities and esper.has_component(ent, PositionComponent)
+            and (esper.has_component(ent, HealthComponent) or esper.has_component(ent, Bandits))
+            and not esper.has_component(ent, ProjectileComponent)
+            for ent in ids.tolist()
+        ]
+        assert selected.tolist() == expected
+
+    def test_deleted_entities_lose_their_bits(self, world):
+        index = ComponentIndex()
+        mask = index.mask_of(HealthComponent, TeamComponent)
+        ent = esper.create_entity(HealthComponent(5, 5), TeamComponent(1))
+        assert index.has_all(ent, mask)
+
+        esper.delete_entity(ent)
+        assert index.has_all(ent, mask)  # comme esper.has_component tant que la suppression est différée
+        esper.clear_dead_entities()
+        assert index.entity_mask(ent) == 0
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests du stockage en colonnes des composants chauds (Position, Velocity, Health, Team)
+"""
+
+import copy
+import gc
+import pytest
+import numpy as np
+
+import esper
+from src.managers.component_store import ComponentTable
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.velocityComponent import VelocityComponent
+from src.components.core.healthComponent import HealthComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.projectileComponent import ProjectileComponent
+
+
+@pytest.mark.unit
+class TestComponentViews:
+    """Les composants restent utilisables comme avant, mais lisent/écrivent les colonnes."""
+
+    def test_attributes_write_through_to_columns(self):
+        pos = PositionComponent(10, 20, 90)
+        pos.x += 5.5
+
+        table = PositionComponent._table
+        assert table.column("x")[pos._row] == pytest.approx(15.5)
+        assert table.column("y")[pos._row] == pytest.approx(20.0)
+        assert pos.direction == 90.0
+
+        table.column("y")[pos._row] = 42.0
+        assert pos.y == 42.0
+
+    def test_health_keeps_int_values_and_team_is_int(self):
+        health = HealthComponent(100, 100)
+        health.currentHealth -= 12.5
+        team = TeamComponent(2)
+
+        assert health.maxHealth == 100 and isinstance(health.maxHealth, int)
+        assert health.currentHealth == pytest.approx(87.5)
+        assert team.team_id == 2 and isinstance(team.team_id, int)
+        assert TeamComponent._table.column("team_id").dtype == np.int16
+
+    def test_copies_get_their_own_row(self):
+        vel = VelocityComponent(3.0, 5.0, -1.0, 1.0)
+        vel.stun_timer = 0.5
+        clone = copy.deepcopy(vel)
+        clone.currentSpeed = 0.0
+
+        assert clone._row != vel._row
+        assert vel.currentSpeed == 3.0
+        assert clone.stun_timer == 0.5
+
+    def test_rows_are_released_with_the_component(self):
+        table = PositionComponent._table
+        live_before = table.live_rows
+        pos = PositionComponent(1, 1)
+        row = pos._row
+        assert table.live_rows == live_before + 1
+
+        del pos
+        gc.collect()
+        assert table.live_rows == live_before
+        assert PositionComponent(2, 2)._row == row
+
+
+@pytest.mark.unit
+class TestComponentTable:
+    """Allocation et croissance des tables."""
+
+    def test_table_grows_and_keeps_values(self):
+        table = ComponentTable("test", (("value", np.float64),), capacity=2)
+        rows = [table.allocate() for _ in range(5)]
+        table.views[0][rows[0]] = 7.0
+        table.views[0][rows[4]] = 9.0
+
+        assert table.capacity >= 5
+        assert len(set(rows)) == 5
+        assert table.column("value")[rows[0]] == 7.0
+        assert table.column("value")[rows[4]] == 9.0
+
+
+@pytest.mark.unit
+class TestComponentStoreQuery:
+    """Requêtes vectorisées synchronisées avec esper."""
+
+    def test_query_returns_rows_of_live_entities(self, world):
+        from src.managers.component_store import component_store
+
+        moving = []
+        for i in range(4):
+            ent = esper.create_entity(PositionComponent(i * 10.0, 0.0), VelocityComponent(1.0), TeamComponent(1))
+            moving.append(ent)
+        esper.create_entity(PositionComponent(500.0, 0.0), TeamComponent(2))
+        esper.add_component(moving[0], ProjectileComponent("bullet"))
+
+        esper.delete_entity(moving[3], immediate=True)
+        entities, (pos_rows, vel_rows, team_rows) = component_store.query(PositionComponent, VelocityComponent, TeamComponent)
+
+        assert sorted(entities.tolist()) == sorted(moving[:3])
+        xs = PositionComponent._table.column("x")[pos_rows]
+        expected = [esper.component_for_entity(int(e), PositionComponent).x for e in entities]
+        assert xs.tolist() == expected
+
+        entities, (pos_rows, proj_rows) = component_store.query(PositionComponent, ProjectileComponent)
+        assert entities.tolist() == [moving[0]]
+        assert proj_rows is None
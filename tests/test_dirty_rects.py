@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests de la présentation par rectangles sales (src/managers/dirty_rects.py, GameRenderer.render_frame)
+"""
+
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+import esper
+from src.game import GameRenderer
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.spriteComponent import SpriteComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.visionComponent import VisionComponent
+from src.components.globals.cameraComponent import Camera
+from src.constants.map_tiles import TileType
+from src.managers.dirty_rects import DirtyRectTracker, merge_rects
+from src.settings.settings import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE, config_manager
+from src.systems.vision_system import vision_system
+
+WINDOW_SIZE = (800, 600)
+
+
+def _surface(color, size=20):
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+@pytest.mark.unit
+class TestDirtyRectTracker:
+    """Diff des listes de blits, empreinte des widgets et repli sur une frame complète."""
+
+    def test_unchanged_blits_cost_nothing(self):
+        tracker = DirtyRectTracker()
+        image = _surface((255, 0, 0, 255))
+        tracker.begin_frame("view", WINDOW_SIZE)
+        tracker.diff("sprites", [(image, (10, 10))])
+        assert tracker.end_frame() is None  # première frame
+
+        tracker.begin_frame("view", WINDOW_SIZE)
+        tracker.diff("sprites", [(image, (10, 10))])
+        assert tracker.end_frame() == [] and tracker.dirty_fraction == 0.0
+
+        tracker.begin_frame("view", WINDOW_SIZE)
+        tracker.diff("sprites", [(image, (100, 10))])
+        assert sorted(tracker.end_frame()) == [pygame.Rect(10, 10, 20, 20), pygame.Rect(100, 10, 20, 20)]
+        assert tracker.dirty_fraction == pytest.approx(800 / (800 * 600))
+
+    def test_widget_footprint_is_repainted_when_it_disappears(self):
+        tracker = DirtyRectTracker()
+        tracker.begin_frame("view", WINDOW_SIZE)
+        tracker.end_frame()
+        tracker.begin_frame("view", WINDOW_SIZE)
+        tracker.track("tooltip", [pygame.Rect(50, 50, 30, 10)])
+        assert tracker.end_frame() == [pygame.Rect(50, 50, 30, 10)]
+
+        tracker.begin_frame("view", WINDOW_SIZE)
+        tracker.track("tooltip", [])
+        assert tracker.end_frame() == [pygame.Rect(50, 50, 30, 10)]
+
+    def test_falls_back_to_full_frames(self):
+        tracker = DirtyRectTracker(max_rects=2, full_fraction=0.5)
+        tracker.begin_frame("view", WINDOW_SIZE)
+        tracker.end_frame()
+
+        tracker.begin_frame("moved", WINDOW_SIZE)  # caméra déplacée
+        assert tracker.end_frame() is None
+        tracker.begin_frame("moved", WINDOW_SIZE)
+        tracker.add([pygame.Rect(0, 0, 800, 400)])  # trop grande surface
+        assert tracker.end_frame() is None
+        tracker.begin_frame("moved", WINDOW_SIZE)
+        tracker.add([pygame.Rect(x, 0, 5, 5) for x in (0, 50, 100)])  # trop de rectangles
+        assert tracker.end_frame() is None and tracker.dirty_fraction == 1.0
+        assert (tracker.full_frames, tracker.partial_frames) == (4, 0)
+
+    def test_merge_rects(self):
+        merged = merge_rects([pygame.Rect(0, 0, 10, 10), pygame.Rect(30, 0, 10, 10), pygame.Rect(9, 0, 22, 5)])
+        assert merged == [pygame.Rect(0, 0, 40, 10)]
+
+
+def _terrain():
+    images = {name: _surface(color, TILE_SIZE) for name, color in
+              (('sea', (0, 60, 160, 255)), ('generic_island', (40, 160, 40, 255)), ('mine', (90, 90, 90, 255)),
+               ('cloud', (220, 220, 220, 255)), ('ally', (200, 200, 0, 255)), ('enemy', (120, 0, 120, 255)))}
+    grid = [[int(TileType.GENERIC_ISLAND) if (x * 7 + y * 3) % 11 == 0 else int(TileType.SEA)
+             for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+    return grid, images
+
+
+def _engine(window, camera, grid, images):
+    action_bar = SimpleNamespace(current_camp=1, draw=lambda surface: surface.fill((30, 30, 30), (0, 560, 800, 40)),
+                                 screen_rects=lambda: [pygame.Rect(0, 560, 800, 40)])
+    inactive = SimpleNamespace(is_active=lambda: False)
+    return SimpleNamespace(window=window, grid=grid, images=images, camera=camera, action_bar=action_bar,
+                           show_debug=False, tutorial_manager=inactive, exit_modal=inactive, victory_modal=None,
+                           game_over=False, notification_system=None, self_play_mode=False, previous_positions={},
+                           selected_unit_id=None, ally_base_pos=(1, 1), enemy_base_pos=(40, 40))
+
+
+@pytest.mark.unit
+class TestDirtyRectRendering:
+    """Les frames partielles donnent les pixels d'un rendu complet."""
+
+    def test_partial_frames_match_full_redraw(self, world, monkeypatch):
+        monkeypatch.setattr("src.systems.vision_system.get_fog_render_mode", lambda: "tiles")
+        presented = []
+        monkeypatch.setattr(pygame.display, "flip", lambda: None)
+        monkeypatch.setattr(pygame.display, "update", lambda rects: presented.append(list(rects)))
+        vision_system.reset()
+        unit = esper.create_entity(PositionComponent(5 * TILE_SIZE, 4 * TILE_SIZE),
+                                   SpriteComponent(image_path="test_unit", width=20, height=20,
+                                                   surface=_surface((255, 0, 0, 255))),
+                                   TeamComponent(1), VisionComponent(3.0))
+        esper.create_entity(PositionComponent(2 * TILE_SIZE, 2 * TILE_SIZE),
+                            SpriteComponent(image_path="test_prop", width=30, height=30,
+                                            surface=_surface((0, 255, 0, 255), 30)), TeamComponent(1))
+        camera = Camera(*WINDOW_SIZE)
+        camera.zoom, camera.x, camera.y = 1.0, 0.0, 0.0
+
+        partial_window = pygame.Surface(WINDOW_SIZE)
+        grid, images = _terrain()  # Le même terrain pour les deux rendus (cache de terrain partagé)
+        partial = GameRenderer(_engine(partial_window, camera, grid, images))
+        full_window = pygame.Surface(WINDOW_SIZE)
+        full = GameRenderer(_engine(full_window, camera, grid, images))
+
+        fractions = []
+        for step in range(6):
+            esper.component_for_entity(unit, PositionComponent).x += TILE_SIZE * 0.4 * (step % 3)
+            monkeypatch.setitem(config_manager.config, "dirty_rect_rendering", True)
+            partial.render_frame(1 / 60)
+            fractions.append(partial.dirty_rects.dirty_fraction)
+            monkeypatch.setitem(config_manager.config, "dirty_rect_rendering", False)
+            full.render_frame(1 / 60)
+            assert pygame.image.tobytes(partial_window, "RGB") == pygame.image.tobytes(full_window, "RGB"), step
+
+        # Seule la première frame est complète ; sans mouvement, seule la barre est redessinée
+        assert (partial.dirty_rects.full_frames, partial.dirty_rects.partial_frames) == (1, 5)
+        assert fractions[0] == 1.0 and all(fraction < 0.6 for fraction in fractions[1:])
+        assert presented[2] == [pygame.Rect(0, 560, 800, 40)]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests de la détection vectorisée des collisions entre entités
+"""
+
+import random
+import pygame
+import pytest
+
+import esper
+from src.processeurs.collisionProcessor import CollisionProcessor
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.spriteComponent import SpriteComponent
+from src.components.core.canCollideComponent import CanCollideComponent
+from src.components.core.teamComponent import TeamComponent
+from src.constants.collision_layers import CollisionLayer, COLLISION_LAYER_MATRIX, layers_collide
+
+
+def _reference_hits():
+    """Paires en collision selon le test pygame.Rect entité par entité d'origine."""
+    entities = esper.get_components(PositionComponent, SpriteComponent, CanCollideComponent, TeamComponent)
+    hits = set()
+    for index, (ent, (pos, sprite, collide, team)) in enumerate(entities):
+        rect1 = pygame.Rect(0, 0, int(sprite.original_width), int(sprite.original_height))
+        rect1.center = (int(pos.x), int(pos.y))
+        for other_ent, (other_pos, other_sprite, other_collide, other_team) in entities[index + 1:]:
+            rect2 = pygame.Rect(0, 0, int(other_sprite.original_width), int(other_sprite.original_height))
+            rect2.center = (int(other_pos.x), int(other_pos.y))
+            if not rect1.colliderect(rect2):
+                continue
+            if not layers_collide(collide.layer, other_collide.layer):
+                continue
+            if team.team_id == other_team.team_id and team.team_id != 0 and other_team.team_id != 0:
+                continue
+            hits.add(frozenset((ent, other_ent)))
+    return hits
+
+
+def _recorded_hits(monkeypatch):
+    hits = []
+    processor = CollisionProcessor()
+    monkeypatch.setattr(processor, "_handle_entity_hit", lambda a, b: hits.append(frozenset((a, b))))
+    processor._process_entity_collisions()
+    return hits
+
+
+@pytest.mark.unit
+class TestVectorizedEntityCollisions:
+    """Seules les paires réellement en collision atteignent _handle_entity_hit."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_rect_by_rect_detection(self, world, monkeypatch, seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            ent = esper.create_entity(
+                PositionComponent(rng.uniform(-50, 800), rng.uniform(-50, 800)),
+                SpriteComponent(width=rng.choice([0, 15, 24, 40, 53.5, 120]), height=rng.choice([10, 24, 40.9, 80])),
+                CanCollideComponent(layer=rng.choice(list(CollisionLayer))),
+                TeamComponent(rng.randint(0, 2)),
+            )
+
+        hits = _recorded_hits(monkeypatch)
+
+        assert len(hits) == len(set(hits))
+        assert set(hits) == _reference_hits()
+
+    def test_filtered_pairs_never_reach_the_handler(self, world, monkeypatch):
+        def collider(x, team, layer=CollisionLayer.UNIT):
+            return esper.create_entity(PositionComponent(x, 100), SpriteComponent(width=40, height=40),
+                                       CanCollideComponent(layer=layer), TeamComponent(team))
+
+        collider(100, 1)
+        collider(110, 1)  # même équipe : ignoré
+        mine = collider(300, 0, CollisionLayer.MINE)
+        ally = collider(310, 1)  # mine (équipe 0) : collision
+        collider(500, 0, CollisionLayer.BANDIT)
+        collider(510, 2, CollisionLayer.BANDIT)  # deux bandits : ignoré
+        collider(700, 1, CollisionLayer.TOWER)
+        collider(710, 0, CollisionLayer.CHEST)  # tour et coffre : ignoré
+
+        assert _recorded_hits(monkeypatch) == [frozenset((mine, ally))]
+
+    def test_layer_matrix_is_symmetric(self):
+        assert (COLLISION_LAYER_MATRIX == COLLISION_LAYER_MATRIX.T).all()
+        assert not layers_collide(CollisionLayer.BASE, CollisionLayer.CHEST)
+        assert not layers_collide(CollisionLayer.PROJECTILE, CollisionLayer.BANDIT)
+        assert layers_collide(CollisionLayer.PROJECTILE, CollisionLayer.MINE)
+        assert layers_collide(CollisionLayer.UNIT, CollisionLayer.UNIT)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests du tampon de commandes d'entités (src/managers/entity_commands.py)
+"""
+
+import pytest
+
+import esper
+from src.managers.entity_commands import EntityCommandBuffer
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.healthComponent import HealthComponent
+from src.components.core.teamComponent import TeamComponent
+
+
+@pytest.mark.unit
+class TestEntityCommandBuffer:
+    """Les changements sont appliqués en un seul lot au flush."""
+
+    def test_creations_appear_at_flush(self, world):
+        buffer = EntityCommandBuffer()
+        ent = buffer.create(PositionComponent(10, 20))
+        buffer.add_component(ent, TeamComponent(2))
+
+        assert not esper.entity_exists(ent)
+        counts = buffer.flush()
+
+        assert counts["created"] == 1 and counts["components_added"] == 0
+        assert esper.component_for_entity(ent, PositionComponent).x == 10
+        assert esper.component_for_entity(ent, TeamComponent).team_id == 2
+        assert [e for e, _ in esper.get_component(TeamComponent)] == [ent]
+
+    def test_deletions_are_idempotent(self, world):
+        buffer = EntityCommandBuffer()
+        ent = esper.create_entity(PositionComponent(0, 0))
+        other = esper.create_entity(PositionComponent(1, 1))
+
+        buffer.delete(ent)
+        buffer.delete(ent)
+        buffer.delete(12345)  # entité inconnue : ignorée
+        assert not esper.entity_exists(ent)  # morte dès la commande
+        assert ent in [e for e, _ in esper.get_component(PositionComponent)]
+
+        counts = buffer.flush()
+        assert counts["deleted"] == 1
+        assert [e for e, _ in esper.get_component(PositionComponent)] == [other]
+        esper.process()  # plus rien à finaliser pour esper
+
+    def test_component_changes_and_counters(self, world):
+        buffer = EntityCommandBuffer()
+        ent = esper.create_entity(PositionComponent(0, 0), HealthComponent(10, 10))
+        doomed = esper.create_entity(PositionComponent(5, 5))
+
+        buffer.add_component(ent, TeamComponent(1))
+        buffer.remove_component(ent, HealthComponent)
+        buffer.remove_component(ent, HealthComponent)  # déjà retiré : ignoré
+        buffer.add_component(doomed, TeamComponent(2))  # entité supprimée : ignoré
+        buffer.delete(doomed)
+        pending = buffer.create(PositionComponent(3, 3))
+        buffer.delete(pending)  # création annulée avant le flush
+
+        assert not esper.has_component(ent, TeamComponent)
+        counts = buffer.flush()
+
+        assert counts == {"created": 0, "deleted": 1, "components_added": 1, "components_removed": 1}
+        assert esper.has_component(ent, TeamComponent) and not esper.has_component(ent, HealthComponent)
+        assert not buffer.is_pending()
+        buffer.flush()
+        assert buffer.totals["deleted"] == 1 and buffer.last_counts["deleted"] == 0
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests de la simulation à pas fixe et de l'interpolation de rendu
+"""
+
+import types
+import pytest
+
+import esper
+from src.game import GameEngine, GameRenderer
+from src.processeurs.movementProcessor import MovementProcessor
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.velocityComponent import VelocityComponent
+from src.constants.gameplay import SIMULATION_REFERENCE_RATE, DEFAULT_SIM_TICK_RATE, INTERPOLATION_MAX_JUMP
+from src.settings.settings import config_manager
+
+
+def _moving_entity(speed=2.0):
+    entity = esper.create_entity()
+    esper.add_component(entity, PositionComponent(500, 500, 180))
+    esper.add_component(entity, VelocityComponent(currentSpeed=speed, terrain_modifier=1.0))
+    return entity
+
+
+@pytest.mark.unit
+class TestFixedStepMovement:
+    """Le déplacement dépend du temps simulé, pas du nombre de ticks."""
+
+    def test_reference_rate_matches_legacy_per_frame_step(self, world):
+        entity = _moving_entity(speed=2.0)
+        MovementProcessor().process(dt=1.0 / SIMULATION_REFERENCE_RATE)
+        pos = esper.component_for_entity(entity, PositionComponent)
+        assert pos.x == pytest.approx(502.0)
+
+    def test_no_dt_keeps_per_frame_step(self, world):
+        entity = _moving_entity(speed=2.0)
+        MovementProcessor().process()
+        assert esper.component_for_entity(entity, PositionComponent).x == pytest.approx(502.0)
+
+    def test_same_distance_per_second_at_any_tick_rate(self, world):
+        slow = _moving_entity(speed=2.0)
+        fast = _moving_entity(speed=2.0)
+        processor = MovementProcessor()
+
+        # 30 Hz pendant une seconde pour slow...
+        esper.remove_component(fast, VelocityComponent)
+        for _ in range(30):
+            processor.process(dt=1.0 / 30)
+        esper.add_component(fast, VelocityComponent(currentSpeed=2.0, terrain_modifier=1.0))
+        # ...puis 144 Hz pendant une seconde pour fast
+        esper.remove_component(slow, VelocityComponent)
+        for _ in range(144):
+            processor.process(dt=1.0 / 144)
+
+        slow_x = esper.component_for_entity(slow, PositionComponent).x
+        fast_x = esper.component_for_entity(fast, PositionComponent).x
+        assert slow_x == pytest.approx(500 + 2.0 * SIMULATION_REFERENCE_RATE)
+        assert fast_x == pytest.approx(slow_x)
+
+
+@pytest.mark.unit
+class TestRenderInterpolation:
+    """Interpolation des positions affichées entre deux ticks."""
+
+    @pytest.fixture
+    def renderer(self):
+        engine = types.SimpleNamespace(previous_positions={1: (100.0, 200.0)})
+        return GameRenderer(engine)
+
+    def test_position_is_interpolated_between_ticks(self, renderer):
+        renderer._interpolation_alpha = 0.25
+        pos = PositionComponent(140.0, 200.0)
+        assert renderer._interpolated_position(1, pos) == pytest.approx((110.0, 200.0))
+
+    def test_latest_tick_or_unknown_entity_uses_current_position(self, renderer):
+        pos = PositionComponent(140.0, 180.0)
+        renderer._interpolation_alpha = 1.0
+        assert renderer._interpolated_position(1, pos) == (140.0, 180.0)
+        renderer._interpolation_alpha = 0.5
+        assert renderer._interpolated_position(2, pos) == (140.0, 180.0)
+
+    def test_teleport_is_not_interpolated(self, renderer):
+        renderer._interpolation_alpha = 0.5
+        pos = PositionComponent(100.0 + INTERPOLATION_MAX_JUMP * 2, 200.0)
+        assert renderer._interpolated_position(1, pos) == (pos.x, pos.y)
+
+
+@pytest.mark.unit
+class TestSimStep:
+    """Lecture de la fréquence de simulation depuis la configuration."""
+
+    def test_sim_step_follows_config(self, monkeypatch):
+        engine = GameEngine(headless=True)
+        monkeypatch.setitem(config_manager.config, "sim_tick_rate", 30)
+        assert engine._get_sim_step() == pytest.approx(1.0 / 30)
+
+    def test_invalid_sim_rate_falls_back_to_default(self, monkeypatch):
+        engine = GameEngine(headless=True)
+        monkeypatch.setitem(config_manager.config, "sim_tick_rate", 0)
+        assert engine._get_sim_step() == pytest.approx(1.0 / DEFAULT_SIM_TICK_RATE)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Tests du mode pipeline : instantanés de frame, double tampon et thread de simulation
+(src/managers/frame_snapshot.py, GameRenderer.build_snapshot / render_world_snapshot)
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+import esper
+from src.game import GameRenderer
+from src.components.core.healthComponent import HealthComponent
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.spriteComponent import SpriteComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.visionComponent import VisionComponent
+from src.components.globals.cameraComponent import Camera
+from src.constants.map_tiles import TileType
+from src.managers.frame_snapshot import SimulationWorker, SnapshotBuffer
+from src.settings.settings import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE, config_manager
+from src.systems.vision_system import vision_system
+
+WINDOW_SIZE = (800, 600)
+
+
+def _surface(color, size=20):
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+
+@pytest.mark.unit
+class TestSnapshotBuffer:
+    """Le moteur de rendu lit toujours le dernier instantané publié."""
+
+    def test_publish_swaps_front_and_back(self):
+        buffer = SnapshotBuffer()
+        assert buffer.front is None
+
+        first, second = object(), object()
+        buffer.publish(first)
+        buffer.publish(second)
+
+        assert buffer.front is second and buffer._back is first
+        assert buffer.published == 2
+        buffer.clear()
+        assert buffer.front is None
+
+
+@pytest.mark.unit
+class TestSimulationWorker:
+    """Un travail à la fois sur le thread de simulation, erreurs renvoyées au thread principal."""
+
+    def test_job_runs_on_the_worker_thread(self):
+        worker = SimulationWorker()
+        threads = []
+        try:
+            worker.start(lambda: threads.append(threading.current_thread()))
+            worker.wait()
+            assert threads and threads[0] is not threading.current_thread()
+            assert not worker.busy
+        finally:
+            worker.stop()
+
+    def test_only_one_job_at_a_time(self):
+        worker = SimulationWorker()
+        release = threading.Event()
+        try:
+            worker.start(release.wait)
+            with pytest.raises(RuntimeError):
+                worker.start(lambda: None)
+            release.set()
+            worker.wait()
+        finally:
+            release.set()
+            worker.stop()
+
+    def test_errors_are_raised_by_wait(self):
+        worker = SimulationWorker()
+        try:
+            worker.start(lambda: 1 / 0)
+            with pytest.raises(ZeroDivisionError):
+                worker.wait()
+            worker.start(lambda: None)  # Le thread continue après une erreur
+            worker.wait()
+        finally:
+            worker.stop()
+
+
+def _engine(window, camera):
+    images = {name: _surface(color, TILE_SIZE) for name, color in
+              (('sea', (0, 60, 160, 255)), ('generic_island', (40, 160, 40, 255)), ('mine', (90, 90, 90, 255)),
+               ('cloud', (220, 220, 220, 255)), ('ally', (200, 200, 0, 255)), ('enemy', (120, 0, 120, 255)))}
+    grid = [[int(TileType.GENERIC_ISLAND) if (x * 7 + y * 3) % 11 == 0 else int(TileType.SEA)
+             for x in range(MAP_WIDTH)] for y in range(MAP_HEIGHT)]
+    action_bar = SimpleNamespace(current_camp=1, draw=lambda surface: surface.fill((30, 30, 30), (0, 560, 800, 40)),
+                                 screen_rects=lambda: [pygame.Rect(0, 560, 800, 40)])
+    inactive = SimpleNamespace(is_active=lambda: False)
+    return SimpleNamespace(window=window, grid=grid, images=images, camera=camera, action_bar=action_bar,
+                           show_debug=False, tutorial_manager=inactive, exit_modal=inactive, victory_modal=None,
+                           game_over=False, notification_system=None, self_play_mode=False, previous_positions={},
+                           selected_unit_id=None, ally_base_pos=(1, 1), enemy_base_pos=(40, 40))
+
+
+@pytest.fixture
+def scene(world, monkeypatch):
+    """Une unité alliée sélectionnée et blessée, un ennemi visible et un ennemi caché."""
+    monkeypatch.setattr("src.systems.vision_system.get_fog_render_mode", lambda: "tiles")
+    monkeypatch.setattr(pygame.display, "flip", lambda: None)
+    monkeypatch.setitem(config_manager.config, "dirty_rect_rendering", False)
+    vision_system.reset()
+    unit = esper.create_entity(PositionComponent(5 * TILE_SIZE, 4 * TILE_SIZE),
+                               SpriteComponent(image_path="test_unit", width=20, height=20,
+                                               surface=_surface((255, 0, 0, 255))),
+                               TeamComponent(1), VisionComponent(3.0), HealthComponent(40, 100))
+    esper.create_entity(PositionComponent(6 * TILE_SIZE, 5 * TILE_SIZE),
+                        SpriteComponent(image_path="test_enemy", width=24, height=24,
+                                        surface=_surface((0, 0, 255, 255), 24)), TeamComponent(2))
+    esper.create_entity(PositionComponent(12 * TILE_SIZE, 9 * TILE_SIZE),
+                        SpriteComponent(image_path="test_hidden", width=24, height=24,
+                                        surface=_surface((255, 0, 255, 255), 24)), TeamComponent(2))
+    camera = Camera(*WINDOW_SIZE)
+    camera.zoom, camera.x, camera.y = 1.0, 0.0, 0.0
+    return unit, camera
+
+
+@pytest.mark.unit
+class TestFrameSnapshot:
+    """L'instantané est une copie figée, et son rendu donne les pixels du rendu depuis l'ECS."""
+
+    def test_snapshot_is_an_immutable_copy(self, scene):
+        unit, camera = scene
+        renderer = GameRenderer(_engine(pygame.Surface(WINDOW_SIZE), camera))
+        renderer.game_engine.selected_unit_id = unit
+
+        snapshot = renderer.build_snapshot(tick=7)
+        esper.component_for_entity(unit, PositionComponent).x += 50
+
+        assert snapshot.tick == 7 and snapshot.team == 1
+        assert [state.entity for state in snapshot.sprites] == sorted(state.entity for state in snapshot.sprites)
+        state = next(state for state in snapshot.sprites if state.entity == unit)
+        assert state.x == 5 * TILE_SIZE and snapshot.xs[snapshot.sprites.index(state)] == 5 * TILE_SIZE
+        assert state.health == pytest.approx(0.4)
+        assert snapshot.vision_circle == (5 * TILE_SIZE, 4 * TILE_SIZE, 3.0)
+        for array in (snapshot.xs, snapshot.ys, snapshot.visible, snapshot.explored, *snapshot.projectiles.values()):
+            assert not array.flags.writeable
+        with pytest.raises(AttributeError):
+            snapshot.tick = 8
+
+    def test_snapshot_render_matches_ecs_render(self, scene):
+        unit, camera = scene
+        direct_window, snapshot_window = pygame.Surface(WINDOW_SIZE), pygame.Surface(WINDOW_SIZE)
+        direct = GameRenderer(_engine(direct_window, camera))
+        pipelined = GameRenderer(_engine(snapshot_window, camera))
+        pipelined.game_engine.grid = direct.game_engine.grid  # Même terrain (cache de terrain partagé)
+        pipelined.game_engine.images = direct.game_engine.images
+        for engine in (direct.game_engine, pipelined.game_engine):
+            engine.selected_unit_id = unit
+            engine.previous_positions = {unit: (5 * TILE_SIZE - 8, 4 * TILE_SIZE)}
+
+        direct.render_frame(1 / 60, alpha=0.5)
+        snapshot = pipelined.build_snapshot(tick=1)
+        pipelined.render_world_snapshot(snapshot, alpha=0.5)
+        pipelined.render_overlays(1 / 60)
+
+        assert pygame.image.tobytes(snapshot_window, "RGB") == pygame.image.tobytes(direct_window, "RGB")
+        # L'ennemi hors de vue n'est pas dessiné
+        hidden = next(state for state in snapshot.sprites if state.image_key == "test_hidden")
+        assert snapshot_window.get_at((int(hidden.x), int(hidden.y)))[:3] != (255, 0, 255)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests du mode headless (simulation sans affichage) du GameEngine
+"""
+
+import pytest
+import pygame
+
+import esper
+from src.game import GameEngine
+from src.managers.sprite_manager import sprite_manager
+from src.components.core.baseComponent import BaseComponent
+
+
+@pytest.fixture
+def headless_engine(world):
+    """GameEngine headless ; la base ECS est nettoyée par la fixture world."""
+    engine = GameEngine(headless=True)
+    yield engine
+    BaseComponent.reset()
+
+
+@pytest.mark.integration
+class TestHeadlessSimulation:
+    """Tests de GameEngine.simulate()."""
+
+    def test_headless_engine_has_no_presentation_layer(self, headless_engine):
+        """Aucune fenêtre, aucun rendu, aucun tutoriel ni notification."""
+        assert headless_engine.self_play_mode
+        assert headless_engine.window is None
+        assert headless_engine.renderer is None
+        assert headless_engine.tutorial_manager is None
+        assert headless_engine.notification_system is None
+        assert headless_engine.audio_manager is None
+
+    def test_simulate_runs_requested_ticks(self, headless_engine):
+        """La simulation avance du nombre de ticks demandé."""
+        image_loading_before = sprite_manager.image_loading_enabled
+        result = headless_engine.simulate(20, seed=42, dt=1.0 / 30.0)
+
+        assert result["ticks"] == 20
+        assert result["sim_time"] == pytest.approx(20 / 30.0)
+        assert result["wall_time"] > 0
+        assert headless_engine.grid is not None
+        assert BaseComponent.get_ally_base() is not None
+        assert BaseComponent.get_enemy_base() is not None
+        # Le chargement des images est rétabli après la simulation
+        assert sprite_manager.image_loading_enabled == image_loading_before
+
+    def test_same_seed_generates_same_map(self, headless_engine):
+        """Une même graine produit la même carte."""
+        headless_engine.simulate(1, seed=7)
+        first_grid = [row[:] for row in headless_engine.grid]
+
+        for entity in list(esper._entities.keys()):
+            esper.delete_entity(entity, immediate=True)
+        other = GameEngine(headless=True)
+        other.simulate(1, seed=7)
+
+        assert other.grid == first_grid
+
+    def test_simulate_requires_headless_engine(self):
+        """simulate() est réservé aux moteurs headless."""
+        pygame.font.init()  # les modales du moteur classique créent leurs polices
+        engine = GameEngine(self_play_mode=True)
+        with pytest.raises(RuntimeError):
+            engine.simulate(1)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Trajectoires de référence du MovementProcessor vectorisé
+"""
+
+import random
+
+import pytest
+
+import esper
+from src.processeurs.movementProcessor import MovementProcessor
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.velocityComponent import VelocityComponent
+from src.components.core.projectileComponent import ProjectileComponent
+from src.components.special.isVinedComponent import isVinedComponent
+from src.components.special.speKamikazeComponent import SpeKamikazeComponent
+from src.components.events.banditsComponent import Bandits
+
+
+def _populate(rng, processor, count=120):
+    """Monde varié : troupes, projectiles, bandits, lianes, kamikazes, bords de carte."""
+    entities = []
+    for _ in range(count):
+        near_edge = rng.random() < 0.2
+        x = rng.choice([processor.boundary_margin + 1, processor.world_width - processor.boundary_margin - 1]) \
+            if near_edge else rng.uniform(0, processor.world_width)
+        ent = esper.create_entity(
+            PositionComponent(x, rng.uniform(0, processor.world_height), rng.uniform(-360, 360)),
+            VelocityComponent(rng.choice([0.0, rng.uniform(-3, 8)]), 8.0, -2.0, rng.choice([0.0, 0.5, 1.0, 1.3])),
+        )
+        kind = rng.random()
+        if kind < 0.15:
+            esper.add_component(ent, ProjectileComponent("bullet"))
+        elif kind < 0.25:
+            esper.add_component(ent, Bandits())
+        elif kind < 0.35:
+            esper.add_component(ent, isVinedComponent(2.0))
+        elif kind < 0.5:
+            esper.add_component(ent, SpeKamikazeComponent(is_active=rng.random() < 0.5, speed_multiplier=rng.choice([1.5, 2.0])))
+        entities.append(ent)
+    return entities
+
+
+def _trajectory(batch, seed, ticks, dt):
+    """Positions et vitesses de chaque entité à chaque tick, par lot ou entité par entité."""
+    esper.clear_database()
+    rng = random.Random(seed)
+    processor = MovementProcessor()
+    processor.batch_min_entities = 0 if batch else float("inf")
+    entities = _populate(rng, processor)
+    frames = []
+    for tick in range(ticks):
+        # Pilotage pseudo-aléatoire identique dans les deux exécutions
+        for ent in entities:
+            pos = esper.component_for_entity(ent, PositionComponent)
+            pos.direction += rng.uniform(-15, 15)
+            if rng.random() < 0.05:
+                esper.component_for_entity(ent, VelocityComponent).currentSpeed = rng.uniform(-3, 8)
+        processor.process(dt=dt)
+        frames.append([
+            (esper.component_for_entity(ent, PositionComponent).x,
+             esper.component_for_entity(ent, PositionComponent).y,
+             esper.component_for_entity(ent, VelocityComponent).currentSpeed,
+             esper.component_for_entity(ent, VelocityComponent).terrain_modifier)
+            for ent in entities
+        ])
+    return frames
+
+
+@pytest.mark.unit
+class TestVectorizedMovement:
+    """Le traitement par lot reproduit exactement le calcul entité par entité."""
+
+    @pytest.mark.parametrize("seed,dt", [(1, None), (2, 1.0 / 60), (3, 1.0 / 144), (4, 1.0 / 30)])
+    def test_matches_legacy_trajectories(self, world, seed, dt):
+        expected = _trajectory(False, seed, ticks=60, dt=dt)
+        actual = _trajectory(True, seed, ticks=60, dt=dt)
+        # Égalité exacte, pas approx : mêmes opérations flottantes dans le même ordre
+        assert actual == expected
+
+    def test_empty_world_is_a_no_op(self, world):
+        processor = MovementProcessor()
+        processor.batch_min_entities = 0
+        processor.process(dt=1.0 / 60)
+
+    @pytest.mark.parametrize("batch_min_entities", [0, float("inf")])
+    def test_projectiles_and_bandits_leave_the_map_troops_stop(self, world, batch_min_entities):
+        processor = MovementProcessor()
+        processor.batch_min_entities = batch_min_entities
+        y = processor.world_height / 2
+        troop = esper.create_entity(PositionComponent(40, y, 0), VelocityComponent(20.0, terrain_modifier=1.0))
+        bullet = esper.create_entity(PositionComponent(40, y, 0), VelocityComponent(20.0, terrain_modifier=1.0),
+                                     ProjectileComponent("bullet"))
+        bandit = esper.create_entity(PositionComponent(40, y, 0), VelocityComponent(20.0), Bandits())
+
+        processor.process()
+
+        assert esper.component_for_entity(troop, PositionComponent).x == processor.boundary_margin
+        assert esper.component_for_entity(troop, VelocityComponent).currentSpeed == 0.0
+        assert esper.component_for_entity(bullet, PositionComponent).x == pytest.approx(20.0)
+        assert esper.component_for_entity(bandit, PositionComponent).x == pytest.approx(20.0)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Tests du service de navigation partagé (src/managers/navigation.py) :
+noyau A*, profils de déplacement, cache de chemins, adaptateurs des IA
+et planification hiérarchique des grandes cartes
+"""
+
+import dataclasses
+
+import numpy as np
+import pytest
+
+from src.constants.map_tiles import TileType
+from src.ia.leviathan.pathfinding import Pathfinder
+from src.managers.navigation import (_MAX_GRIDS, DRUID, KAMIKAZE, LEVIATHAN, NavigationProfile, NavigationService,
+                                     _astar, build_cost, simplify_cells)
+from src.managers.navigation_hierarchy import SectorGraph
+from src.settings.settings import TILE_SIZE
+
+SEA, ISLAND, MINE = int(TileType.SEA), int(TileType.GENERIC_ISLAND), int(TileType.MINE)
+
+
+def _grid(width=10, height=10, walls=()):
+    grid = [[SEA] * width for _ in range(height)]
+    for x, y in walls:
+        grid[y][x] = ISLAND
+    return grid
+
+
+def _length(cells):
+    return sum(np.hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(cells, cells[1:]))
+
+
+@pytest.fixture
+def service():
+    return NavigationService()
+
+
+@pytest.mark.unit
+class TestSearch:
+    """Le noyau compilé rend un plus court chemin qui évite les cases bloquées."""
+
+    def test_straight_and_diagonal_paths(self, service):
+        grid = _grid()
+        assert service.find_cells(grid, DRUID, (0, 0), (9, 0)) == [(x, 0) for x in range(10)]
+        assert service.find_cells(grid, DRUID, (0, 0), (5, 5)) == [(i, i) for i in range(6)]
+
+    def test_detour_around_a_wall(self, service):
+        wall = [(5, y) for y in range(9)]
+        cells = service.find_cells(_grid(walls=wall), DRUID, (0, 0), (9, 0))
+        assert cells[0] == (0, 0) and cells[-1] == (9, 0)
+        assert not set(cells) & set(wall)
+        # Passage obligé par (5, 9) : 5 diagonales + 4 cases droites, puis 4 diagonales + 5 cases droites
+        assert (5, 9) in cells
+        assert _length(cells) == pytest.approx(9 * np.sqrt(2) + 9)
+        for a, b in zip(cells, cells[1:]):
+            assert max(abs(b[0] - a[0]), abs(b[1] - a[1])) == 1
+
+    def test_no_path_when_enclosed(self, service):
+        ring = [(x, y) for x in range(3, 8) for y in range(3, 8) if x in (3, 7) or y in (3, 7)]
+        assert service.find_cells(_grid(walls=ring), DRUID, (0, 0), (5, 5), snap=False) == []
+
+    def test_four_neighbour_profile_moves_along_axes(self, service):
+        cells = service.find_cells(_grid(), dataclasses.replace(KAMIKAZE, inflated_tiles=()), (0, 0), (4, 4))
+        assert len(cells) == 9
+        for a, b in zip(cells, cells[1:]):
+            assert abs(b[0] - a[0]) + abs(b[1] - a[1]) == 1
+
+
+@pytest.mark.unit
+class TestProfiles:
+    """Chaque classe d'unité a ses propres coûts sur la même grille."""
+
+    def test_inflated_tiles_block_a_margin(self):
+        tiles = np.asarray(_grid(walls=[(5, 5)]), dtype=np.int8)
+        cost = build_cost(tiles, KAMIKAZE)
+        assert np.isinf(cost[3:8, 3:8]).all()
+        assert np.isfinite(cost[2, 5]) and np.isfinite(cost[5, 8])
+
+    def test_weights_margin_border_and_sub_tiles(self):
+        tiles = np.asarray(_grid(walls=[(5, 5)]), dtype=np.int8)
+        tiles[0, 0] = int(TileType.CLOUD)
+        profile = NavigationProfile("test", sub_tile_factor=2, blocked_tiles=(ISLAND,), margin_radius=1,
+                                    margin_weight=9.0, tile_weights=((int(TileType.CLOUD), 3.0),), border_radius=1)
+        cost = build_cost(tiles, profile)
+        assert cost.shape == (20, 20) and cost.dtype == np.float32
+        assert np.isinf(cost[10:12, 10:12]).all()
+        assert cost[9, 10] == 9.0 and cost[12, 12] == 9.0 and cost[13, 13] == 1.0
+        assert np.isinf(cost[0]).all() and np.isinf(cost[:, -1]).all()
+        assert cost[1, 1] == 3.0
+
+    def test_profiles_disagree_on_mines(self, service):
+        grid = _grid()
+        grid[0][5] = MINE
+        assert (5, 0) in service.find_cells(grid, DRUID, (0, 0), (9, 0))
+        assert (5, 0) not in service.find_cells(grid, LEVIATHAN, (0, 0), (9, 0))
+
+
+@pytest.mark.unit
+class TestPathCache:
+    """Un seul cache de chemins, invalidé quand une tuile change."""
+
+    def test_repeated_request_is_served_from_cache(self, service):
+        grid = _grid()
+        first = service.find_cells(grid, DRUID, (0, 0), (9, 9))
+        second = service.find_cells(grid, DRUID, (0, 0), (9, 9))
+        assert first == second
+        assert (service.searches, service.cache_hits) == (1, 1)
+        service.find_cells(grid, dataclasses.replace(DRUID, cache_ttl=0.0), (0, 0), (9, 9))
+        assert service.searches == 2
+
+    def test_layer_without_key_is_not_cached(self, service):
+        grid = _grid()
+        layer = np.zeros((10, 10), dtype=np.float32)
+        service.find_cells(grid, DRUID, (0, 0), (9, 9), layer=layer)
+        service.find_cells(grid, DRUID, (0, 0), (9, 9), layer=layer)
+        service.find_cells(grid, DRUID, (0, 0), (9, 9), layer=layer, layer_key="calm")
+        service.find_cells(grid, DRUID, (0, 0), (9, 9), layer=layer, layer_key="calm")
+        assert (service.searches, service.cache_hits) == (3, 1)
+
+    def test_set_tile_invalidates_costs_and_paths(self, service):
+        grid = _grid()
+        assert (4, 0) in service.find_cells(grid, DRUID, (0, 0), (9, 0))
+        grid[0][4] = ISLAND
+        service.set_tile(grid, 4, 0, ISLAND)
+        assert (4, 0) not in service.find_cells(grid, DRUID, (0, 0), (9, 0))
+        assert service.cache_hits == 0
+
+    def test_evicted_grid_drops_its_paths_and_fields(self, service):
+        grids = [_grid() for _ in range(_MAX_GRIDS + 1)]
+        service.find_cells(grids[0], DRUID, (0, 0), (9, 9))
+        service.route_cells(grids[0], DRUID, (0, 0), (9, 9))
+        serial = service.grid(grids[0]).serial
+        for grid in grids[1:]:
+            service.grid(grid)
+        assert not any(key[0] == serial for key in (*service._cache, *service._fields))
+        # Une grille suivie à nouveau reçoit un nouveau numéro : rien de l'ancienne ne lui est servi
+        assert service.grid(grids[0]).serial != serial
+
+    def test_frame_counters(self, service):
+        service.find_cells(_grid(), DRUID, (0, 0), (9, 9))
+        assert service.frame_requests == 1 and service.frame_time > 0
+        service.begin_frame()
+        assert service.last_frame_requests == 1 and service.frame_requests == 0
+
+
+@pytest.mark.unit
+class TestSnapAndAdapters:
+    """Départ ou arrivée bloqués, conversions monde/grille des IA."""
+
+    def test_blocked_goal_and_start_are_snapped(self, service):
+        grid = _grid(walls=[(5, 5), (0, 0)])
+        cells = service.find_cells(grid, DRUID, (0, 0), (5, 5))
+        assert cells[0] == (0, 0)  # La case de départ reste la première
+        assert cells[-1] != (5, 5) and max(abs(cells[-1][0] - 5), abs(cells[-1][1] - 5)) == 1
+
+    def test_world_path_keeps_corners_only(self, service):
+        assert simplify_cells([(0, 0), (1, 0), (2, 0), (3, 1), (4, 2)]) == [(0, 0), (2, 0), (4, 2)]
+        path = service.find_path(_grid(), DRUID, (0.5 * TILE_SIZE, 0.5 * TILE_SIZE), (9.5 * TILE_SIZE, 0.5 * TILE_SIZE))
+        assert path == [(0.5 * TILE_SIZE, 0.5 * TILE_SIZE), (9.5 * TILE_SIZE, 0.5 * TILE_SIZE)]
+
+    def test_leviathan_dynamic_obstacles(self):
+        grid = _grid(walls=[(5, 5)])
+        pathfinder = Pathfinder(grid, TILE_SIZE)
+        # Îles et mines bloquent avec une marge d'une tuile dans le profil, pas dans la couche de la requête
+        assert NavigationService().grid(grid).blocked_cells(LEVIATHAN) == [(x, y) for y in (4, 5, 6) for x in (4, 5, 6)]
+        pathfinder.dynamic_obstacles = [(4.5 * TILE_SIZE, 0.5 * TILE_SIZE, TILE_SIZE * 1.2)]
+        path = pathfinder.findPath((0.5 * TILE_SIZE, 0.5 * TILE_SIZE), (9.5 * TILE_SIZE, 0.5 * TILE_SIZE))
+        assert path and path[-1] == (9.5 * TILE_SIZE, 0.5 * TILE_SIZE)
+        assert len(path) > 2  # Contourne la tempête au lieu de suivre la ligne 0
+        # Une tempête qui se déplace dans les mêmes cases donne la même clé de requête
+        moved = [(4.6 * TILE_SIZE, 0.4 * TILE_SIZE, TILE_SIZE * 1.2)]
+        assert pathfinder.obstacleCells(moved) == pathfinder.obstacleCells(pathfinder.dynamic_obstacles)
+        assert pathfinder.obstacleCells(moved) != pathfinder.obstacleCells([(7.5 * TILE_SIZE, 0.5 * TILE_SIZE, TILE_SIZE)])
+
+
+@pytest.mark.unit
+class TestFlowField:
+    """Un champ de flux par destination commune, relu par toutes les unités."""
+
+    def test_route_matches_astar_cost(self, service):
+        grid = _grid(walls=[(5, y) for y in range(9)])
+        for start in ((0, 0), (2, 7), (9, 9)):
+            route = service.route_cells(grid, DRUID, start, (9, 0))
+            assert route[0] == start and route[-1] == (9, 0)
+            assert _length(route) == pytest.approx(_length(service.find_cells(grid, DRUID, start, (9, 0))))
+        assert service.field_builds == 1
+
+    def test_field_rebuilt_only_when_a_tile_changes(self, service):
+        grid = _grid()
+        service.route_cells(grid, DRUID, (0, 0), (9, 9))
+        service.route_cells(grid, DRUID, (3, 0), (9, 9))
+        assert service.field_builds == 1
+        grid[5][5] = ISLAND
+        service.set_tile(grid, 5, 5, ISLAND)
+        assert (5, 5) not in service.route_cells(grid, DRUID, (0, 0), (9, 9))
+        assert service.field_builds == 2
+
+    def test_blocked_target_is_snapped(self, service):
+        grid = _grid(walls=[(x, y) for x in range(7, 10) for y in range(7, 10)])
+        field = service.flow_field(grid, DRUID, (8, 8))
+        assert field.target == (8, 6)  # Case libre la plus proche (première dans l'ordre des lignes)
+        assert service.route_cells(grid, DRUID, (0, 0), (8, 8))[-1] == field.target
+
+    def test_layer_on_the_route_falls_back_to_astar(self, service):
+        grid = _grid()
+        layer = np.zeros((10, 10), dtype=np.float32)
+        layer[9, :5] = np.inf  # Tempête au début de la ligne 9, hors du chemin diagonal
+        assert service.route_cells(grid, DRUID, (0, 0), (9, 9), layer=layer, layer_key="storm") == \
+            [(i, i) for i in range(10)]
+        assert service.searches == 0
+        layer[5, 5] = np.inf
+        route = service.route_cells(grid, DRUID, (0, 0), (9, 9), layer=layer, layer_key="storm")
+        assert (5, 5) not in route and route[-1] == (9, 9)
+        assert service.searches == 1
+
+
+def _large_grid(size=130):
+    """Carte au-dessus de NAVIGATION_HIERARCHY_MIN_CELLS : murs percés d'une ouverture tous les 20 cases."""
+    grid = _grid(size, size)
+    for x in range(20, size, 20):
+        gap = (x * 7) % (size - 10) + 5
+        for y in range(size):
+            if abs(y - gap) > 1:
+                grid[y][x] = ISLAND
+    return grid
+
+
+def _cost_of(cost, cells):
+    return sum((1.414 if a[0] != b[0] and a[1] != b[1] else 1.0) * cost[b[1], b[0]] for a, b in zip(cells, cells[1:]))
+
+
+@pytest.mark.unit
+class TestHierarchy:
+    """Grandes cartes : graphe de secteurs, détaillé près de l'unité et mis à jour localement."""
+
+    def test_path_is_valid_and_close_to_flat_astar(self, service):
+        grid = _large_grid()
+        nav = service.grid(grid)
+        cost = nav.cost(DRUID)
+        cells = nav.hierarchy(DRUID).find(cost, (2, 3), (127, 120))
+        assert cells[0] == (2, 3) and cells[-1] == (127, 120)
+        for a, b in zip(cells, cells[1:]):
+            assert max(abs(b[0] - a[0]), abs(b[1] - a[1])) == 1 and np.isfinite(cost[b[1], b[0]])
+        flat, _ = _astar(cost, 2, 3, 127, 120, True, 1.414, 1.0, 0)
+        assert _cost_of(cost, cells) <= 1.15 * _cost_of(cost, [tuple(cell) for cell in flat.tolist()])
+
+    def test_service_refines_every_leg(self, service):
+        grid = _large_grid()
+        cells = service.find_cells(grid, DRUID, (2, 3), (127, 120))
+        assert cells[0] == (2, 3) and cells[-1] == (127, 120)
+        assert DRUID in service.grid(grid)._hierarchies
+        assert all(max(abs(b[0] - a[0]), abs(b[1] - a[1])) == 1 for a, b in zip(cells, cells[1:]))
+
+    def test_failed_leg_gives_no_path(self, service):
+        grid = _large_grid()
+        layer = np.zeros((130, 130), dtype=np.float32)
+        layer[:, 100] = np.inf  # Mur de la couche : le graphe le traverse, aucune étape ne peut le franchir
+        assert service.find_cells(grid, DRUID, (2, 3), (127, 120), layer=layer, layer_key="wall") == []
+        assert not service._cache
+
+    def test_set_tile_updates_the_sectors_around_it(self, service):
+        grid = _large_grid()
+        nav = service.grid(grid)
+        nav.hierarchy(KAMIKAZE)
+        grid[60][50] = MINE
+        service.set_tile(grid, 50, 60, MINE)
+        updated = nav.hierarchy(KAMIKAZE)
+        rebuilt = SectorGraph(nav.cost(KAMIKAZE), KAMIKAZE.diagonal, KAMIKAZE.diagonal_cost)
+        assert updated.version == nav.version
+        assert np.array_equal(updated.cells, rebuilt.cells) and np.array_equal(updated.indptr, rebuilt.indptr)
+        order_a = np.lexsort((updated.weights, updated.indices))
+        order_b = np.lexsort((rebuilt.weights, rebuilt.indices))
+        assert np.allclose(updated.weights[order_a], rebuilt.weights[order_b])
+
+    def test_small_maps_stay_flat(self, service):
+        grid = _grid(45, 45)
+        service.find_cells(grid, DRUID, (0, 0), (44, 44))
+        assert not service.grid(grid)._hierarchies
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests de l'ordonnanceur global des requêtes de chemin (src/managers/path_scheduler.py) :
+priorités, budget par frame, fusion des requêtes identiques, annulation et latences
+"""
+
+import pytest
+
+from src.components.core.positionComponent import PositionComponent
+from src.managers.path_scheduler import PathScheduler
+
+
+def _job(log, name):
+    def compute():
+        log.append(name)
+        return [name]
+    return compute
+
+
+@pytest.fixture
+def scheduler():
+    # Budget nul : rien n'est servi pendant submit, run(minimum=...) sert la file à la demande
+    return PathScheduler(budget_ms=0.0)
+
+
+@pytest.mark.unit
+class TestPriorities:
+    """Unités sélectionnées, puis à l'écran, puis hors écran ; l'urgence départage."""
+
+    def test_selected_then_visible_then_offscreen(self, world, scheduler):
+        offscreen = world.create_entity(PositionComponent(5000, 5000))
+        visible = world.create_entity(PositionComponent(100, 100))
+        selected = world.create_entity(PositionComponent(6000, 6000))
+        scheduler.begin_frame((selected,), (0, 0, 800, 600))
+        log = []
+        for entity, name in ((offscreen, "offscreen"), (visible, "visible"), (selected, "selected")):
+            scheduler.submit(_job(log, name), entity=entity)
+        scheduler.submit(_job(log, "urgent"), entity=offscreen, urgency=5.0)
+        assert scheduler.run(minimum=10) == 4
+        assert log == ["selected", "visible", "urgent", "offscreen"]
+
+    def test_new_frame_reorders_pending_requests(self, world, scheduler):
+        first = world.create_entity(PositionComponent(100, 100))
+        second = world.create_entity(PositionComponent(100, 100))
+        log = []
+        scheduler.submit(_job(log, "first"), entity=first)
+        scheduler.submit(_job(log, "second"), entity=second)
+        scheduler.begin_frame((second,))
+        scheduler.run(minimum=10)
+        assert log == ["second", "first"]
+
+
+@pytest.mark.unit
+class TestBudget:
+    """Le budget de la frame borne le travail ; le reste attend la frame suivante."""
+
+    def test_budget_defers_requests(self, scheduler):
+        log = []
+        for name in "abc":
+            scheduler.submit(_job(log, name))
+        assert log == [] and scheduler.pending == 3
+        assert scheduler.run(minimum=1) == 1 and log == ["a"]
+        assert scheduler.run(minimum=1, max_jobs=1) == 1 and scheduler.pending == 1
+
+    def test_submit_serves_at_once_while_budget_lasts(self):
+        scheduler = PathScheduler(budget_ms=1000.0)
+        results = []
+        scheduler.submit(lambda: [(0, 0), (1, 1)], on_done=results.append)
+        assert results == [[(0, 0), (1, 1)]] and scheduler.pending == 0
+        assert scheduler.frame_served == 1
+        scheduler.begin_frame()
+        assert scheduler.frame_served == 0 and scheduler.frame_time == 0.0
+
+
+@pytest.mark.unit
+class TestCoalescingAndCancel:
+    """Une seule recherche pour les requêtes identiques ; une requête annulée n'est jamais servie."""
+
+    def test_identical_requests_share_one_search(self, scheduler):
+        log, results = [], []
+        scheduler.submit(_job(log, "path"), key=("druid", (0, 0), (5, 5)), on_done=results.append)
+        scheduler.submit(_job(log, "other"), key=("druid", (0, 0), (5, 5)), on_done=results.append)
+        scheduler.run(minimum=10)
+        assert log == ["path"] and results == [["path"], ["path"]]
+        assert results[0] is not results[1]  # Chaque unité reçoit sa propre liste
+        assert scheduler.coalesced == 1
+
+    def test_cancelled_requests_are_dropped(self, scheduler):
+        log, results = [], []
+        kept = scheduler.submit(_job(log, "shared"), key="k", on_done=results.append)
+        dropped = scheduler.submit(_job(log, "shared"), key="k", on_done=lambda path: results.append("dropped"))
+        alone = scheduler.submit(_job(log, "alone"))
+        scheduler.cancel(dropped)
+        scheduler.cancel(alone)
+        assert scheduler.is_pending(kept) and not scheduler.is_pending(alone)
+        scheduler.run(minimum=10)
+        assert log == ["shared"] and results == [["shared"]]
+
+    def test_cancelled_key_can_be_requested_again(self, scheduler):
+        log = []
+        scheduler.cancel(scheduler.submit(_job(log, "old"), key="k"))
+        scheduler.submit(_job(log, "new"), key="k")
+        scheduler.run(minimum=10)
+        assert log == ["new"]
+
+    def test_failures_leave_no_request_pending(self, scheduler):
+        def failing():
+            raise ZeroDivisionError
+
+        def broken_callback(path):
+            raise RuntimeError("callback")
+
+        results = []
+        failed = scheduler.submit(failing, key="fail", on_done=results.append)
+        first = scheduler.submit(_job([], "shared"), key="k", on_done=broken_callback)
+        second = scheduler.submit(_job([], "shared"), key="k", on_done=results.append)
+        scheduler.frame_time = 1.0  # Budget épuisé : seul minimum compte
+        assert scheduler.run(minimum=10) == 2
+        assert not any(scheduler.is_pending(request) for request in (failed, first, second))
+        assert scheduler.pending == 0
+        assert results == [[], ["shared"]]  # Recherche en échec : aucun chemin ; second rappel servi malgré le premier
+
+
+@pytest.mark.unit
+def test_latency_percentiles(scheduler):
+    assert scheduler.latency_percentiles((50, 99)) == {50: 0.0, 99: 0.0}
+    for name in "abcd":
+        scheduler.submit(_job([], name))
+    scheduler.run(minimum=10)
+    latency = scheduler.latency_percentiles((50, 99))
+    assert 0.0 < latency[50] <= latency[99]
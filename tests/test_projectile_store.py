@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Tests du stockage en colonnes des balles (src/managers/projectile_store.py)
+"""
+
+import pytest
+
+import esper
+from src.managers.projectile_store import ProjectileStore, projectile_store
+from src.managers.sprite_manager import SpriteID
+from src.processeurs.collisionProcessor import CollisionProcessor
+from src.processeurs.movementProcessor import MovementProcessor
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.velocityComponent import VelocityComponent
+from src.components.core.spriteComponent import SpriteComponent
+from src.components.core.canCollideComponent import CanCollideComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.healthComponent import HealthComponent
+from src.components.core.attackComponent import AttackComponent
+from src.components.core.baseComponent import BaseComponent
+from src.components.core.projectileComponent import ProjectileComponent
+from src.components.events.banditsComponent import Bandits
+from src.constants.collision_layers import CollisionLayer
+
+
+def _spawn(store, x=100.0, y=100.0, direction=0.0, speed=10.0, team_id=1, damage=10, owner=None, **kwargs):
+    kwargs.setdefault("lifetime", 1.0)
+    return store.spawn(x=x, y=y, direction=direction, speed=speed, team_id=team_id, damage=damage, owner=owner,
+                       sprite_id=SpriteID.PROJECTILE_BULLET, width=10, height=10, **kwargs)
+
+
+def _target(x=100.0, y=100.0, team_id=2, health=100, layer=CollisionLayer.UNIT):
+    return esper.create_entity(
+        PositionComponent(x, y), SpriteComponent(width=40, height=40),
+        CanCollideComponent(layer=layer), TeamComponent(team_id), HealthComponent(health, health),
+    )
+
+
+@pytest.mark.unit
+class TestProjectileStoreSlots:
+    """Allocation, déplacement et durée de vie des balles."""
+
+    def test_released_slots_are_reused_and_pool_grows(self):
+        store = ProjectileStore(capacity=2)
+        slots = [_spawn(store) for _ in range(5)]
+        assert len(set(slots)) == 5 and len(store) == 5
+
+        store.kill(slots[1])
+        assert len(store) == 5  # suppression différée, comme esper.delete_entity
+        store.flush_dead()
+        assert len(store) == 4
+        assert _spawn(store) == slots[1]
+
+    def test_integrate_matches_entity_movement(self, world):
+        store = ProjectileStore()
+        for direction, speed, modifier in ((0.0, 12.0, 1.0), (37.5, 9.0, 1.0), (210.0, 15.0, 0.0)):
+            slot = _spawn(store, direction=direction, speed=speed, terrain_modifier=modifier)
+            ent = esper.create_entity(PositionComponent(100.0, 100.0, direction),
+                                      VelocityComponent(speed, speed, 0.0, modifier),
+                                      ProjectileComponent("bullet"))
+            pos = esper.component_for_entity(ent, PositionComponent)
+            velocity = esper.component_for_entity(ent, VelocityComponent)
+
+            store.integrate(0.75)
+            MovementProcessor()._move_entity(ent, velocity, pos, 0.75)
+
+            assert store.column("x")[slot] == pos.x
+            assert store.column("y")[slot] == pos.y
+
+    def test_expired_bullets_are_released(self):
+        store = ProjectileStore()
+        short = _spawn(store, lifetime=0.1)
+        long = _spawn(store, lifetime=1.0)
+
+        store.expire(0.2)
+
+        assert store.live_slots().tolist() == [long]
+        assert store.column("lifetime")[long] == pytest.approx(0.8)
+        assert short not in store.live_slots().tolist()
+
+
+@pytest.mark.unit
+class TestProjectileCollisions:
+    """Les balles du store suivent les règles des anciennes entités projectiles."""
+
+    def test_bullet_damages_target_once(self, world):
+        target = _target()
+        ally = _target(x=400, team_id=1)
+        _spawn(projectile_store, damage=15)
+        _spawn(projectile_store, x=400, damage=15)  # même équipe : ignorée
+
+        processor = CollisionProcessor()
+        processor._process_entity_collisions()
+        assert len(projectile_store) == 1  # balle libérée après l'impact
+        processor._process_entity_collisions()
+
+        assert esper.component_for_entity(target, HealthComponent).currentHealth == 85
+        assert esper.component_for_entity(ally, HealthComponent).currentHealth == 100
+        assert projectile_store.column("x")[projectile_store.live_slots()].tolist() == [400]
+
+    def test_mines_and_bandits(self, world):
+        mine = esper.create_entity(
+            PositionComponent(100, 100), SpriteComponent(width=40, height=40),
+            CanCollideComponent(layer=CollisionLayer.MINE), TeamComponent(0),
+            HealthComponent(1, 1), AttackComponent(40),
+        )
+        bandit = _target(x=500, team_id=0, layer=CollisionLayer.UNIT)
+        esper.add_component(bandit, Bandits())
+        _spawn(projectile_store, x=100)
+        _spawn(projectile_store, x=500)
+
+        CollisionProcessor()._process_entity_collisions()
+
+        # La mine reste intacte, la balle est détruite ; le bandit est invulnérable
+        assert esper.component_for_entity(mine, HealthComponent).currentHealth == 1
+        assert esper.component_for_entity(bandit, HealthComponent).currentHealth == 100
+        assert projectile_store.column("x")[projectile_store.live_slots()].tolist() == [500]
+
+    def test_bandit_bullets_spare_bases(self, world):
+        bandit = esper.create_entity(Bandits())
+        base = _target(team_id=2)
+        esper.add_component(base, BaseComponent())
+        _spawn(projectile_store, owner=bandit, team_id=1)
+
+        CollisionProcessor()._process_entity_collisions()
+
+        assert esper.component_for_entity(base, HealthComponent).currentHealth == 100
+        assert len(projectile_store) == 1
+
+    def test_bullets_destroy_each_other(self, world):
+        _spawn(projectile_store, team_id=1, health=1)
+        _spawn(projectile_store, x=104, team_id=2, health=1)
+
+        CollisionProcessor()._process_entity_collisions()
+
+        assert len(projectile_store) == 0
+
+    def test_terrain_pass_releases_first_tick_stall(self, world):
+        slot = _spawn(projectile_store)
+        assert projectile_store.column("terrain_modifier")[slot] == 0.0
+
+        CollisionProcessor(graph=[[0, 2], [1, 0]])._process_terrain_collisions()
+
+        assert projectile_store.column("terrain_modifier")[slot] == 1.0
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Tests de l'interface retenue (src/ui/retained_layer.py) : ActionBar, boutique,
+notifications et tutoriel ne redessinent leurs surfaces que si leur état change
+"""
+
+import pygame
+import pytest
+
+from src.components.core.baseComponent import BaseComponent
+from src.ui.action_bar import ActionBar
+from src.ui.boutique import ShopFaction, UnifiedShop
+from src.ui.notification_system import NotificationSystem, NotificationType
+from src.ui.retained_layer import RetainedLayer
+from src.ui.tutorial_notification import TutorialNotification
+
+WINDOW_SIZE = (800, 600)
+
+
+def _background():
+    """Écran avec un motif, pour vérifier le mélange des parties semi-transparentes."""
+    surface = pygame.Surface(WINDOW_SIZE)
+    for x in range(0, WINDOW_SIZE[0], 40):
+        surface.fill((20 + x % 200, 90, 160), (x, 0, 40, WINDOW_SIZE[1]))
+    return surface
+
+
+def _max_difference(first, second):
+    first_bytes, second_bytes = pygame.image.tobytes(first, "RGB"), pygame.image.tobytes(second, "RGB")
+    return max(abs(a - b) for a, b in zip(first_bytes, second_bytes))
+
+
+@pytest.mark.unit
+class TestRetainedLayer:
+    """Rendu seulement au changement de clé, puis un simple blit."""
+
+    def test_renders_only_when_key_or_rect_changes(self):
+        layer = RetainedLayer()
+        target = pygame.Surface(WINDOW_SIZE)
+        calls = []
+
+        def render(surface):
+            calls.append(1)
+            surface.fill((200, 10, 10), (10, 10, 30, 30))
+
+        for key in ("a", "a", "b", "b"):
+            layer.draw(target, pygame.Rect(0, 0, 100, 100), key, render)
+        layer.draw(target, pygame.Rect(0, 0, 50, 50), "b", render)
+
+        assert len(calls) == layer.renders == 3
+        assert target.get_at((20, 20))[:3] == (200, 10, 10)
+        layer.invalidate()
+        layer.draw(target, pygame.Rect(0, 0, 50, 50), "b", render)
+        assert layer.renders == 4
+
+    def test_drawing_outside_the_rect_is_discarded(self):
+        layer = RetainedLayer()
+        target = pygame.Surface(WINDOW_SIZE)
+        layer.draw(target, pygame.Rect(0, 0, 20, 20), 1, lambda surface: surface.fill((255, 255, 255)))
+
+        assert target.get_at((10, 10))[:3] == (255, 255, 255)
+        assert target.get_at((30, 30))[:3] == (0, 0, 0)
+
+
+@pytest.mark.unit
+class TestRetainedWidgets:
+    """Les widgets retenus donnent les pixels du dessin direct."""
+
+    def test_action_bar_matches_direct_drawing(self, world):
+        BaseComponent.reset()
+        action_bar = ActionBar(*WINDOW_SIZE)
+        retained, direct = _background(), _background()
+
+        action_bar.draw(_background())
+        action_bar.draw(retained)
+        action_bar._draw_bar(direct)
+
+        assert action_bar._bar_layer.renders == 1
+        assert _max_difference(retained, direct) <= 2
+
+        action_bar.hovered_button = 0
+        action_bar.draw(retained)
+        assert action_bar._bar_layer.renders == 2
+
+    def test_tooltip_is_rendered_once_per_text(self, world):
+        BaseComponent.reset()
+        action_bar = ActionBar(*WINDOW_SIZE)
+        action_bar.tooltip_text = "Scout\nRapide"
+        surface = _background()
+
+        action_bar.draw(surface)
+        tooltip = action_bar._tooltip_surface
+        action_bar.draw(surface)
+
+        assert action_bar._tooltip_surface is tooltip
+        action_bar.tooltip_text = "Maraudeur"
+        action_bar.draw(surface)
+        assert action_bar._tooltip_surface is not tooltip
+
+    def test_shop_panel_matches_direct_drawing(self, world):
+        BaseComponent.reset()
+        shop = UnifiedShop(*WINDOW_SIZE, ShopFaction.ALLY)
+        shop.open()
+        retained, direct = _background(), _background()
+
+        shop.draw(_background())
+        shop.draw(retained)
+        direct.blit(shop._overlay, (0, 0))
+        shop._draw_panel(direct)
+
+        assert shop._panel_layer.renders == 1
+        # Ombre et fond semi-transparents empilés : arrondis du mélange alpha sur la toile
+        assert _max_difference(retained, direct) <= 8
+
+        shop.hovered_item_index = 0
+        shop.draw(retained)
+        assert shop._panel_layer.renders == 2
+
+    def test_notifications_are_rendered_again_only_while_fading(self):
+        notifications = NotificationSystem()
+        notifications.add_notification("Or insuffisant", NotificationType.WARNING, duration=1.0)
+        screen = _background()
+
+        notifications.render(screen)
+        surface = notifications.notifications[0].surface
+        notifications.update(0.1)
+        notifications.render(screen)
+        assert notifications.notifications[0].surface is surface
+
+        notifications.update(0.6)  # fade out
+        notifications.render(screen)
+        assert notifications.notifications[0].surface is not surface
+
+    def test_tutorial_notification_is_retained(self):
+        notification = TutorialNotification("Bienvenue", "Sélectionnez une unité.\nPuis déplacez-la.")
+        notification.set_position(*WINDOW_SIZE)
+        screen = _background()
+
+        notification.draw(screen)
+        notification.draw(screen)
+        assert notification._layer.renders == 1
+
+        notification.ok_button_hover = True
+        notification.draw(screen)
+        assert notification._layer.renders == 2
+        assert notification._get_ok_button_rect().bottom < notification.y + notification.height
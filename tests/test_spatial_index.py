@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests de l'index spatial partagé (src/managers/spatial_index.py)
+"""
+
+import math
+import random
+import pytest
+
+import esper
+import numpy as np
+
+from src.managers.spatial_index import SpatialIndex, candidate_pairs
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.healthComponent import HealthComponent
+from src.components.core.projectileComponent import ProjectileComponent
+
+
+def _scatter(rng, count=300, size=3000):
+    entities = []
+    for _ in range(count):
+        ent = esper.create_entity(
+            PositionComponent(rng.uniform(0, size), rng.uniform(0, size)),
+            TeamComponent(rng.randint(0, 2)),
+        )
+        if rng.random() < 0.5:
+            esper.add_component(ent, HealthComponent(10, 10))
+        entities.append(ent)
+    return entities
+
+
+def _xy(ent):
+    pos = esper.component_for_entity(ent, PositionComponent)
+    return pos.x, pos.y
+
+
+@pytest.mark.unit
+class TestSpatialIndexQueries:
+    """Les requêtes donnent le même résultat qu'un parcours complet des entités."""
+
+    @pytest.fixture
+    def index(self, world):
+        return SpatialIndex(cell_size=128, slack=16)
+
+    def test_radius_query_matches_brute_force(self, index):
+        rng = random.Random(1)
+        entities = _scatter(rng)
+        for _ in range(40):
+            x, y, radius = rng.uniform(0, 3000), rng.uniform(0, 3000), rng.uniform(10, 600)
+            found = sorted(ent for ent, _, _ in index.query_radius(x, y, radius, team_id=1, components=(HealthComponent,)))
+            expected = sorted(
+                ent for ent in entities
+                if esper.component_for_entity(ent, TeamComponent).team_id == 1
+                and esper.has_component(ent, HealthComponent)
+                and math.hypot(_xy(ent)[0] - x, _xy(ent)[1] - y) <= radius
+            )
+            assert found == expected
+
+    def test_rect_and_nearest_queries(self, index):
+        rng = random.Random(2)
+        entities = _scatter(rng)
+
+        found = sorted(ent for ent, _ in index.query_rect(500, 800, 1500, 1200, exclude_teams=(0,)))
+        expected = sorted(
+            ent for ent in entities
+            if esper.component_for_entity(ent, TeamComponent).team_id != 0
+            and 500 <= _xy(ent)[0] <= 1500 and 800 <= _xy(ent)[1] <= 1200
+        )
+        assert found == expected
+
+        nearest = index.query_nearest(1000, 1000, k=5, without=(HealthComponent,))
+        expected = sorted(
+            (math.hypot(_xy(ent)[0] - 1000, _xy(ent)[1] - 1000), ent)
+            for ent in entities if not esper.has_component(ent, HealthComponent)
+        )[:5]
+        assert [ent for ent, _, _ in nearest] == [ent for _, ent in expected]
+
+    def test_candidate_pairs_on_arrays(self):
+        rng = np.random.default_rng(4)
+        xs = rng.uniform(-100, 1000, 400)
+        ys = rng.uniform(-100, 1000, 400)
+        xs[:20] = 500.0  # points superposés dans une même cellule
+
+        first, second = candidate_pairs(xs, ys, 35, 20)
+        found = {tuple(sorted(pair)) for pair in zip(first.tolist(), second.tolist())}
+        expected = {
+            (i, j) for i in range(400) for j in range(i + 1, 400)
+            if abs(xs[i] - xs[j]) <= 35 and abs(ys[i] - ys[j]) <= 20
+        }
+        assert len(found) == first.size
+        assert found == expected
+
+    def test_candidate_pairs_skip_groups_that_never_interact(self):
+        rng = np.random.default_rng(5)
+        xs = rng.uniform(0, 300, 200)
+        ys = rng.uniform(0, 300, 200)
+        groups = rng.integers(0, 3, 200)
+        # groupe 0 : avec tout le monde ; groupe 1 : seulement avec 0 ; groupe 2 : avec personne
+        matrix = np.array([[True, True, False], [True, False, False], [False, False, False]])
+
+        first, second = candidate_pairs(xs, ys, 30, 30, groups, matrix)
+        found = {tuple(sorted(pair)) for pair in zip(first.tolist(), second.tolist())}
+        expected = {
+            (i, j) for i in range(200) for j in range(i + 1, 200)
+            if matrix[groups[i], groups[j]] and abs(xs[i] - xs[j]) <= 30 and abs(ys[i] - ys[j]) <= 30
+        }
+        assert len(found) == first.size
+        assert found == expected
+
+
+@pytest.mark.unit
+class TestSpatialIndexMaintenance:
+    """Mise à jour incrémentale de l'index."""
+
+    def test_moved_spawned_and_deleted_entities(self, world):
+        index = SpatialIndex(cell_size=100, slack=10)
+        mover = esper.create_entity(PositionComponent(50, 50), TeamComponent(1))
+        victim = esper.create_entity(PositionComponent(60, 60), TeamComponent(2))
+        index.refresh()
+
+        # Déplacement loin de la cellule d'origine, puis refresh explicite
+        esper.component_for_entity(mover, PositionComponent).x = 950
+        index.refresh()
+        assert [ent for ent, _, _ in index.query_radius(950, 50, 20)] == [mover]
+
+        # Création et suppression : l'index se resynchronise de lui-même
+        esper.delete_entity(victim, immediate=True)
+        bullet = esper.create_entity(PositionComponent(55, 55), ProjectileComponent("bullet"))
+        assert [ent for ent, _, _ in index.query_radius(50, 50, 50)] == [bullet]
+
+    def test_entities_pending_deletion_are_skipped_by_default(self, world):
+        index = SpatialIndex(cell_size=100, slack=10)
+        ent = esper.create_entity(PositionComponent(10, 10))
+        esper.delete_entity(ent)
+
+        assert index.query_radius(10, 10, 5) == []
+        assert [e for e, _, _ in index.query_radius(10, 10, 5, alive_only=False)] == [ent]
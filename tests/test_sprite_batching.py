@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests du rendu des sprites par listes (GameRenderer._render_sprites)
+"""
+
+from types import SimpleNamespace
+
+import pygame
+import pytest
+
+import esper
+from src.game import GameRenderer
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.spriteComponent import SpriteComponent
+from src.components.core.velocityComponent import VelocityComponent
+from src.components.core.healthComponent import HealthComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.lifetimeComponent import LifetimeComponent
+from src.components.core.playerSelectedComponent import PlayerSelectedComponent
+from src.components.globals.cameraComponent import Camera
+from src.systems.vision_system import vision_system
+
+
+class _RecordingWindow(pygame.Surface):
+    """Surface qui enregistre les listes soumises à blits()."""
+
+    def __init__(self, size):
+        super().__init__(size)
+        self.batches = []
+
+    def blits(self, blit_sequence, doreturn=True):
+        batch = list(blit_sequence)
+        self.batches.append(batch)
+        return super().blits(batch, doreturn=doreturn)
+
+
+def _sprite(color, size=20):
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+    surface.fill(color)
+    return SpriteComponent(image_path=f"test_{color}", width=size, height=size, surface=surface)
+
+
+def _renderer():
+    engine = SimpleNamespace(action_bar=SimpleNamespace(current_camp=1), self_play_mode=False, previous_positions={})
+    renderer = GameRenderer(engine)
+    renderer._interpolation_alpha = 1.0
+    camera = Camera(400, 300)
+    camera.zoom, camera.x, camera.y = 1.0, 0.0, 0.0
+    return renderer, camera
+
+
+@pytest.mark.unit
+class TestSpriteBatching:
+    """Un seul blits() pour les sprites, triés par couche, puis les surcouches."""
+
+    def test_sprites_are_drawn_once_in_layer_order(self, world):
+        esper.create_entity(PositionComponent(50, 50), _sprite((255, 0, 0, 255)), LifetimeComponent(1.0),
+                            TeamComponent(1))
+        esper.create_entity(PositionComponent(100, 50), _sprite((0, 255, 0, 255)), VelocityComponent(1.0),
+                            TeamComponent(1))
+        esper.create_entity(PositionComponent(150, 50), _sprite((0, 0, 255, 255)), TeamComponent(1))
+        renderer, camera = _renderer()
+        window = _RecordingWindow((400, 300))
+
+        renderer._render_sprites(window, camera)
+
+        assert len(window.batches) == 1
+        colors = [tuple(surface.get_at((10, 10)))[:3] for surface, _ in window.batches[0]]
+        assert colors == [(0, 0, 255), (0, 255, 0), (255, 0, 0)]  # décor, unités, effets
+        assert window.get_at((50, 50))[:3] == (255, 0, 0)
+
+    def test_overlays_are_separate_batches_over_sprites(self, world):
+        esper.create_entity(PositionComponent(100, 100), _sprite((0, 255, 0, 255), size=40), VelocityComponent(1.0),
+                            TeamComponent(1), HealthComponent(50, 100), PlayerSelectedComponent(1))
+        renderer, camera = _renderer()
+        window = _RecordingWindow((400, 300))
+
+        renderer._render_sprites(window, camera)
+
+        sprites, rings, bars = window.batches
+        assert len(sprites) == 1 and len(rings) == 1
+        assert len(bars) == 3  # fond, remplissage, bordure
+        # La barre de vie (au-dessus du sprite) est dessinée : remplissage orange à 50 %
+        bar_dest = bars[1][1]
+        assert window.get_at((bar_dest[0] + 2, bar_dest[1] + 4))[:3] == (255, 165, 0)
+
+    def test_hidden_enemy_is_not_queued(self, world):
+        vision_system.reset()
+        esper.create_entity(PositionComponent(100, 100), _sprite((0, 255, 0, 255)), TeamComponent(2))
+        renderer, camera = _renderer()
+        window = _RecordingWindow((400, 300))
+
+        renderer._render_sprites(window, camera)
+
+        assert window.batches == [[]]
+
+
+@pytest.mark.unit
+class TestSpriteCulling:
+    """Seules les entités proches du rectangle de la caméra sont examinées."""
+
+    def test_off_screen_entities_are_not_examined(self, world, monkeypatch):
+        on_screen = esper.create_entity(PositionComponent(100, 100), _sprite((0, 255, 0, 255)), TeamComponent(1))
+        esper.create_entity(PositionComponent(3000, 100), _sprite((255, 0, 0, 255)), TeamComponent(1))
+        esper.create_entity(PositionComponent(100, -2000), _sprite((255, 0, 0, 255)), TeamComponent(1))
+        renderer, camera = _renderer()
+        examined = []
+        queue_sprite = renderer._queue_sprite
+        monkeypatch.setattr(renderer, "_queue_sprite",
+                            lambda *args: examined.append(args[5]) or queue_sprite(*args))
+
+        renderer._render_sprites(pygame.Surface((400, 300)), camera)
+
+        assert examined == [on_screen]
+
+    def test_large_sprite_overlapping_the_edge_is_drawn(self, world):
+        # Position hors écran, mais l'image (300 px) déborde dans la fenêtre
+        esper.create_entity(PositionComponent(-120, 150), _sprite((0, 0, 255, 255), size=300), TeamComponent(1))
+        renderer, camera = _renderer()
+        window = _RecordingWindow((400, 300))
+
+        renderer._render_sprites(window, camera)
+
+        assert len(window.batches[0]) == 1
+        assert window.get_at((5, 150))[:3] == (0, 0, 255)
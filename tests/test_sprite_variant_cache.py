@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests du cache LRU des variantes de sprites (src/managers/sprite_variant_cache.py)
+"""
+
+import pygame
+import pytest
+
+from src.constants.gameplay import SPRITE_ZOOM_LEVELS
+from src.managers.sprite_variant_cache import (
+    ROTATION_BUCKETS,
+    SpriteVariantCache,
+    build_variant,
+    discrete_zoom,
+    rotation_bucket,
+)
+
+
+def _image(width=40, height=20):
+    image = pygame.Surface((width, height), pygame.SRCALPHA)
+    image.fill((200, 40, 40, 255))
+    pygame.draw.rect(image, (10, 200, 10, 255), (0, 0, width // 2, height // 2))
+    return image
+
+
+def _bytes(surface):
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+@pytest.mark.unit
+class TestSpriteVariantCache:
+    """LRU borné en octets, compteurs de succès et génération anticipée."""
+
+    def test_rotation_buckets_wrap_around(self):
+        assert rotation_bucket(0) == 0
+        assert rotation_bucket(7.4) == 0 and rotation_bucket(7.6) == 15
+        assert rotation_bucket(-15) == 345
+        assert rotation_bucket(360) == 0 and rotation_bucket(375) == 15
+        assert discrete_zoom(1.1) == 1.0 and discrete_zoom(9.0) == max(SPRITE_ZOOM_LEVELS)
+
+    def test_variant_matches_direct_transform(self):
+        image = _image()
+        cache = SpriteVariantCache()
+        variant = cache.get("unit", 40, 20, 1.5, 30, True, lambda: image)
+
+        expected = pygame.transform.rotate(pygame.transform.flip(pygame.transform.scale(image, (60, 30)), False, True), -30)
+        assert pygame.image.tobytes(variant, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+    def test_hits_and_misses(self):
+        image = _image()
+        cache = SpriteVariantCache()
+        loads = []
+
+        def load():
+            loads.append(1)
+            return image
+
+        first = cache.get("unit", 40, 20, 1.0, 45, False, load)
+        assert cache.get("unit", 40, 20, 1.0, 45, False, load) is first
+        cache.get("unit", 40, 20, 0.5, 45, False, load)
+
+        assert (cache.hits, cache.misses, len(loads)) == (1, 2, 2)
+        assert cache.hit_rate == pytest.approx(1 / 3)
+
+    def test_eviction_is_lru_and_bounded_by_bytes(self):
+        image = _image()
+        one = _bytes(build_variant(image, 40, 20, 2.0, 0, False))
+        cache = SpriteVariantCache(budget_bytes=2 * one)
+
+        cache.get("a", 40, 20, 2.0, 0, False, lambda: image)
+        cache.get("b", 40, 20, 2.0, 0, False, lambda: image)
+        cache.get("a", 40, 20, 2.0, 0, False, lambda: image)  # "a" devient le plus récent
+        cache.get("c", 40, 20, 2.0, 0, False, lambda: image)  # évince "b"
+
+        assert cache.bytes_used <= 2 * one
+        assert {key[0] for key in cache._variants} == {"a", "c"}
+
+    def test_prewarm_generates_every_variant(self):
+        image = _image()
+        cache = SpriteVariantCache(budget_bytes=1 << 40, prewarm=True)
+
+        cache.get("unit", 40, 20, 1.0, 0, False, lambda: image, reversable=True)
+
+        assert len(cache) == len(SPRITE_ZOOM_LEVELS) * ROTATION_BUCKETS * 2
+        cache.get("unit", 40, 20, 2.5, 345, True, lambda: None, reversable=True)
+        assert cache.misses == 1 and cache.hits == 1
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests du cache de blocs de terrain pré-rendus (src/managers/terrain_cache.py)
+"""
+
+import random
+
+import pygame
+import pytest
+
+from src.components.globals.cameraComponent import Camera
+from src.components.globals.mapComponent import afficher_tuiles
+from src.constants.map_tiles import TileType
+from src.managers.terrain_cache import TERRAIN_BACKGROUND, TerrainChunkCache
+from src.settings.settings import TILE_SIZE
+
+WINDOW_SIZE = (640, 400)
+
+
+def _image(seed, alpha):
+    """Image de tuile avec un motif (et une transparence variable pour les surcouches)."""
+    rng = random.Random(seed)
+    surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    for y in range(TILE_SIZE):
+        for x in range(TILE_SIZE):
+            surface.set_at((x, y), (rng.randrange(256), rng.randrange(256), rng.randrange(256),
+                                    rng.randrange(256) if alpha else 255))
+    return surface
+
+
+@pytest.fixture(scope="module")
+def images():
+    return {
+        'sea': _image(1, alpha=False),
+        'generic_island': _image(2, alpha=True),
+        'mine': _image(3, alpha=True),
+        'cloud': _image(4, alpha=True),
+    }
+
+
+def _grid(seed, width=21, height=17):
+    rng = random.Random(seed)
+    tiles = [int(TileType.SEA)] * 6 + [int(TileType.GENERIC_ISLAND), int(TileType.MINE), int(TileType.CLOUD),
+                                       int(TileType.ALLY_BASE)]
+    return [[rng.choice(tiles) for _ in range(width)] for _ in range(height)]
+
+
+def _camera(zoom, x, y):
+    camera = Camera(*WINDOW_SIZE)
+    camera.zoom = zoom
+    camera.x, camera.y = x, y
+    return camera
+
+
+def _frame(draw):
+    window = pygame.Surface(WINDOW_SIZE)
+    window.fill(TERRAIN_BACKGROUND)
+    draw(window)
+    return pygame.image.tobytes(window, "RGB")
+
+
+@pytest.mark.unit
+class TestTerrainChunkCache:
+    """Les blocs pré-rendus donnent les pixels du rendu tuile par tuile."""
+
+    @pytest.mark.parametrize("zoom,x,y", [
+        (1.0, 0.0, 0.0),
+        (0.75, 13.3, 41.7),
+        (1.25, 101.49, 0.5),
+        (0.5, -30.0, -12.25),
+        (1.37, 250.8, 77.1),
+        (2.5, 333.3, 222.2),
+    ])
+    def test_matches_tile_by_tile_renderer(self, images, zoom, x, y):
+        grid = _grid(7)
+        camera = _camera(zoom, x, y)
+        cache = TerrainChunkCache(chunk_tiles=4)
+
+        expected = _frame(lambda window: afficher_tuiles(window, grid, images, camera))
+        assert _frame(lambda window: cache.render(window, grid, images, camera)) == expected
+        # Deuxième frame servie par le cache
+        misses = cache.misses
+        assert _frame(lambda window: cache.render(window, grid, images, camera)) == expected
+        assert cache.misses == misses and cache.hits > 0
+
+    def test_frame_is_a_few_chunk_blits(self, images):
+        grid = _grid(3, width=45, height=45)
+        cache = TerrainChunkCache(chunk_tiles=8)
+        window = pygame.Surface(WINDOW_SIZE)
+
+        blits = cache.render(window, grid, images, _camera(1.0, 120.0, 90.0))
+
+        tiles_per_chunk = 8 * 8
+        visible_tiles = (WINDOW_SIZE[0] // TILE_SIZE + 2) * (WINDOW_SIZE[1] // TILE_SIZE + 2)
+        assert blits <= visible_tiles // tiles_per_chunk + 6
+
+    def test_changed_tile_redraws_its_chunk(self, images):
+        grid = _grid(5)
+        camera = _camera(1.0, 0.0, 0.0)
+        cache = TerrainChunkCache(chunk_tiles=4)
+        _frame(lambda window: cache.render(window, grid, images, camera))
+        chunks = len(cache)
+
+        grid[5][6] = int(TileType.MINE) if grid[5][6] != TileType.MINE else int(TileType.SEA)
+        cache.invalidate_tile(6, 5)
+
+        assert len(cache) == chunks - 1
+        expected = _frame(lambda window: afficher_tuiles(window, grid, images, camera))
+        assert _frame(lambda window: cache.render(window, grid, images, camera)) == expected
+
+    def test_zoom_float_noise_shares_chunks(self, images):
+        grid = _grid(6)
+        cache = TerrainChunkCache(chunk_tiles=4)
+        _frame(lambda window: cache.render(window, grid, images, _camera(0.3, 0.0, 0.0)))
+        misses = cache.misses
+        # 0.1 * 3 == 0.30000000000000004 : même niveau de zoom, mêmes blocs
+        _frame(lambda window: cache.render(window, grid, images, _camera(0.1 * 3, 0.0, 0.0)))
+        assert cache.misses == misses
+        assert {key[0] for key in cache._chunks} == {0.3}
+
+    def test_least_recently_used_chunks_are_evicted(self, images):
+        grid = _grid(9)
+        cache = TerrainChunkCache(chunk_tiles=4)
+        _frame(lambda window: cache.render(window, grid, images, _camera(1.0, 0.0, 0.0)))
+        one_zoom = cache.bytes_used
+        cache.budget_bytes = one_zoom
+
+        _frame(lambda window: cache.render(window, grid, images, _camera(1.25, 0.0, 0.0)))
+
+        # Les blocs du zoom précédent partent, ceux de la frame courante restent
+        assert {key[0] for key in cache._chunks} == {1.25}
+        assert cache.bytes_used > 0
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Tests des collisions avec le terrain (tables de correspondance par tuile)
+"""
+
+import math
+import random
+
+import pytest
+
+import esper
+from src.processeurs.collisionProcessor import CollisionProcessor
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.velocityComponent import VelocityComponent
+from src.components.core.canCollideComponent import CanCollideComponent
+from src.components.core.projectileComponent import ProjectileComponent
+from src.components.events.banditsComponent import Bandits
+from src.constants.map_tiles import TileType
+from src.settings.settings import TILE_SIZE
+
+
+def _reference_terrain_pass(processor, step_scale):
+    """Calcul d'origine entité par entité (grille en listes, effets en dictionnaire)."""
+    graph = processor.graph
+    for ent, (pos, velocity, _) in esper.get_components(PositionComponent, VelocityComponent, CanCollideComponent):
+        if velocity.currentSpeed == 0:
+            velocity.terrain_modifier = 1.0
+            continue
+        direction_rad = math.radians(pos.direction)
+        step = velocity.currentSpeed * step_scale
+        grid_x = int((pos.x - step * math.cos(direction_rad)) // TILE_SIZE)
+        grid_y = int((pos.y - step * math.sin(direction_rad)) // TILE_SIZE)
+        flying = esper.has_component(ent, Bandits) or esper.has_component(ent, ProjectileComponent)
+        if not (0 <= grid_x < len(graph[0]) and 0 <= grid_y < len(graph)):
+            if not flying:
+                velocity.currentSpeed = 0
+            velocity.terrain_modifier = 1.0
+            continue
+        terrain_type = processor._get_terrain_type(graph[grid_y][grid_x])
+        effect = processor.terrain_effects[terrain_type]
+        if not effect['can_pass']:
+            if flying:
+                velocity.terrain_modifier = 1.0
+            else:
+                processor._apply_knockback(ent, pos, velocity, magnitude=TILE_SIZE * 0.5)
+                velocity.terrain_modifier = 0.0
+        elif flying and terrain_type == 'cloud':
+            velocity.terrain_modifier = 1.0
+        else:
+            velocity.terrain_modifier = effect['speed_modifier']
+
+
+def _state():
+    """État de chaque entité, dans l'ordre de création."""
+    return [
+        (pos.x, pos.y, pos.direction, vel.currentSpeed, vel.terrain_modifier, getattr(vel, 'stun_timer', None))
+        for _, (pos, vel) in sorted(esper.get_components(PositionComponent, VelocityComponent), key=lambda item: item[0])
+    ]
+
+
+def _populate(seed, width=12, height=10):
+    rng = random.Random(seed)
+    graph = [[rng.choice([0, 0, 0, 1, 2, 3, 4, 5, 9]) for _ in range(width)] for _ in range(height)]
+    for _ in range(150):
+        ent = esper.create_entity(
+            PositionComponent(rng.uniform(-TILE_SIZE, (width + 1) * TILE_SIZE),
+                              rng.uniform(-TILE_SIZE, (height + 1) * TILE_SIZE), rng.uniform(-360, 360)),
+            VelocityComponent(rng.choice([0.0, rng.uniform(-40, 80)]), 80.0, -20.0, 0.3),
+            CanCollideComponent(),
+        )
+        kind = rng.random()
+        if kind < 0.15:
+            esper.add_component(ent, ProjectileComponent("bullet"))
+        elif kind < 0.3:
+            esper.add_component(ent, Bandits())
+    return graph
+
+
+@pytest.mark.unit
+class TestTerrainCollisions:
+    """Le traitement par tables donne le même résultat que le calcul d'origine."""
+
+    @pytest.mark.parametrize("seed,step_scale", [(1, 1.0), (2, 0.5), (3, 2.4)])
+    def test_matches_per_entity_lookup(self, world, seed, step_scale):
+        graph = _populate(seed)
+        _reference_terrain_pass(CollisionProcessor(graph=[row[:] for row in graph]), step_scale)
+        expected = _state()
+
+        esper.clear_database()
+        _populate(seed)
+        CollisionProcessor(graph=graph)._process_terrain_collisions(step_scale)
+
+        assert _state() == expected
+
+    def test_destroyed_mine_updates_both_grids(self, world):
+        graph = [[int(TileType.SEA), int(TileType.MINE)]]
+        processor = CollisionProcessor(graph=graph)
+
+        processor._destroy_mine_on_grid_with_position((1.5 * TILE_SIZE, 0.5 * TILE_SIZE))
+
+        assert graph[0][1] == TileType.SEA
+        assert processor.tiles[0, 1] == TileType.SEA
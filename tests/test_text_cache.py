@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Tests du cache des textes rendus (src/managers/font_cache.py)
+"""
+
+import pygame
+import pytest
+
+from src.managers.font_cache import TextCache, get_font
+
+
+def _bytes(surface):
+    return surface.get_bytesize() * surface.get_width() * surface.get_height()
+
+
+@pytest.mark.unit
+class TestTextCache:
+    """LRU borné en octets, compteurs de succès et composition des nombres par glyphes."""
+
+    def test_render_matches_font_render(self):
+        font = get_font(None, 24)
+        cache = TextCache()
+
+        surface = cache.render(font, "Mode: Normal", (240, 240, 250))
+
+        expected = font.render("Mode: Normal", True, (240, 240, 250))
+        assert pygame.image.tobytes(surface, "RGBA") == pygame.image.tobytes(expected, "RGBA")
+
+    def test_hits_and_misses(self):
+        font = get_font(None, 24)
+        cache = TextCache()
+
+        first = cache.render(font, "Or", (255, 215, 0))
+        assert cache.render(font, "Or", [255, 215, 0]) is first
+        cache.render(font, "Or", (255, 255, 255))  # autre couleur
+        cache.render(font, "Or", (255, 215, 0), antialias=False)
+        cache.render(get_font(None, 30), "Or", (255, 215, 0))  # autre police
+
+        assert (cache.hits, cache.misses, len(cache)) == (1, 4, 4)
+        assert cache.hit_rate == pytest.approx(1 / 5)
+
+    def test_eviction_is_lru_and_bounded_by_bytes(self):
+        font = get_font(None, 24)
+        red, green, blue = (255, 0, 0), (0, 255, 0), (0, 0, 255)
+        one = _bytes(font.render("1250", True, red))
+        cache = TextCache(budget_bytes=2 * one)
+
+        cache.render(font, "1250", red)
+        cache.render(font, "1250", green)
+        cache.render(font, "1250", red)  # rouge devient le plus récent
+        cache.render(font, "1250", blue)  # évince le vert
+
+        assert cache.bytes_used <= 2 * one
+        assert {key[2] for key in cache._surfaces} == {red, blue}
+
+    def test_numbers_are_composed_from_cached_digits(self):
+        font = get_font(None, 24)
+        cache = TextCache()
+        target = pygame.Surface((200, 40))
+
+        rect = cache.blit_glyphs(target, font, "1250", (255, 215, 0), (10, 5))
+        misses = cache.misses
+        cache.blit_glyphs(target, font, "1520", (255, 215, 0), (10, 5))
+
+        assert misses == 4 and cache.misses == 4  # aucun nouveau rendu : mêmes chiffres
+        assert rect.topleft == (10, 5) and rect.size == cache.glyphs_size(font, "1520", (255, 215, 0))
+        assert rect.width == sum(font.render(digit, True, (0, 0, 0)).get_width() for digit in "1520")
+        assert any(target.get_at((x, y))[:3] != (0, 0, 0) for x in range(rect.left, rect.right)
+                   for y in range(rect.top, rect.bottom))
+
+    def test_zero_width_characters_are_skipped(self):
+        font = get_font(None, 18)
+        cache = TextCache()
+
+        blits = cache.glyph_blits(font, "⏱️ 1.5s", (255, 165, 0), (0, 0))
+
+        assert len(blits) == 6
+        assert [dest[0] for _, dest in blits] == sorted(dest[0] for _, dest in blits)
@@ -14,9 +14,9 @@ def test_create_fog_surface_tiles_mode_returns_surface():
     vision_system.reset()
 
     cam = Camera(800, 600)
-    # set some visible/explored tiles
-    vision_system.explored_tiles[1] = set()
-    vision_system.visible_tiles[1] = set()
+    # no visible/explored tiles yet
+    assert not vision_system.explored_grid(1).any()
+    assert not vision_system.visible_grid(1).any()
 
     # Call create_fog_surface, must not return None in tiles mode
     surf = vision_system.create_fog_surface(cam, 1)
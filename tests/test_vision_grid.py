@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Tests des grilles de visibilité (uint8) et du rendu du brouillard (src/systems/vision_system.py)
+"""
+
+import math
+import random
+
+import numpy as np
+import pygame
+import pytest
+
+import esper
+from src.components.core.positionComponent import PositionComponent
+from src.components.core.teamComponent import TeamComponent
+from src.components.core.visionComponent import VisionComponent
+from src.components.globals.cameraComponent import Camera
+from src.managers.terrain_cache import camera_origin, tile_edge
+from src.settings.settings import MAP_HEIGHT, MAP_WIDTH, TILE_SIZE
+from src.systems.vision_system import EXPLORED_FOG_ALPHA, VisionSystem
+
+
+def _reference_visible(units):
+    """Calcul d'origine : ensemble des tuiles (x, y) à portée (distance euclidienne en tuiles)."""
+    tiles = set()
+    for x, y, vision_range in units:
+        grid_x, grid_y = int(x / TILE_SIZE), int(y / TILE_SIZE)
+        radius = int(vision_range)
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                if math.sqrt(dx * dx + dy * dy) <= vision_range:
+                    if 0 <= grid_x + dx < MAP_WIDTH and 0 <= grid_y + dy < MAP_HEIGHT:
+                        tiles.add((grid_x + dx, grid_y + dy))
+    return tiles
+
+
+def _grid_tiles(grid):
+    return {(int(x), int(y)) for y, x in zip(*np.nonzero(grid))}
+
+
+@pytest.mark.unit
+class TestVisionGrids:
+    """Les grilles uint8 contiennent les tuiles du calcul d'origine."""
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_reference_visibility(self, world, seed):
+        rng = random.Random(seed)
+        units = [(rng.uniform(-2 * TILE_SIZE, (MAP_WIDTH + 2) * TILE_SIZE),
+                  rng.uniform(-2 * TILE_SIZE, (MAP_HEIGHT + 2) * TILE_SIZE),
+                  rng.choice([4.0, 5.0, 6.0, 2.5, 8.0])) for _ in range(12)]
+        for x, y, vision_range in units:
+            esper.create_entity(PositionComponent(x, y), TeamComponent(1), VisionComponent(vision_range))
+        esper.create_entity(PositionComponent(100, 100), TeamComponent(2), VisionComponent(6.0))
+
+        vision = VisionSystem()
+        vision._suppress_explore_events = True
+        vision.update_visibility(1)
+
+        expected = _reference_visible(units)
+        assert _grid_tiles(vision.visible_grid(1)) == expected
+        assert _grid_tiles(vision.explored_grid(1)) == expected
+        assert all(vision.is_tile_visible(x, y, 1) for x, y in expected)
+        assert not vision.is_tile_visible(-1, 0, 1) and not vision.is_tile_visible(0, 0, 2)
+
+    def test_explored_tiles_stay_explored(self, world):
+        unit = esper.create_entity(PositionComponent(5 * TILE_SIZE, 5 * TILE_SIZE), TeamComponent(1),
+                                   VisionComponent(2.0))
+        vision = VisionSystem()
+        vision._suppress_explore_events = True
+        vision.update_visibility(1)
+        esper.component_for_entity(unit, PositionComponent).x = 20 * TILE_SIZE
+        vision.update_visibility(1)
+
+        assert not vision.is_tile_visible(5, 5, 1) and vision.is_tile_explored(5, 5, 1)
+        assert vision.is_tile_visible(20, 5, 1) and vision.is_tile_explored(20, 5, 1)
+
+
+@pytest.mark.unit
+class TestFogRenderer:
+    """Une tuile de texture par tuile de carte, alignée sur le terrain."""
+
+    @pytest.mark.parametrize("fog_mode", ["tiles", "image"])
+    @pytest.mark.parametrize("zoom,x,y", [(1.0, 0.0, 0.0), (0.75, 37.3, 12.6), (1.5, 200.4, 90.9)])
+    def test_fog_alpha_per_tile(self, monkeypatch, fog_mode, zoom, x, y):
+        monkeypatch.setattr("src.systems.vision_system.get_fog_render_mode", lambda: fog_mode)
+        vision = VisionSystem()
+        cloud = pygame.Surface((64, 64), pygame.SRCALPHA)
+        cloud.fill((230, 230, 240, 220))
+        vision.cloud_image = cloud
+        visible, explored = vision.visible_grid(1), vision.explored_grid(1)
+        rng = np.random.default_rng(4)
+        explored[...] = rng.integers(0, 2, explored.shape)
+        visible[...] = explored & rng.integers(0, 2, visible.shape)
+
+        camera = Camera(480, 320)
+        camera.zoom, camera.x, camera.y = zoom, x, y
+        fog = vision.create_fog_surface(camera, 1)
+
+        origin_x, origin_y = camera_origin(camera)
+        for tile_y in range(MAP_HEIGHT):
+            for tile_x in range(MAP_WIDTH):
+                # Centre de la tuile à l'écran
+                px = (tile_edge(tile_x, zoom) + tile_edge(tile_x + 1, zoom)) // 2 - origin_x
+                py = (tile_edge(tile_y, zoom) + tile_edge(tile_y + 1, zoom)) // 2 - origin_y
+                if not (0 <= px < 480 and 0 <= py < 320):
+                    continue
+                color = fog.get_at((px, py))
+                if visible[tile_y, tile_x]:
+                    assert color.a == 0
+                elif explored[tile_y, tile_x]:
+                    assert (color.r, color.g, color.b, color.a) == (0, 0, 0, EXPLORED_FOG_ALPHA)
+                else:
+                    assert color.a > EXPLORED_FOG_ALPHA and color.r > 0
+
+    def test_buffers_are_reused(self, monkeypatch):
+        monkeypatch.setattr("src.systems.vision_system.get_fog_render_mode", lambda: "tiles")
+        vision = VisionSystem()
+        camera = Camera(320, 240)
+        first = vision.create_fog_surface(camera, 1)
+        texture = vision._fog_texture
+
+        assert vision.create_fog_surface(camera, 1) is first
+        assert vision._fog_texture is texture
+
+
+@pytest.mark.unit
+class TestIncrementalVision:
+    """Compteurs par tuile : seuls les changements de tuile touchent aux grilles."""
+
+    def test_random_moves_spawns_and_deaths_match_reference(self, world):
+        rng = random.Random(11)
+        vision = VisionSystem()
+        vision._suppress_explore_events = True
+        units = []
+        explored = set()
+        for step in range(40):
+            if not units or rng.random() < 0.3:
+                units.append(esper.create_entity(
+                    PositionComponent(rng.uniform(0, MAP_WIDTH * TILE_SIZE), rng.uniform(0, MAP_HEIGHT * TILE_SIZE)),
+                    TeamComponent(1), VisionComponent(rng.choice([2.5, 4.0, 6.0]))))
+            if len(units) > 2 and rng.random() < 0.2:
+                esper.delete_entity(units.pop(rng.randrange(len(units))), immediate=True)
+            for ent in units:
+                pos = esper.component_for_entity(ent, PositionComponent)
+                pos.x += rng.uniform(-TILE_SIZE, TILE_SIZE)
+                pos.y += rng.uniform(-TILE_SIZE, TILE_SIZE)
+
+            vision.update_visibility(1)
+
+            expected = _reference_visible(
+                (pos.x, pos.y, vis.range) for _, (pos, vis) in esper.get_components(PositionComponent, VisionComponent))
+            explored |= expected
+            assert _grid_tiles(vision.visible_grid(1)) == expected, step
+            assert _grid_tiles(vision.explored_grid(1)) == explored, step
+
+    def test_moves_inside_a_tile_do_not_stamp(self, world, monkeypatch):
+        ent = esper.create_entity(PositionComponent(5.5 * TILE_SIZE, 5.5 * TILE_SIZE), TeamComponent(1),
+                                  VisionComponent(4.0))
+        vision = VisionSystem()
+        vision._suppress_explore_events = True
+        vision.update_visibility(1)
+
+        stamps = []
+        apply_stamp = vision._apply_stamp
+        monkeypatch.setattr(vision, "_apply_stamp", lambda *args: stamps.append(args) or apply_stamp(*args))
+        pos = esper.component_for_entity(ent, PositionComponent)
+        pos.x += TILE_SIZE * 0.3
+        vision.update_visibility(1)
+        assert stamps == []
+
+        pos.x += TILE_SIZE
+        vision.update_visibility(1)
+        assert [args[-1] for args in stamps] == [-1, 1]
+
+    def test_reveal_lasts_until_next_update(self, world):
+        esper.create_entity(PositionComponent(TILE_SIZE, TILE_SIZE), TeamComponent(1), VisionComponent(2.0))
+        vision = VisionSystem()
+        vision._suppress_explore_events = True
+        vision.update_visibility(1)
+
+        vision.reveal_all_map(1)
+        assert vision.is_tile_visible(MAP_WIDTH - 1, MAP_HEIGHT - 1, 1)
+        vision.update_visibility(1)
+
+        assert not vision.is_tile_visible(MAP_WIDTH - 1, MAP_HEIGHT - 1, 1)
+        assert vision.is_tile_explored(MAP_WIDTH - 1, MAP_HEIGHT - 1, 1)
+        assert vision.is_tile_visible(1, 1, 1)